@@ -7,6 +7,7 @@ __version__ = "0.0"
 
 from knotpy import utils
 from knotpy.utils import *
+from knotpy.utils.cache import cache_stats
 
 from knotpy import notation
 from knotpy.notation import *
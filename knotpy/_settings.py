@@ -7,6 +7,7 @@ __all__ = ["settings"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
+import os
 import re
 
 _DEFAULT_ALLOWED_MOVES = ["R1", "R2", "R3", "R4", "R5"]
@@ -18,6 +19,9 @@ _DEFAULT_FRAMED = False  # track framing on Reidemeister moves (R1, R4)
 #_DEFAULT_R1_INCREASE_SIMPLIFICATION = False  # use increasing R1 move to simplify knots
 _DEFAULT_FLYPE_CROSSINGS_ONLY = True  # allow flyping only tangles consisting only of crossings
 _DEFAULT_USE_PRECOMPUTED_INVARIANTS = True
+_DEFAULT_PERSISTENT_CACHE_DIR = None  # directory of the on-disk invariant cache (None disables the cache)
+_DEFAULT_PERSISTENT_CACHE_MAX_SIZE = 2 ** 30  # maximal total size of the values in the on-disk cache (in bytes)
+_DEFAULT_DATA_PACK_DIR = None  # directory of additional (block) tables, e.g. the knots with 13-16 crossings
 
 def _clean_allowed_moves(allowed_moves) -> list:
     """From the input parameter, e.g. "R1,R2,R3" or {"R1", "R2", "R3"}, return a set of allowed moves as a a set of ."""
@@ -55,6 +59,34 @@ class SettingProxyBool:
         self._value = value
 
 
+class SettingProxyPath:
+
+    def __init__(self, default_value):
+        self._value = default_value
+
+    def __get__(self, obj, objtype=None):
+        return self._value
+
+    def __set__(self, obj, value):
+        if value is not None and not isinstance(value, (str, os.PathLike)):
+            raise ValueError("Value must be a path or None")
+        self._value = None if value is None else os.fspath(value)
+
+
+class SettingProxyPositiveInt:
+
+    def __init__(self, default_value):
+        self._value = default_value
+
+    def __get__(self, obj, objtype=None):
+        return self._value
+
+    def __set__(self, obj, value):
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            raise ValueError("Value must be a positive integer")
+        self._value = value
+
+
 class SettingProxyReidemeisterMoves:
 
     def __init__(self, default_value):
@@ -75,6 +107,9 @@ class Settings:
     #r1_increase_simplification = SettingProxyBool(_DEFAULT_R1_INCREASE_SIMPLIFICATION)
     flype_crossings_only = SettingProxyBool(_DEFAULT_FLYPE_CROSSINGS_ONLY)
     use_precomputed_invariants = SettingProxyBool(_DEFAULT_USE_PRECOMPUTED_INVARIANTS)
+    persistent_cache_dir = SettingProxyPath(_DEFAULT_PERSISTENT_CACHE_DIR)
+    persistent_cache_max_size = SettingProxyPositiveInt(_DEFAULT_PERSISTENT_CACHE_MAX_SIZE)
+    data_pack_dir = SettingProxyPath(_DEFAULT_DATA_PACK_DIR)
 
     def add_allowed_move(self, move):
         self.allowed_moves.extend(_clean_allowed_moves(move))
@@ -88,7 +123,10 @@ class Settings:
             "framed": self.framed,
             #"r1_increase_simplification": self.r1_increase_simplification,
             "flype_crossings_only": self.flype_crossings_only,
-            "use_precomputed_invariants": self.use_precomputed_invariants
+            "use_precomputed_invariants": self.use_precomputed_invariants,
+            "persistent_cache_dir": self.persistent_cache_dir,
+            "persistent_cache_max_size": self.persistent_cache_max_size,
+            "data_pack_dir": self.data_pack_dir,
         }
 
     def update(self, data: dict):
@@ -107,6 +145,12 @@ class Settings:
             self.flype_crossings_only = data["flype_crossings_only"]
         if "use_precomputed_invariants" in data:
             self.use_precomputed_invariants = data["use_precomputed_invariants"]
+        if "persistent_cache_dir" in data:
+            self.persistent_cache_dir = data["persistent_cache_dir"]
+        if "persistent_cache_max_size" in data:
+            self.persistent_cache_max_size = data["persistent_cache_max_size"]
+        if "data_pack_dir" in data:
+            self.data_pack_dir = data["data_pack_dir"]
 
 
     def load(self, data: dict):
@@ -118,6 +162,9 @@ class Settings:
         #self.r1_increase_simplification = data["r1_increase_simplification"] if "r1_increase_simplification" in data else _DEFAULT_R1_INCREASE_SIMPLIFICATION
         self.flype_crossings_only = data["flype_crossings_only"] if "flype_crossings_only" in data else _DEFAULT_FLYPE_CROSSINGS_ONLY
         self.use_precomputed_invariants = data["use_precomputed_invariants"] if "use_precomputed_invariants" in data else _DEFAULT_USE_PRECOMPUTED_INVARIANTS
+        self.persistent_cache_dir = data["persistent_cache_dir"] if "persistent_cache_dir" in data else _DEFAULT_PERSISTENT_CACHE_DIR
+        self.persistent_cache_max_size = data["persistent_cache_max_size"] if "persistent_cache_max_size" in data else _DEFAULT_PERSISTENT_CACHE_MAX_SIZE
+        self.data_pack_dir = data["data_pack_dir"] if "data_pack_dir" in data else _DEFAULT_DATA_PACK_DIR
 
 
 settings = Settings()
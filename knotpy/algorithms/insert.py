@@ -213,6 +213,7 @@ def _insert_none_at_node_position(k: PlanarDiagram, node, position: int, count:
     # Finally insert ``None`` slots at this node
     for i in range(count):
         k._nodes[node]._inc.insert(position + i, None)
+    k._reset_endpoint_caches()
 
 
 if __name__ == "__main__":
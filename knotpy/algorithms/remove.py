@@ -185,6 +185,8 @@ def remove_bivalent_vertices(k: PlanarDiagram, match_attributes: bool = False) -
         # splice a0 <-> a1
         k.nodes[a0.node][a0.position] = a1
         k.nodes[a1.node][a1.position] = a0
+        k._reset_endpoint_caches(a0.node)
+        k._reset_endpoint_caches(a1.node)
         k.remove_node(node_for_removing=node, remove_incident_endpoints=False)
         removed += 1
 
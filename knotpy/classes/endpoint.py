@@ -64,7 +64,7 @@ class Endpoint:
         """
         self.node = node
         self.position = int(position)
-        self.attr = dict(attr)
+        self.attr = attr  # a fresh dictionary of the keyword arguments
 
     def __iter__(self):
         """Allow tuple-unpacking into ``(node, position)``.
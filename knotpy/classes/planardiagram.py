@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copyreg
 from collections.abc import Hashable, Iterable, Sequence
 from functools import cached_property
 from itertools import chain
@@ -74,6 +75,9 @@ class _NodeCachedPropertyResetter:
             if prop_name in od:
                 del od[prop_name]
 
+        # Caches derived from the endpoints (crossing signs, writhe, linking numbers)
+        obj._reset_endpoint_caches()
+
 
 @total_ordering_from_compare
 class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
@@ -135,6 +139,14 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
         copy_using = copy_using or type(self)
         the_copy = planar_diagram_from_data(incoming_data=self, create_using=copy_using)
         the_copy.attr.update(attr)
+        if type(the_copy) is type(self):
+            # the copy has the same crossings and endpoint types, so the caches remain valid
+            od = self.__dict__
+            if "_signs" in od:
+                the_copy.__dict__.update(_signs=dict(od["_signs"]), _stale_signs=set(od["_stale_signs"]),
+                                         _sign_sum=od["_sign_sum"])
+            if "_endpoint_cache" in od:
+                the_copy.__dict__["_endpoint_cache"] = dict(od["_endpoint_cache"])
         return the_copy
 
     # Views
@@ -175,6 +187,42 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
         """
         return FaceView(self._nodes)
 
+    # Caches
+
+    @property
+    def _endpoint_cache(self) -> dict[str, Any]:
+        """Return the cache of (immutable) values derived from the endpoints, e.g. linking numbers.
+
+        The cache is cleared by the mutation methods of the diagram. Modifying the node instances directly
+        (bypassing the diagram methods) does not clear the cache.
+
+        Returns:
+            dict[str, Any]: Cached values by name.
+        """
+        return self.__dict__.setdefault("_endpoint_cache", {})
+
+    def _reset_endpoint_caches(self, node: Hashable | None = None) -> None:
+        """Invalidate the caches derived from the endpoints after a mutation.
+
+        The cached crossing signs (of oriented diagrams) are updated locally: only the sign of ``node`` is
+        invalidated and recomputed on next access. Other cached values are cleared.
+
+        Args:
+            node: Node whose endpoints have changed, or ``None`` if the whole diagram has changed.
+        """
+        od = self.__dict__
+        if "_endpoint_cache" in od:
+            del od["_endpoint_cache"]
+        signs = od.get("_signs")
+        if signs is None:
+            return
+        if node is None:
+            del od["_signs"], od["_stale_signs"], od["_sign_sum"]
+            return
+        if node in signs:
+            od["_sign_sum"] -= signs.pop(node)
+        od["_stale_signs"].add(node)
+
     # Basic protocol
 
     def __len__(self) -> int:
@@ -308,6 +356,7 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
             raise NotImplementedError("Node type change not implemented")
 
         self._nodes[node].attr.update(attr)
+        self._reset_endpoint_caches(node)
 
     def add_nodes_from(
         self,
@@ -383,6 +432,7 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
                 **ep.attr,
             )
             self._nodes[ep.node][permutation[ep.position]] = adj_ep
+        self._reset_endpoint_caches(node)
 
     def convert_node(self, node_for_converting: Hashable, node_type: type) -> None:
         """Convert a node's concrete type (e.g., vertex → crossing).
@@ -398,6 +448,7 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
                 degree=len(node_inst),
                 *node_inst.attr,  # REVIEW: confirm the node constructor signature supports this splat
             )
+            self._reset_endpoint_caches(node_for_converting)
 
     def convert_nodes(self, nodes_for_converting: Iterable[Hashable], node_type: type) -> None:
         """Convert multiple nodes to a given concrete type.
@@ -423,6 +474,7 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
         if remove_incident_endpoints:
             self.remove_endpoints_from(self._nodes[node])
         del self._nodes[node]
+        self._reset_endpoint_caches(node)
         return self
 
     def remove_nodes_from(self, nodes_for_removal: Iterable[Hashable], remove_incident_endpoints: bool = True) -> None:
@@ -510,6 +562,7 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
             self._nodes[node].append(Node)
 
         self._nodes[node][node_pos] = adj
+        self._reset_endpoint_caches(node)
 
     def twin(self, endpoint: Endpoint | tuple[Hashable, int]) -> Endpoint:
         """Return the opposite endpoint (twin) of an endpoint.
@@ -579,6 +632,7 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
         """
         node, pos = endpoint_for_removal
         del self._nodes[node][pos]
+        self._reset_endpoint_caches()  # positions of the adjacent endpoints are shifted
 
         # Adjust positions for adjacent endpoints in the suffix
         for adj_node, adj_pos in self._nodes[node][pos:]:
@@ -680,6 +734,26 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
             )
         )
 
+    # Pickling
+
+    def __reduce__(self) -> tuple:
+        """Pickle the diagram through its compact binary encoding.
+
+        The diagram is pickled as the encoding of :func:`knotpy.notation.binary.to_bytes` together with its attributes
+        and its frozen state, which is several times smaller and faster than pickling the node and endpoint objects
+        (e.g. when diagrams are sent to the workers of a process pool). Diagrams with node labels other than strings
+        or integers are pickled by their instance dictionary.
+
+        Returns:
+            tuple: The reconstructing function and its arguments.
+        """
+        from knotpy.notation.binary import _reduce_diagram  # lazy import (circular)
+
+        try:
+            return _reduce_diagram(self)
+        except TypeError:
+            return copyreg.__newobj__, (type(self),), self.__dict__
+
     # Orientation / attributes
 
     @staticmethod
@@ -837,6 +911,54 @@ class OrientedPlanarDiagram(PlanarDiagram):
         """
         return True
 
+    def sign(self, crossing: Hashable) -> int:
+        """Return the sign of a crossing (read from the cached crossing signs if available).
+
+        Args:
+            crossing: Crossing identifier.
+
+        Returns:
+            int: Crossing sign (``+1`` or ``-1``).
+        """
+        signs = self.__dict__.get("_signs")
+        if signs is not None and crossing in signs:
+            return signs[crossing]
+        return self._nodes[crossing].sign()
+
+    def _crossing_signs(self) -> dict[Hashable, int]:
+        """Return the cached signs of all crossings.
+
+        The signs are computed on first access. Afterward, the mutation methods only invalidate the signs of the
+        modified nodes, which are recomputed on the next access together with the writhe.
+
+        Returns:
+            dict[Hashable, int]: Signs by crossing (the cache itself, it should not be modified).
+        """
+        od = self.__dict__
+        signs = od.get("_signs")
+        if signs is None:
+            signs = {c: self._nodes[c].sign() for c in self.crossings}
+            od["_signs"], od["_stale_signs"], od["_sign_sum"] = signs, set(), sum(signs.values())
+            return signs
+        stale = od["_stale_signs"]
+        while stale:
+            node = next(iter(stale))
+            node_inst = self._nodes.get(node)
+            if isinstance(node_inst, Crossing) and node not in signs:
+                signs[node] = node_sign = node_inst.sign()
+                od["_sign_sum"] += node_sign
+            stale.discard(node)
+        return signs
+
+    def _writhe(self) -> int:
+        """Return the writhe (the sum of the crossing signs) from the cached crossing signs.
+
+        Returns:
+            int: The writhe of the diagram.
+        """
+        self._crossing_signs()
+        return self.__dict__["_sign_sum"]
+
 
 def planar_diagram_from_data(incoming_data: Any, create_using: type[PlanarDiagram] | PlanarDiagram | None) -> PlanarDiagram:
     """Generate a planar diagram from input data.
@@ -31,4 +31,9 @@ from .alexander import *
 from .classifier import *
 from .fundamental_group import *
 from .tutte import *
+from .khovanov import *
+from .invariant_set import *
+from .goeritz import *
+from .coloring import *
+from .persistent_cache import *
 from ._symbols import SYMBOL_LOCALS
@@ -0,0 +1,286 @@
+"""
+Numeric evaluation of skein state sums.
+
+Instead of symbolic (SymPy) coefficients, the state sums of polynomial invariants can run over values of the
+variables at one or several evaluation points. A :class:`_PointValue` holds such values and supports the ring
+operations used in the state sums (``+``, ``-``, ``*``, ``/`` and integer powers):
+
+- exact rational arithmetic (Python ints and :class:`fractions.Fraction`),
+- arithmetic modulo a prime (or any modulus, as long as the inverted values are units),
+- floating point and complex arithmetic,
+- vectorized arithmetic over many points at once (NumPy arrays).
+
+To evaluate invariants with fractional exponents exactly (e.g. the Jones polynomial is obtained from the bracket by
+``A = t^(-1/4)``), a value can also be an element of the ring ``R[s]/(s^d - c)``, where ``s`` is a formal ``d``-th
+root of the value ``c``.
+"""
+
+from __future__ import annotations
+
+__all__ = []
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+from fractions import Fraction
+from math import isqrt
+from numbers import Integral, Rational
+
+import sympy as sp
+
+# moduli below this bound are evaluated with int64 arrays, since products of two residues do not overflow
+_INT64_MODULUS_BOUND = 2 ** 31
+
+
+def _is_sequence(value) -> bool:
+    return isinstance(value, (list, tuple)) or type(value).__name__ == "ndarray"
+
+
+def _convert_scalar(value, modulus: int | None):
+    """Convert a scalar (Python or SymPy number) to an int/Fraction/float/complex (reduced modulo ``modulus``)."""
+    if isinstance(value, sp.Basic):
+        if value.is_Integer:
+            value = int(value)
+        elif value.is_Rational:
+            value = Fraction(int(value.p), int(value.q))
+        else:
+            value = complex(sp.N(value))
+            value = value.real if value.imag == 0 else value
+    if modulus is not None:
+        if isinstance(value, Integral):
+            return int(value) % modulus
+        if isinstance(value, Rational):
+            return int(value.numerator) * pow(int(value.denominator), -1, modulus) % modulus
+        raise TypeError(f"Cannot reduce {value} modulo {modulus}")
+    if isinstance(value, Rational):
+        return Fraction(value)
+    return value
+
+
+def _convert(value, modulus: int | None):
+    """Convert evaluation points to a scalar or a NumPy array suitable for the state sum."""
+    if not _is_sequence(value):
+        return _convert_scalar(value, modulus)
+
+    import numpy as np
+
+    values = [_convert_scalar(v.item() if hasattr(v, "item") else v, modulus) for v in value]
+    if modulus is not None:
+        return np.array(values, dtype=np.int64 if modulus < _INT64_MODULUS_BOUND else object)
+    if all(isinstance(v, Fraction) for v in values):
+        return np.array(values, dtype=object)
+    return np.array(values, dtype=complex if any(isinstance(v, complex) for v in values) else float)
+
+
+def _is_inexact(value) -> bool:
+    """Return True if the value is a float or complex number (or an array of them)."""
+    return isinstance(value, (float, complex)) or getattr(getattr(value, "dtype", None), "kind", None) in ("f", "c")
+
+
+def _is_zero(value) -> bool:
+    if _is_sequence(value):
+        return not value.any()
+    return value == 0
+
+
+class _PointValue:
+    """Values of a state sum coefficient at evaluation points.
+
+    The value is an element ``data[0] + data[1] s + ... + data[d-1] s^(d-1)`` of ``R[s]/(s^d - root_of)``, where
+    each component is a scalar or a NumPy array (one entry per evaluation point). For ``d = 1`` this is just a
+    number (or an array of numbers).
+    """
+
+    __slots__ = ("data", "modulus", "root_of")
+
+    def __init__(self, data: list, modulus: int | None = None, root_of=None):
+        self.data = data
+        self.modulus = modulus
+        self.root_of = root_of  # the value of s^d (only used if d > 1)
+
+    # constructors
+
+    @classmethod
+    def variable(cls, value, modulus: int | None = None) -> _PointValue:
+        """Return the value of a variable at the evaluation point(s) ``value``."""
+        if modulus is not None and (not isinstance(modulus, Integral) or modulus < 2):
+            raise ValueError(f"The modulus should be an integer larger than 1 (got {modulus})")
+        return cls([_convert(value, modulus)], modulus)
+
+    def root(self, degree: int) -> _PointValue:
+        """Return a formal ``degree``-th root ``s`` of this (scalar) value, i.e. the generator of ``R[s]/(s^d - self)``."""
+        if len(self.data) != 1:
+            raise ValueError("Roots can only be adjoined to scalar values")
+        return _PointValue([0, 1] + [0] * (degree - 2), self.modulus, self.data[0]) if degree > 1 else self
+
+    def _constant(self, value) -> _PointValue:
+        value = value.data[0] if isinstance(value, _PointValue) else _convert_scalar(value, self.modulus)
+        if isinstance(value, Fraction) and _is_inexact(self.data[0]):
+            value = float(value)  # keep the (extended) precision of float arrays
+        return _PointValue([value] + [0] * (len(self.data) - 1), self.modulus, self.root_of)
+
+    # arithmetic
+
+    def _reduce(self, value):
+        return value % self.modulus if self.modulus is not None else value
+
+    def _coerce(self, other) -> _PointValue:
+        if isinstance(other, _PointValue):
+            if len(other.data) < len(self.data):  # scalar times a root extension
+                return _PointValue(other.data + [0] * (len(self.data) - len(other.data)), self.modulus, self.root_of)
+            return other
+        return self._constant(other)
+
+    def _lift(self, other: _PointValue) -> _PointValue:
+        """Return ``self`` with the same number of components as ``other``."""
+        if len(self.data) < len(other.data):
+            return _PointValue(self.data + [0] * (len(other.data) - len(self.data)), self.modulus, other.root_of)
+        return self
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        self_ = self._lift(other)
+        return _PointValue([self._reduce(a + b) for a, b in zip(self_.data, other.data)], self.modulus, self_.root_of)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return _PointValue([self._reduce(-a) for a in self.data], self.modulus, self.root_of)
+
+    def __sub__(self, other):
+        return self + (-self._coerce(other))
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        other = self._coerce(other)
+        self_ = self._lift(other)
+        d = len(self_.data)
+        if d == 1:
+            return _PointValue([self._reduce(self_.data[0] * other.data[0])], self.modulus)
+        result = [0] * d
+        for i, a in enumerate(self_.data):
+            if _is_zero(a):
+                continue
+            for j, b in enumerate(other.data):
+                if _is_zero(b):
+                    continue
+                if i + j < d:
+                    result[i + j] = self._reduce(result[i + j] + self._reduce(a * b))
+                else:  # s^(i+j) = c * s^(i+j-d)
+                    result[i + j - d] = self._reduce(result[i + j - d] + self._reduce(self._reduce(a * b) * self_.root_of))
+        return _PointValue(result, self.modulus, self_.root_of)
+
+    __rmul__ = __mul__
+
+    def _inverse_scalar(self, value):
+        if self.modulus is None:
+            return 1 / value if not isinstance(value, Integral) else Fraction(1, value)
+        if _is_sequence(value):
+            import numpy as np
+            return np.array([pow(int(v), -1, self.modulus) for v in value], dtype=value.dtype)
+        return pow(int(value), -1, self.modulus)
+
+    def inverse(self) -> _PointValue:
+        """Return the multiplicative inverse (for root extensions, only monomials ``a s^i`` are invertible)."""
+        d = len(self.data)
+        nonzero = [i for i, a in enumerate(self.data) if not _is_zero(a)]
+        if len(nonzero) != 1:
+            if not nonzero:
+                raise ZeroDivisionError("Division by zero at an evaluation point")
+            raise ValueError("Only monomials can be inverted in a root extension")
+        i = nonzero[0]
+        inv = self._inverse_scalar(self.data[i])
+        result = [0] * d
+        if i == 0:
+            result[0] = inv
+        else:  # (a s^i)^-1 = a^-1 c^-1 s^(d-i)
+            result[d - i] = self._reduce(inv * self._inverse_scalar(self.root_of))
+        return _PointValue(result, self.modulus, self.root_of)
+
+    def __truediv__(self, other):
+        return self * self._coerce(other).inverse()
+
+    def __rtruediv__(self, other):
+        return self._coerce(other) * self.inverse()
+
+    def __pow__(self, exponent: int):
+        exponent = int(exponent)
+        base = self if exponent >= 0 else self.inverse()
+        exponent = abs(exponent)
+        result = self._constant(1)
+        while exponent:
+            if exponent & 1:
+                result = result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        return result
+
+    # output
+
+    def monomial(self) -> tuple[object, int]:
+        """Return the pair ``(a, i)`` if the value is the monomial ``a s^i`` (``(0, 0)`` for zero)."""
+        nonzero = [i for i, a in enumerate(self.data) if not _is_zero(a)]
+        if not nonzero:
+            return self.data[0], 0
+        if len(nonzero) > 1:
+            raise ValueError("The value is not a monomial in the adjoined root")
+        return self.data[nonzero[0]], nonzero[0]
+
+    def value(self):
+        """Return the value at the evaluation point(s) as a number or a NumPy array."""
+        if len(self.data) != 1:
+            raise ValueError("The value contains a formal root")
+        return _output(self.data[0])
+
+
+def _output(value):
+    """Convert Fractions with denominator 1 to ints (element-wise for arrays)."""
+    if _is_sequence(value):
+        if value.dtype == object:
+            import numpy as np
+            return np.array([_output(v) for v in value], dtype=object)
+        return value
+    if isinstance(value, Fraction) and value.denominator == 1:
+        return int(value.numerator)
+    return value
+
+
+def _sqrt(value, modulus: int | None):
+    """Return the (principal) square root of an evaluation point, if it can be computed in the given arithmetic."""
+    if modulus is not None:
+        raise ValueError("Square roots of evaluation points are not supported in modular arithmetic")
+    if _is_sequence(value):
+        import numpy as np
+        if value.dtype == object:
+            return np.array([_sqrt(v, modulus) for v in value], dtype=object)
+        return np.sqrt(value.astype(complex)) if (value.real < 0).any() else np.sqrt(value)
+    if isinstance(value, Fraction):
+        if value >= 0:
+            n, d = isqrt(value.numerator), isqrt(value.denominator)
+            if n * n == value.numerator and d * d == value.denominator:
+                return Fraction(n, d)
+        raise ValueError(f"The square root of {value} is not rational")
+    return value ** 0.5
+
+
+def _evaluate_expression(expression: sp.Expr, values: dict) -> _PointValue:
+    """Evaluate a (Laurent) polynomial with integer exponents, replacing symbols by point values."""
+    one = next(iter(values.values())) ** 0
+    result = one * 0
+    for term in sp.Add.make_args(sp.expand(expression)):
+        coefficient, monomial = term.as_coeff_Mul()
+        value = one * coefficient
+        for symbol, exponent in monomial.as_powers_dict().items():
+            if symbol == 1:
+                continue
+            if not exponent.is_Integer:
+                raise ValueError(f"Cannot evaluate the non-integer power {symbol}**{exponent}")
+            value = value * values[symbol] ** int(exponent)
+        result = result + value
+    return result
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,344 @@
+"""
+Polynomial invariants of abstract multigraphs with integer coefficients.
+
+Planar graph evaluations (e.g. the Yamada polynomial of a crossingless spatial graph) only depend on the abstract
+graph, not on its embedding. Here a graph is a multigraph given by a list of edges ``(u, v)`` on hashable vertices, and
+polynomials are tuples of integer coefficients (lowest degree first) or, for two variables, dictionaries
+``{(i, j): coefficient}``, so no SymPy arithmetic is needed in the recursion.
+
+The flow polynomial ``F(q)`` is computed by deletion–contraction with the following optimizations:
+
+- loops contribute the factor ``q - 1``, isolated vertices are ignored and graphs with bridges evaluate to 0,
+- series edges (bivalent vertices) are merged, and all parallel edges between two vertices are resolved in one step,
+- the polynomial is multiplicative over blocks (2-connected components), which are evaluated independently,
+- every block is cached by an exact canonical form (computed by color refinement), regardless of its size.
+
+The Tutte polynomial ``T(x, y)`` is computed in the same way: loops contribute ``y``, bridges ``x``, the polynomial is
+multiplicative over blocks, and cycles, parallel classes and series paths (chains of bivalent vertices) are resolved by
+closed formulas, so that only two minors (the class deleted and the class contracted) are expanded for each of them.
+Other edges are chosen at a vertex of maximal degree, and the minors of all blocks are cached by their canonical forms.
+"""
+
+from __future__ import annotations
+
+__all__ = []
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+from collections import defaultdict
+
+from knotpy.classes.planardiagram import PlanarDiagram
+from knotpy.utils.cache import BoundedCache
+
+# flow and Tutte polynomials of 2-connected multigraphs (keys are canonical forms, see _canonical_form)
+_flow_cache = BoundedCache(max_entries=100000, policy="lru", name="flow_polynomial")
+_tutte_cache = BoundedCache(max_entries=100000, policy="lru", name="tutte_polynomial")
+
+_ZERO = ()
+_ONE = (1,)
+_Q_MINUS_ONE = (-1, 1)
+
+
+# integer polynomials
+
+
+def _poly_add(a: tuple, b: tuple) -> tuple:
+    if len(a) < len(b):
+        a, b = b, a
+    result = list(a)
+    for i, c in enumerate(b):
+        result[i] += c
+    return _poly_trim(result)
+
+
+def _poly_neg(a: tuple) -> tuple:
+    return tuple(-c for c in a)
+
+
+def _poly_mul(a: tuple, b: tuple) -> tuple:
+    if not a or not b:
+        return _ZERO
+    result = [0] * (len(a) + len(b) - 1)
+    for i, c in enumerate(a):
+        if c:
+            for j, d in enumerate(b):
+                result[i + j] += c * d
+    return _poly_trim(result)
+
+
+def _poly_pow(a: tuple, exponent: int) -> tuple:
+    result = _ONE
+    for _ in range(exponent):
+        result = _poly_mul(result, a)
+    return result
+
+
+def _poly_trim(coefficients: list) -> tuple:
+    while coefficients and coefficients[-1] == 0:
+        coefficients.pop()
+    return tuple(coefficients)
+
+
+# integer polynomials in two variables
+
+
+def _bipoly_add(*polynomials: dict) -> dict:
+    result = defaultdict(int)
+    for polynomial in polynomials:
+        for monomial, c in polynomial.items():
+            result[monomial] += c
+    return {monomial: c for monomial, c in result.items() if c}
+
+
+def _bipoly_mul(a: dict, b: dict) -> dict:
+    result = defaultdict(int)
+    for (i, j), c in a.items():
+        for (k, l), d in b.items():
+            result[i + k, j + l] += c * d
+    return {monomial: c for monomial, c in result.items() if c}
+
+
+def _geometric_sum(start: int, stop: int, variable: int) -> dict:
+    """Return ``v^start + ... + v^(stop - 1)`` for the variable ``v = x`` (0) or ``v = y`` (1)."""
+    return {((i, 0) if variable == 0 else (0, i)): 1 for i in range(start, stop)}
+
+
+_BI_ONE = {(0, 0): 1}
+
+
+# multigraphs
+
+
+def _multigraph(g: PlanarDiagram) -> list[tuple]:
+    """Return the edges of a crossingless diagram as pairs of node names (loops are pairs ``(v, v)``)."""
+    edges = []
+    for arc in g.arcs:
+        ep1, ep2 = arc
+        edges.append((ep1.node, ep2.node))
+    return edges
+
+
+def _adjacency(edges: list[tuple]) -> dict:
+    """Return the dictionary ``{u: {v: multiplicity}}`` of a loopless multigraph."""
+    adjacency = defaultdict(lambda: defaultdict(int))
+    for u, v in edges:
+        adjacency[u][v] += 1
+        adjacency[v][u] += 1
+    return adjacency
+
+
+def _canonical_form(adjacency: dict) -> tuple:
+    """Return a canonical form of a loopless multigraph without isolated vertices.
+
+    Vertices are ordered by iterated color refinement (degree, then the multiset of neighbour colors and
+    multiplicities); ties are broken by individualizing each vertex of the first non-trivial color class and taking the
+    lexicographically smallest result. The form is the sorted tuple of relabeled edges ``(i, j, multiplicity)``.
+    """
+    vertices = list(adjacency)
+
+    def _refine(color: dict) -> dict:
+        number_of_colors = len(set(color.values()))
+        while True:
+            signature = {v: (color[v], tuple(sorted((color[w], m) for w, m in adjacency[v].items())))
+                         for v in vertices}
+            ranks = {s: i for i, s in enumerate(sorted(set(signature.values())))}
+            color = {v: ranks[signature[v]] for v in vertices}
+            if len(ranks) == number_of_colors:
+                return color
+            number_of_colors = len(ranks)
+
+    def _search(color: dict) -> tuple:
+        cells = defaultdict(list)
+        for v in vertices:
+            cells[color[v]].append(v)
+        target = next((cells[c] for c in sorted(cells) if len(cells[c]) > 1), None)
+        if target is None:
+            return tuple(sorted((min(color[u], color[v]), max(color[u], color[v]), m)
+                                for u in vertices for v, m in adjacency[u].items() if color[u] <= color[v]))
+        return min(_search(_refine({u: 2 * color[u] + (u != v) for u in vertices})) for v in target)
+
+    return _search(_refine({v: sum(adjacency[v].values()) for v in vertices}))
+
+
+def _blocks(adjacency: dict) -> list[list]:
+    """Return the blocks (2-connected components and bridges) of a loopless multigraph as lists of vertices."""
+    index, low, blocks = {}, {}, []
+    counter = 0
+    for root in adjacency:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack = [(root, None, iter(adjacency[root]))]
+        vertex_stack = [root]
+        while stack:
+            v, parent, neighbours = stack[-1]
+            for w in neighbours:
+                if w == parent:
+                    continue
+                if w in index:
+                    low[v] = min(low[v], index[w])
+                else:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    vertex_stack.append(w)
+                    stack.append((w, v, iter(adjacency[w])))
+                    break
+            else:
+                stack.pop()
+                if parent is not None:
+                    low[parent] = min(low[parent], low[v])
+                    if low[v] >= index[parent]:  # parent is a cut vertex (or the root)
+                        block = [parent]
+                        while block[-1] != v:
+                            block.append(vertex_stack.pop())
+                        blocks.append(block)
+    return blocks
+
+
+def _reduce(edges: list[tuple]) -> tuple[tuple, list[tuple] | None]:
+    """Remove loops and bivalent vertices, preserving the flow polynomial up to the returned factor.
+
+    Returns:
+        tuple: The factor and the reduced (loopless) edge list, or ``(0, None)`` if the graph has a vertex of degree 1.
+    """
+    factor = _ONE
+    edges = list(edges)
+    while True:
+        loops = sum(1 for u, v in edges if u == v)
+        if loops:
+            factor = _poly_mul(factor, _poly_pow(_Q_MINUS_ONE, loops))
+            edges = [(u, v) for u, v in edges if u != v]
+
+        incident = defaultdict(list)
+        for i, (u, v) in enumerate(edges):
+            incident[u].append(i)
+            incident[v].append(i)
+        if any(len(e) == 1 for e in incident.values()):
+            return _ZERO, None
+        bivalent = next((v for v, e in incident.items() if len(e) == 2), None)
+        if bivalent is None:
+            return factor, edges
+        # merge the two edges at a bivalent vertex (possibly into a loop)
+        i, j = incident[bivalent]
+        u = edges[i][0] if edges[i][1] == bivalent else edges[i][1]
+        w = edges[j][0] if edges[j][1] == bivalent else edges[j][1]
+        edges = [e for k, e in enumerate(edges) if k != i and k != j] + [(u, w)]
+
+
+def _flow_polynomial(edges: list[tuple]) -> tuple:
+    """Return the flow polynomial of a multigraph as a tuple of integer coefficients in ``q``."""
+    factor, edges = _reduce(edges)
+    if edges is None:
+        return _ZERO
+    if not edges:
+        return factor
+
+    adjacency = _adjacency(edges)
+    blocks = _blocks(adjacency)
+    result = factor
+    for block in blocks:
+        if len(block) == 2 and adjacency[block[0]][block[1]] == 1:
+            return _ZERO  # bridge
+        if len(blocks) > 1:
+            block = set(block)
+            block_edges = [(u, v) for u, v in edges if u in block and v in block]
+        else:
+            block_edges = edges
+        result = _poly_mul(result, _block_flow_polynomial(block_edges))
+        if not result:
+            return _ZERO
+    return result
+
+
+def _block_flow_polynomial(edges: list[tuple]) -> tuple:
+    """Return the flow polynomial of a 2-connected loopless multigraph (cached by its canonical form)."""
+    adjacency = _adjacency(edges)
+    key = _canonical_form(adjacency)
+    value = _flow_cache.get(key)
+    if value is not None:
+        return value
+
+    # resolve all m parallel edges between u and v at once: F(G_m) = (q-1)^(m-1) F(G/uv) - F(G_(m-1)), F(G_0) = F(G-uv)
+    u, v = max(((u, v) for u in adjacency for v in adjacency[u]), key=lambda e: adjacency[e[0]][e[1]])
+    multiplicity = adjacency[u][v]
+    deleted = [e for e in edges if e != (u, v) and e != (v, u)]
+    contracted = [(u if a == v else a, u if b == v else b) for a, b in deleted]
+    value = _flow_polynomial(deleted)
+    contracted_value = _flow_polynomial(contracted)
+    for j in range(1, multiplicity + 1):
+        value = _poly_add(_poly_mul(_poly_pow(_Q_MINUS_ONE, j - 1), contracted_value), _poly_neg(value))
+
+    _flow_cache.set(key, value)
+    return value
+
+
+def _tutte_polynomial(edges: list[tuple]) -> dict:
+    """Return the Tutte polynomial of a multigraph as a dictionary ``{(i, j): coefficient}`` of monomials ``x^i y^j``."""
+    loops = sum(1 for u, v in edges if u == v)
+    result = {(0, loops): 1}
+    edges = [(u, v) for u, v in edges if u != v]
+    if not edges:
+        return result
+
+    adjacency = _adjacency(edges)
+    blocks = _blocks(adjacency)
+    bridges = 0
+    for block in blocks:
+        if len(block) == 2 and adjacency[block[0]][block[1]] == 1:
+            bridges += 1
+            continue
+        if len(blocks) > 1:
+            block = set(block)
+            block_edges = [(u, v) for u, v in edges if u in block and v in block]
+        else:
+            block_edges = edges
+        result = _bipoly_mul(result, _block_tutte_polynomial(block_edges))
+    return _bipoly_mul(result, {(bridges, 0): 1}) if bridges else result
+
+
+def _block_tutte_polynomial(edges: list[tuple]) -> dict:
+    """Return the Tutte polynomial of a 2-connected loopless multigraph (cached by its canonical form)."""
+    adjacency = _adjacency(edges)
+    degree = {v: sum(adjacency[v].values()) for v in adjacency}
+
+    if len(adjacency) == 2:  # m parallel edges: x + y + ... + y^(m-1)
+        return _bipoly_add({(1, 0): 1}, _geometric_sum(1, len(edges), 1))
+    if all(d == 2 for d in degree.values()):  # cycle: x + ... + x^(n-1) + y
+        return _bipoly_add(_geometric_sum(1, len(edges), 0), {(0, 1): 1})
+
+    key = _canonical_form(adjacency)
+    value = _tutte_cache.get(key)
+    if value is not None:
+        return value
+
+    bivalent = next((v for v in adjacency if degree[v] == 2), None)
+    if bivalent is not None:
+        # series path a - ... - b of length k: T = (1 + x + ... + x^(k-1)) T(G - path) + T(G - path / ab)
+        path, ends = {bivalent}, []
+        for start in adjacency[bivalent]:
+            previous, v = bivalent, start
+            while degree[v] == 2 and v not in path:
+                path.add(v)
+                previous, v = v, next(w for w in adjacency[v] if w != previous)
+            ends.append(v)
+        a, b = ends
+        deleted = [e for e in edges if e[0] not in path and e[1] not in path]
+        contracted = [(a if u == b else u, a if v == b else v) for u, v in deleted]
+        value = _bipoly_add(_bipoly_mul(_geometric_sum(0, len(path) + 1, 0), _tutte_polynomial(deleted)),
+                            _tutte_polynomial(contracted))
+    else:
+        # parallel class of m edges at a vertex of maximal degree: T = T(G - uv) + (1 + y + ... + y^(m-1)) T(G / uv)
+        u = max(adjacency, key=lambda w: (degree[w], -len(adjacency[w])))
+        v = max(adjacency[u], key=lambda w: (adjacency[u][w], degree[w]))
+        deleted = [e for e in edges if e != (u, v) and e != (v, u)]
+        contracted = [(u if a == v else a, u if b == v else b) for a, b in deleted]
+        value = _bipoly_add(_tutte_polynomial(deleted),
+                            _bipoly_mul(_geometric_sum(0, adjacency[u][v], 1), _tutte_polynomial(contracted)))
+
+    _tutte_cache.set(key, value)
+    return value
+
+
+if __name__ == "__main__":
+    pass
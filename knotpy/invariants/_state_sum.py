@@ -0,0 +1,247 @@
+# knotpy/invariants/_state_sum.py
+"""
+State sums over crossing smoothings, enumerated in Gray-code order.
+
+A diagram is reduced to a fixed *boundary graph*: the half-edges are the positions ``4 * i + p`` of the crossings
+(``i`` is the index of the crossing, ``p`` the position), each half-edge is joined by an arc to its twin (or to a
+terminal), and each smoothing of a crossing pairs its four half-edges. A smoothing may also place a cusp on each of
+its two strands, as the disoriented smoothings of the arrow polynomial do.
+
+States are enumerated in Gray-code order, so consecutive states differ by the smoothing of a single crossing. Only
+the (at most two) state components through the flipped crossing are retraced, and the states are accumulated by the
+multiset of their components and the exponent of the state into integer counts. The cusps of a component are
+counted by their reduced number ``|sum_i (-1)^i d_i|``, where ``d_i = ±1`` is the direction of the ``i``-th cusp
+along the component (consecutive cusps in the same direction cancel).
+
+The enumeration can be split on the leading state bits: fixing the smoothings of the first crossings gives disjoint
+parts of the state sum, which can be computed in parallel and added (see :func:`_parallel_smoothing_state_sum`).
+"""
+
+from __future__ import annotations
+
+__all__ = []
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from knotpy.classes.planardiagram import PlanarDiagram
+from knotpy.classes.node import Crossing
+
+_TERMINAL = -1  # twin of a half-edge joined to a terminal (a vertex of degree 1)
+
+
+@dataclass(frozen=True)
+class _BoundaryGraph:
+    """Fixed boundary graph of a diagram together with the smoothings of its crossings.
+
+    Attributes:
+        twin: ``twin[h]`` is the half-edge joined to ``h`` by an arc (or ``_TERMINAL``).
+        link: ``link[r][h]`` is the half-edge paired with ``h`` by the smoothing ``r`` (0 or 1) of its crossing.
+        cusp: ``cusp[r][h]`` is the direction (0 if none, ±1) of the cusp passed when walking from ``h`` to
+            ``link[r][h]``.
+        exponent: ``exponent[i][r]`` is the contribution of the smoothing ``r`` of the ``i``-th crossing to the
+            exponent of the state.
+        free_circles: Number of components without crossings that are closed curves.
+        free_segments: Number of components without crossings that join two terminals.
+    """
+    twin: tuple
+    link: tuple
+    cusp: tuple
+    exponent: tuple
+    free_circles: int
+    free_segments: int
+
+
+def _boundary_graph(k: PlanarDiagram, crossings: list, smoothings) -> _BoundaryGraph:
+    """Return the boundary graph of ``k``.
+
+    Args:
+        k: Diagram with crossings and vertices of degree 1 (terminals) or 2 (walked over).
+        crossings: The crossings of ``k`` in the order of the state bits.
+        smoothings: Function mapping a crossing to a pair of smoothings, each smoothing is a triple
+            ``(pairs, cusped, exponent)``, where ``pairs`` are the two pairs of joined positions, ``cusped`` tells if
+            the strands carry a cusp directed from the first to the second position of the pair, and ``exponent`` is
+            the contribution to the exponent of the state.
+
+    Raises:
+        ValueError: If the diagram has a vertex of degree larger than 2.
+    """
+    index = {c: i for i, c in enumerate(crossings)}
+    visited = set()
+
+    def _follow(ep):
+        # walk over bivalent vertices to the next crossing (or terminal)
+        while not isinstance(k.nodes[ep.node], Crossing):
+            degree = k.degree(ep.node)
+            visited.add(ep.node)
+            if degree == 1:
+                return _TERMINAL
+            if degree != 2:
+                raise ValueError(f"The state sum is not defined for vertices of degree {degree}")
+            ep = k.nodes[ep.node][1 - ep.position]
+        return 4 * index[ep.node] + ep.position
+
+    twin = [_follow(k.nodes[c][p]) for c in crossings for p in range(4)]
+
+    link = ([0] * len(twin), [0] * len(twin))
+    cusp = ([0] * len(twin), [0] * len(twin))
+    exponent = []
+    for i, c in enumerate(crossings):
+        exponents = []
+        for r, (pairs, cusped, e) in enumerate(smoothings(c)):
+            for p, q in pairs:
+                link[r][4 * i + p], link[r][4 * i + q] = 4 * i + q, 4 * i + p
+                if cusped:
+                    cusp[r][4 * i + p], cusp[r][4 * i + q] = 1, -1
+            exponents.append(e)
+        exponent.append(tuple(exponents))
+
+    # components without crossings
+    free_circles = free_segments = 0
+    for v in k.nodes:
+        if v in visited or isinstance(k.nodes[v], Crossing):
+            continue
+        degree = k.degree(v)
+        if degree > 2:
+            raise ValueError(f"The state sum is not defined for vertices of degree {degree}")
+        if degree == 0:
+            continue
+        # walk in both directions from v
+        visited.add(v)
+        is_segment = degree == 1
+        for position in range(degree):
+            ep = k.nodes[v][position]
+            while ep.node not in visited and k.degree(ep.node) == 2:
+                visited.add(ep.node)
+                ep = k.nodes[ep.node][1 - ep.position]
+            visited.add(ep.node)
+            is_segment = is_segment or k.degree(ep.node) == 1
+        if is_segment:
+            free_segments += 1
+        else:
+            free_circles += 1
+
+    return _BoundaryGraph(tuple(twin), (tuple(link[0]), tuple(link[1])), (tuple(cusp[0]), tuple(cusp[1])),
+                          tuple(exponent), free_circles, free_segments)
+
+
+def _smoothing_state_sum(graph: _BoundaryGraph, prefix: tuple = ()) -> dict:
+    """Return the state sum of a boundary graph.
+
+    Args:
+        graph: The boundary graph.
+        prefix: Fixed smoothings of the leading crossings, only the states extending the prefix are enumerated.
+
+    Returns:
+        dict: A dictionary ``{components: {exponent: count}}``, where ``components`` is a sorted tuple of triples
+        ``(closed, cusps, multiplicity)`` describing the components of the states (closed curves and segments with
+        the given reduced number of cusps), not including the components without crossings.
+    """
+    twin = graph.twin
+    number_of_crossings = len(graph.exponent)
+    state = list(prefix) + [0] * (number_of_crossings - len(prefix))
+    link = [graph.link[state[h >> 2]][h] for h in range(len(twin))]
+    cusp = [graph.cusp[state[h >> 2]][h] for h in range(len(twin))]
+    exponent = sum(graph.exponent[i][r] for i, r in enumerate(state))
+
+    component = [-1] * len(twin)  # half-edge -> component id
+    signature = {}  # component id -> (closed, cusps)
+    counts = defaultdict(int)  # (closed, cusps) -> number of components
+    new_id = 0
+
+    def _trace(h):
+        # find the start of the component through h (the first half-edge after a terminal, or h if closed)
+        g = h
+        while True:
+            previous = twin[g]
+            if previous == _TERMINAL:
+                start, closed = g, False
+                break
+            g = link[previous]
+            if g == h:
+                start, closed = h, True
+                break
+        # walk the component from the start and compute the reduced number of cusps
+        total, parity, g = 0, 1, start
+        while True:
+            component[g] = new_id
+            g2 = link[g]
+            component[g2] = new_id
+            if cusp[g]:
+                total += parity * cusp[g]
+                parity = -parity
+            g = twin[g2]
+            if g == _TERMINAL or g == start:
+                break
+        key = (closed, abs(total))
+        signature[new_id] = key
+        counts[key] += 1
+
+    for h in range(len(twin)):
+        if component[h] < 0:
+            _trace(h)
+            new_id += 1
+
+    result = defaultdict(lambda: defaultdict(int))
+    free = range(len(prefix), number_of_crossings)
+    for step in range(1 << len(free)):
+        if step:
+            # flip the crossing at the lowest set bit of the step (Gray code)
+            i = free[(step & -step).bit_length() - 1]
+            for c in {component[4 * i + p] for p in range(4)}:
+                key = signature.pop(c)
+                counts[key] -= 1
+                if not counts[key]:
+                    del counts[key]
+            r = state[i] = 1 - state[i]
+            exponent += graph.exponent[i][r] - graph.exponent[i][1 - r]
+            for h in range(4 * i, 4 * i + 4):
+                link[h], cusp[h] = graph.link[r][h], graph.cusp[r][h]
+                component[h] = -1
+            for h in range(4 * i, 4 * i + 4):
+                if component[h] < 0:
+                    _trace(h)
+                    new_id += 1
+        result[tuple(sorted((closed, cusps, m) for (closed, cusps), m in counts.items()))][exponent] += 1
+
+    return {key: dict(polynomial) for key, polynomial in result.items()}
+
+
+def _add_state_sums(results) -> dict:
+    """Return the sum of state sums given as dictionaries ``{components: {exponent: count}}``."""
+    total = defaultdict(lambda: defaultdict(int))
+    for result in results:
+        for key, polynomial in result.items():
+            for e, c in polynomial.items():
+                total[key][e] += c
+    return {key: dict(polynomial) for key, polynomial in total.items()}
+
+
+def _parallel_smoothing_state_sum(graph: _BoundaryGraph, workers: int | None = 1, prefix_length: int | None = None) -> dict:
+    """Return the state sum of a boundary graph, split on the leading state bits among worker processes.
+
+    Args:
+        graph: The boundary graph.
+        workers: Number of worker processes (``None`` or ``<= 0`` for the number of CPUs, ``1`` computes the sum in
+            the current process).
+        prefix_length: Number of leading crossings whose smoothings are fixed in each part (by default such that
+            there are at least four parts per worker).
+    """
+    if workers is None or workers <= 0:
+        workers = os.cpu_count() or 1
+    number_of_crossings = len(graph.exponent)
+    if workers == 1 or number_of_crossings < 8:
+        return _smoothing_state_sum(graph)
+    if prefix_length is None:
+        prefix_length = min(number_of_crossings - 4, (4 * workers - 1).bit_length())
+    prefixes = [tuple((bits >> j) & 1 for j in range(prefix_length)) for bits in range(1 << prefix_length)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _add_state_sums(executor.map(_smoothing_state_sum, [graph] * len(prefixes), prefixes))
+
+
+if __name__ == "__main__":
+    pass
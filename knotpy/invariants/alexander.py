@@ -19,7 +19,7 @@ from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
 from knotpy.invariants.homflypt import homflypt
 from knotpy.algorithms.orientation import orient
 from knotpy.algorithms.components_link import link_components_endpoints
-from knotpy.invariants.fundamental_group import fundamental_group, alexander_fox_matrix
+from knotpy.invariants.fundamental_group import group_presentation
 from knotpy.invariants._symbols import _t, _x, _y, _z, _T
 from knotpy.utils.laurent import normalize_symmetric,   normalize_laurent
 from knotpy.reidemeister.simplify import simplify_decreasing
@@ -48,9 +48,13 @@ def alexander(k: PlanarDiagram | OrientedPlanarDiagram, symmetric: bool = False)
         >>> # alexander(K)
         t**2 - t + 1
     """
-    polynomial = homflypt(k, variables="xyz")
+    return alexander_from_homflypt(homflypt(k, variables="xyz"), symmetric=symmetric)
+
+
+def alexander_from_homflypt(polynomial_xyz, symmetric: bool = False) -> sp.Expr:
+    """Compute the Alexander polynomial from the homflypt polynomial in variables xyz."""
     polynomial = sp.expand(
-        polynomial.subs(
+        polynomial_xyz.subs(
             {
                 _x: sp.Integer(1),
                 _y: sp.Integer(-1),
@@ -521,11 +525,17 @@ def minors(
 
 def multivariable_alexander(k: "PlanarDiagram | OrientedPlanarDiagram") -> sp.Expr:
     k = k.copy() if k.is_oriented() else orient(k)
-    G, eps_gen_dict = fundamental_group(k, return_dict=True)
-    A = alexander_fox_matrix(G)
+    # Tietze-reduced Wirtinger presentation (the elementary ideals of the Fox matrix are invariant under Tietze moves)
+    presentation, generator = group_presentation(k, simplify=True, return_dict=True)
 
+    # abelianization: each meridian maps to the variable of its component
     component_endpoints = link_components_endpoints(k)
-    M, variables = collapse_generators_by_components(A, eps_gen_dict, component_endpoints)
+    variables = [sp.symbols(f"t{i + 1}") for i in range(len(component_endpoints))]
+    abelianization = {generator[ep]: t for t, endpoints in zip(variables, component_endpoints) for ep in endpoints}
+    M = presentation.alexander_matrix(abelianization)
+    if M.rows < M.cols:
+        # removed trivial relators are zero rows, keep a square matrix for the (n-1)-minors
+        M = M.col_join(sp.zeros(M.cols - M.rows, M.cols))
 
     poly_gcd = stream_n_minus_1_minors_gcd(M, variables, method="bareiss", debug=False)
     if poly_gcd.is_zero:
@@ -1,6 +1,11 @@
 # knotpy/invariants/arrow.py
 """
 Arrow polynomial for knotoids (per Kauffman et al.).
+
+The state sum over oriented and disoriented smoothings is evaluated by the Gray-code engine of
+:mod:`knotpy.invariants._state_sum` on the fixed boundary graph of the diagram, so the diagram is never copied or
+smoothed. Each state is described by its components and their reduced numbers of cusps, which determine the
+variables ``K_i`` (closed components) and ``L_j`` (long components).
 """
 
 __all__ = ["arrow_polynomial"]
@@ -8,7 +13,9 @@ __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
 import sympy as sp
+from collections import defaultdict
 from itertools import product
+from math import comb
 
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
 from knotpy.algorithms.orientation import orient
@@ -18,6 +25,7 @@ from knotpy.classes.endpoint import OutgoingEndpoint
 from knotpy.algorithms.disjoint_union import add_unknot
 from knotpy.invariants.writhe import writhe
 from knotpy.invariants._symbols import _A
+from knotpy.invariants._state_sum import _boundary_graph, _parallel_smoothing_state_sum
 
 
 def disoriented_smoothing(k: OrientedPlanarDiagram, crossing) -> None:
@@ -170,15 +178,28 @@ def _generator_to_variables(k: PlanarDiagram) -> sp.Expr:
     return polynomial
 
 
+def _arrow_smoothings(k: OrientedPlanarDiagram, crossing):
+    """Return the oriented and the disoriented smoothing of a crossing for :func:`_boundary_graph`."""
+    node_inst = k.nodes[crossing]
+    same_type = node_inst[0].__class__ is node_inst[1].__class__
+    exponent = 1 if node_inst.sign() > 0 else -1  # the oriented smoothing is the "A" smoothing of a positive crossing
+    pos = 0 if same_type else 1  # see disoriented_smoothing
+    oriented = ((pos + 1, pos + 2), ((pos + 3) % 4, pos))
+    disoriented = ((pos, pos + 1), (pos + 2, (pos + 3) % 4))
+    return (oriented, False, exponent), (disoriented, True, -exponent)
+
+
 def arrow_polynomial(
     k: PlanarDiagram | OrientedPlanarDiagram,
     normalize: bool = True,
+    workers: int | None = 1,
 ) -> sp.Expr:
     """Compute the arrow polynomial of a knotoid (arXiv:1602.03579).
 
     Args:
         k: Planar diagram of a knotoid. If not oriented, it will be oriented internally.
         normalize: If True, multiply by ``(-A^3)^(-writhe)`` to ignore framing.
+        workers: Number of processes among which the states are split (``None`` or ``<= 0`` for the number of CPUs).
 
     Returns:
         A SymPy expression in ``A`` and formal variables ``K_i, L_j``.
@@ -188,6 +209,41 @@ def arrow_polynomial(
         opposite-acuteness cusps are reduced; each component contributes a factor as described in
         :func:`_generator_to_variables`.
     """
+    original_knot = k if k.is_oriented() else orient(k)
+    crossings = list(original_knot.crossings)
+
+    graph = _boundary_graph(original_knot, crossings, lambda c: _arrow_smoothings(original_knot, c))
+    state_sum = _parallel_smoothing_state_sum(graph, workers=workers)
+
+    # collect integer Laurent polynomials in A by the monomials in K_i, L_j
+    terms = defaultdict(lambda: defaultdict(int))
+    for components, polynomial in state_sum.items():
+        loops = graph.free_circles
+        variables = []
+        for closed, cusps, multiplicity in components:
+            if closed and not cusps:
+                loops += multiplicity
+            elif cusps:
+                variables += [f"{'K' if closed else 'L'}{cusps // 2}"] * multiplicity
+        # (-A^2 - A^-2)^loops = (-1)^loops sum_i binomial(loops, i) A^(2 loops - 4 i)
+        for e, c in polynomial.items():
+            for i in range(loops + 1):
+                terms[tuple(sorted(variables))][e + 2 * loops - 4 * i] += (-1) ** loops * comb(loops, i) * c
+
+    polynomial = sp.Add(*(c * _A ** e * sp.Mul(*(sp.Symbol(v) for v in variables))
+                          for variables, coefficients in terms.items() for e, c in coefficients.items() if c))
+
+    factor = (-_A**3) ** (-writhe(original_knot) if normalize else -original_knot.framing)
+    polynomial *= factor
+
+    return sp.expand(polynomial)
+
+
+def _naive_arrow_polynomial(
+    k: PlanarDiagram | OrientedPlanarDiagram,
+    normalize: bool = True,
+) -> sp.Expr:
+    """Compute the arrow polynomial by smoothing copies of the diagram for each state (for testing purposes)."""
     polynomial = sp.Integer(0)
 
     original_knot = k if k.is_oriented() else orient(k)
@@ -210,6 +266,5 @@ def arrow_polynomial(
 
     return sp.expand(polynomial)
 
-
 if __name__ == "__main__":
     pass
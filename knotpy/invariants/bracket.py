@@ -16,24 +16,108 @@ __all__ = ["bracket", "kauffman_bracket_skein_module"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
-from collections import deque
 import sympy as sp
 
 from knotpy.invariants.skein import smoothen_crossing
 from knotpy.invariants.writhe import writhe
 from knotpy.algorithms.orientation import unorient
 from knotpy.classes.planardiagram import PlanarDiagram
-from knotpy.algorithms.topology import is_empty_diagram, is_knot
-from knotpy.algorithms.remove import remove_unknots
+from knotpy.algorithms.topology import is_knot
 from knotpy.utils.module import Module
 from knotpy.algorithms.canonical import canonical
 from knotpy.reidemeister.simplify import simplify_decreasing
-from knotpy.invariants.cache import Cache
+from knotpy.invariants.cache import LRUCache
+from knotpy.invariants.homflypt import _memoized_skein_sum
+from knotpy.classes.freezing import freeze
 from knotpy._settings import settings
 from knotpy.invariants._symbols import _A, _KAUFFMAN_TERM, _x, _y, _z
+from knotpy.invariants._evaluation import _PointValue, _evaluate_expression
 
-_USE_JONES_CACHE = False
-_KBSM_cache = Cache(max_number_of_nodes=5, cache_size=10000)
+# (unnormalized) brackets and skein module elements of framing-0 sub-diagrams in state sums
+_bracket_skein_cache = LRUCache(max_number_of_nodes=12, max_size=200000, size=lambda p: len(sp.Add.make_args(p)),
+                                name="bracket_skein")
+_KBSM_cache = LRUCache(max_number_of_nodes=12, max_size=200000, size=len, name="kbsm")
+_MIN_MEMOIZED_NODES = 11  # smaller state sums are faster without memoization
+
+
+class _SkeinElement:
+    """Linear combination of crossingless (frozen, canonical) diagrams, the values of skein module state sums."""
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: dict):
+        self.terms = terms
+
+    def __add__(self, other):
+        if not isinstance(other, _SkeinElement):
+            if other == 0:
+                return self
+            return NotImplemented
+        terms = dict(self.terms)
+        for s, r in other.terms.items():
+            terms[s] = terms[s] + r if s in terms else r
+        return _SkeinElement(terms)
+
+    __radd__ = __add__
+
+    def __mul__(self, r):
+        return _SkeinElement({s: coeff * r for s, coeff in self.terms.items()})
+
+    __rmul__ = __mul__
+
+    def expand(self) -> "_SkeinElement":
+        terms = {s: sp.expand(r) for s, r in self.terms.items()}
+        return _SkeinElement({s: r for s, r in terms.items() if r != 0})
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+
+def _max_cached_nodes(k: PlanarDiagram, cache: LRUCache) -> int:
+    """Return the size of the largest sub-diagrams worth memoizing in a state sum of ``k``.
+
+    Sub-diagrams of the size of the input rarely repeat, while the smallest ones repeat often but are cheap to expand.
+    The limit grows with the input, but is at most ``cache.max_number_of_nodes``. Diagrams with fewer than
+    ``_MIN_MEMOIZED_NODES`` nodes are not memoized, since computing the canonical forms of their sub-diagrams takes about
+    as long as expanding them.
+
+    Diagrams with vertices of degree three or more are not memoized, since the half-twist framings of R5 moves depend
+    on the order of simplifications, so the value of a sub-diagram is not determined by its canonical form.
+    """
+    if len(k) < _MIN_MEMOIZED_NODES or any(len(k.nodes[v]) > 2 for v in k.vertices):
+        return 0
+    return min(cache.max_number_of_nodes, len(k) - 2)
+
+
+def _bracket_state_sum(k: PlanarDiagram, A, kauffman_term, cache: LRUCache, empty=None):
+    """Evaluate the bracket state sum of ``k``, memoizing sub-diagrams (normalized to framing 0) in ``cache``.
+
+    If ``empty`` is ``None``, the value of ``k`` is the (unnormalized) bracket, otherwise it is the skein module element
+    with crossingless diagrams (and ``empty`` for the empty diagram) as the basis.
+    """
+
+    max_number_of_nodes = _max_cached_nodes(k, cache)
+
+    def _reduce(k):
+        k = simplify_decreasing(k, inplace=True)
+        if not max_number_of_nodes and k.crossings:
+            return k, A ** 0  # the (half-integer) framing is accounted for in crossingless diagrams
+        factor = (-A ** 3) ** (-k.framing)
+        k.framing = 0
+        return k, factor
+
+    def _expand(k):
+        if not k.crossings:
+            if empty is None:
+                raise ValueError("Obtained non-empty diagram after removing all crossings.")
+            return _SkeinElement({freeze(canonical(k)): A ** 0}), []
+        crossing = next(iter(k.crossings))
+        kA = smoothen_crossing(k, crossing_for_smoothing=crossing, method="A")
+        kB = smoothen_crossing(k, crossing_for_smoothing=crossing, method="B")
+        return A ** 0, [(A, kA), (A ** -1, kB)]
+
+    return _memoized_skein_sum(k, _reduce, _expand, kauffman_term, cache, empty=empty,
+                               max_number_of_nodes=max_number_of_nodes)
 
 
 def lowest_exponent(laurent_polynomial: sp.Expr, variable: sp.Symbol) -> int:
@@ -70,36 +154,21 @@ def kauffman_bracket_skein_module(
     is_single_knot = is_knot(k)
     original_framing = k.framing if k.is_framed() else 0
     original_knot = k
-    expression = Module()
-    stack = deque()
 
     k = unorient(k) if k.is_oriented() else k.copy()
     if not k.is_framed():
         k.framing = 0
 
-    stack.append((sp.Integer(1), k))
-
-    while stack:
-        coeff, k = stack.pop()
-        simplify_decreasing(k, inplace=True)
+    # the empty diagram is a basis element of the module
+    empty = k.copy()
+    empty.remove_nodes_from(list(empty.nodes))
+    empty.framing = 0
+    value = _bracket_state_sum(k, _A, _KAUFFMAN_TERM, _KBSM_cache,
+                               empty=_SkeinElement({freeze(canonical(empty)): sp.Integer(1)}))
 
-        if k.crossings:
-            crossing = next(iter(k.crossings))
-            kA = smoothen_crossing(k, crossing_for_smoothing=crossing, method="A")
-            kB = smoothen_crossing(k, crossing_for_smoothing=crossing, method="B")
-            stack.append((coeff * _A, kA))
-            stack.append((coeff * (_A**-1), kB))
-        else:
-            number_of_unknots = remove_unknots(k)
-            framing = k.framing
-            k_canonical = canonical(k)
-            k_canonical.framing = 0
-            expression += (
-                coeff
-                * (_KAUFFMAN_TERM**number_of_unknots)
-                * ((- _A**3) ** (-framing)),
-                k_canonical,
-            )
+    expression = Module()
+    for s, r in value.terms.items():
+        expression += (r, s.copy())
 
     if normalize:
         if is_single_knot:
@@ -127,24 +196,8 @@ def bracket_from_homflypt(polynomial_xyz) -> sp.Expr:
     return polynomial_xyz
 
 
-def bracket(k: PlanarDiagram, normalize: bool = True) -> sp.Expr:
-    """Compute the Kauffman bracket polynomial ⟨·⟩.
-
-    Defined by:
-        1. ⟨U⟩ = 1.
-        2. ⟨L_X⟩ = A⟨L_0⟩ + A⁻¹⟨L_∞⟩.
-        3. ⟨L ⊔ U⟩ = (−A² − A⁻²)⟨L⟩.
-
-    Args:
-        k: Planar diagram.
-        normalize: If True, multiply by factor ``(-A³)^{-wr(k)}`` (ignore framing).
-
-    Returns:
-        Laurent polynomial in variable ``A``.
-
-    Raises:
-        ValueError: If unknot removal yields a non-empty diagram.
-    """
+def _bracket(k: PlanarDiagram, normalize: bool, A) -> sp.Expr | _PointValue:
+    """Compute the bracket polynomial with the variable ``A`` being either the symbol ``A`` or a point value."""
 
     # try do compute the bracket polynomial from the precomputed homflypt polynomial
     from knotpy.tables.knot import knot_precomputed_homflypt
@@ -156,7 +209,7 @@ def bracket(k: PlanarDiagram, normalize: bool = True) -> sp.Expr:
             polynomial *= (-_A ** -3) ** (-original_framing)  # reverse
         else:
             polynomial *= (-_A ** -3) ** (-original_framing - writhe(k))  # reverse
-        return sp.expand(polynomial)
+        return sp.expand(polynomial) if A is _A else _evaluate_expression(polynomial, {_A: A})
 
 
     settings_dump = settings.dump()
@@ -166,41 +219,59 @@ def bracket(k: PlanarDiagram, normalize: bool = True) -> sp.Expr:
     if k.is_oriented():
         k = unorient(k)
 
-    polynomial = sp.Integer(0)
-    stack = deque()
     k = unorient(k) if k.is_oriented() else k.copy()
     if not k.is_framed():
         k.framing = 0
 
-    stack.append((sp.Integer(1), k))
-
-    while stack:
-        coeff, k = stack.pop()
-        simplify_decreasing(k, inplace=True)
-
-        if k.crossings:
-            crossing = next(iter(k.crossings))
-            kA = smoothen_crossing(k, crossing_for_smoothing=crossing, method="A")
-            kB = smoothen_crossing(k, crossing_for_smoothing=crossing, method="B")
-            stack.append((coeff * _A, kA))
-            stack.append((coeff * (_A**-1), kB))
-        else:
-            number_of_unknots = remove_unknots(k)
-            if not is_empty_diagram(k):
-                raise ValueError("Obtained non-empty diagram after removing all crossings.")
-            polynomial += coeff * (_KAUFFMAN_TERM ** (number_of_unknots - 1)) * (
-                (-_A**3) ** (-k.framing)
-            )
+    if A is _A:
+        polynomial = _bracket_state_sum(k, A, _KAUFFMAN_TERM, _bracket_skein_cache)
+    else:
+        polynomial = _bracket_state_sum(k, A, -A ** 2 - A ** -2, LRUCache(_bracket_skein_cache.max_number_of_nodes))
 
     original_framing = original_knot.framing if original_knot.is_framed() else 0
 
     if normalize:
-        polynomial *= (-_A**-3) ** (writhe(original_knot) + original_framing)
+        polynomial *= (-A**-3) ** (writhe(original_knot) + original_framing)
     else:
-        polynomial *= (-_A**-3) ** original_framing
+        polynomial *= (-A**-3) ** original_framing
 
     settings.load(settings_dump)
-    return sp.expand(polynomial)
+    return sp.expand(polynomial) if A is _A else polynomial
+
+
+def bracket(k: PlanarDiagram, normalize: bool = True, evaluate_at=None, modulus: int | None = None) -> sp.Expr:
+    """Compute the Kauffman bracket polynomial ⟨·⟩.
+
+    Defined by:
+        1. ⟨U⟩ = 1.
+        2. ⟨L_X⟩ = A⟨L_0⟩ + A⁻¹⟨L_∞⟩.
+        3. ⟨L ⊔ U⟩ = (−A² − A⁻²)⟨L⟩.
+
+    Args:
+        k: Planar diagram.
+        normalize: If True, multiply by factor ``(-A³)^{-wr(k)}`` (ignore framing).
+        evaluate_at: If given, the state sum is computed numerically at ``A = evaluate_at`` instead of symbolically.
+            The value can be an integer, a fraction, a float or complex number, or a sequence of such values, in
+            which case all points are evaluated at once (vectorized with NumPy).
+        modulus: If given (together with ``evaluate_at``), the evaluation is computed modulo ``modulus``.
+
+    Returns:
+        Laurent polynomial in variable ``A``, or its value(s) at ``evaluate_at``.
+
+    Raises:
+        ValueError: If unknot removal yields a non-empty diagram, or a modulus is given without evaluation points.
+
+    Examples:
+        >>> bracket(knot("3_1"), evaluate_at=2)
+        Fraction(4111, 65536)
+        >>> bracket(knot("3_1"), evaluate_at=[2, 3], modulus=101)
+        array([80, 10])
+    """
+    if evaluate_at is None:
+        if modulus is not None:
+            raise ValueError("The modulus can only be used together with evaluation points")
+        return _bracket(k, normalize=normalize, A=_A)
+    return _bracket(k, normalize=normalize, A=_PointValue.variable(evaluate_at, modulus)).value()
 
 
 if __name__ == "__main__":
@@ -1,103 +1,87 @@
 # knotpy/invariants/cache.py
 """
-Lightweight LFU cache with an optional size cap.
+LFU and LRU caches of invariant values with optional size caps.
 
 Notes:
     - Only keys with ``len(key) <= max_number_of_nodes`` are cached.
     - On cache miss, :meth:`get` returns ``None`` (even if a cached value could be ``None``).
       If you need to distinguish, wrap your values or add a sentinel in the caller.
 
-This is intentionally minimal; O(n) eviction via a linear scan is acceptable for small caches.
+Both caches are thin wrappers around :class:`knotpy.utils.cache.BoundedCache`, so all operations (including eviction)
+are O(1), thread-safe and counted in :func:`knotpy.utils.cache.cache_stats`.
 """
 
 from __future__ import annotations
 
-from collections.abc import Sized
-from typing import TypeVar, Generic, Protocol, runtime_checkable
+from collections.abc import Callable
 
-__all__ = ["Cache"]
-__version__ = "1.0"
+from knotpy.utils.cache import BoundedCache
+
+__all__ = ["Cache", "LRUCache"]
+__version__ = "1.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
 
-@runtime_checkable
-class _Hashable(Protocol):
-    def __hash__(self) -> int: ...
+class Cache(BoundedCache):
+    """Least-frequently-used (LFU) cache with an optional capacity.
 
+    Args:
+        max_number_of_nodes: Only cache keys with ``len(key) <= max_number_of_nodes``.
+        cache_size: Maximum number of entries to keep. If ``None``, the cache grows without limit.
+        name: If given, the cache is registered for :func:`knotpy.utils.cache.cache_stats` under this name.
 
-@runtime_checkable
-class HashableSized(_Hashable, Sized, Protocol):
-    """Protocol for keys that are both hashable and have a length."""
+    Attributes:
+        cache_size: The capacity limit or ``None``.
+        max_number_of_nodes: Maximum allowed ``len(key)`` to be cached.
 
+    Notes:
+        - Eviction policy is LFU using frequency buckets. Ties are broken by evicting the oldest entry.
+        - Updating an existing key bumps its usage counter by 1.
+    """
 
-K = TypeVar("K", bound=HashableSized)
-V = TypeVar("V")
+    def __init__(self, max_number_of_nodes: int, cache_size: int | None = None, name: str | None = None) -> None:
+        super().__init__(max_entries=cache_size, max_key_length=max_number_of_nodes, policy="lfu", name=name)
 
+    @property
+    def cache_size(self) -> int | None:
+        return self.max_entries
 
-class Cache(Generic[K, V]):
-    """Least-frequently-used (LFU) cache with an optional capacity.
+    @property
+    def max_number_of_nodes(self) -> int:
+        return self.max_key_length
+
+
+class LRUCache(BoundedCache):
+    """Least-recently-used (LRU) cache bounded by the total size of the cached values.
 
     Args:
-        max_number_of_nodes: Only cache keys with ``len(key) <= max_number_of_nodes``.
-        cache_size: Maximum number of entries to keep. If ``None``, the cache grows without limit.
+        max_number_of_nodes: Only cache keys with ``len(key) <= max_number_of_nodes`` (``None`` for no limit).
+        max_size: Maximum total size of the cached values. If ``None``, the cache grows without limit.
+        size: Callable returning the size of a value (each value has size 1 by default).
+        name: If given, the cache is registered for :func:`knotpy.utils.cache.cache_stats` under this name.
 
     Attributes:
-        cache_size: The capacity limit or ``None``.
-        max_number_of_nodes: Maximum allowed ``len(key)`` to be cached.
+        hits: Number of successful lookups.
+        misses: Number of failed lookups.
+        evictions: Number of evicted entries.
+        total_size: Total size of the cached values.
 
     Notes:
-        - Eviction policy is LFU using a simple usage counter. Tie-breaking is arbitrary.
-        - Updating an existing key bumps its usage counter by 1 (preserves your original behavior).
+        Values larger than ``max_size`` are not cached.
     """
 
-    def __init__(self, max_number_of_nodes: int, cache_size: int | None = None) -> None:
-        self.cache_size = cache_size
-        self.cache: dict[K, V] = {}
-        self.usage_count: dict[K, int] = {}
-        self.max_number_of_nodes = max_number_of_nodes
-
-    def get(self, key: K) -> V | None:
-        """Return the cached value for ``key`` and increment its usage, or ``None`` if missing."""
-        if key in self.cache:
-            self.usage_count[key] += 1
-            return self.cache[key]
-        return None
-
-    def set(self, key: K, value: V) -> None:
-        """Insert or update ``key`` with ``value``, enforcing LFU eviction if at capacity.
-
-        Keys with ``len(key) > max_number_of_nodes`` are ignored (not cached).
-        """
-        # Respect length cap
-        if len(key) > self.max_number_of_nodes:
-            return
-
-        if key in self.cache:
-            self.cache[key] = value
-            self.usage_count[key] += 1
-            return
-
-        # Evict if needed
-        if self.cache_size is not None and len(self.cache) >= self.cache_size:
-            # Least frequently used key (O(n) scan)
-            least_frequent_key = min(self.usage_count, key=self.usage_count.get)
-            del self.cache[least_frequent_key]
-            del self.usage_count[least_frequent_key]
-
-        self.cache[key] = value
-        self.usage_count[key] = 1
-
-    # Small quality-of-life helpers (don’t change existing API)
-    def __contains__(self, key: K) -> bool:
-        return key in self.cache
-
-    def __len__(self) -> int:
-        return len(self.cache)
-
-    def clear(self) -> None:
-        """Remove all entries."""
-        self.cache.clear()
-        self.usage_count.clear()
+    def __init__(self, max_number_of_nodes: int | None = None, max_size: int | None = None,
+                 size: Callable[[object], int] | None = None, name: str | None = None) -> None:
+        super().__init__(max_key_length=max_number_of_nodes, policy="lru", max_total_size=max_size, size=size,
+                         name=name)
+
+    @property
+    def max_number_of_nodes(self) -> int | None:
+        return self.max_key_length
+
+    @property
+    def max_size(self) -> int | None:
+        return self.max_total_size
 
 
 if __name__ == "__main__":
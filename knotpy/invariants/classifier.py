@@ -9,6 +9,7 @@ from typing import Callable, Iterable, Mapping, Any
 
 from tqdm import tqdm
 from knotpy.tables.invariant_writer import save_invariant_table
+from knotpy.invariants.invariant_set import InvariantSet
 
 
 # --- Helpers (single-invariant) ------------------------------------------------
@@ -33,23 +34,30 @@ def _save_key_single(args: tuple[Any, Callable[[Any], Any], Path]) -> None:
 
 
 # --- Helpers (multi-invariant) -------------------------------------------------
-def _compute_key_multi(
-    args: tuple[Any, Mapping[str, Callable[[Any], Any]]]
-) -> tuple[tuple[tuple[str, Any], ...] | None, Any]:
-    """Compute multiple invariants; return (key-tuple, diagram) or (None, diagram) on error."""
-    k, invariant_funcs = args
+# the invariant set of a worker process, built once per worker (see _init_worker)
+_INVARIANT_SET: InvariantSet | None = None
+
+
+def _init_worker(invariant_funcs: Mapping[str, Callable[[Any], Any]]) -> None:
+    """Build the invariant set of a worker process."""
+    global _INVARIANT_SET
+    _INVARIANT_SET = InvariantSet(invariant_funcs)
+
+
+def _compute_key_multi(k: Any) -> tuple[tuple[tuple[str, Any], ...] | None, Any]:
+    """Compute multiple invariants of the worker; return (key-tuple, diagram) or (None, diagram) on error."""
     try:
-        key = tuple((name, func(k)) for name, func in invariant_funcs.items())
+        key = tuple(_INVARIANT_SET.compute(k).items())
         return key, k
     except Exception:
         return None, k
 
 
-def _save_key_multi(args: tuple[Any, Mapping[str, Callable[[Any], Any]], Path]) -> None:
-    """Compute multiple invariants and save to a per-diagram file in a directory."""
-    k, invariant_funcs, path = args
+def _save_key_multi(args: tuple[Any, Path]) -> None:
+    """Compute multiple invariants of the worker and save to a per-diagram file in a directory."""
+    k, path = args
     try:
-        key = tuple((name, func(k)) for name, func in invariant_funcs.items())
+        key = tuple(_INVARIANT_SET.compute(k).items())
         filename = path / f"{k.name}.json" if hasattr(k, "name") else path / "unnamed.json"
         save_invariant_table(filename=filename, table=[{"diagram": k} | dict(key)])
     except Exception:
@@ -85,8 +93,11 @@ def group_by_invariants(
     is_single = callable(invariant_funcs)
 
     if parallel:
-        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
-            args = [(d, invariant_funcs) for d in diagrams]
+        # the invariant set is built once per worker
+        initializer, initargs = (None, ()) if is_single else (_init_worker, (invariant_funcs,))
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), initializer=initializer,
+                                 initargs=initargs) as executor:
+            args = [(d, invariant_funcs) if is_single else d for d in diagrams]
             submit_fn = _compute_key_single if is_single else _compute_key_multi
             futures = [executor.submit(submit_fn, arg) for arg in args]
 
@@ -97,15 +108,13 @@ def group_by_invariants(
                         grouped[key].append(diagram)
                     pbar.update(1)
     else:
+        invariant_set = None if is_single else InvariantSet(invariant_funcs)  # type: ignore[arg-type]
         for diagram in tqdm(list(diagrams), desc="Computing invariants", unit="item"):
             try:
                 if is_single:
                     key = invariant_funcs(diagram)  # type: ignore[misc]
                 else:
-                    key = tuple(
-                        (name, func(diagram))  # type: ignore[union-attr]
-                        for name, func in invariant_funcs.items()  # type: ignore[union-attr]
-                    )
+                    key = tuple(invariant_set.compute(diagram).items())
                 grouped[key].append(diagram)
             except Exception:
                 pass  # optionally log
@@ -145,8 +154,10 @@ def save_invariants(
     if parallel:
         if not save_path.is_dir():
             raise ValueError("For parallel=True, 'path' must be an existing directory.")
-        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
-            args = [(d, invariant_funcs, save_path) for d in diagrams]
+        initializer, initargs = (None, ()) if is_single else (_init_worker, (invariant_funcs,))
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), initializer=initializer,
+                                 initargs=initargs) as executor:
+            args = [(d, invariant_funcs, save_path) if is_single else (d, save_path) for d in diagrams]
             submit_fn = _save_key_single if is_single else _save_key_multi
             futures = [executor.submit(submit_fn, arg) for arg in args]
             with tqdm(total=len(futures), desc="Computing invariants", unit="item") as pbar:
@@ -157,16 +168,14 @@ def save_invariants(
             raise ValueError("For parallel=False, 'path' must be a file (not a directory).")
 
         table: list[dict[str, Any]] = []
+        invariant_set = None if is_single else InvariantSet(invariant_funcs)  # type: ignore[arg-type]
         for diagram in tqdm(list(diagrams), desc="Computing invariants", unit="item"):
             try:
                 if is_single:
                     value = invariant_funcs(diagram)  # type: ignore[misc]
                     table.append({"diagram": diagram, "value": value})
                 else:
-                    key = tuple(
-                        (name, func(diagram))  # type: ignore[union-attr]
-                        for name, func in invariant_funcs.items()  # type: ignore[union-attr]
-                    )
+                    key = tuple(invariant_set.compute(diagram).items())
                     table.append({"diagram": diagram} | dict(key))
             except Exception:
                 pass  # optionally log
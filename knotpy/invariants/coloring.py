@@ -1,22 +1,425 @@
-__all__ = ["conway"]
-__version__ = "0.1"
+"""
+Colorings of knot and link diagrams.
+
+- Fox n-colorings: arcs are colored by Z/n, so that at every crossing twice the color of the over-arc equals the sum
+  of the colors of the two under-arcs.
+- Dehn n-colorings: faces are colored by Z/n, so that at every crossing the two faces on one side of the over-arc
+  sum to the same value as the two faces on the other side.
+- Quandle colorings: arcs of an oriented diagram are colored by the elements of a finite quandle given by its
+  operation table.
+
+Fox and Dehn colorings are counted in polynomial time from the invariant factors (Smith normal form) of the
+coloring matrix: if the matrix has nonzero invariant factors d_1, ..., d_r and m columns, the number of
+n-colorings is n^(m - r) * gcd(d_1, n) * ... * gcd(d_r, n). The Smith normal form is computed once per diagram,
+so counting over many moduli is cheap. Explicit colorings are enumerated by propagating the crossing relations.
+"""
+
+from __future__ import annotations
+
+__all__ = ["coloring_matrix", "number_of_colorings", "colorings", "tricolorable", "number_of_dehn_colorings",
+           "coloring_numbers", "quandle_colorings", "number_of_quandle_colorings", "dihedral_quandle",
+           "alexander_quandle"]
+__version__ = "0.2"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
-from collections import deque
+from math import gcd, prod
+from typing import Iterable, Iterator, Sequence
 
-from knotpy.classes.planardiagram import Diagram
-from knotpy.algorithms.attributes import clear_endpoint_attributes
+import sympy as sp
 
+from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
+from knotpy.classes.endpoint import IngoingEndpoint
+from knotpy.algorithms.orientation import orient
+from knotpy.algorithms.disjoint_union import disjoint_union_decomposition, number_of_disjoint_components
+from knotpy.invariants.goeritz import _face_corners
+from knotpy.utils.disjoint_union_set import DisjointSetUnion
+from knotpy.utils.integer_matrix import smith_normal_form_diagonal
 
-def tricolorable(k:Diagram) -> int:
-    pass
 
-def colorings(k:Diagram, n:int):
-    k = k.copy()
-    clear_endpoint_attributes(k, "color")
-    stack = deque([k])
-    nodes = list(k.nodes)
-    for n in nodes:
-        pass
+def _arcs(k: PlanarDiagram | OrientedPlanarDiagram) -> tuple[dict, int]:
+    """Return the dictionary mapping ``(node, position)`` to the index of its arc, and the number of arcs.
+
+    An arc runs from an undercrossing to the next undercrossing, passing over crossings and through bivalent vertices.
+
+    Raises:
+        ValueError: If the diagram contains virtual crossings or vertices of degree other than two.
+    """
+    if k.virtual_crossings:
+        raise ValueError("Colorings are not defined for virtual diagrams")
+    if any(len(k.nodes[v]) != 2 for v in k.vertices):
+        raise ValueError("Colorings are defined only for knot and link diagrams")
+
+    dsu = DisjointSetUnion((node, pos) for node in k.nodes for pos in range(len(k.nodes[node])))
+    for ep1, ep2 in k.arcs:
+        dsu.union((ep1.node, ep1.position), (ep2.node, ep2.position))
+    for c in k.crossings:
+        dsu.union((c, 1), (c, 3))
+    for v in k.vertices:
+        dsu.union((v, 0), (v, 1))
+
+    # enumerate arcs in the order of nodes
+    index = {}
+    arc = {}
+    for node in k.nodes:
+        for pos in range(len(k.nodes[node])):
+            root = dsu.find((node, pos))
+            arc[(node, pos)] = index.setdefault(root, len(index))
+    return arc, len(index)
+
+
+def _count_from_invariant_factors(factors: Sequence[int], number_of_columns: int, n: int) -> int:
+    """Return the number of solutions in (Z/n)^m of the system given by the invariant factors of its matrix."""
+    if n < 1:
+        raise ValueError(f"The modulus should be a positive integer (got {n})")
+    nonzero = [d for d in factors if d]
+    return n ** (number_of_columns - len(nonzero)) * prod(gcd(d, n) for d in nonzero)
+
+
+def _fox_matrix_rows(k: PlanarDiagram | OrientedPlanarDiagram) -> tuple[list[list[int]], int]:
+    """Return the Fox coloring matrix as integer rows (one row per crossing) and the number of arcs."""
+    arc, number_of_arcs = _arcs(k)
+    rows = []
+    for c in k.crossings:
+        row = [0] * number_of_arcs
+        row[arc[(c, 1)]] += 2
+        row[arc[(c, 0)]] -= 1
+        row[arc[(c, 2)]] -= 1
+        rows.append(row)
+    return rows, number_of_arcs
+
+
+def coloring_matrix(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Matrix:
+    """Return the Fox coloring matrix of a knot or link diagram.
+
+    Rows correspond to crossings and columns to arcs. The row of a crossing with over-arc ``o`` and under-arcs
+    ``u``, ``v`` encodes the relation ``2o - u - v = 0``.
+
+    Args:
+        k: Knot or link diagram.
+
+    Returns:
+        sympy.Matrix: The integer coloring matrix.
+
+    Raises:
+        ValueError: If the diagram contains virtual crossings or vertices of degree other than two.
+    """
+    rows, number_of_arcs = _fox_matrix_rows(k)
+    return sp.Matrix(len(rows), number_of_arcs, [x for row in rows for x in row])
+
+
+def number_of_colorings(k: PlanarDiagram | OrientedPlanarDiagram, n: int | Iterable[int] = 3) -> int | dict:
+    """Return the number of Fox n-colorings of a knot or link diagram.
+
+    The count includes the ``n`` trivial (monochromatic) colorings. It is computed in polynomial time from the Smith
+    normal form of the coloring matrix, which is computed only once if several moduli are given.
+
+    Args:
+        k: Knot or link diagram.
+        n: The modulus or an iterable of moduli.
+
+    Returns:
+        int | dict: The number of n-colorings, or a dictionary ``{n: number of n-colorings}`` if several moduli are
+        given.
+
+    Raises:
+        ValueError: If a modulus is not positive, or the diagram is not a classical knot or link diagram.
+
+    Examples:
+        >>> number_of_colorings(knot("3_1"), 3)
+        9
+        >>> number_of_colorings(knot("4_1"), [3, 5])
+        {3: 3, 5: 25}
+    """
+    rows, number_of_arcs = _fox_matrix_rows(k)
+    factors = smith_normal_form_diagonal(rows)
+    if isinstance(n, int):
+        return _count_from_invariant_factors(factors, number_of_arcs, n)
+    return {n_: _count_from_invariant_factors(factors, number_of_arcs, n_) for n_ in n}
+
+
+def tricolorable(k: PlanarDiagram | OrientedPlanarDiagram) -> bool:
+    """Return True if the diagram admits a non-trivial Fox 3-coloring.
+
+    Args:
+        k: Knot or link diagram.
+
+    Returns:
+        bool: True if there exists a coloring using more than one color.
+    """
+    return number_of_colorings(k, 3) > 3
+
+
+def number_of_dehn_colorings(k: PlanarDiagram | OrientedPlanarDiagram, n: int | Iterable[int] = 3) -> int | dict:
+    """Return the number of Dehn n-colorings (colorings of faces) of a knot or link diagram.
+
+    At each crossing, the sum of the colors of the two faces on one side of the over-arc must equal the sum of the
+    colors of the two faces on the other side. The number of Dehn n-colorings is ``n`` times the number of Fox
+    n-colorings.
+
+    Args:
+        k: Knot or link diagram.
+        n: The modulus or an iterable of moduli.
+
+    Returns:
+        int | dict: The number of Dehn n-colorings, or a dictionary ``{n: number of colorings}`` if several moduli
+        are given.
+
+    Raises:
+        ValueError: If a modulus is not positive, or the diagram is not a classical knot or link diagram.
+    """
+    moduli = [n] if isinstance(n, int) else list(n)
+
+    if number_of_disjoint_components(k) > 1:
+        # the color of the outer face is shared by all split components
+        counts = [number_of_dehn_colorings(d, moduli) for d in disjoint_union_decomposition(k)]
+        result = {n_: n_ * prod(c[n_] // n_ for c in counts) for n_ in moduli}
+    else:
+        _arcs(k)  # validates the diagram
+        corner = _face_corners(k)
+        number_of_faces = len(set(corner.values()))
+        rows = []
+        for c in k.crossings:
+            row = [0] * number_of_faces
+            row[corner[(c, 0)]] += 1
+            row[corner[(c, 1)]] += 1
+            row[corner[(c, 2)]] -= 1
+            row[corner[(c, 3)]] -= 1
+            rows.append(row)
+        factors = smith_normal_form_diagonal(rows)
+        result = {n_: _count_from_invariant_factors(factors, number_of_faces, n_) for n_ in moduli}
+
+    return result[n] if isinstance(n, int) else result
+
+
+def coloring_numbers(diagrams: Iterable[PlanarDiagram | OrientedPlanarDiagram], moduli: Iterable[int],
+                     as_array: bool = False):
+    """Return the numbers of Fox colorings of many diagrams for many moduli.
+
+    The Smith normal form of each coloring matrix is computed once; the counts for all moduli are then obtained from
+    the invariant factors. This is intended for bulk scoring of (census) diagrams.
+
+    Args:
+        diagrams: Iterable of knot or link diagrams.
+        moduli: Iterable of positive moduli.
+        as_array: If True, return a NumPy array (requires NumPy) of shape ``(len(diagrams), len(moduli))``, where
+            the counts for all moduli are evaluated with vectorized gcd operations.
 
+    Returns:
+        list[list[int]] | numpy.ndarray: Row ``i`` contains the numbers of colorings of the ``i``-th diagram.
+    """
+    moduli = list(moduli)
+    data = []
+    for k in diagrams:
+        rows, number_of_arcs = _fox_matrix_rows(k)
+        nonzero = [d for d in smith_normal_form_diagonal(rows) if d]
+        data.append((nonzero, number_of_arcs - len(nonzero)))
 
+    if not as_array:
+        return [[_count_from_invariant_factors(factors, free + len(factors), n) for n in moduli]
+                for factors, free in data]
+
+    import numpy as np
+
+    n = np.array(moduli, dtype=object)
+    result = np.empty((len(data), len(moduli)), dtype=object)
+    for i, (factors, free) in enumerate(data):
+        counts = n ** free
+        if factors:
+            counts = counts * np.gcd.outer(np.array(factors, dtype=np.int64), n.astype(np.int64)).astype(object).prod(axis=0)
+        result[i] = counts
+    return result.astype(np.int64) if all(int(x).bit_length() < 63 for x in result.flat) else result
+
+
+def _enumerate(number_of_arcs: int, relations: list[tuple[int, int, int]], size: int, operation,
+               inverse) -> Iterator[tuple[int, ...]]:
+    """Enumerate colorings of arcs satisfying ``color[target] = operation(color[source], color[over])``.
+
+    The relations are triples ``(over, source, target)``; ``inverse(color[target], color[over])`` recovers the color
+    of the source. Colors are propagated along the relations and an uncolored arc is branched on only when no color
+    is forced, so the running time is proportional to the number of colorings times the size of the diagram (for
+    knots).
+    """
+    arc_relations = [[] for _ in range(number_of_arcs)]
+    for relation in relations:
+        for a in set(relation):
+            arc_relations[a].append(relation)
+
+    stack = [([None] * number_of_arcs, None)]
+    while stack:
+        colors, assigned = stack.pop()
+        queue = [assigned] if assigned is not None else []
+        consistent = True
+        while queue and consistent:
+            a = queue.pop()
+            for over, source, target in arc_relations[a]:
+                if colors[over] is None:
+                    continue
+                if colors[source] is not None:
+                    arc, value = target, operation(colors[source], colors[over])
+                elif colors[target] is not None:
+                    arc, value = source, inverse(colors[target], colors[over])
+                else:
+                    continue
+                if colors[arc] is None:
+                    colors[arc] = value
+                    queue.append(arc)
+                elif colors[arc] != value:
+                    consistent = False
+                    break
+        if not consistent:
+            continue
+
+        free = next((a for a in range(number_of_arcs) if colors[a] is None), None)
+        if free is None:
+            yield tuple(colors)
+            continue
+        for value in reversed(range(size)):
+            new_colors = list(colors)
+            new_colors[free] = value
+            stack.append((new_colors, free))
+
+
+def _endpoint_colors(k: PlanarDiagram | OrientedPlanarDiagram, arc: dict, colors: tuple[int, ...]) -> dict:
+    """Convert colors of arcs into a dictionary endpoint -> color."""
+    return {ep: colors[arc[(ep.node, ep.position)]] for ep in k.endpoints}
+
+
+def colorings(k: PlanarDiagram | OrientedPlanarDiagram, n: int = 3) -> Iterator[dict]:
+    """Enumerate the Fox n-colorings of a knot or link diagram.
+
+    Args:
+        k: Knot or link diagram.
+        n: The modulus.
+
+    Yields:
+        dict: A coloring as a dictionary mapping each endpoint of the diagram to its color in ``range(n)``.
+
+    Raises:
+        ValueError: If the modulus is not positive, or the diagram is not a classical knot or link diagram.
+
+    Examples:
+        >>> len(list(colorings(knot("3_1"), 3)))
+        9
+    """
+    if n < 1:
+        raise ValueError(f"The modulus should be a positive integer (got {n})")
+    arc, number_of_arcs = _arcs(k)
+    relations = [(arc[(c, 1)], arc[(c, 0)], arc[(c, 2)]) for c in k.crossings]
+    dihedral = lambda a, b: (2 * b - a) % n
+    for colors in _enumerate(number_of_arcs, relations, n, dihedral, dihedral):
+        yield _endpoint_colors(k, arc, colors)
+
+
+def _check_quandle(quandle: Sequence[Sequence[int]]) -> list[list[int]]:
+    """Check the quandle axioms for an operation table and return its right-division table.
+
+    Raises:
+        ValueError: If the table does not define a quandle.
+    """
+    size = len(quandle)
+    if any(len(row) != size or any(not 0 <= x < size for x in row) for row in quandle):
+        raise ValueError("A quandle should be given by a square table with entries in range(size)")
+    if any(quandle[a][a] != a for a in range(size)):
+        raise ValueError("The quandle operation is not idempotent")
+    inverse = [[None] * size for _ in range(size)]
+    for a in range(size):
+        for b in range(size):
+            inverse[quandle[a][b]][b] = a
+    if any(x is None for row in inverse for x in row):
+        raise ValueError("The quandle operation is not right-invertible")
+    for a in range(size):
+        for b in range(size):
+            for c in range(size):
+                if quandle[quandle[a][b]][c] != quandle[quandle[a][c]][quandle[b][c]]:
+                    raise ValueError("The quandle operation is not right self-distributive")
+    return inverse
+
+
+def _quandle_relations(k: OrientedPlanarDiagram, arc: dict) -> list[tuple[int, int, int]]:
+    """Return the relations ``(over, source, target)`` with ``target = source ▷ over`` at each crossing.
+
+    At a positive crossing, the outgoing under-arc is the incoming under-arc acted on by the over-arc; at a negative
+    crossing, the incoming under-arc is the outgoing under-arc acted on by the over-arc.
+    """
+    relations = []
+    for c in k.crossings:
+        ingoing = 0 if isinstance(k.endpoints[c][0], IngoingEndpoint) else 2
+        incoming, outgoing = arc[(c, ingoing)], arc[(c, 2 - ingoing)]
+        if k.nodes[c].sign() > 0:
+            relations.append((arc[(c, 1)], incoming, outgoing))
+        else:
+            relations.append((arc[(c, 1)], outgoing, incoming))
+    return relations
+
+
+def quandle_colorings(k: PlanarDiagram | OrientedPlanarDiagram, quandle: Sequence[Sequence[int]]) -> Iterator[dict]:
+    """Enumerate the colorings of an oriented knot or link diagram by a finite quandle.
+
+    Args:
+        k: Knot or link diagram. Unoriented diagrams are oriented by
+            :func:`knotpy.algorithms.orientation.orient`.
+        quandle: Operation table of the quandle on ``range(size)``, where ``quandle[a][b]`` is ``a ▷ b``.
+
+    Yields:
+        dict: A coloring as a dictionary mapping each endpoint of the diagram to its color in ``range(size)``.
+
+    Raises:
+        ValueError: If the table does not define a quandle, or the diagram is not a classical knot or link diagram.
+    """
+    inverse = _check_quandle(quandle)
+    k = k if k.is_oriented() else orient(k)
+    arc, number_of_arcs = _arcs(k)
+    relations = _quandle_relations(k, arc)
+    for colors in _enumerate(number_of_arcs, relations, len(quandle), lambda a, b: quandle[a][b],
+                             lambda c, b: inverse[c][b]):
+        yield _endpoint_colors(k, arc, colors)
+
+
+def number_of_quandle_colorings(k: PlanarDiagram | OrientedPlanarDiagram, quandle: Sequence[Sequence[int]]) -> int:
+    """Return the number of colorings of an oriented knot or link diagram by a finite quandle.
+
+    Args:
+        k: Knot or link diagram. Unoriented diagrams are oriented by
+            :func:`knotpy.algorithms.orientation.orient`.
+        quandle: Operation table of the quandle on ``range(size)``, where ``quandle[a][b]`` is ``a ▷ b``.
+
+    Returns:
+        int: The number of quandle colorings (including the trivial ones).
+
+    Examples:
+        >>> number_of_quandle_colorings(knot("3_1"), dihedral_quandle(3))
+        9
+    """
+    inverse = _check_quandle(quandle)
+    k = k if k.is_oriented() else orient(k)
+    arc, number_of_arcs = _arcs(k)
+    relations = _quandle_relations(k, arc)
+    return sum(1 for _ in _enumerate(number_of_arcs, relations, len(quandle), lambda a, b: quandle[a][b],
+                                     lambda c, b: inverse[c][b]))
+
+
+def dihedral_quandle(n: int) -> list[list[int]]:
+    """Return the operation table of the dihedral quandle ``a ▷ b = 2b - a (mod n)``.
+
+    Colorings by the dihedral quandle are exactly the Fox n-colorings.
+    """
+    return [[(2 * b - a) % n for b in range(n)] for a in range(n)]
+
+
+def alexander_quandle(n: int, t: int) -> list[list[int]]:
+    """Return the operation table of the Alexander quandle ``a ▷ b = t a + (1 - t) b (mod n)``.
+
+    Args:
+        n: The modulus.
+        t: A unit modulo ``n``.
+
+    Raises:
+        ValueError: If ``t`` is not invertible modulo ``n``.
+    """
+    if gcd(t, n) != 1:
+        raise ValueError(f"{t} is not invertible modulo {n}")
+    return [[(t * a + (1 - t) * b) % n for b in range(n)] for a in range(n)]
+
+
+if __name__ == "__main__":
+    pass
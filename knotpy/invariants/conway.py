@@ -30,9 +30,13 @@ def conway(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Expr:
     Returns:
         SymPy expression in ``z`` representing the Conway polynomial.
     """
-    polynomial = homflypt(k, variables="xyz")
+    return conway_from_homflypt(homflypt(k, variables="xyz"))
+
+
+def conway_from_homflypt(polynomial_xyz) -> sp.Expr:
+    """Compute the Alexander–Conway polynomial from the homflypt polynomial in variables xyz."""
     return sp.expand(
-        polynomial.subs({_x: sp.Integer(1), _y: sp.Integer(-1), _z: -_z})
+        polynomial_xyz.subs({_x: sp.Integer(1), _y: sp.Integer(-1), _z: -_z})
     )
 
 
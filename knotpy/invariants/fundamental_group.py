@@ -3,10 +3,12 @@
 Fundamental group presentation and Fox calculus utilities.
 """
 
-__all__ = ["fundamental_group", "fox_derivative", "alexander_fox_matrix"]
-__version__ = "0.1"
+__all__ = ["fundamental_group", "group_presentation", "GroupPresentation", "fox_derivative", "alexander_fox_matrix"]
+__version__ = "0.2"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
+from collections import defaultdict
+
 import sympy as sp
 from sympy.combinatorics.fp_groups import FpGroup
 from sympy.combinatorics.free_groups import free_group, FreeGroupElement
@@ -16,9 +18,269 @@ from knotpy.classes.planardiagram import OrientedPlanarDiagram
 from knotpy.algorithms.topology import overstrands as get_overstrands
 
 
+def _reduce(word: tuple) -> tuple:
+    """Return the freely reduced word."""
+    stack = []
+    for letter in word:
+        if stack and stack[-1] == -letter:
+            stack.pop()
+        else:
+            stack.append(letter)
+    return tuple(stack)
+
+
+def _cyclically_reduce(word: tuple) -> tuple:
+    """Return the freely and cyclically reduced word."""
+    word = _reduce(word)
+    start, end = 0, len(word)
+    while end - start > 1 and word[start] == -word[end - 1]:
+        start, end = start + 1, end - 1
+    return word[start:end]
+
+
+def _inverse(word: tuple) -> tuple:
+    return tuple(-letter for letter in reversed(word))
+
+
+def _relator_key(word: tuple) -> tuple:
+    """Return a key of a cyclically reduced relator that is the same for its cyclic permutations and its inverse."""
+    inverse = _inverse(word)
+    return min(min(w[i:] + w[:i] for i in range(len(w))) for w in (word, inverse)) if word else ()
+
+
+class GroupPresentation:
+    """Finite presentation of a group with words stored as tuples of integers.
+
+    The generator ``i`` is the letter ``i + 1`` and its inverse is the letter ``-(i + 1)``. Tietze reductions
+    eliminate generators, the remaining generators keep their indices and the eliminated generators are expressed as
+    words in the remaining ones.
+
+    Args:
+        number_of_generators: Number of generators ``0, 1, ..., number_of_generators - 1``.
+        relators: Relators as sequences of letters.
+
+    Attributes:
+        generators: Indices of the (remaining) generators.
+        relators: Relators (freely and cyclically reduced nontrivial relators after simplification).
+        substitutions: Words in the remaining generators expressing the eliminated generators.
+    """
+
+    def __init__(self, number_of_generators: int, relators) -> None:
+        self.generators = list(range(number_of_generators))
+        self.relators = [tuple(relator) for relator in relators]
+        self.substitutions = {}
+
+    def copy(self) -> "GroupPresentation":
+        presentation = GroupPresentation(0, ())
+        presentation.generators = list(self.generators)
+        presentation.relators = list(self.relators)
+        presentation.substitutions = dict(self.substitutions)
+        return presentation
+
+    def word(self, generator: int) -> tuple:
+        """Return the word in the remaining generators that is equal to the (possibly eliminated) generator."""
+        return self.substitutions.get(generator, (generator + 1,))
+
+    def simplify(self, max_length: int | None = None) -> "GroupPresentation":
+        """Reduce the presentation in place by Tietze transformations and return it.
+
+        A generator ``g`` that appears exactly once in a relator ``u g^±1 v`` is eliminated by substituting
+        ``g = (v u)^∓1`` into the other relators. The eliminations are chosen greedily by the smallest increase of
+        the total length of the relators. Trivial and duplicated relators (up to cyclic permutations and inversion)
+        are removed.
+
+        Args:
+            max_length: Bound for the total length of the relators. Eliminations that do not increase the total
+                length are always performed, other eliminations only while the total length stays within the bound
+                (by default four times the initial total length).
+        """
+        relators = {i: relator for i, relator in enumerate(map(_cyclically_reduce, self.relators)) if relator}
+        occurrences = defaultdict(set)  # generator -> ids of relators containing the generator
+        letters = defaultdict(int)  # generator -> number of occurrences in all relators
+        for i, relator in relators.items():
+            for letter in relator:
+                occurrences[abs(letter) - 1].add(i)
+                letters[abs(letter) - 1] += 1
+        total_length = sum(len(relator) for relator in relators.values())
+        if max_length is None:
+            max_length = 4 * total_length
+
+        while True:
+            best = None  # ((increase of the total length, length of the relator, generator), relator id)
+            for i, relator in relators.items():
+                counts = defaultdict(int)
+                for letter in relator:
+                    counts[abs(letter) - 1] += 1
+                for g, count in counts.items():
+                    if count == 1:
+                        key = ((letters[g] - 1) * (len(relator) - 2) - len(relator), len(relator), g)
+                        if best is None or key < best[0]:
+                            best = (key, i)
+            if best is None or (best[0][0] > 0 and total_length + best[0][0] > max_length):
+                break
+
+            (_, _, generator), i = best
+            relator = relators.pop(i)
+            for letter in relator:
+                occurrences[abs(letter) - 1].discard(i)
+                letters[abs(letter) - 1] -= 1
+            # rotate the relator to g^e w, then g = w^-1 (e = 1) or g = w (e = -1)
+            position = next(j for j, letter in enumerate(relator) if abs(letter) == generator + 1)
+            rest = relator[position + 1:] + relator[:position]
+            value = _inverse(rest) if relator[position] > 0 else rest
+            self._substitute(generator, value, relators, occurrences, letters)
+            total_length = sum(len(relator) for relator in relators.values())
+
+        keys = set()
+        self.relators = []
+        for relator in relators.values():
+            if (key := _relator_key(relator)) not in keys:
+                keys.add(key)
+                self.relators.append(relator)
+        return self
+
+    def _substitute(self, generator: int, value: tuple, relators: dict, occurrences: dict, letters: dict) -> None:
+        """Eliminate ``generator = value`` from the relators and the substitutions."""
+        letter, inverse = generator + 1, _inverse(value)
+
+        def _replace(word):
+            result = []
+            for x in word:
+                if x == letter:
+                    result.extend(value)
+                elif x == -letter:
+                    result.extend(inverse)
+                else:
+                    result.append(x)
+            return tuple(result)
+
+        for i in occurrences.pop(generator, ()):
+            relator = relators[i]
+            for x in relator:
+                occurrences[abs(x) - 1].discard(i)
+                letters[abs(x) - 1] -= 1
+            relator = _cyclically_reduce(_replace(relator))
+            if relator:
+                relators[i] = relator
+                for x in relator:
+                    occurrences[abs(x) - 1].add(i)
+                    letters[abs(x) - 1] += 1
+            else:
+                del relators[i]
+
+        self.substitutions = {g: _reduce(_replace(word)) for g, word in self.substitutions.items()}
+        self.substitutions[generator] = _reduce(value)
+        self.generators.remove(generator)
+
+    def to_sympy(self) -> tuple[FpGroup, dict]:
+        """Return the presentation as a SymPy ``FpGroup`` and a dictionary mapping the (remaining and eliminated)
+        generators to elements of its free group. The remaining generator ``i`` is named ``x{i}``."""
+        F, *free_generators = free_group(" ".join(f"x{i}" for i in self.generators))
+        element = dict(zip(self.generators, free_generators))
+
+        def _element(word):
+            result = F.identity
+            for letter in word:
+                result *= element[abs(letter) - 1] ** (1 if letter > 0 else -1)
+            return result
+
+        G = FpGroup(F, [_element(relator) for relator in self.relators])
+        elements = {g: _element(self.word(g)) for g in list(self.generators) + list(self.substitutions)}
+        return G, elements
+
+    def alexander_matrix(self, abelianization: dict) -> sp.Matrix:
+        """Return the abelianized Fox Jacobian of the presentation.
+
+        Args:
+            abelianization: Dictionary mapping the (remaining) generators to SymPy symbols.
+
+        Returns:
+            sympy.Matrix: Matrix with a row for each relator and a column for each remaining generator.
+        """
+        symbols = sorted(set(abelianization[g] for g in self.generators), key=str)
+        position = {symbol: j for j, symbol in enumerate(symbols)}
+        column = {g: j for j, g in enumerate(self.generators)}
+        image = {g: position[abelianization[g]] for g in self.generators}
+
+        rows = []
+        for relator in self.relators:
+            derivatives = [defaultdict(int) for _ in self.generators]  # column -> {exponents: coefficient}
+            exponents = [0] * len(symbols)  # abelianized prefix of the relator
+            for letter in relator:
+                g = abs(letter) - 1
+                if letter > 0:
+                    derivatives[column[g]][tuple(exponents)] += 1
+                    exponents[image[g]] += 1
+                else:
+                    exponents[image[g]] -= 1
+                    derivatives[column[g]][tuple(exponents)] -= 1
+            rows.append([sp.Add(*(c * sp.Mul(*(s ** e for s, e in zip(symbols, monomial)))
+                                  for monomial, c in derivative.items() if c))
+                         for derivative in derivatives])
+        return sp.Matrix(len(rows), len(self.generators), [x for row in rows for x in row])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self.generators)} generators, {len(self.relators)} relators)"
+
+
+def group_presentation(
+    k: OrientedPlanarDiagram,
+    simplify: bool = True,
+    return_dict: bool = False,
+) -> GroupPresentation | tuple[GroupPresentation, dict]:
+    """Return the Wirtinger presentation of the fundamental group of the complement of ``k`` with integer words.
+
+    The generators are the overstrands (in sorted order), the relators are the same as in :func:`fundamental_group`.
+
+    Args:
+        k: Oriented planar diagram.
+        simplify: If True, reduce the presentation by Tietze transformations (see :meth:`GroupPresentation.simplify`).
+        return_dict: If True, also return a dict mapping each endpoint to the index of the generator of its
+            overstrand (use :meth:`GroupPresentation.word` to express eliminated generators).
+
+    Returns:
+        - ``GroupPresentation`` if ``return_dict`` is False.
+        - Tuple ``(GroupPresentation, overstrand_generator_dict)`` if True.
+
+    Raises:
+        TypeError: If ``k`` is not oriented.
+
+    Example:
+        >>> group_presentation(orient(knot("3_1")))
+        GroupPresentation(2 generators, 1 relators)
+    """
+    if not k.is_oriented():
+        raise TypeError("Cannot compute the fundamental group of an unoriented planar diagram.")
+
+    overstrands = sorted(get_overstrands(k))
+    letter = {ep: i + 1 for i, strand in enumerate(overstrands) for ep in strand}
+
+    relators = []
+    for c in k.crossings:
+        ep0, ep1, ep2, ep3 = k.endpoints[c]
+        if not isinstance(ep0, IngoingEndpoint):
+            ep0, ep2 = ep2, ep0
+        if k.sign(c) > 0:
+            relators.append((letter[ep0], letter[ep1], -letter[ep2], -letter[ep3]))
+        else:
+            relators.append((letter[ep0], -letter[ep1], -letter[ep2], letter[ep3]))
+
+    for v in k.vertices:
+        relators.append(tuple(-letter[ep] if isinstance(ep, IngoingEndpoint) else letter[ep]
+                              for ep in k.endpoints[v]))
+
+    presentation = GroupPresentation(len(overstrands), relators)
+    if simplify:
+        presentation.simplify()
+    if return_dict:
+        return presentation, {ep: index - 1 for ep, index in letter.items()}
+    return presentation
+
+
 def fundamental_group(
     k: OrientedPlanarDiagram,
     return_dict: bool = False,
+    simplify: bool = False,
 ) -> FpGroup | tuple[FpGroup, dict]:
     """Return a presentation of the fundamental group of the complement of ``k`` in S³.
 
@@ -31,9 +293,13 @@ def fundamental_group(
           ``x₁^{s₁} * x₂^{s₂} * ...`` where ``sᵢ = 1`` if the arc is directed
           **into** the vertex, and ``-1`` if **out** of the vertex.
 
+    The presentation is built with integer words (see :func:`group_presentation`) and converted to SymPy at the end.
+
     Args:
         k: Oriented planar diagram.
         return_dict: If True, also return a dict mapping each overstrand endpoint to its generator.
+        simplify: If True, reduce the presentation by Tietze transformations. The generators of the eliminated
+            overstrands are then mapped to words in the remaining generators.
 
     Returns:
         - ``FpGroup`` if ``return_dict`` is False.
@@ -42,64 +308,9 @@ def fundamental_group(
     Raises:
         TypeError: If ``k`` is not oriented.
     """
-    if not k.is_oriented():
-        raise TypeError("Cannot compute the fundamental group of an unoriented planar diagram.")
-
-    overstrands = sorted(get_overstrands(k))
-    F, *generators = free_group(" ".join(f"x{i}" for i in range(len(overstrands))))
-    overstrand_generator = {
-        ep: generator
-        for strand, generator in zip(overstrands, generators)
-        for ep in strand
-    }
-
-    relators = []
-    for c in k.crossings:
-        ep0, ep1, ep2, ep3 = k.endpoints[c]
-        if k.sign(c) > 0:
-            if isinstance(ep0, IngoingEndpoint):
-                relators.append(
-                    overstrand_generator[ep0]
-                    * overstrand_generator[ep1]
-                    * (overstrand_generator[ep2] ** -1)
-                    * (overstrand_generator[ep3] ** -1)
-                )
-            else:
-                relators.append(
-                    overstrand_generator[ep2]
-                    * overstrand_generator[ep1]
-                    * (overstrand_generator[ep0] ** -1)
-                    * (overstrand_generator[ep3] ** -1)
-                )
-        else:
-            if isinstance(ep0, IngoingEndpoint):
-                relators.append(
-                    overstrand_generator[ep0]
-                    * (overstrand_generator[ep1] ** -1)
-                    * (overstrand_generator[ep2] ** -1)
-                    * overstrand_generator[ep3]
-                )
-            else:
-                relators.append(
-                    overstrand_generator[ep2]
-                    * (overstrand_generator[ep1] ** -1)
-                    * (overstrand_generator[ep0] ** -1)
-                    * overstrand_generator[ep3]
-                )
-
-    for v in k.vertices:
-        eps = k.endpoints[v]
-        relator = overstrand_generator[eps[0]] ** (
-            -1 if isinstance(eps[0], IngoingEndpoint) else 1
-        )
-        for ep in eps[1:]:
-            relator *= overstrand_generator[ep] ** (
-                -1 if isinstance(ep, IngoingEndpoint) else 1
-            )
-        relators.append(relator)
-
-    G = FpGroup(F, relators)
-    return (G, overstrand_generator) if return_dict else G
+    presentation, generator = group_presentation(k, simplify=simplify, return_dict=True)
+    G, elements = presentation.to_sympy()
+    return (G, {ep: elements[g] for ep, g in generator.items()}) if return_dict else G
 
 
 def fox_derivative(
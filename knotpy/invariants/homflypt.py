@@ -20,7 +20,6 @@ __all__ = ["homflypt"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
-from collections import OrderedDict, deque
 from random import choice
 
 import sympy as sp
@@ -37,13 +36,17 @@ from knotpy.classes.planardiagram import OrientedPlanarDiagram, PlanarDiagram
 from knotpy.reidemeister.reidemeister_3 import find_reidemeister_3_triangle, reidemeister_3
 from knotpy.reidemeister.simplify import simplify_decreasing, simplify_non_increasing
 from knotpy.utils.set_utils import LeveledSet
+from knotpy.invariants.cache import LRUCache
 #from knotpy.tables.knot import knot_precomputed_homflypt
 
 from knotpy.invariants._symbols import _A, _a, _l, _m, _v, _x, _y, _z, _HOMFLYPT_SUM_XYZ, _tmp
+from knotpy.invariants._evaluation import _PointValue, _evaluate_expression
+from knotpy.invariants.persistent_cache import persistent_invariant
 
 
-_USE_HOMFLYPT_PRECACHE = False
-_homflypt_xyz_precache: "OrderedDict[object, sp.Expr]" = OrderedDict()
+# symbolic HOMFLY-PT polynomials of sub-diagrams in skein trees (the size of an entry is its number of terms)
+_homflypt_skein_cache = LRUCache(max_number_of_nodes=8, max_size=200000, size=lambda p: len(sp.Add.make_args(p)),
+                                 name="homflypt_skein")
 
 
 def _simplify_to_2_face(k: PlanarDiagram) -> PlanarDiagram | None:
@@ -62,11 +65,12 @@ def _simplify_to_2_face(k: PlanarDiagram) -> PlanarDiagram | None:
     return None
 
 
-def _choose_crossing_for_switching(
-    k: OrientedPlanarDiagram, sum_coefficient: sp.Expr
-) -> tuple[OrientedPlanarDiagram, object | None]:
+def _choose_crossing_for_switching(k: OrientedPlanarDiagram) -> tuple[OrientedPlanarDiagram, object | None]:
     """Choose a crossing for skein expansion that tends to simplify after switching.
 
+    If the diagram is simplified by R3 moves, the unknots that split off are removed and their number is added to the
+    attribute ``"_unknots"`` of the returned diagram.
+
     Returns:
         A pair ``(diagram, crossing_or_none)``. If no crossing is chosen, the diagram should be terminal.
     """
@@ -99,13 +103,11 @@ def _choose_crossing_for_switching(
                         if len(k_r3_) < num_nodes or any(
                             len(f) == 2 for f in k_r3_.faces
                         ):
-                            k_r3_.attr["_coefficient"] *= sum_coefficient ** remove_unknots(k_r3_)
+                            k_r3_.attr["_unknots"] = k_r3_.attr.get("_unknots", 0) + remove_unknots(k_r3_)
                             if len(k_r3_.crossings) == 0:
                                 return k_r3_, None
                             # Not optimal to recurse, but keeps logic simple
-                            return _choose_crossing_for_switching(
-                                k_r3_, sum_coefficient=_HOMFLYPT_SUM_XYZ
-                            )
+                            return _choose_crossing_for_switching(k_r3_)
                         ls.add(freeze(canonical(k_r3)))
 
         alt_faces = [face for face in faces3 if is_face_alternating(face)]
@@ -122,65 +124,125 @@ def _choose_crossing_for_switching(
     )
 
 
-def _compute_homflypt(k: OrientedPlanarDiagram) -> sp.Expr:
-    """Compute the HOMFLY-PT polynomial in variables ``x, y, z`` for an oriented diagram."""
-    stack: deque[OrientedPlanarDiagram] = deque([k.copy(_coefficient=sp.Integer(1))])
-    polynomial = sp.Integer(0)
+def _memoized_skein_sum(k: PlanarDiagram, reduce, expand, sum_coefficient, cache: LRUCache, empty=None,
+                        max_number_of_nodes: int | None = None):
+    """Evaluate a skein tree, where each sub-diagram (up to relabeling) is expanded only once.
 
-    while stack:
-        k = stack.pop()
-        k = simplify_decreasing(k, inplace=True)
-        k.attr["_coefficient"] *= _HOMFLYPT_SUM_XYZ ** remove_unknots(k)
+    The value ``V`` of a diagram is normalized by ``V(unknot) = 1`` and ``V(D ⊔ unknot) = sum_coefficient * V(D)``. It
+    is defined by two callables:
 
-        k, crossing = _choose_crossing_for_switching(
-            k, sum_coefficient=_HOMFLYPT_SUM_XYZ
-        )
+    - ``reduce(k)`` simplifies ``k`` (in place) and returns the pair ``(k, factor)``, such that
+      ``V(input) = factor * V(k)``,
+    - ``expand(k)`` returns the pair ``(coefficient, branches)``, such that
+      ``V(k) = coefficient * sum(c * V(d) for c, d in branches)``, or ``V(k) = coefficient`` if there are no branches.
 
-        if crossing is not None:
-            k_switch = mirror(k, [crossing], inplace=False)
-            k_smooth = smoothen_crossing(k, crossing, method="O", inplace=False)
+    If ``empty`` is given, the empty diagram is not normalized and has the value ``empty`` (e.g. a basis element of a
+    skein module), so that ``V(unknot) = sum_coefficient * empty``.
 
-            if k.sign(crossing) > 0:
-                k_switch.attr["_coefficient"] *= (-_y * _x ** -1)
-                k_smooth.attr["_coefficient"] *= (-_z * _x ** -1)
-            else:
-                k_switch.attr["_coefficient"] *= (-_x * _y ** -1)
-                k_smooth.attr["_coefficient"] *= (-_z * _y ** -1)
-
-            stack.append(k_switch)
-            stack.append(k_smooth)
-        else:
-            if len(k) == 0:
-                polynomial += k.attr["_coefficient"] / _HOMFLYPT_SUM_XYZ
+    Values are stored in ``cache`` under the canonical (frozen) form of the reduced diagram without unknots, so repeated
+    subtrees of the skein tree are evaluated once and the tree becomes a DAG. Diagrams with more than
+    ``max_number_of_nodes`` (by default ``cache.max_number_of_nodes``) nodes rarely repeat and are expanded without
+    computing their canonical form. Cached values are expanded if they are SymPy expressions (or have an ``expand``
+    method).
+    """
+    if max_number_of_nodes is None:
+        max_number_of_nodes = cache.max_number_of_nodes
+
+    def _enter(diagram):
+        diagram, factor = reduce(diagram)
+        unknots = remove_unknots(diagram)
+        if len(diagram) == 0:
+            if empty is not None:
+                return None, 1, factor * sum_coefficient ** unknots * empty
+            return None, 1, factor * sum_coefficient ** (unknots - 1)
+        factor = factor * sum_coefficient ** unknots
+        if len(diagram) > max_number_of_nodes:
+            return diagram, factor, None
+        key = freeze(canonical(diagram))
+        return key, factor, cache.get(key)
+
+    def _expand(key):
+        return expand(key.copy() if key.is_frozen() else key)
+
+    key, factor, value = _enter(k)
+    if value is not None:
+        return factor * value
+
+    # stack of frames [key, coefficient, branches, next branch index, partial sum, multiplier in the parent]
+    stack = [[key, *_expand(key), 0, 0, factor]]
+    while True:
+        frame = stack[-1]
+        key, coefficient, branches, index, total, multiplier = frame
+        if index < len(branches):
+            frame[3] += 1
+            branch_coefficient, diagram = branches[index]
+            child_key, child_factor, value = _enter(diagram)
+            if value is None:
+                stack.append([child_key, *_expand(child_key), 0, 0, branch_coefficient * child_factor])
             else:
-                raise ValueError(
-                    "Reduced HOMFLY-PT state has vertices or crossings unexpectedly."
-                )
+                frame[4] = total + branch_coefficient * child_factor * value
+            continue
+
+        value = coefficient * total if branches else coefficient
+        if key.is_frozen():
+            if hasattr(value, "expand"):
+                value = value.expand()
+            cache.set(key, value)
+        stack.pop()
+        if not stack:
+            return multiplier * value
+        stack[-1][4] += multiplier * value
+
+
+def _compute_homflypt(k: OrientedPlanarDiagram, x=_x, y=_y, z=_z) -> sp.Expr:
+    """Compute the HOMFLY-PT polynomial in variables ``x, y, z`` for an oriented diagram.
+
+    The variables can also be point values (see :mod:`knotpy.invariants._evaluation`), in which case the state sum
+    is evaluated numerically. Symbolic values of sub-diagrams are memoized in ``_homflypt_skein_cache``.
+    """
+    is_symbolic = x is _x
+    sum_coefficient = _HOMFLYPT_SUM_XYZ if is_symbolic else -x / z - y / z
+
+    def _reduce(k):
+        return simplify_decreasing(k, inplace=True), x ** 0
 
-    return polynomial
+    def _expand(k):
+        k.attr["_unknots"] = 0
+        k, crossing = _choose_crossing_for_switching(k)
+        unknots = k.attr["_unknots"]
 
+        if crossing is None:
+            if len(k) != 0 or unknots == 0:
+                raise ValueError("Reduced HOMFLY-PT state has vertices or crossings unexpectedly.")
+            return sum_coefficient ** (unknots - 1), []
 
-def _homflypt_xyz(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Expr:
-    """Return the HOMFLY-PT polynomial in variables ``x, y, z``, satisfying ``xP(L+) + yP(L−) + zP(L₀) = 0``."""
-    if _USE_HOMFLYPT_PRECACHE and k in _homflypt_xyz_precache:
-        return _homflypt_xyz_precache[k]
+        k_switch = mirror(k, [crossing], inplace=False)
+        k_smooth = smoothen_crossing(k, crossing, method="O", inplace=False)
+        if k.sign(crossing) > 0:
+            return sum_coefficient ** unknots, [(-y * x ** -1, k_switch), (-z * x ** -1, k_smooth)]
+        return sum_coefficient ** unknots, [(-x * y ** -1, k_switch), (-z * y ** -1, k_smooth)]
 
-    k_original = k
+    cache = _homflypt_skein_cache if is_symbolic else LRUCache(_homflypt_skein_cache.max_number_of_nodes)
+    return _memoized_skein_sum(k.copy(), _reduce, _expand, sum_coefficient, cache)
+
+
+def _homflypt_xyz(k: PlanarDiagram | OrientedPlanarDiagram, x=_x, y=_y, z=_z) -> sp.Expr:
+    """Return the HOMFLY-PT polynomial in variables ``x, y, z``, satisfying ``xP(L+) + yP(L−) + zP(L₀) = 0``.
+
+    If ``x``, ``y`` and ``z`` are point values, return the value of the polynomial at these points.
+    """
     k = k.copy() if k.is_oriented() else orient(k)
 
     settings_dump = settings.dump()
     settings.update({"trace_moves": False, "allowed_moves": "r1,r2,r3", "framed": False})
-    polynomial = sp.expand(_compute_homflypt(k))
+    polynomial = _compute_homflypt(k, x, y, z)
     settings.load(settings_dump)
 
-    if _USE_HOMFLYPT_PRECACHE:
-        _homflypt_xyz_precache[freeze(k_original, inplace=False)] = polynomial
-        if len(_homflypt_xyz_precache) > 16:
-            _homflypt_xyz_precache.popitem(last=False)
-
-    return polynomial
+    return sp.expand(polynomial) if x is _x else polynomial
 
-def homflypt(k: PlanarDiagram | OrientedPlanarDiagram, variables: str="vz") -> sp.Expr:
+@persistent_invariant("homflypt")
+def homflypt(k: PlanarDiagram | OrientedPlanarDiagram, variables: str="vz", evaluate_at=None,
+             modulus: int | None = None) -> sp.Expr:
     r"""Compute the HOMFLY–PT polynomial.
 
     This version satisfies the skein relation
@@ -205,12 +267,19 @@ def homflypt(k: PlanarDiagram | OrientedPlanarDiagram, variables: str="vz") -> s
 
     Args:
         k: The input knot or link diagram (oriented or unoriented).
+        variables: The normalization, one of ``"xyz"``, ``"vz"``, ``"lm"`` or ``"az"``.
+        evaluate_at: If given, the state sum is computed numerically at the given point(s) instead of symbolically.
+            Either a dictionary ``{variable name: value}`` or a tuple of values in the order of ``variables``
+            (e.g. ``(v, z)``). Values can be integers, fractions, floats or complex numbers, or sequences of such
+            values, in which case all points are evaluated at once (vectorized with NumPy).
+        modulus: If given (together with ``evaluate_at``), the evaluation is computed modulo ``modulus``.
 
     Returns:
-        sympy.Expr: The HOMFLY–PT polynomial \(P\) in variables \(x, y, z\).
+        sympy.Expr: The HOMFLY–PT polynomial \(P\) in the given variables, or its value(s) at ``evaluate_at``.
 
     Raises:
-        ValueError: If a reduced terminal state contains unexpected vertices/crossings.
+        ValueError: If a reduced terminal state contains unexpected vertices/crossings, or a modulus is given without
+            evaluation points.
 
     Examples:
         >>> import knotpy as kp
@@ -223,12 +292,24 @@ def homflypt(k: PlanarDiagram | OrientedPlanarDiagram, variables: str="vz") -> s
         z**2/A**2 + 2/A**2 - 1/A**4
         >>> kp.homflypt(k, variables="xyz")
         -2*y/x - y**2/x**2 + z**2/x**2
+        >>> kp.homflypt(k, evaluate_at=(2, 3))
+        28
     """
 
     from knotpy.tables.knot import knot_precomputed_homflypt
 
     variables = str(variables).lower()
 
+    if evaluate_at is not None:
+        x, y, z = _xyz_point_values(variables, evaluate_at, modulus)
+        polynomial = knot_precomputed_homflypt(k)
+        if polynomial is not None:
+            return _evaluate_expression(polynomial, {_x: x, _y: y, _z: z}).value()
+        return _homflypt_xyz(k, x, y, z).value()
+
+    if modulus is not None:
+        raise ValueError("The modulus can only be used together with evaluation points")
+
     # try to get the HOMFLYPT polynomial from the precomputed data
     polynomial = knot_precomputed_homflypt(k)
     # otherwise, compute it
@@ -245,6 +326,33 @@ def homflypt(k: PlanarDiagram | OrientedPlanarDiagram, variables: str="vz") -> s
         return _xyz_to_az(polynomial)
     raise ValueError(f"Invalid variable choice: {variables}")
 
+
+def _xyz_point_values(variables: str, evaluate_at, modulus: int | None) -> tuple:
+    """Convert evaluation points given in the normalization ``variables`` to point values of ``x``, ``y`` and ``z``."""
+    names = "xyz" if "x" in variables else "vz" if "v" in variables else "lm" if "l" in variables else "az" if "a" in variables else None
+    if names is None:
+        raise ValueError(f"Invalid variable choice: {variables}")
+    if isinstance(evaluate_at, dict):
+        evaluate_at = {str(key).lower(): value for key, value in evaluate_at.items()}
+        if set(evaluate_at) != set(names):
+            raise ValueError(f"Evaluation points should be given for the variables {', '.join(names)}")
+        evaluate_at = [evaluate_at[name] for name in names]
+    if len(evaluate_at) != len(names):
+        raise ValueError(f"Evaluation points should be given for the variables {', '.join(names)}")
+    values = [_PointValue.variable(value, modulus) for value in evaluate_at]
+
+    if names == "xyz":
+        return tuple(values)
+    if names == "vz":
+        v, z = values
+        return v ** -1, -v, -z
+    if names == "lm":
+        l, m = values
+        return l, l ** -1, m
+    a, z = values
+    return a, -a ** -1, -z
+
+
 def _homflypt_xyz_mirror(polynomial: sp.Expr) -> sp.Expr:
     return sp.expand(polynomial.xreplace({_x: _tmp, _y: _x}).xreplace({_tmp: _y}))
 
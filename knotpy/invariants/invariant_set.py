@@ -0,0 +1,224 @@
+# knotpy/invariants/invariant_set.py
+"""
+Compute several invariants of a diagram at once.
+
+The invariants of a diagram are computed through a shared :class:`InvariantContext`, which orients and simplifies the
+diagram once and stores the computed values, so that dependent invariants are derived from the computed ones instead
+of repeating the skein expansions:
+
+- the HOMFLY-PT polynomial (in variables ``x, y, z``) is computed once (or read from the precomputed knot tables),
+- the Jones polynomial, the (normalized) bracket polynomial, the Alexander polynomial and the Conway polynomial are
+  specializations of the HOMFLY-PT polynomial,
+- the Kauffman polynomial and Khovanov homology of a knot are computed from the simplified diagram.
+
+An :class:`InvariantSet` schedules the requested invariants from the cheapest to the most expensive one.
+"""
+
+from __future__ import annotations
+
+__all__ = ["InvariantContext", "InvariantSet", "compute_invariants"]
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+from functools import cached_property
+from typing import Callable, Iterable, Mapping
+
+from knotpy._settings import settings
+from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
+from knotpy.algorithms.orientation import orient
+from knotpy.algorithms.components_link import number_of_link_components
+from knotpy.reidemeister.simplify import simplify_decreasing
+from knotpy.invariants.writhe import writhe
+from knotpy.invariants.homflypt import homflypt, _xyz_to_vz
+from knotpy.invariants.jones import jones, jones_from_homflypt
+from knotpy.invariants.bracket import bracket, bracket_from_homflypt
+from knotpy.invariants.alexander import alexander, alexander_from_homflypt
+from knotpy.invariants.conway import conway, conway_from_homflypt
+from knotpy.invariants.kauffman import kauffman
+from knotpy.invariants.khovanov import khovanov_homology
+
+
+class InvariantContext:
+    """Per-diagram context that shares the preprocessing and the computed invariants.
+
+    Args:
+        k: Knot or link diagram (oriented or unoriented).
+
+    Attributes:
+        diagram: The input diagram.
+        values: Computed invariants by name.
+
+    Example:
+        >>> context = InvariantContext(knot("3_1"))
+        >>> context.get("jones")
+        -t**4 + t**3 + t
+        >>> sorted(context.values)
+        ['homflypt_xyz', 'jones']
+    """
+
+    def __init__(self, k: PlanarDiagram | OrientedPlanarDiagram) -> None:
+        self.diagram = k
+        self.values = {}
+
+    @cached_property
+    def is_knot(self) -> bool:
+        """Is the diagram a knot (a diagram with a single component)?"""
+        return number_of_link_components(self.diagram) == 1
+
+    @cached_property
+    def simplified(self) -> OrientedPlanarDiagram:
+        """Oriented copy of the diagram simplified by crossing-decreasing Reidemeister moves."""
+        k = self.diagram.copy() if self.diagram.is_oriented() else orient(self.diagram)
+        settings_dump = settings.dump()
+        settings.update({"trace_moves": False, "framed": False})
+        k = simplify_decreasing(k, inplace=True)
+        settings.load(settings_dump)
+        k.name = None  # the simplified diagram is not the diagram of the tables
+        return k
+
+    @property
+    def _orientation_is_fixed(self) -> bool:
+        # invariants of unoriented links use the orientation minimizing the writhe, which may differ from the
+        # orientation of the simplified diagram
+        return self.diagram.is_oriented() or self.is_knot
+
+    @property
+    def _is_unframed(self) -> bool:
+        return not self.diagram.is_framed() or self.diagram.framing == 0
+
+    def get(self, name: str):
+        """Return the invariant ``name``, computing it (and the invariants it depends on) if necessary.
+
+        Raises:
+            ValueError: If the invariant is unknown.
+        """
+        if name not in self.values:
+            if name not in _INVARIANTS:
+                raise ValueError(f"Unknown invariant {name} (expected one of {', '.join(_INVARIANTS)})")
+            self.values[name] = _INVARIANTS[name][1](self)
+        return self.values[name]
+
+
+def _homflypt_xyz(context: InvariantContext):
+    from knotpy.tables.knot import knot_precomputed_homflypt
+    if not context.diagram.is_oriented():
+        polynomial = knot_precomputed_homflypt(context.diagram)
+        if polynomial is not None:
+            return polynomial
+    return homflypt(context.simplified, variables="xyz")
+
+
+def _jones(context: InvariantContext):
+    if context._orientation_is_fixed:
+        return jones_from_homflypt(context.get("homflypt_xyz"))
+    return jones(context.diagram)
+
+
+def _bracket(context: InvariantContext):
+    if context._orientation_is_fixed and context._is_unframed:
+        return bracket_from_homflypt(context.get("homflypt_xyz"))
+    return bracket(context.diagram)
+
+
+def _kauffman(context: InvariantContext):
+    return kauffman(context.simplified if context.is_knot else context.diagram)
+
+
+# invariants by name: (cost, function computing the invariant from the context)
+_INVARIANTS: dict[str, tuple[int, Callable[[InvariantContext], object]]] = {
+    "writhe": (0, lambda context: writhe(context.diagram)),
+    "homflypt_xyz": (2, _homflypt_xyz),
+    "homflypt": (2, lambda context: _xyz_to_vz(context.get("homflypt_xyz"))),
+    "alexander": (3, lambda context: alexander_from_homflypt(context.get("homflypt_xyz"))),
+    "conway": (3, lambda context: conway_from_homflypt(context.get("homflypt_xyz"))),
+    "jones": (3, _jones),
+    "bracket": (3, _bracket),
+    "kauffman": (4, _kauffman),
+    "khovanov": (5, lambda context: khovanov_homology(context.simplified)),
+}
+
+# invariant functions (with default arguments) that can be given instead of names
+_FUNCTIONS = {writhe: "writhe", homflypt: "homflypt", alexander: "alexander", conway: "conway", jones: "jones",
+              bracket: "bracket", kauffman: "kauffman", khovanov_homology: "khovanov"}
+
+
+class InvariantSet:
+    """A set of invariants computed together through a shared :class:`InvariantContext`.
+
+    Args:
+        invariants: Names of invariants (``"writhe"``, ``"homflypt"`` (in variables ``v, z``), ``"homflypt_xyz"``,
+            ``"alexander"``, ``"conway"``, ``"jones"``, ``"bracket"``, ``"kauffman"``, ``"khovanov"``), or a mapping
+            ``{key: invariant}``, where each invariant is a name or a callable. The invariant functions of KnotPy with
+            default arguments (e.g. ``kp.jones``) are recognized, other callables are called with the diagram.
+
+    Raises:
+        ValueError: If an invariant name is unknown.
+
+    Example:
+        >>> invariants = InvariantSet(["jones", "alexander"])
+        >>> invariants(knot("3_1"))
+        {'jones': -t**4 + t**3 + t, 'alexander': t**2 - t + 1}
+    """
+
+    def __init__(self, invariants: Iterable[str] | Mapping[str, str | Callable]) -> None:
+        if not isinstance(invariants, Mapping):
+            invariants = {name: name for name in invariants}
+        self.invariants = {key: _FUNCTIONS.get(value, value) if callable(value) else value
+                           for key, value in invariants.items()}
+        for value in self.invariants.values():
+            if isinstance(value, str) and value not in _INVARIANTS:
+                raise ValueError(f"Unknown invariant {value} (expected one of {', '.join(_INVARIANTS)})")
+        # cheap invariants first (other callables last)
+        self._schedule = sorted(self.invariants, key=lambda key: _INVARIANTS[self.invariants[key]][0]
+                                if isinstance(self.invariants[key], str) else len(_INVARIANTS))
+
+    def compute(self, k: PlanarDiagram | OrientedPlanarDiagram, errors: list[str] | None = None) -> dict:
+        """Compute the invariants of a diagram.
+
+        Args:
+            k: Knot or link diagram.
+            errors: If given, exceptions raised by the invariants are not propagated: the value of a failed invariant
+                is ``None`` and a message is appended to ``errors``.
+
+        Returns:
+            dict: The values of the invariants by key (in the order of the invariants of the set).
+        """
+        context = InvariantContext(k)
+        values = {}
+        for key in self._schedule:
+            invariant = self.invariants[key]
+            try:
+                values[key] = context.get(invariant) if isinstance(invariant, str) else invariant(k)
+            except Exception as e:
+                if errors is None:
+                    raise
+                values[key] = None
+                errors.append(f"{key} failed: {e!r}")
+        return {key: values[key] for key in self.invariants}
+
+    __call__ = compute
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(self.invariants)})"
+
+
+def compute_invariants(k: PlanarDiagram | OrientedPlanarDiagram,
+                       invariants: Iterable[str] | Mapping[str, str | Callable]) -> dict:
+    """Compute several invariants of a diagram, sharing the preprocessing and deriving dependent invariants.
+
+    Args:
+        k: Knot or link diagram.
+        invariants: Names of the invariants or a mapping ``{key: invariant}`` (see :class:`InvariantSet`).
+
+    Returns:
+        dict: The values of the invariants by name (or key).
+
+    Example:
+        >>> compute_invariants(knot("3_1"), ["jones", "conway"])
+        {'jones': -t**4 + t**3 + t, 'conway': z**2 + 1}
+    """
+    return InvariantSet(invariants).compute(k)
+
+
+if __name__ == "__main__":
+    pass
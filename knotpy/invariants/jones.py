@@ -8,16 +8,20 @@ See: L. H. Kauffman, *State models and the Jones polynomial*, Topology 26(3), 19
 
 from __future__ import annotations
 
-__all__ = ["jones"]
+__all__ = ["jones", "jones_evaluations"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
 
 
+from numbers import Integral
+from typing import Iterable
+
 import sympy as sp
 
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
-from knotpy.invariants.bracket import bracket
+from knotpy.invariants.bracket import bracket, _bracket
+from knotpy.invariants._evaluation import _PointValue, _output, _sqrt
 from knotpy.invariants._symbols import _A, _t, _x, _y, _z
 
 def jones_from_homflypt(polynomial_xyz) -> sp.Expr:
@@ -30,7 +34,7 @@ def jones_from_homflypt(polynomial_xyz) -> sp.Expr:
 
 
 
-def jones(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Expr:
+def jones(k: PlanarDiagram | OrientedPlanarDiagram, evaluate_at=None, modulus: int | None = None) -> sp.Expr:
     r"""Compute the Jones polynomial via the normalized Kauffman bracket.
 
     The Kauffman bracket polynomial ⟨·⟩ is characterized by:
@@ -49,9 +53,19 @@ def jones(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Expr:
 
     Args:
         k: Planar diagram of a knot or link (oriented or unoriented).
+        evaluate_at: If given, the state sum is computed numerically at ``t = evaluate_at`` instead of symbolically.
+            The value can be an integer, a fraction, a float or complex number, or a sequence of such values, in
+            which case all points are evaluated at once (vectorized with NumPy). The bracket variable is treated as
+            a formal root ``A`` with ``A^4 = 1/t``, so exact and modular evaluations need no roots of ``t``, except
+            for links with half-integer exponents, where ``t^(1/2)`` is the principal square root.
+        modulus: If given (together with ``evaluate_at``), the evaluation is computed modulo ``modulus``.
 
     Returns:
-        A SymPy expression in ``t`` representing the Jones polynomial.
+        A SymPy expression in ``t`` representing the Jones polynomial, or its value(s) at ``evaluate_at``.
+
+    Raises:
+        ValueError: If a modulus is given without evaluation points, or if ``t^(1/2)`` cannot be computed exactly
+            for a link with half-integer exponents.
 
     Notes:
         Alternative (equivalent) substitution in the \(l\)–\(m\) variables:
@@ -62,12 +76,145 @@ def jones(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Expr:
         >>> k = kp.knot("3_1")
         >>> kp.jones(k)
         -t**4 + t**3 + t
+        >>> kp.jones(k, evaluate_at=-1)
+        -3
     """
+    if evaluate_at is not None:
+        t = _PointValue.variable(evaluate_at, modulus)
+        value, exponent = _bracket(k, normalize=True, A=t.inverse().root(4)).monomial()
+        if exponent == 0:
+            return _output(value)
+        if exponent == 2:  # A^2 = t^(-1/2)
+            return _output(value / _sqrt(t.data[0], modulus))
+        raise ValueError("The normalized bracket polynomial has unexpected exponents")
+
+    if modulus is not None:
+        raise ValueError("The modulus can only be used together with evaluation points")
+
     polynomial = bracket(k, normalize=True)
 
     # alternative: l = i * t^(−1),  m = i * (t^(−1/2) − t^(1/2))
     return sp.expand(polynomial.subs({_A: _t ** sp.Rational(-1, 4)}))
 
 
+def _principal_quartic_root_exponent(order: int) -> int:
+    """Return ``e`` such that ``ζ^e`` is the principal value of ``t^(-1/4)`` for ``t = e^(2πi/order)``, where
+    ``ζ = e^(2πi/(4 order))``."""
+    return 0 if order == 1 else -1
+
+
+def jones_evaluations(diagrams: Iterable[PlanarDiagram | OrientedPlanarDiagram], roots: Iterable,
+                      exact: bool = False, dtype: str = "complex128", error_bound: bool = False):
+    """Evaluate the Jones polynomials of many diagrams at many points (typically roots of unity) at once.
+
+    The Kauffman bracket state sum of each diagram is computed numerically with complex NumPy arrays holding all
+    requested points, so each diagram is expanded only once. No symbolic polynomials are computed (except for
+    diagrams of the knot table, for which the precomputed polynomials are evaluated).
+
+    Points are given by ``roots``: an integer ``n`` stands for the primitive root of unity ``t = e^(2πi/n)``, any
+    other number (or SymPy number) is used as the value of ``t``. The bracket is evaluated at the principal value
+    ``A = t^(-1/4)``, so for links with half-integer exponents ``t^(1/2)`` is the principal square root.
+
+    Args:
+        diagrams: Iterable of knot or link diagrams.
+        roots: Iterable of points (integers n for the roots of unity e^(2πi/n), or numbers).
+        exact: If True, evaluate exactly over the cyclotomic integers. All roots must then be integers ``n`` and
+            the value at ``e^(2πi/n)`` is returned as the tuple of integer coordinates in the power basis
+            ``1, ζ, ..., ζ^(φ(4n)-1)`` of ``Z[ζ]``, where ``ζ = e^(2πi/(4n))``.
+        dtype: NumPy complex type of the numeric evaluation, ``"complex128"`` or ``"clongdouble"`` (extended
+            precision, where supported by the platform).
+        error_bound: If True (numeric mode only), also return an a priori bound for the absolute rounding error of
+            each diagram. The bound holds for points on the unit circle (see :func:`_rounding_error_bound`).
+
+    Returns:
+        numpy.ndarray | list: In numeric mode, a complex array of shape ``(len(diagrams), len(roots))`` (and an
+        array of error bounds if ``error_bound`` is True). In exact mode, a list (one entry per diagram) of lists of
+        coefficient tuples (one per root).
+
+    Raises:
+        ValueError: If exact evaluation is requested for non-integer roots, or error bounds are requested for points
+            off the unit circle or in exact mode.
+
+    Examples:
+        >>> abs(jones_evaluations([knot("4_1")], roots=[2, 3])).round(12)
+        array([[5., 1.]])
+        >>> jones_evaluations([knot("3_1")], roots=[3], exact=True)
+        [[(1, 0, 0, 0)]]
+    """
+    roots = list(roots)
+    diagrams = list(diagrams)
+
+    if exact:
+        if error_bound:
+            raise ValueError("Error bounds are only available for numeric evaluations")
+        if not all(isinstance(n, Integral) and n >= 1 for n in roots):
+            raise ValueError("Exact evaluations are only supported at roots of unity e^(2πi/n) given by integers n")
+        result = [[] for _ in diagrams]
+        for n in roots:
+            zeta = _PointValue.variable(1).root(4 * n)  # zeta = e^(2πi/(4n))
+            cyclotomic = sp.Poly(sp.cyclotomic_poly(4 * n, _t), _t)
+            degree = cyclotomic.degree()
+            A = zeta ** _principal_quartic_root_exponent(n)
+            for i, k in enumerate(diagrams):
+                coefficients = _bracket(k, normalize=True, A=A).data
+                remainder = sp.Poly(list(reversed([int(c) for c in coefficients])), _t).rem(cyclotomic)
+                remainder = [int(c) for c in reversed(remainder.all_coeffs())]
+                result[i].append(tuple(remainder + [0] * (degree - len(remainder))))
+        return result
+
+    import numpy as np
+
+    complex_type = np.dtype(dtype).type
+    pi_ = np.arccos(np.finfo(complex_type).dtype.type(-1))  # π in the precision of dtype
+    A_values = []
+    on_unit_circle = True
+    for t in roots:
+        if isinstance(t, Integral):
+            A_values.append(complex_type(1) if t == 1 else np.exp(complex_type(-1j) * pi_ / (2 * t)))
+        else:
+            t = complex(sp.N(t)) if isinstance(t, sp.Basic) else complex(t)
+            on_unit_circle = on_unit_circle and abs(abs(t) - 1) < 1e-12
+            A_values.append(complex_type(t) ** complex_type(-0.25))
+    A = _PointValue([np.array(A_values, dtype=complex_type)])
+
+    values = np.empty((len(diagrams), len(roots)), dtype=complex_type)
+    for i, k in enumerate(diagrams):
+        values[i] = _bracket(k, normalize=True, A=A).data[0]
+
+    if not error_bound:
+        return values
+    if not on_unit_circle:
+        raise ValueError("Error bounds are only available for points on the unit circle")
+    eps = float(np.finfo(complex_type).eps)
+    bounds = np.array([_rounding_error_bound(len(k.crossings), eps) for k in diagrams])
+    return values, bounds
+
+
+def _rounding_error_bound(crossings: int, eps: float) -> float:
+    """Return an a priori bound for the absolute rounding error of the numeric state sum at a point on the unit circle.
+
+    With the unit roundoff ``u = eps/2``, a complex multiplication has a relative error of at most ``√5·u`` and a
+    complex addition of at most ``u`` (Higham, Accuracy and Stability of Numerical Algorithms, §3.6), and ``n``
+    operations with relative errors at most ``r`` accumulate to at most ``γ(n, r) = n·r / (1 - n·r)``.
+
+    For a diagram with ``c`` crossings and ``|A| = 1``:
+
+    - there are at most ``2^c`` states, each term is a product of at most ``4c + 4`` factors: ``c`` smoothing factors
+      ``A^(±1)``, at most ``c + 1`` loop factors ``d = -A^2 - A^(-2)`` (two roundings each) and at most ``c + 1``
+      framing factors ``(-A^3)^(±1)``,
+    - a term has modulus at most ``|d|^c ≤ 2^c``, so the sum of the moduli of the terms is at most ``4^c``,
+    - the terms are added by at most ``2^c`` additions.
+
+    The error is thus at most ``(γ(4c + 4, √5·u) + γ(2^c, u)·(1 + γ(4c + 4, √5·u)))·4^c``.
+    """
+    u = eps / 2
+
+    def gamma(n: int, r: float) -> float:
+        return n * r / (1 - n * r)
+
+    products = gamma(4 * crossings + 4, 5 ** 0.5 * u)
+    return (products + gamma(2 ** crossings, u) * (1 + products)) * 4 ** crossings
+
+
 if __name__ == "__main__":
     pass
@@ -38,72 +38,104 @@ __all__ = ["kauffman"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
-from collections import deque
 import sympy as sp
 
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
 from knotpy.reidemeister.simplify import simplify_decreasing
-from knotpy.algorithms.remove import remove_unknots
-from knotpy.invariants.homflypt import _choose_crossing_for_switching
+from knotpy.invariants.homflypt import _choose_crossing_for_switching, _memoized_skein_sum
+from knotpy.invariants.cache import LRUCache
 from knotpy.algorithms.symmetry import mirror
 from knotpy.invariants.skein import smoothen_crossing
 from knotpy.invariants.writhe import writhe
 from knotpy.algorithms.orientation import unorient
 from knotpy.invariants._symbols import _a, _z, _KAUFFMAN_2_VARIABLE_SUM
+from knotpy.invariants._evaluation import _PointValue
+from knotpy.invariants.persistent_cache import persistent_invariant
 
 
-def _compute_kauffman(k: PlanarDiagram) -> sp.Expr:
-    stack = deque([k.copy(_coefficient=sp.Integer(1), _unknots=0)])
-    polynomial = sp.Integer(0)
+# symbolic (unnormalized) Kauffman polynomials of sub-diagrams in skein trees
+_kauffman_skein_cache = LRUCache(max_number_of_nodes=8, max_size=200000, size=lambda p: len(sp.Add.make_args(p)),
+                                 name="kauffman_skein")
 
-    while stack:
-        k = stack.pop()
+
+def _compute_kauffman(k: PlanarDiagram, a=_a, z=_z) -> sp.Expr:
+    """Compute the (unnormalized) Kauffman polynomial L, where ``a`` and ``z`` are symbols or point values.
+
+    Symbolic values of sub-diagrams (with framing 0) are memoized in ``_kauffman_skein_cache``.
+    """
+    is_symbolic = a is _a
+    kauffman_sum = _KAUFFMAN_2_VARIABLE_SUM if is_symbolic else a * z ** (-1) + a ** (-1) * z ** (-1) - 1
+
+    def _reduce(k):
         k = simplify_decreasing(k, inplace=True)
-        k.attr["_unknots"] += remove_unknots(k)
-
-        k, crossing = _choose_crossing_for_switching(
-            k, sum_coefficient=_KAUFFMAN_2_VARIABLE_SUM
-        )
-
-        if crossing is not None:
-            k_switch = mirror(k, [crossing], inplace=False)
-            k_smooth_A = smoothen_crossing(k, crossing, method="A", inplace=False)
-            k_smooth_B = smoothen_crossing(k, crossing, method="B", inplace=False)
-
-            k_switch.attr["_coefficient"] *= -1
-            k_smooth_A.attr["_coefficient"] *= _z
-            k_smooth_B.attr["_coefficient"] *= _z
-
-            stack.append(k_switch)
-            stack.append(k_smooth_A)
-            stack.append(k_smooth_B)
-        else:
-            if len(k) == 0:
-                polynomial += sp.expand(
-                    k.attr["_coefficient"]
-                    * (_a ** k.framing)
-                    * _KAUFFMAN_2_VARIABLE_SUM ** (k.attr["_unknots"] - 1)
-                )
-            else:
-                raise ValueError(
-                    "Got a reduced HOMFLYPT polynomial state with vertices or crossings."
-                )
-
-    return polynomial
-
-
-def kauffman(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Expr:
+        factor = a ** k.framing
+        k.framing = 0  # L(s^+) = a L(s), so the framing only contributes a factor
+        return k, factor
+
+    def _expand(k):
+        k.attr["_unknots"] = 0
+        k, crossing = _choose_crossing_for_switching(k)
+        unknots = k.attr["_unknots"]
+
+        if crossing is None:
+            if len(k) != 0 or unknots == 0:
+                raise ValueError("Got a reduced Kauffman polynomial state with vertices or crossings.")
+            return a ** k.framing * kauffman_sum ** (unknots - 1), []
+
+        k_switch = mirror(k, [crossing], inplace=False)
+        k_smooth_A = smoothen_crossing(k, crossing, method="A", inplace=False)
+        k_smooth_B = smoothen_crossing(k, crossing, method="B", inplace=False)
+        for k_ in (k_switch, k_smooth_A, k_smooth_B):
+            k_.framing = 0
+        return a ** k.framing * kauffman_sum ** unknots, [(-1, k_switch), (z, k_smooth_A), (z, k_smooth_B)]
+
+    cache = _kauffman_skein_cache if is_symbolic else LRUCache(_kauffman_skein_cache.max_number_of_nodes)
+    return _memoized_skein_sum(k.copy(), _reduce, _expand, kauffman_sum, cache)
+
+
+@persistent_invariant("kauffman")
+def kauffman(k: PlanarDiagram | OrientedPlanarDiagram, evaluate_at=None, modulus: int | None = None) -> sp.Expr:
+    """Compute the Kauffman 2-variable polynomial F(a, z).
+
+    Args:
+        k: Knot or link diagram (oriented or unoriented).
+        evaluate_at: If given, the state sum is computed numerically at the given point(s) instead of symbolically.
+            Either a dictionary ``{"a": value, "z": value}`` or a tuple ``(a, z)``. Values can be integers,
+            fractions, floats or complex numbers, or sequences of such values, in which case all points are
+            evaluated at once (vectorized with NumPy).
+        modulus: If given (together with ``evaluate_at``), the evaluation is computed modulo ``modulus``.
+
+    Returns:
+        sympy.Expr: The Kauffman polynomial in variables ``a`` and ``z``, or its value(s) at ``evaluate_at``.
+
+    Raises:
+        ValueError: If a modulus is given without evaluation points, or the evaluation points are invalid.
+    """
+    if evaluate_at is not None:
+        if isinstance(evaluate_at, dict):
+            evaluate_at = {str(key): value for key, value in evaluate_at.items()}
+            if set(evaluate_at) != {"a", "z"}:
+                raise ValueError("Evaluation points should be given for the variables a, z")
+            evaluate_at = (evaluate_at["a"], evaluate_at["z"])
+        if len(evaluate_at) != 2:
+            raise ValueError("Evaluation points should be given for the variables a, z")
+        a, z = (_PointValue.variable(value, modulus) for value in evaluate_at)
+    elif modulus is not None:
+        raise ValueError("The modulus can only be used together with evaluation points")
+    else:
+        a, z = _a, _z
+
     original_knot = k
     k = unorient(k) if k.is_oriented() else k.copy()
     if not k.is_framed():
         k.framing = 0
 
-    polynomial = _compute_kauffman(k)
+    polynomial = _compute_kauffman(k, a, z)
 
     original_framing = original_knot.framing if original_knot.is_framed() else 0
-    polynomial *= _a ** (writhe(original_knot) + original_framing)
+    polynomial *= a ** (writhe(original_knot) + original_framing)
 
-    return sp.expand(polynomial)
+    return sp.expand(polynomial) if evaluate_at is None else polynomial.value()
 
 
 if __name__ == "__main__":
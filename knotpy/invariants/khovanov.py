@@ -0,0 +1,561 @@
+# knotpy/invariants/khovanov.py
+"""
+Khovanov homology of knots and links, computed by Bar-Natan's local algorithm.
+
+Crossings are added to a tangle one at a time. The complex of the tangle lives in Bar-Natan's category of
+crossingless tangles and dotted cobordisms (with ``t = h = 0``, i.e. the original Khovanov theory): after adding a
+crossing, closed loops are removed by delooping (a loop is isomorphic to the empty tangle shifted by ``q`` and by
+``q^-1``) and all isomorphisms in the differential are removed by Gaussian elimination, so the complex stays small.
+When all crossings are added, the tangle is closed, the differentials are integer matrices and the homology is read
+from their Smith normal forms (or their ranks modulo a prime).
+
+A morphism between crossingless tangles ``a`` and ``b`` (without loops) is stored as a linear combination of dotted
+disks: each cycle of ``a ∪ b`` bounds a disk carrying at most one dot, and a term is given by the bit mask of the
+dotted cycles. By neck cutting, a connected surface of genus ``g`` with ``d`` dots and ``k`` boundary cycles equals
+``2^g`` times the sum of the disks with ``k - 1 + d + g`` dots (and vanishes if ``d + g > 1``).
+
+The smoothings follow :func:`knotpy.invariants.skein.smoothen_crossing`: the 0-smoothing of a crossing is the "A"
+smoothing (joining the positions 0, 1 and 2, 3) and the 1-smoothing is the "B" smoothing. Crossings are added in a
+greedy order that keeps the boundary of the tangle small.
+
+References:
+    Mikhail Khovanov, *A categorification of the Jones polynomial*, Duke Math. J. 101 (2000), no. 3, 359–426.
+
+    Dror Bar-Natan, *Fast Khovanov homology computations*, J. Knot Theory Ramifications 16 (2007), no. 3, 243–255.
+"""
+
+from __future__ import annotations
+
+__all__ = ["khovanov_homology", "khovanov_polynomial", "khovanov_homologies"]
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable
+
+import sympy as sp
+
+from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
+from knotpy.algorithms.orientation import orient
+from knotpy.invariants._state_sum import _boundary_graph, _TERMINAL
+from knotpy.invariants.persistent_cache import persistent_invariant
+from knotpy.invariants._symbols import _q, _t
+from knotpy.utils.integer_matrix import smith_normal_form_diagonal
+
+# positions joined by the 0-smoothing ("A") and the 1-smoothing ("B") of a crossing
+_SMOOTHINGS = (((0, 1), (2, 3)), ((1, 2), (3, 0)))
+
+
+def _matching(pairs) -> tuple:
+    """Return the canonical form (sorted tuple of sorted pairs) of a crossingless matching."""
+    return tuple(sorted((x, y) if x <= y else (y, x) for x, y in pairs))
+
+
+def _glue_matchings(a: tuple, s: tuple) -> tuple[tuple, list]:
+    """Glue two crossingless tangles along their common boundary points.
+
+    Returns:
+        The pair ``(matching, loops)`` of the resulting tangle, loops are given by the sets of their (glued) points.
+    """
+    edges = a + s
+    neighbours = defaultdict(list)
+    for e, (x, y) in enumerate(edges):
+        neighbours[x].append((e, y))
+        neighbours[y].append((e, x))
+
+    used = [False] * len(edges)
+    pairs = []
+    for p, incident in neighbours.items():
+        if len(incident) != 1 or used[incident[0][0]]:
+            continue
+        e, x = incident[0]
+        while True:
+            used[e] = True
+            if len(neighbours[x]) == 1:
+                break
+            first, second = neighbours[x]
+            e, x = second if first[0] == e else first
+        pairs.append((p, x))
+
+    loops = []
+    for e0 in range(len(edges)):
+        if used[e0]:
+            continue
+        points = set()
+        e, x = e0, edges[e0][0]
+        while not used[e]:
+            used[e] = True
+            x = edges[e][1] if edges[e][0] == x else edges[e][0]
+            points.add(x)
+            first, second = neighbours[x]
+            e = second[0] if first[0] == e else first[0]
+        loops.append(frozenset(points))
+
+    return _matching(pairs), loops
+
+
+def _surface_components(number_of_pieces: int, joins: list, cycle_pieces: list) -> list[tuple[int, int, list]]:
+    """Return the components of a surface glued from disks.
+
+    Args:
+        number_of_pieces: Number of disks.
+        joins: Pairs of disks glued along an interval of their boundaries (a disk can be glued to itself).
+        cycle_pieces: For each boundary cycle of the glued surface, a disk containing (a part of) the cycle.
+
+    Returns:
+        list: Triples ``(pieces, genus, cycles)`` of the components, ``pieces`` is the bit mask of the disks.
+    """
+    parent = list(range(number_of_pieces))
+
+    def _find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for x, y in joins:
+        parent[_find(x)] = _find(y)
+
+    euler = defaultdict(int)
+    pieces = defaultdict(int)
+    cycles = defaultdict(list)
+    for x in range(number_of_pieces):
+        root = _find(x)
+        euler[root] += 1
+        pieces[root] |= 1 << x
+    for x, _ in joins:
+        euler[_find(x)] -= 1
+    for index, x in enumerate(cycle_pieces):
+        cycles[_find(x)].append(index)
+
+    return [(pieces[root], (2 - len(cycles[root]) - euler[root]) // 2, cycles[root]) for root in pieces]
+
+
+def _expand(components: list, dots: int, coefficient: int) -> list[tuple[int, int]]:
+    """Neck-cut a dotted surface into dotted disks.
+
+    Args:
+        components: Components of the surface (see :func:`_surface_components`).
+        dots: Bit mask of the dotted pieces.
+        coefficient: Coefficient of the surface.
+
+    Returns:
+        list: Pairs ``(mask, coefficient)``, where ``mask`` is the bit mask of the dotted boundary cycles.
+    """
+    terms = [(0, coefficient)]
+    for pieces, genus, cycles in components:
+        excess = (dots & pieces).bit_count() + genus
+        if excess > 1:
+            return []
+        all_cycles = 0
+        for cycle in cycles:
+            all_cycles |= 1 << cycle
+        if excess:
+            terms = [(mask | all_cycles, c << genus) for mask, c in terms]
+        else:
+            terms = [(mask | (all_cycles ^ (1 << cycle)), c) for mask, c in terms for cycle in cycles]
+    return terms
+
+
+class _TangleComplex:
+    """Chain complex of the tangle formed by the crossings added so far.
+
+    Objects are triples ``(homological degree, matching, q-degree)`` of crossingless tangles without loops, and the
+    differential is stored in both directions as ``out[i][j] = inc[j][i] = {mask: coefficient}`` (the same
+    dictionary).
+    """
+
+    def __init__(self, modulus: int | None = None, loops: int = 0) -> None:
+        self.modulus = modulus
+        self.boundary = set()
+        self.objects = {}
+        self.out = {}
+        self.inc = {}
+        self._next_object = 0
+        self._cycles_cache = {}
+        self._composition_cache = {}
+        for choice in range(1 << loops):
+            self._add_object(0, (), 2 * choice.bit_count() - loops)
+
+    def _add_object(self, degree: int, matching: tuple, q: int) -> int:
+        i = self._next_object
+        self._next_object += 1
+        self.objects[i] = (degree, matching, q)
+        self.out[i] = {}
+        self.inc[i] = {}
+        return i
+
+    def _add_term(self, i: int, j: int, mask: int, coefficient: int) -> None:
+        """Add a term to the differential from object ``i`` to object ``j``."""
+        morphism = self.out[i].get(j)
+        if morphism is None:
+            morphism = self.out[i][j] = self.inc[j][i] = {}
+        value = morphism.get(mask, 0) + coefficient
+        if self.modulus is not None:
+            value %= self.modulus
+        if value:
+            morphism[mask] = value
+        else:
+            morphism.pop(mask, None)
+            if not morphism:
+                del self.out[i][j], self.inc[j][i]
+
+    # cobordisms
+
+    def _cycles(self, a: tuple, b: tuple) -> tuple[list, dict]:
+        """Return the cycles of ``a ∪ b`` (sorted by their minimal points) and the index of the cycle of each point."""
+        key = (a, b)
+        cached = self._cycles_cache.get(key)
+        if cached is None:
+            partner_a, partner_b = {}, {}
+            for x, y in a:
+                partner_a[x], partner_a[y] = y, x
+            for x, y in b:
+                partner_b[x], partner_b[y] = y, x
+            cycles, seen = [], set()
+            for start in sorted(partner_a):
+                if start in seen:
+                    continue
+                cycle, x = [], start
+                while x not in seen:
+                    y = partner_a[x]
+                    seen.update((x, y))
+                    cycle += [x, y]
+                    x = partner_b[y]
+                cycles.append(cycle)
+            index = {x: i for i, cycle in enumerate(cycles) for x in cycle}
+            cached = self._cycles_cache[key] = (cycles, index)
+        return cached
+
+    def _compose(self, f: dict, a: tuple, b: tuple, g: dict, c: tuple) -> dict:
+        """Return the composition ``g ∘ f`` of the morphisms ``f: a → b`` and ``g: b → c``."""
+        key = (a, b, c)
+        components = self._composition_cache.get(key)
+        if components is None:
+            cycles_ab, index_ab = self._cycles(a, b)
+            cycles_bc, index_bc = self._cycles(b, c)
+            cycles_ac, _ = self._cycles(a, c)
+            n = len(cycles_ab)
+            joins = [(index_ab[x], n + index_bc[x]) for x, _ in b]
+            cycle_pieces = [index_ab[cycle[0]] for cycle in cycles_ac]
+            components = self._composition_cache[key] = _surface_components(n + len(cycles_bc), joins, cycle_pieces)
+
+        n = len(self._cycles(a, b)[0])
+        result = defaultdict(int)
+        for mask_f, c_f in f.items():
+            for mask_g, c_g in g.items():
+                for mask, c in _expand(components, mask_f | (mask_g << n), c_f * c_g):
+                    result[mask] += c
+        if self.modulus is not None:
+            return {mask: c % self.modulus for mask, c in result.items() if c % self.modulus}
+        return {mask: c for mask, c in result.items() if c}
+
+    # adding crossings
+
+    def add_crossing(self, arcs: tuple) -> None:
+        """Add a crossing with the arcs ``arcs`` at its positions 0, 1, 2, 3 to the tangle and simplify the complex."""
+        glued = self.boundary & set(arcs)
+        smoothings = [_matching((arcs[p], arcs[q]) for p, q in pairs) for pairs in _SMOOTHINGS]
+        for x in arcs:
+            self.boundary ^= {x}
+
+        objects, out = self.objects, self.out
+        self.objects, self.out, self.inc = {}, {}, {}
+        self._next_object = 0
+
+        # objects (o, s) of the new complex are delooped: choice bit 1 means the loop is replaced by q, bit 0 by q^-1
+        new_objects = {}
+        glued_matchings = {}
+        for o, (degree, a, q) in objects.items():
+            for s in (0, 1):
+                if (a, s) not in glued_matchings:
+                    glued_matchings[a, s] = _glue_matchings(a, smoothings[s])
+                matching, loops = glued_matchings[a, s]
+                new_objects[o, s] = [self._add_object(degree + s, matching, q + s + 2 * choice.bit_count() - len(loops))
+                                     for choice in range(1 << len(loops))]
+
+        # d ⊗ id
+        structures = {}
+        for o, targets in out.items():
+            a = objects[o][1]
+            for o2, morphism in targets.items():
+                b = objects[o2][1]
+                for s in (0, 1):
+                    key = (a, b, s)
+                    if key not in structures:
+                        structures[key] = self._identity_structure(a, b, smoothings[s], s, glued, glued_matchings)
+                    self._add_glued(morphism, structures[key], new_objects[o, s], new_objects[o2, s])
+
+        # id ⊗ saddle with the sign (-1)^degree
+        for o, (degree, a, q) in objects.items():
+            key = (a, None)
+            if key not in structures:
+                structures[key] = self._saddle_structure(a, smoothings, arcs, glued, glued_matchings)
+            self._add_glued({0: -1 if degree % 2 else 1}, structures[key], new_objects[o, 0], new_objects[o, 1])
+
+        self._cycles_cache.clear()
+        self._composition_cache.clear()
+        self.simplify()
+
+    def _identity_structure(self, a: tuple, b: tuple, s: tuple, smoothing: int, glued: set,
+                            glued_matchings: dict) -> tuple:
+        """Return the structure of the surface ``f ⊗ id_s`` for morphisms ``f: a → b`` (``s`` is the smoothing)."""
+        cycles_ab, index_ab = self._cycles(a, b)
+        n = len(cycles_ab)
+        strips = defaultdict(list)
+        for index, (x, y) in enumerate(s):
+            strips[x].append(n + index)
+            strips[y].append(n + index)
+        joins = [(index_ab[x], strips[x][0]) for x in glued]
+        joins += [tuple(pieces) for x, pieces in strips.items() if len(pieces) == 2]  # arcs of kinks
+
+        a_glued, loops_a = glued_matchings[a, smoothing]
+        b_glued, loops_b = glued_matchings[b, smoothing]
+        cycles, _ = self._cycles(a_glued, b_glued)
+        cycle_pieces = [index_ab[x] if x in index_ab else strips[x][0] for x in (cycle[0] for cycle in cycles)]
+        cycle_pieces += [strips[next(iter(loop))][0] for loop in loops_a + loops_b]
+        components = _surface_components(n + len(s), joins, cycle_pieces)
+        return components, len(cycles), len(loops_a), len(loops_b)
+
+    def _saddle_structure(self, a: tuple, smoothings: list, arcs: tuple, glued: set, glued_matchings: dict) -> tuple:
+        """Return the structure of the surface ``id_a ⊗ saddle``."""
+        strips = {}
+        for index, (x, y) in enumerate(a):
+            strips[x] = strips[y] = index
+        saddle = len(a)
+        joins = [(strips[x], saddle) for x in glued]
+        joins += [(saddle, saddle)] * (len(arcs) - len(set(arcs)))  # arcs of kinks
+
+        source, loops_0 = glued_matchings[a, 0]
+        target, loops_1 = glued_matchings[a, 1]
+        cycles, _ = self._cycles(source, target)
+        cycle_pieces = [strips.get(cycle[0], saddle) for cycle in cycles]
+        cycle_pieces += [saddle] * (len(loops_0) + len(loops_1))
+        components = _surface_components(len(a) + 1, joins, cycle_pieces)
+        return components, len(cycles), len(loops_0), len(loops_1)
+
+    def _add_glued(self, morphism: dict, structure: tuple, sources: list, targets: list) -> None:
+        """Add the glued morphism to the differential between the delooped objects."""
+        components, n, loops_source, loops_target = structure
+        base = (1 << n) - 1
+        source_mask = (1 << loops_source) - 1
+        target_mask = (1 << loops_target) - 1
+        for dots, coefficient in morphism.items():
+            for mask, c in _expand(components, dots, coefficient):
+                # a dotted loop in the source pairs with q (cup), an undotted loop in the target with q (dotted cap)
+                source = sources[(mask >> n) & source_mask]
+                target = targets[~(mask >> (n + loops_source)) & target_mask]
+                self._add_term(source, target, mask & base, c)
+
+    # simplification
+
+    def _unit(self, i: int, j: int, morphism: dict) -> int | None:
+        """Return the coefficient if the morphism from ``i`` to ``j`` is an invertible multiple of the identity."""
+        if len(morphism) != 1 or 0 not in morphism:
+            return None
+        _, a, q = self.objects[i]
+        _, b, r = self.objects[j]
+        if a != b or q != r:
+            return None
+        c = morphism[0]
+        if self.modulus is None:
+            return c if c in (1, -1) else None
+        return c
+
+    def simplify(self) -> None:
+        """Remove all invertible components of the differential by Gaussian elimination."""
+        stack = list(self.objects)
+        while stack:
+            i = stack.pop()
+            if i not in self.objects:
+                continue
+            best = None
+            for j, morphism in self.out[i].items():
+                c = self._unit(i, j, morphism)
+                if c is not None:
+                    cost = (len(self.inc[j]) - 1) * (len(self.out[i]) - 1)
+                    if best is None or cost < best[0]:
+                        best = (cost, j, c)
+                        if not cost:
+                            break
+            if best is not None:
+                _, j, c = best
+                stack.extend(i2 for i2 in self.inc[j] if i2 != i)
+                self._eliminate(i, j, c)
+
+    def _eliminate(self, i: int, j: int, c: int) -> None:
+        """Gaussian elimination of the isomorphism ``c * id`` from ``i`` to ``j``."""
+        inverse = c if self.modulus is None else pow(c, -1, self.modulus)
+        a = self.objects[i][1]
+        sources = [(i2, f) for i2, f in self.inc[j].items() if i2 != i]
+        targets = [(j2, g) for j2, g in self.out[i].items() if j2 != j]
+        for i2, f in sources:
+            a2 = self.objects[i2][1]
+            for j2, g in targets:
+                for mask, value in self._compose(f, a2, a, g, self.objects[j2][1]).items():
+                    self._add_term(i2, j2, mask, -inverse * value)
+
+        for x in (i, j):
+            for y in self.out.pop(x):
+                del self.inc[y][x]
+            for y in self.inc.pop(x):
+                del self.out[y][x]
+            del self.objects[x]
+
+    # homology
+
+    def homology(self) -> dict[tuple[int, int], tuple[int, tuple]]:
+        """Return the homology of a closed tangle as ``{(degree, q): (rank, torsion)}``."""
+        groups = defaultdict(list)
+        for i, (degree, _, q) in self.objects.items():
+            groups[degree, q].append(i)
+
+        differentials = {}  # (degree, q) -> (rank, invariant factors) of the differential from the group
+        for (degree, q), sources in groups.items():
+            targets = groups.get((degree + 1, q), [])
+            matrix = [[self.out[i].get(j, {}).get(0, 0) for i in sources] for j in targets]
+            if self.modulus is None:
+                factors = [d for d in smith_normal_form_diagonal(matrix) if d] if targets else []
+                differentials[degree, q] = (len(factors), tuple(d for d in factors if d > 1))
+            else:
+                differentials[degree, q] = (_rank_modulo(matrix, self.modulus), ())
+
+        result = {}
+        for (degree, q), objects in groups.items():
+            rank_out = differentials[degree, q][0]
+            rank_in, torsion = differentials.get((degree - 1, q), (0, ()))
+            rank = len(objects) - rank_out - rank_in
+            if rank or torsion:
+                result[degree, q] = (rank, torsion)
+        return result
+
+
+def _rank_modulo(matrix: list[list[int]], modulus: int) -> int:
+    """Return the rank of an integer matrix modulo a prime."""
+    rows = [[x % modulus for x in row] for row in matrix]
+    rank = 0
+    columns = len(rows[0]) if rows else 0
+    for column in range(columns):
+        pivot = next((r for r in range(rank, len(rows)) if rows[r][column]), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        inverse = pow(rows[rank][column], -1, modulus)
+        rows[rank] = [x * inverse % modulus for x in rows[rank]]
+        for r in range(len(rows)):
+            if r != rank and rows[r][column]:
+                factor = rows[r][column]
+                rows[r] = [(x - factor * y) % modulus for x, y in zip(rows[r], rows[rank])]
+        rank += 1
+    return rank
+
+
+def _crossing_order(crossing_arcs: list[tuple]) -> list[int]:
+    """Return a greedy order of the crossings that keeps the boundary of the partial tangle small."""
+    remaining = set(range(len(crossing_arcs)))
+    boundary = set()
+    order = []
+    while remaining:
+        def _cost(i):
+            new_boundary = set(boundary)
+            for x in crossing_arcs[i]:
+                new_boundary ^= {x}
+            return len(new_boundary), -len(boundary & set(crossing_arcs[i])), i
+
+        i = min(remaining, key=_cost)
+        remaining.remove(i)
+        order.append(i)
+        for x in crossing_arcs[i]:
+            boundary ^= {x}
+    return order
+
+
+@persistent_invariant("khovanov_homology")
+def khovanov_homology(k: PlanarDiagram | OrientedPlanarDiagram, modulus: int | None = None) \
+        -> dict[tuple[int, int], tuple[int, tuple[int, ...]]]:
+    """Compute the Khovanov homology of a knot or link.
+
+    Args:
+        k: Planar diagram of a knot or link. If not oriented, it will be oriented internally.
+        modulus: If given, the homology is computed with coefficients in ``Z/modulus`` (the modulus must be a prime),
+            otherwise with integer coefficients.
+
+    Returns:
+        dict: A dictionary ``{(i, j): (rank, torsion)}`` of the nonzero groups ``Kh^{i,j}``, where ``i`` is the
+        homological degree, ``j`` the quantum degree, ``rank`` the rank of the free part (the dimension over
+        ``Z/modulus``) and ``torsion`` the tuple of orders of the cyclic torsion summands.
+
+    Raises:
+        ValueError: If the diagram is not a knot or link diagram, or the modulus is not a prime.
+
+    Examples:
+        >>> import knotpy as kp
+        >>> kp.khovanov_homology(kp.knot("3_1"))
+        {(0, 1): (1, ()), (0, 3): (1, ()), (2, 5): (1, ()), (3, 7): (0, (2,)), (3, 9): (1, ())}
+    """
+    if modulus is not None and (modulus < 2 or any(modulus % d == 0 for d in range(2, int(modulus ** 0.5) + 1))):
+        raise ValueError(f"The modulus {modulus} is not a prime")
+
+    k = k if k.is_oriented() else orient(k)
+    crossings = list(k.crossings)
+    graph = _boundary_graph(k, crossings, lambda c: ((_SMOOTHINGS[0], False, 0), (_SMOOTHINGS[1], False, 0)))
+    if graph.free_segments or _TERMINAL in graph.twin:
+        raise ValueError("Khovanov homology is only defined for knots and links")
+
+    crossing_arcs = [tuple(min(h, graph.twin[h]) for h in range(4 * i, 4 * i + 4)) for i in range(len(crossings))]
+    complex_ = _TangleComplex(modulus, loops=graph.free_circles)
+    for i in _crossing_order(crossing_arcs):
+        complex_.add_crossing(crossing_arcs[i])
+
+    positive = sum(1 for c in crossings if k.nodes[c].sign() > 0)
+    negative = len(crossings) - positive
+    return {(degree - negative, q + positive - 2 * negative): value
+            for (degree, q), value in sorted(complex_.homology().items())}
+
+
+def khovanov_polynomial(k: PlanarDiagram | OrientedPlanarDiagram, modulus: int | None = None) -> sp.Expr:
+    """Return the Poincaré polynomial ``sum_{i,j} rank(Kh^{i,j}) t^i q^j`` of the Khovanov homology.
+
+    Args:
+        k: Planar diagram of a knot or link.
+        modulus: If given, the ranks are the dimensions of the homology with coefficients in ``Z/modulus``.
+
+    Returns:
+        SymPy expression in ``t`` and ``q`` (torsion is not included, see :func:`khovanov_homology`).
+
+    Examples:
+        >>> import knotpy as kp
+        >>> kp.khovanov_polynomial(kp.knot("3_1"))
+        q**9*t**3 + q**5*t**2 + q**3 + q
+    """
+    homology = khovanov_homology(k, modulus=modulus)
+    return sp.Add(*(rank * _t ** i * _q ** j for (i, j), (rank, _) in homology.items() if rank))
+
+
+def khovanov_homologies(diagrams: Iterable[PlanarDiagram | OrientedPlanarDiagram], modulus: int | None = None,
+                        workers: int | None = None) -> list[dict]:
+    """Compute the Khovanov homologies of several diagrams in parallel.
+
+    Args:
+        diagrams: Knot or link diagrams.
+        modulus: Coefficients modulo a prime (see :func:`khovanov_homology`).
+        workers: Number of worker processes (``None`` or ``<= 0`` for the number of CPUs, ``1`` computes the
+            homologies in the current process).
+
+    Returns:
+        list: The homologies in the order of the diagrams.
+    """
+    diagrams = list(diagrams)
+    if workers is None or workers <= 0:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(diagrams) < 2:
+        return [khovanov_homology(k, modulus=modulus) for k in diagrams]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(khovanov_homology, modulus=modulus), diagrams))
+
+
+if __name__ == "__main__":
+    pass
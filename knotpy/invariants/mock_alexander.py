@@ -10,6 +10,8 @@ Notes:
     - Orientation is ensured internally (via :func:`orient`).
     - The outgoing terminal endpoint determines the starred face set.
     - Only endpoints on crossings contribute nontrivial weights.
+    - Partial markings with the same set of marked crossings are merged and their weights are accumulated as integer
+      Laurent coefficients, so the number of partial states is bounded by the number of sets of marked crossings.
 
 Returns:
     A SymPy expression in the symbol ``w``.
@@ -21,7 +23,7 @@ __all__ = ["mock_alexander_polynomial"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
-from collections import deque
+from collections import defaultdict
 import sympy as sp
 
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
@@ -54,13 +56,12 @@ def mock_alexander_polynomial(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Ex
     # Unstarred faces are those not incident to the chosen outgoing terminal.
     unstarred_faces = [face for face in k.faces if out_ep not in face]
 
-    # Stack holds pairs of (weight, marked_vertices_set)
-    stack: deque[tuple[sp.Expr, set]] = deque([(sp.Integer(1), set())])
+    # Partial markings with the same marked crossings are merged: marked vertices -> {exponent of w: coefficient}.
+    states: dict[frozenset, dict[int, int]] = {frozenset(): {0: 1}}
 
     for face in unstarred_faces:
-        new_stack: deque[tuple[sp.Expr, set]] = deque()
-        while stack:
-            weight, marked_vertices = stack.pop()
+        new_states: dict[frozenset, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        for marked_vertices, polynomial in states.items():
             for ep in face:
                 # Mark at most one crossing per face; skip already marked vertices.
                 if ep.node not in marked_vertices and isinstance(k.nodes[ep.node], Crossing):
@@ -69,20 +70,26 @@ def mock_alexander_polynomial(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Ex
                     is_positive = k.nodes[ep.node].sign() > 0
 
                     if is_outgoing and (not is_over) and is_positive:
-                        new_weight = _w
+                        sign, exponent = 1, 1  # w
                     elif (not is_outgoing) and is_over and (not is_positive):
-                        new_weight = -_w
+                        sign, exponent = -1, 1  # -w
                     elif is_outgoing and is_over and (not is_positive):
-                        new_weight = _w ** (-1)
+                        sign, exponent = 1, -1  # w^(-1)
                     elif (not is_outgoing) and (not is_over) and is_positive:
-                        new_weight = -_w ** (-1)
+                        sign, exponent = -1, -1  # -w^(-1)
                     else:
-                        new_weight = sp.Integer(1)
-
-                    new_stack.append((weight * new_weight, marked_vertices | {ep.node}))
-        stack = new_stack
-
-    polynomial = sum(w for w, _ in stack) if stack else sp.Integer(0)
+                        sign, exponent = 1, 0
+
+                    new_polynomial = new_states[marked_vertices | {ep.node}]
+                    for e, c in polynomial.items():
+                        new_polynomial[e + exponent] += sign * c
+        states = new_states
+
+    coefficients = defaultdict(int)
+    for polynomial in states.values():
+        for e, c in polynomial.items():
+            coefficients[e] += c
+    polynomial = sp.Add(*(c * _w ** e for e, c in coefficients.items() if c))
     return sp.expand(polynomial)
 
 
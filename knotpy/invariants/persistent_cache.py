@@ -0,0 +1,234 @@
+"""
+Persistent on-disk cache of invariant values shared across processes and runs.
+
+Values are stored in an SQLite database ``invariants.sqlite`` in the directory given by
+``settings.persistent_cache_dir`` (the cache is disabled if the setting is ``None``). Entries are keyed by the invariant
+name, the invariant version and the canonical form of the diagram (together with the remaining call arguments), so the
+same diagram with relabeled nodes hits the same entry. The database is used in write-ahead-log mode, which allows
+concurrent readers and writers, e.g. the workers of a process pool.
+
+Notes:
+    - Values are stored pickled, so only point the cache to directories you trust.
+    - When the total size of the stored values exceeds ``settings.persistent_cache_max_size`` bytes, the oldest entries
+      are removed.
+
+Example:
+    >>> import knotpy as kp
+    >>> kp.settings.persistent_cache_dir = "/tmp/knotpy-cache"
+    >>> kp.homflypt(kp.knot("3_1"))  # computed and stored
+    -v**4 + v**2*z**2 + 2*v**2
+    >>> kp.homflypt(kp.knot("3_1"))  # read from the cache (also in other processes)
+    -v**4 + v**2*z**2 + 2*v**2
+"""
+
+from __future__ import annotations
+
+__all__ = ["PersistentInvariantCache", "persistent_cache", "persistent_invariant"]
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+import os
+import pickle
+import sqlite3
+import time
+from functools import wraps
+from pathlib import Path
+
+from knotpy._settings import settings
+from knotpy.classes.planardiagram import PlanarDiagram
+from knotpy.algorithms.canonical import canonical
+from knotpy.algorithms.attributes import clear_temporary_attributes
+from knotpy.notation.native import to_knotpy_notation
+from knotpy.utils.cache import register_cache
+
+_DATABASE_NAME = "invariants.sqlite"
+_DEFAULT_MAX_SIZE = 2 ** 30  # bytes
+_EVICTION_CHECK_INTERVAL = 256  # check the total size after this many writes
+_TIMEOUT = 60.0  # seconds to wait for a lock held by another process
+
+# (directory, process id) -> cache, connections cannot be shared with forked processes
+_caches: dict[tuple[str, int], "PersistentInvariantCache"] = {}
+
+
+class PersistentInvariantCache:
+    """SQLite store of invariant values.
+
+    Args:
+        directory: Directory of the database (created if it does not exist).
+        max_size: Maximum total size of the stored (pickled) values in bytes.
+
+    Attributes:
+        hits: Number of successful lookups in this process.
+        misses: Number of failed lookups in this process.
+        writes: Number of stored values in this process.
+        evictions: Number of entries removed by this process due to the size limit.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_size: int = _DEFAULT_MAX_SIZE) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / _DATABASE_NAME
+        self.max_size = max_size
+        self.hits = self.misses = self.writes = self.evictions = 0
+
+        self._connection = sqlite3.connect(self.path, timeout=_TIMEOUT, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS invariants ("
+            "name TEXT NOT NULL, version TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, created REAL NOT NULL, PRIMARY KEY (name, version, key))"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS invariants_created ON invariants (created)")
+
+    def get(self, name: str, version: str, key: str) -> tuple[bool, object]:
+        """Return the pair ``(found, value)`` for the given invariant and key."""
+        row = self._connection.execute(
+            "SELECT value FROM invariants WHERE name = ? AND version = ? AND key = ?", (name, version, key)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, pickle.loads(row[0])
+
+    def set(self, name: str, version: str, key: str, value) -> None:
+        """Store the value of an invariant (values larger than ``max_size`` are not stored)."""
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+        self._connection.execute(
+            "INSERT OR REPLACE INTO invariants (name, version, key, value, size, created) VALUES (?, ?, ?, ?, ?, ?)",
+            (name, version, key, data, len(data), time.time()),
+        )
+        self.writes += 1
+        if self.writes % _EVICTION_CHECK_INTERVAL == 0:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the oldest entries until the total size of the values is at most 90% of ``max_size``."""
+        total = self.size()
+        if total <= self.max_size:
+            return
+        excess = total - self.max_size * 9 // 10
+        removed = 0
+        rows = self._connection.execute("SELECT rowid, size FROM invariants ORDER BY created").fetchall()
+        rowids = []
+        for rowid, size in rows:
+            if removed >= excess:
+                break
+            rowids.append((rowid,))
+            removed += size
+        self._connection.executemany("DELETE FROM invariants WHERE rowid = ?", rowids)
+        self.evictions += len(rowids)
+
+    def size(self) -> int:
+        """Return the total size of the stored values in bytes."""
+        return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM invariants").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM invariants").fetchone()[0]
+
+    def clear(self, name: str | None = None) -> None:
+        """Remove all entries (of the invariant ``name``, if given)."""
+        if name is None:
+            self._connection.execute("DELETE FROM invariants")
+        else:
+            self._connection.execute("DELETE FROM invariants WHERE name = ?", (name,))
+
+    def stats(self) -> dict:
+        """Return the statistics of this process and the number of entries and total size of the database."""
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes, "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0, "entries": len(self), "size": self.size()}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def persistent_cache() -> PersistentInvariantCache | None:
+    """Return the persistent cache in the directory ``settings.persistent_cache_dir`` (``None`` if disabled).
+
+    The size limit of the cache follows ``settings.persistent_cache_max_size``.
+    """
+    directory = settings.persistent_cache_dir
+    if directory is None:
+        return None
+    index = (os.path.abspath(directory), os.getpid())
+    if index not in _caches:
+        _caches[index] = PersistentInvariantCache(directory, max_size=settings.persistent_cache_max_size)
+        register_cache("persistent", _caches[index])
+    _caches[index].max_size = settings.persistent_cache_max_size
+    return _caches[index]
+
+
+def _diagram_key(k: PlanarDiagram) -> str | None:
+    """Return the canonical notation of the diagram without its name and temporary attributes."""
+    k = canonical(k)
+    clear_temporary_attributes(k)
+    k.attr.pop("name", None)
+    return to_knotpy_notation(k)
+
+
+def _is_simple(value) -> bool:
+    """Can the argument be part of a cache key (i.e. does it have a stable ``repr``)?"""
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return True
+    if isinstance(value, (tuple, list)):
+        return all(_is_simple(v) for v in value)
+    if isinstance(value, dict):
+        return all(_is_simple(key) and _is_simple(v) for key, v in value.items())
+    return False
+
+
+def persistent_invariant(name: str | None = None, version: str = "1"):
+    """Decorator that reads values of an invariant through the persistent cache.
+
+    The decorated function should take a diagram as the first argument. The result is looked up by the invariant
+    name, the version, the canonical form of the diagram and the remaining arguments. Calls with arguments that do not
+    have a stable representation (e.g. arrays), and all calls when ``settings.persistent_cache_dir`` is ``None``, are
+    passed to the function directly. Increase the version when the output of the invariant changes.
+
+    Args:
+        name: Name of the invariant (defaults to the name of the function).
+        version: Version of the invariant.
+
+    Returns:
+        Callable: The decorator.
+
+    Example:
+        >>> @persistent_invariant("crossing_number_upper_bound")
+        ... def crossing_number_upper_bound(k):
+        ...     return len(k.crossings)
+    """
+
+    def decorator(function):
+        invariant_name = name or function.__name__
+
+        @wraps(function)
+        def wrapper(k, *args, **kwargs):
+            cache = persistent_cache()
+            if cache is None or not isinstance(k, PlanarDiagram) or not _is_simple((args, kwargs)):
+                return function(k, *args, **kwargs)
+
+            key = _diagram_key(k)
+            if key is None:
+                return function(k, *args, **kwargs)
+            if args or kwargs:
+                key += " " + repr((args, sorted(kwargs.items())))
+
+            found, value = cache.get(invariant_name, version, key)
+            if found:
+                return value
+            value = function(k, *args, **kwargs)
+            cache.set(invariant_name, version, key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    pass
@@ -1,3 +1,5 @@
+import sympy as sp
+
 import knotpy as kp
 
 
@@ -49,6 +51,93 @@ def test_bracket_precomputed():
         assert h == hp
 
 
+def test_bracket_skein_cache():
+    import sys
+    bracket_module = sys.modules["knotpy.invariants.bracket"]
+
+    settings_dump = kp.settings.dump()
+    kp.settings.use_precomputed_invariants = False
+    try:
+        diagrams = [kp.knot(name) for name in ["11a_1", "11n_34", "12a_1", "12n_242"]]  # smaller ones are not memoized
+        bracket_module._bracket_skein_cache.clear()
+        cold = [kp.bracket(k) for k in diagrams]
+        assert bracket_module._bracket_skein_cache.hits > 0
+        warm = [kp.bracket(k) for k in diagrams]
+        uncached = []
+        for k in diagrams:
+            bracket_module._bracket_skein_cache.clear()
+            bracket_module._bracket_skein_cache.max_key_length = 0
+            uncached.append(kp.bracket(k))
+        bracket_module._bracket_skein_cache.max_key_length = 12
+
+        # skein module elements of a knotoid
+        k = kp.from_pd_notation("X[0,4,1,5],X[5,1,6,2],X[2,6,3,7],X[8,4,7,3],V[0],V[8]")
+        bracket_module._KBSM_cache.clear()
+        module_cold = kp.kauffman_bracket_skein_module(k)
+        module_warm = kp.kauffman_bracket_skein_module(k)
+
+        # the skein module element of a knot is its bracket times the unknot (the empty diagram is the basis)
+        knot_module = kp.kauffman_bracket_skein_module(diagrams[0])
+        assert bracket_module._KBSM_cache.hits > 0
+    finally:
+        kp.settings.load(settings_dump)
+
+    assert cold == warm == uncached
+    assert [kp.bracket(k) for k in diagrams] == cold  # precomputed
+    assert module_cold == module_warm
+    A = sp.Symbol("A")
+    assert len(knot_module) == 1 and sp.expand(knot_module[0][0] - (-A ** 2 - A ** -2) * cold[0]) == 0
+
+
+def test_bracket_cache_speed():
+    from time import perf_counter
+    import sys
+    bracket_module = sys.modules["knotpy.invariants.bracket"]
+    cache = bracket_module._bracket_skein_cache
+
+    def _time(diagrams, memoize):
+        max_key_length = cache.max_key_length
+        try:
+            cache.clear()
+            if not memoize:
+                cache.max_key_length = 0
+            t = perf_counter()
+            values = [kp.bracket(k) for k in diagrams]
+            return perf_counter() - t, values
+        finally:
+            cache.max_key_length = max_key_length
+
+    settings_dump = kp.settings.dump()
+    kp.settings.use_precomputed_invariants = False
+    try:
+        # minimal speedup of memoization, measured 2-3x (diagrams with 10 crossings are not memoized, the margin is
+        # for the timing noise)
+        for name, diagrams, min_speedup in [
+            ("10 crossings", kp.knots([10])[:20], None),
+            ("11 crossings", kp.knots([11])[:10], 1.8),
+            ("12 crossings", kp.knots([12])[:10], 1.8),
+        ]:
+            # alternate the runs, so that the timing noise of the machine affects both
+            times_uncached, times_cached = [], []
+            for _ in range(3):
+                time_uncached, uncached = _time(diagrams, memoize=False)
+                time_cached, cached = _time(diagrams, memoize=True)
+                times_uncached.append(time_uncached)
+                times_cached.append(time_cached)
+            time_uncached, time_cached = min(times_uncached), min(times_cached)
+
+            speedup = time_uncached / time_cached
+            print(f"{name}: uncached {time_uncached:.3f}s, cached {time_cached:.3f}s ({speedup:.1f}x, "
+                  f"hit rate {cache.hit_rate:.2f})")
+            assert cached == uncached
+            if min_speedup is None:
+                assert cache.hits + cache.misses == 0
+            else:
+                assert speedup >= min_speedup, (name, speedup)
+    finally:
+        kp.settings.load(settings_dump)
+
+
 if __name__ == "__main__":
     #test_bracket()
     #test_bracket_vs_homflypt()
@@ -49,6 +49,24 @@ def test_group_by_invariants():
     assert actual_keys4 == expected_keys_single, "Mismatch in single-func keys (parallel=True)"
 
 
+def test_group_by_invariants_builds_invariant_set_once(monkeypatch):
+    import sys
+    from knotpy.invariants.invariant_set import InvariantSet
+    classifier = sys.modules["knotpy.invariants.classifier"]
+
+    built = []
+
+    class _CountingInvariantSet(InvariantSet):
+        def __init__(self, invariants):
+            built.append(invariants)
+            super().__init__(invariants)
+
+    monkeypatch.setattr(classifier, "InvariantSet", _CountingInvariantSet)
+    groups = group_by_invariants(["alpha", "beta", "gamma", "dogma"], {"first": first_letter, "last": last_letter},
+                                 parallel=False)
+    assert len(groups) == 4 and len(built) == 1
+
+
 def test_saver():
     import knotpy as kp
     codes = ["a=V(b0) b=X(a0 c0 c3 d3) c=X(b1 e0 f3 b2) d=X(g0 g2 e1 b3) e=X(c1 d2 f1 f0) f=X(e3 e2 g1 c2) g=X(d0 f2 d1 h0) h=V(g3)",
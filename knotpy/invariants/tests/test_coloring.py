@@ -0,0 +1,59 @@
+import knotpy as kp
+from knotpy.invariants.coloring import (
+    number_of_colorings,
+    colorings,
+    tricolorable,
+    number_of_dehn_colorings,
+    coloring_numbers,
+    number_of_quandle_colorings,
+    dihedral_quandle,
+    alexander_quandle,
+)
+
+
+def test_fox_colorings():
+    assert number_of_colorings(kp.knot("0_1"), 3) == 3
+    assert number_of_colorings(kp.knot("3_1"), 3) == 9
+    assert number_of_colorings(kp.knot("4_1"), [3, 5]) == {3: 3, 5: 25}
+    assert number_of_colorings(kp.knot("5_2"), 7) == 49
+    assert number_of_colorings(kp.knot("8_18"), [3, 5, 6]) == {3: 27, 5: 25, 6: 54}
+    assert tricolorable(kp.knot("3_1"))
+    assert not tricolorable(kp.knot("4_1"))
+
+
+def test_enumerate_colorings():
+    for name in ["3_1", "4_1", "6_1", "8_18"]:
+        k = kp.knot(name)
+        for n in range(1, 7):
+            cols = list(colorings(k, n))
+            assert len(cols) == number_of_colorings(k, n)
+            assert len({tuple(sorted(c.items(), key=str)) for c in cols}) == len(cols)
+
+
+def test_dehn_colorings():
+    for k in [kp.knot("3_1"), kp.knot("6_1"), kp.add_unknot(kp.knot("3_1"), inplace=False)]:
+        fox = number_of_colorings(k, range(1, 8))
+        dehn = number_of_dehn_colorings(k, range(1, 8))
+        assert all(dehn[n] == n * fox[n] for n in fox)
+
+
+def test_coloring_numbers():
+    diagrams = [kp.knot("3_1"), kp.knot("4_1"), kp.knot("5_2")]
+    assert coloring_numbers(diagrams, [3, 5, 7]) == [[9, 5, 7], [3, 25, 7], [3, 5, 49]]
+
+
+def test_quandle_colorings():
+    k = kp.knot("3_1")
+    assert number_of_quandle_colorings(k, dihedral_quandle(3)) == 9
+    # the trefoil has Alexander polynomial t^2 - t + 1, which vanishes at t = 3 modulo 7
+    assert number_of_quandle_colorings(k, alexander_quandle(7, 3)) == 49
+    assert number_of_quandle_colorings(k, alexander_quandle(5, 2)) == 5
+    assert number_of_quandle_colorings(kp.knot("6_1"), alexander_quandle(5, 2)) == 25
+
+
+def test_quandle_colorings_reidemeister():
+    quandle = alexander_quandle(7, 3)
+    k = kp.orient(kp.knot("3_1"))
+    for _ in range(10):
+        k_ = kp.randomize_diagram(k, number_of_moves=5, max_crossings_increase=3)
+        assert number_of_quandle_colorings(k_, quandle) == 49
@@ -0,0 +1,121 @@
+from fractions import Fraction
+
+import sympy as sp
+
+import knotpy as kp
+from knotpy.invariants._symbols import _A, _t, _v, _z, _a
+
+
+def _mod(value, modulus):
+    value = Fraction(value)
+    return value.numerator * pow(value.denominator, -1, modulus) % modulus
+
+
+def _diagrams():
+    return [
+        kp.knot("3_1"),
+        kp.knot("4_1"),
+        kp.from_pd_notation("X[1,5,2,4],X[3,1,4,6],X[5,3,6,2]"),
+        kp.from_pd_notation("X[4,2,5,1],X[8,6,1,5],X[6,3,7,4],X[2,7,3,8]"),
+        kp.link("L2a1"),
+    ]
+
+
+def test_bracket_evaluation():
+    for k in _diagrams():
+        polynomial = kp.bracket(k)
+        assert kp.bracket(k, evaluate_at=2) == polynomial.subs(_A, 2)
+        assert kp.bracket(k, evaluate_at=Fraction(2, 3)) == polynomial.subs(_A, sp.Rational(2, 3))
+        values = kp.bracket(k, evaluate_at=[2, 3, 5], modulus=101)
+        assert list(values) == [_mod(polynomial.subs(_A, p), 101) for p in [2, 3, 5]]
+
+
+def test_jones_evaluation():
+    for k in _diagrams()[:4]:
+        polynomial = kp.jones(k)
+        assert kp.jones(k, evaluate_at=-1) == polynomial.subs(_t, -1)
+        assert list(kp.jones(k, evaluate_at=[2, 3])) == [polynomial.subs(_t, 2), polynomial.subs(_t, 3)]
+        assert kp.jones(k, evaluate_at=2, modulus=7) == _mod(polynomial.subs(_t, 2), 7)
+        assert abs(kp.jones(k, evaluate_at=1j) - complex(polynomial.subs(_t, sp.I))) < 1e-9
+
+    # the Jones polynomial of the Hopf link has half-integer exponents
+    polynomial = kp.jones(kp.link("L2a1"))
+    assert kp.jones(kp.link("L2a1"), evaluate_at=4) == polynomial.subs(_t, 4)
+
+
+def test_homflypt_evaluation():
+    for k in _diagrams():
+        polynomial = kp.homflypt(k)
+        assert kp.homflypt(k, evaluate_at=(2, 3)) == polynomial.subs({_v: 2, _z: 3})
+        assert kp.homflypt(k, evaluate_at={"v": 3, "z": Fraction(1, 2)}) == polynomial.subs({_v: 3, _z: sp.Rational(1, 2)})
+        assert kp.homflypt(k, evaluate_at=(2, 3), modulus=13) == _mod(polynomial.subs({_v: 2, _z: 3}), 13)
+
+
+def test_kauffman_evaluation():
+    for k in _diagrams():
+        polynomial = kp.kauffman(k)
+        assert kp.kauffman(k, evaluate_at=(2, 3)) == polynomial.subs({_a: 2, _z: 3})
+        assert list(kp.kauffman(k, evaluate_at=([2, 5], 3), modulus=11)) == \
+               [_mod(polynomial.subs({_a: a, _z: 3}), 11) for a in [2, 5]]
+
+
+def _root_of_unity_values(polynomial, roots):
+    return [complex(sp.N(polynomial.subs(_t, sp.exp(2 * sp.pi * sp.I / n)), 30)) for n in roots]
+
+
+def test_jones_evaluations():
+    import numpy as np
+    from knotpy.invariants.jones import jones_evaluations
+
+    diagrams = _diagrams()
+    roots = [1, 2, 3, 5, 6, 7, 12]
+    values, bounds = jones_evaluations(diagrams, roots, error_bound=True)
+    assert values.shape == (len(diagrams), len(roots))
+    for k, row, bound in zip(diagrams, values, bounds):
+        expected = _root_of_unity_values(kp.jones(k), roots)
+        assert np.abs(row - np.array(expected)).max() <= bound
+
+    # general points
+    values = jones_evaluations(diagrams[:4], [sp.I, 0.5])
+    for k, row in zip(diagrams[:4], values):
+        polynomial = kp.jones(k)
+        assert abs(row[0] - complex(polynomial.subs(_t, sp.I))) < 1e-9
+        assert abs(row[1] - float(polynomial.subs(_t, sp.Rational(1, 2)))) < 1e-9
+
+
+def test_jones_evaluations_exact():
+    from knotpy.invariants.jones import jones_evaluations
+
+    diagrams = _diagrams()
+    roots = [1, 3, 5, 6]
+    values = jones_evaluations(diagrams, roots, exact=True)
+    for k, row in zip(diagrams, values):
+        for n, coefficients, expected in zip(roots, row, _root_of_unity_values(kp.jones(k), roots)):
+            zeta = sp.exp(2 * sp.pi * sp.I / (4 * n))
+            assert len(coefficients) == sp.totient(4 * n)
+            assert abs(complex(sp.N(sum(c * zeta ** i for i, c in enumerate(coefficients)), 30)) - expected) < 1e-12
+
+
+def test_jones_evaluations_speed():
+    from time import time
+    from knotpy.invariants.jones import jones_evaluations
+
+    # diagrams without names miss the precomputed polynomials of the knot table, so the state sums are timed
+    diagrams = []
+    for k in kp.knots([11])[:5] + kp.knots([12])[:5]:
+        k = k.copy()
+        del k.attr["name"]
+        diagrams.append(k)
+    roots = [3, 4, 5, 6, 7, 8]
+
+    t = time()
+    symbolic = [[complex(sp.N(kp.jones(k).subs(_t, sp.exp(2 * sp.pi * sp.I / n)))) for n in roots] for k in diagrams]
+    time_symbolic = time() - t
+
+    t = time()
+    values, bounds = jones_evaluations(diagrams, roots, error_bound=True)
+    time_numeric = time() - t
+
+    print(f"Jones at roots of unity of {len(diagrams)} diagrams with 11-12 crossings: symbolic {time_symbolic:.3f}s, "
+          f"batch numeric {time_numeric:.3f}s")
+    assert (abs(values - symbolic).max(axis=1) <= bounds).all()
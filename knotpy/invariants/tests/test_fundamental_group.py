@@ -0,0 +1,64 @@
+from time import time
+
+import sympy as sp
+
+import knotpy as kp
+from knotpy.invariants.fundamental_group import GroupPresentation, group_presentation, fundamental_group
+from knotpy.invariants._symbols import _t
+
+
+def test_tietze_reduction():
+    # <a, b | a b a^-1 b^-1, b> = Z
+    presentation = GroupPresentation(2, [(1, 2, -1, -2), (2,)]).simplify()
+    assert presentation.generators == [0] and presentation.relators == []
+    assert presentation.word(1) == ()
+
+    # the trefoil group is the braid group on three strands
+    presentation = group_presentation(kp.orient(kp.knot("3_1")))
+    assert len(presentation.generators) == 2 and len(presentation.relators) == 1
+    relator = presentation.relators[0]
+    assert len(relator) == 6 and sum(1 if x > 0 else -1 for x in relator) == 0
+    assert {abs(x) - 1 for x in relator} == set(presentation.generators)
+
+    # the unsimplified presentation is the Wirtinger presentation
+    k = kp.orient(kp.knot("5_2"))
+    assert len(fundamental_group(k).generators) == 5
+    G, generators = fundamental_group(k, simplify=True, return_dict=True)
+    assert len(G.generators) < 5 and set(generators) == set(k.endpoints)
+
+
+def test_alexander_matrix():
+    """The gcd of the (n-1)-minors of the reduced Fox matrix is the Alexander polynomial."""
+    for k in kp.knots(crossings=[3, 4, 5, 6, 7]):
+        presentation = group_presentation(kp.orient(k))
+        matrix = presentation.alexander_matrix({g: _t for g in presentation.generators})
+        n = len(presentation.generators)
+        matrix = matrix.col_join(sp.zeros(max(0, n - matrix.rows), n))
+        minor = matrix[:n - 1, :n - 1].det() if n > 1 else sp.Integer(1)
+        quotient = sp.factor(minor / kp.alexander(k))
+        assert quotient.is_Pow or quotient.is_Symbol or quotient.is_Number or quotient.is_Mul, k.name
+        assert all(not factor.is_Add for factor in sp.Mul.make_args(quotient)), k.name
+
+
+def test_multivariable_alexander_tietze():
+    t1, t2 = sp.symbols("t1 t2")
+    # the (2, 4) torus link with parallel or anti-parallel orientations
+    assert kp.multivariable_alexander(kp.link("L4a1")) in (t1 * t2 + 1, t1 + t2)
+
+
+def test_group_presentation_speed():
+    for name in ["10_100", "12a_1"]:
+        k = kp.orient(kp.knot(name))
+        t = time()
+        presentation = group_presentation(k)
+        print(f"Tietze reduction of {name}: {time() - t:.4f}s ({presentation})")
+        t = time()
+        kp.multivariable_alexander(k)
+        print(f"Multivariable Alexander polynomial of {name}: {time() - t:.2f}s")
+
+
+if __name__ == '__main__':
+    test_tietze_reduction()
+    test_alexander_matrix()
+    test_multivariable_alexander_tietze()
+    test_group_presentation_speed()
@@ -0,0 +1,45 @@
+import knotpy as kp
+from knotpy.invariants.goeritz import goeritz_matrix, determinant, signature, nullity
+
+
+def test_determinant():
+    expected = {"0_1": 1, "3_1": 3, "4_1": 5, "5_1": 5, "5_2": 7, "6_1": 9, "8_19": 3}
+    for name, det in expected.items():
+        k = kp.knot(name)
+        assert determinant(k) == det
+        assert determinant(kp.mirror(k)) == det
+
+
+def test_determinant_alexander():
+    for k in kp.knots(crossings=[3, 4, 5, 6, 7]):
+        assert determinant(k) == abs(kp.alexander(k).subs("t", -1))
+
+
+def test_signature():
+    # positive knots have negative signature
+    expected = {"0_1": 0, "3_1": -2, "4_1": 0, "5_1": -4, "5_2": -2, "7_1": -6, "8_19": -6, "8_20": 0}
+    for name, sig in expected.items():
+        k = kp.knot(name)
+        assert signature(k) == sig
+        assert signature(kp.mirror(k)) == -sig
+
+
+def test_signature_determinant_congruence():
+    # for knots, the signature is divisible by 4 iff the determinant is 1 mod 4
+    for k in kp.knots(crossings=[3, 4, 5, 6, 7, 8]):
+        assert (signature(k) % 4 == 0) == (determinant(k) % 4 == 1)
+
+
+def test_split_link():
+    k = kp.add_unknot(kp.knot("3_1"), inplace=False)
+    assert determinant(k) == 0
+    assert nullity(k) == 1
+    assert signature(k) == -2
+    assert goeritz_matrix(k).shape == (2, 2)
+
+
+def test_goeritz_matrix():
+    g = goeritz_matrix(kp.knot("4_1"))
+    assert g == g.T
+    assert abs(g.det()) == 5
+    assert nullity(kp.knot("4_1")) == 0
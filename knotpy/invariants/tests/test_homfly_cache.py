@@ -1,6 +1,15 @@
 from collections import OrderedDict
+from pathlib import Path
+
+import sympy as sp
 
 import knotpy as kp
+from knotpy.invariants.cache import LRUCache
+from knotpy.tables.invariant_reader import load_invariant_table
+
+_DATA_DIR = Path(kp.__file__).parent / "tables" / "data"
+
+
 def test():
     k = kp.knot("8_9")
     p = kp.homflypt(k.copy())
@@ -10,6 +19,58 @@ def test():
         assert p == p_
 
 
+def test_lru_cache():
+    cache = LRUCache(max_number_of_nodes=3, max_size=5, size=len)
+    cache.set("ab", "xx")
+    cache.set("cd", "yyy")
+    assert cache.get("ab") == "xx"
+    cache.set("ef", "zz")  # evicts "cd" (least recently used)
+    assert "cd" not in cache and "ab" in cache and "ef" in cache
+    cache.set("abcd", "z")  # key too long
+    cache.set("gh", "long value")  # value too large
+    assert len(cache) == 2 and cache.total_size == 4
+    assert cache.get("cd") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1 and cache.stats()["evictions"] == 1
+
+
+def test_skein_subdiagram_cache():
+    import sys
+    homflypt_module = sys.modules["knotpy.invariants.homflypt"]
+    kauffman_module = sys.modules["knotpy.invariants.kauffman"]
+
+    settings_dump = kp.settings.dump()
+    kp.settings.use_precomputed_invariants = False
+    try:
+        diagrams = [kp.knot(name) for name in ["6_2", "7_5", "8_19", "8_20"]]
+        links = [kp.link(name) for name in ["L4a_1", "L6a_4", "L7n_1", "L8a_14"]]
+        homflypt_module._homflypt_skein_cache.clear()
+        kauffman_module._kauffman_skein_cache.clear()
+        cold = [(kp.homflypt(k), kp.kauffman(k)) for k in diagrams]
+        assert homflypt_module._homflypt_skein_cache.hits > 0
+        assert kauffman_module._kauffman_skein_cache.hit_rate > 0
+        warm = [(kp.homflypt(k), kp.kauffman(k)) for k in diagrams]
+        links_cached = [kp.kauffman(k) for k in links]
+
+        # state sums without memoization
+        max_key_length = kauffman_module._kauffman_skein_cache.max_key_length
+        try:
+            kauffman_module._kauffman_skein_cache.clear()
+            kauffman_module._kauffman_skein_cache.max_key_length = 0
+            links_uncached = [kp.kauffman(k) for k in links]
+        finally:
+            kauffman_module._kauffman_skein_cache.max_key_length = max_key_length
+    finally:
+        kp.settings.load(settings_dump)
+
+    for k, (h, f), (h_, f_) in zip(diagrams, cold, warm):
+        assert sp.expand(h - h_) == 0 and sp.expand(f - f_) == 0
+        assert sp.expand(h - kp.homflypt(k)) == 0  # precomputed
+        table = load_invariant_table(_DATA_DIR / f"knots_kauffman_{len(k)}.csv.gz", only_field_name="kauffman")
+        assert sp.expand(f - table[k.name]) == 0, k.name
+
+    for k, f, f_ in zip(links, links_cached, links_uncached):
+        assert sp.expand(f - f_) == 0, k.name
+
 
 if __name__ == "__main__":
     from time import time
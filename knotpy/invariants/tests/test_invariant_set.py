@@ -0,0 +1,81 @@
+from time import time
+
+import sympy as sp
+
+import knotpy as kp
+from knotpy.invariants.invariant_set import InvariantSet, InvariantContext, compute_invariants
+
+
+def _diagrams():
+    diagrams = list(kp.knots(crossings=[3, 4, 5, 6, 7]))
+    # diagrams that are not in the tables (non-reduced, oriented)
+    k = kp.from_pd_notation("X[1,5,2,4],X[3,1,4,6],X[5,3,6,2],X[7,8,8,7]")  # trefoil with a kink
+    diagrams.append(k)
+    diagrams.append(kp.orient(kp.from_pd_notation(kp.to_pd_notation(kp.knot("5_2")))))
+    return diagrams
+
+
+def test_invariant_set():
+    functions = {"writhe": kp.writhe, "homflypt": kp.homflypt, "alexander": kp.alexander, "conway": kp.conway,
+                 "jones": kp.jones, "bracket": kp.bracket, "kauffman": kp.kauffman}
+    invariants = InvariantSet(list(functions))
+    for k in _diagrams():
+        values = invariants(k)
+        assert list(values) == list(functions)
+        for name, function in functions.items():
+            assert sp.expand(values[name] - function(k)) == 0, (k.name, name)
+
+    # invariant functions and other callables
+    k = kp.knot("4_1")
+    values = compute_invariants(k, {"J": kp.jones, "crossings": lambda k: len(k.crossings)})
+    assert values == {"J": kp.jones(k), "crossings": 4}
+
+
+def test_invariant_context():
+    context = InvariantContext(kp.knot("5_2"))
+    assert context.get("conway") == kp.conway(kp.knot("5_2"))
+    assert sorted(context.values) == ["conway", "homflypt_xyz"]
+    context.get("jones")
+    assert sorted(context.values) == ["conway", "homflypt_xyz", "jones"]
+
+
+def test_invariant_set_errors():
+    try:
+        InvariantSet(["jones", "unknown"])
+        assert False
+    except ValueError:
+        pass
+
+    def _fail(k):
+        raise RuntimeError("failed")
+
+    errors = []
+    values = InvariantSet({"jones": "jones", "fail": _fail}).compute(kp.knot("3_1"), errors=errors)
+    assert values["fail"] is None and values["jones"] == kp.jones(kp.knot("3_1"))
+    assert len(errors) == 1 and errors[0].startswith("fail failed")
+
+
+def test_invariant_set_speed():
+    diagrams = [kp.from_pd_notation(kp.to_pd_notation(k)) for k in kp.knots(crossings=[8, 9])]
+    names = ["homflypt", "jones", "bracket", "alexander", "conway"]
+    functions = [kp.homflypt, kp.jones, kp.bracket, kp.alexander, kp.conway]
+
+    t = time()
+    for k in diagrams:
+        [f(k) for f in functions]
+    separate = time() - t
+
+    invariants = InvariantSet(names)
+    t = time()
+    for k in diagrams:
+        invariants(k)
+    together = time() - t
+    print(f"{len(names)} invariants of {len(diagrams)} diagrams: separately {separate:.2f}s, "
+          f"as an invariant set {together:.2f}s")
+
+
+if __name__ == '__main__':
+    test_invariant_set()
+    test_invariant_context()
+    test_invariant_set_errors()
+    test_invariant_set_speed()
@@ -0,0 +1,89 @@
+from time import time
+
+import sympy as sp
+
+import knotpy as kp
+from knotpy.invariants.khovanov import khovanov_homology, khovanov_polynomial, khovanov_homologies
+from knotpy.invariants._symbols import _q, _t
+
+
+def _euler_characteristic(homology):
+    return sp.expand(sum((-1) ** (i % 2) * rank * _q ** j for (i, j), (rank, _) in homology.items()))
+
+
+def _braid_closure(word, strands):
+    """Return the PD notation of the closure of a braid given by a list of signed generators 1, 2, ..."""
+    labels = list(range(strands))
+    new_label = strands
+    crossings = []
+    for g in word:
+        p = abs(g) - 1
+        a, b = labels[p], labels[p + 1]
+        c, d = new_label, new_label + 1
+        new_label += 2
+        crossings.append((a, b, d, c) if g > 0 else (b, d, c, a))
+        labels[p], labels[p + 1] = c, d
+    closure = dict(zip(labels, range(strands)))
+    return ",".join("X[" + ",".join(str(closure.get(x, x)) for x in crossing) + "]" for crossing in crossings)
+
+
+def test_khovanov_trefoil_figure_eight():
+    assert khovanov_homology(kp.knot("0_1")) == {(0, -1): (1, ()), (0, 1): (1, ())}
+
+    assert khovanov_homology(kp.knot("3_1")) == {
+        (0, 1): (1, ()), (0, 3): (1, ()), (2, 5): (1, ()), (3, 7): (0, (2,)), (3, 9): (1, ())}
+
+    assert khovanov_homology(kp.knot("4_1")) == {
+        (-2, -5): (1, ()), (-1, -3): (0, (2,)), (-1, -1): (1, ()), (0, -1): (1, ()), (0, 1): (1, ()),
+        (1, 1): (1, ()), (2, 3): (0, (2,)), (2, 5): (1, ())}
+
+    assert khovanov_polynomial(kp.knot("3_1")) == _q + _q ** 3 + _t ** 2 * _q ** 5 + _t ** 3 * _q ** 9
+    assert khovanov_polynomial(kp.knot("3_1"), modulus=2) == \
+        _q + _q ** 3 + _t ** 2 * _q ** 5 + _t ** 2 * _q ** 7 + _t ** 3 * _q ** 7 + _t ** 3 * _q ** 9
+
+
+def test_khovanov_jones():
+    """The graded Euler characteristic of the Khovanov homology is the unnormalized Jones polynomial."""
+    for k in kp.knots(crossings=[3, 4, 5, 6, 7, 8]):
+        homology = khovanov_homology(k)
+        jones = kp.jones(k)
+        assert _euler_characteristic(homology) == sp.expand((_q + 1 / _q) * jones.subs(_t, _q ** 2)), k.name
+
+
+def test_khovanov_universal_coefficients():
+    """Compare the homology modulo 2 with the integral homology through the universal coefficient theorem."""
+    for k in kp.knots(crossings=[6, 7, 8]):
+        homology = khovanov_homology(k)
+        homology_2 = khovanov_homology(k, modulus=2)
+        for i, j in set(homology) | set(homology_2):
+            rank, torsion = homology.get((i, j), (0, ()))
+            _, torsion_shifted = homology.get((i + 1, j), (0, ()))
+            expected = rank + sum(1 for d in torsion + torsion_shifted if d % 2 == 0)
+            assert homology_2.get((i, j), (0, ()))[0] == expected, k.name
+
+
+def test_khovanov_homologies():
+    diagrams = list(kp.knots(crossings=[5, 6]))
+    assert khovanov_homologies(diagrams, workers=2) == [khovanov_homology(k) for k in diagrams]
+
+
+def test_khovanov_speed():
+    for name in ["10_124", "12a_1", "12n_242"]:
+        t = time()
+        homology = khovanov_homology(kp.knot(name))
+        print(f"Khovanov homology of {name}: {time() - t:.2f}s ({sum(r for r, _ in homology.values())} generators)")
+
+    for n in [8, 11]:
+        k = kp.from_pd_notation(_braid_closure([1, 2] * n, 3))
+        t = time()
+        homology = khovanov_homology(k)
+        print(f"Khovanov homology of T(3, {n}) with {2 * n} crossings: {time() - t:.2f}s "
+              f"({sum(r for r, _ in homology.values())} generators)")
+
+
+if __name__ == '__main__':
+    test_khovanov_trefoil_figure_eight()
+    test_khovanov_jones()
+    test_khovanov_universal_coefficients()
+    test_khovanov_homologies()
+    test_khovanov_speed()
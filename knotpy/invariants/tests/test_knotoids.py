@@ -1,5 +1,9 @@
+from time import time
+
 import knotpy as kp
 from knotpy import export_pdf
+from knotpy.invariants.arrow import _naive_arrow_polynomial, _arrow_smoothings
+from knotpy.invariants._state_sum import _boundary_graph, _smoothing_state_sum, _add_state_sums
 
 
 def test_affine_index_polynomial():
@@ -37,6 +41,36 @@ def test_arrow_polynomial():
         assert p == p_, f"{k} \n{p}\n{p_} (orientation)"
 
 
+def test_arrow_polynomial_state_sum():
+    knotoids = [kp.from_pd_notation("X[0,4,1,5],X[5,1,6,2],X[2,6,3,7],X[8,4,7,3],V[0],V[8]"),
+                kp.from_knotpy_notation("a=V(b0) b=X(a0 c0 d3 c1) c=X(b1 b3 e0 d2) d=X(f3 g0 c3 b2) e=V(c2) "
+                                        "f=X(g3 h0 i3 d0) g=X(d1 i2 h1 f0) h=X(f1 g2 j3 j2) i=X(j1 j0 g1 f2) "
+                                        "j=X(i1 i0 h3 h2)"),
+                kp.knot("4_1"), kp.knot("5_2")]
+
+    for k in knotoids:
+        assert kp.arrow_polynomial(k) == _naive_arrow_polynomial(k)
+
+        # the state sum splits on the leading state bits
+        k = kp.orient(k) if not k.is_oriented() else k
+        crossings = list(k.crossings)
+        graph = _boundary_graph(k, crossings, lambda c: _arrow_smoothings(k, c))
+        parts = [_smoothing_state_sum(graph, prefix) for prefix in [(0, 0), (0, 1), (1, 0), (1, 1)]]
+        assert _add_state_sums(parts) == _smoothing_state_sum(graph)
+
+
+def test_arrow_polynomial_speed():
+    k = kp.from_knotpy_notation("a=V(b0) b=X(a0 c0 d3 c1) c=X(b1 b3 e0 d2) d=X(f3 g0 c3 b2) e=V(c2) "
+                                "f=X(g3 h0 i3 d0) g=X(d1 i2 h1 f0) h=X(f1 g2 j3 j2) i=X(j1 j0 g1 f2) j=X(i1 i0 h3 h2)")
+    t = time()
+    _naive_arrow_polynomial(k)
+    t_naive = time() - t
+    t = time()
+    kp.arrow_polynomial(k)
+    t_gray = time() - t
+    print(f"Arrow polynomial ({len(k.crossings)} crossings): {t_naive:.3f}s (states) vs {t_gray:.3f}s (Gray code)")
+
+
 def test_mock_polynomial():
     kp.settings.allowed_moves = "r1,r2,r3"
     k = kp.from_pd_notation("X[0,4,1,5],X[5,1,6,2],X[2,6,3,7],X[8,4,7,3],V[0],V[8]")
@@ -93,6 +127,8 @@ def test_yamada_polynomial():
 if __name__ == '__main__':
 
     test_arrow_polynomial()
+    test_arrow_polynomial_state_sum()
+    test_arrow_polynomial_speed()
     test_affine_index_polynomial()
     test_mock_polynomial()
     test_kauffman_polynomial()
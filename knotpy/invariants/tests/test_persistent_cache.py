@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import sympy as sp
+
+import knotpy as kp
+from knotpy.invariants.persistent_cache import PersistentInvariantCache, persistent_cache, persistent_invariant
+
+_calls = []
+
+
+@persistent_invariant("number_of_crossings", version="test")
+def _number_of_crossings(k, offset=0):
+    _calls.append(k)
+    return len(k.crossings) + offset
+
+
+def _homflypt_in_worker(args):
+    directory, k = args
+    kp.settings.persistent_cache_dir = directory
+    kp.settings.use_precomputed_invariants = False
+    return kp.homflypt(k), persistent_cache().stats()["writes"]
+
+
+def test_persistent_invariant(tmp_path):
+    settings_dump = kp.settings.dump()
+    kp.settings.persistent_cache_dir = str(tmp_path)
+    try:
+        _calls.clear()
+        k = kp.knot("5_2")
+        assert _number_of_crossings(k) == 5
+        assert _number_of_crossings(kp.canonical(k.copy())) == 5  # same canonical key
+        assert _number_of_crossings(k, offset=1) == 6  # different arguments
+        assert len(_calls) == 2
+
+        cache = persistent_cache()
+        assert cache.stats()["hits"] == 1 and cache.stats()["writes"] == 2
+        assert (tmp_path / "invariants.sqlite").exists()
+
+        # a new process (connection) reads the stored values
+        assert len(PersistentInvariantCache(tmp_path)) == 2
+    finally:
+        kp.settings.load(settings_dump)
+
+    _calls.clear()
+    assert _number_of_crossings(kp.knot("5_2")) == 5  # cache disabled
+    assert len(_calls) == 1
+
+
+def test_persistent_cache_processes(tmp_path):
+    diagrams = [kp.knot(name) for name in ["3_1", "4_1", "6_2", "7_3"]] * 2
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_homflypt_in_worker, [(str(tmp_path), k) for k in diagrams]))
+
+    for k, (polynomial, _) in zip(diagrams, results):
+        assert sp.expand(polynomial - kp.homflypt(k)) == 0
+    cache = PersistentInvariantCache(tmp_path)
+    assert len(cache) == 4  # each knot was stored once
+
+
+def test_persistent_cache_size_limit(tmp_path):
+    cache = PersistentInvariantCache(tmp_path, max_size=1000)
+    for i in range(20):
+        cache.set("test", "1", str(i), "x" * 100)
+    cache.evict()
+    assert cache.size() <= 1000
+    assert cache.get("test", "1", "19")[0]
+    assert not cache.get("test", "1", "0")[0]
+    assert cache.stats()["evictions"] > 0
+
+
+def test_persistent_cache_max_size_setting(tmp_path):
+    settings_dump = kp.settings.dump()
+    kp.settings.persistent_cache_dir = str(tmp_path)
+    try:
+        kp.settings.persistent_cache_max_size = 1000
+        assert persistent_cache().max_size == 1000
+        kp.settings.persistent_cache_max_size = 2000  # also applies to the already opened cache
+        assert persistent_cache().max_size == 2000
+    finally:
+        kp.settings.load(settings_dump)
+    assert kp.settings.persistent_cache_max_size == 2 ** 30
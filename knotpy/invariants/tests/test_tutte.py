@@ -1,6 +1,14 @@
+from time import time
+
+import sympy as sp
+
+import knotpy as kp
 from knotpy import from_knotpy_notation
-from knotpy.tables.families import parallel_edges, bouquet, path_graph, cycle_graph
-from knotpy.invariants.tutte import deletion_contraction
+from knotpy.tables.families import parallel_edges, bouquet, path_graph, cycle_graph, wheel_graph
+from knotpy.invariants.tutte import deletion_contraction, tutte
+from knotpy.invariants._graph_polynomials import _tutte_polynomial, _tutte_cache
+from knotpy.invariants._symbols import _x, _y
+from knotpy.invariants.skein import crossing_to_vertex
 from knotpy.algorithms.canonical import canonical
 from knotpy.algorithms.attributes import clear_attributes
 
@@ -50,7 +58,71 @@ def test_deletion_contraction_square_with_diagonal():
 
     assert sorted(result) == sorted(expected_result)
 
+
+def _tutte_by_deletion_contraction(g):
+    g = g.copy()
+    polynomial = sp.Integer(0)
+    for h in deletion_contraction(g, contract_bridges=False):
+        loops = sum(1 for ep1, ep2 in h.arcs if ep1.node == ep2.node)
+        polynomial += _x ** (len(h.arcs) - loops) * _y ** loops
+    return polynomial
+
+
+def _shadow(k):
+    for c in list(k.crossings):
+        k = crossing_to_vertex(k, crossing=c, inplace=False)
+    return k
+
+
+def _antiprism(n):
+    return ([(i, (i + 1) % n) for i in range(n)] + [(n + i, n + (i + 1) % n) for i in range(n)] +
+            [(i, n + i) for i in range(n)] + [(i, n + (i + 1) % n) for i in range(n)])
+
+
+def test_tutte():
+    assert tutte(cycle_graph(4)) == _x ** 3 + _x ** 2 + _x + _y
+    assert tutte(parallel_edges(3)) == _x + _y + _y ** 2
+    assert tutte(path_graph(4)) == _x ** 3
+    assert tutte(bouquet(2)) == _y ** 2
+    assert sp.expand(tutte(wheel_graph(4)) - (_x ** 3 + 3 * _x ** 2 + 2 * _x + 4 * _x * _y + 2 * _y + 3 * _y ** 2 +
+                                              _y ** 3)) == 0  # K4
+
+    graphs = [from_knotpy_notation("a=V(c0 d1 b0) b=V(a2 d0) c=V(a0 d2) d=V(b1 a1 c1)"),
+              from_knotpy_notation("a=V(b2) b=V(b1 b0 a0)"),
+              wheel_graph(5)] + [_shadow(kp.knot(name)) for name in ["3_1", "4_1", "5_2", "6_3"]]
+    for g in graphs:
+        assert sp.expand(tutte(g) - _tutte_by_deletion_contraction(g)) == 0
+
+    # T(1, 1) is the number of spanning trees, T(2, 2) = 2^|E|
+    k = _shadow(kp.knot("8_18"))
+    polynomial = tutte(k)
+    assert polynomial.subs({_x: 2, _y: 2}) == 2 ** len(k.arcs)
+    assert sum(_tutte_polynomial(_antiprism(6)).values()) == 248832
+
+    try:
+        tutte(kp.knot("3_1"))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_tutte_speed():
+    for n in [6, 8, 10]:
+        _tutte_cache.clear()
+        t = time()
+        polynomial = _tutte_polynomial(_antiprism(n))
+        print(f"Tutte polynomial of the antiprism with {4 * n} edges: {time() - t:.2f}s "
+              f"({len(polynomial)} terms, {len(_tutte_cache)} cached minors)")
+
+    k = _shadow(kp.knot("12a_1"))
+    t = time()
+    tutte(k)
+    print(f"Tutte polynomial of the shadow of 12a_1: {time() - t:.2f}s")
+
+
 if __name__ == '__main__':
     test_deletion_contraction_parallel_edges()
     test_deletion_contraction_cycle()
-    test_deletion_contraction_square_with_diagonal()
\ No newline at end of file
+    test_deletion_contraction_square_with_diagonal()
+    test_tutte()
+    test_tutte_speed()
\ No newline at end of file
@@ -0,0 +1,78 @@
+import random
+from time import time
+
+import knotpy as kp
+from knotpy.invariants.writhe import writhe, linking_numbers
+from knotpy.algorithms.orientation import orientations
+from knotpy.reidemeister.reidemeister import random_reidemeister_move
+
+
+def _writhe(k):
+    return sum(k.nodes[c].sign() for c in k.crossings)
+
+
+def test_writhe_unoriented():
+    for k in list(kp.knots(crossings=[3, 4, 5, 6])) + list(kp.links(crossings=[2, 4, 5, 6])):
+        assert writhe(k) == min(_writhe(o) for o in orientations(k)), k.name
+
+
+def test_linking_numbers():
+    hopf = kp.orient(kp.from_pd_notation("X[1,3,2,4],X[3,1,4,2]"))
+    assert linking_numbers(hopf) in [((0, 1), (1, 0)), ((0, -1), (-1, 0))]
+    assert linking_numbers(kp.orient(kp.knot("3_1"))) == ((0,),)
+
+    # Whitehead link
+    assert linking_numbers(kp.orient(kp.link("L5a1"))) == ((0, 0), (0, 0))
+
+    try:
+        linking_numbers(kp.knot("3_1"))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_sign_cache_reidemeister():
+    """The cached signs are updated by the Reidemeister moves and copied with the diagram."""
+    random.seed(0)
+    for k in list(kp.links(crossings=[4, 5]))[:6] + list(kp.knots(crossings=[5]))[:2]:
+        k = kp.orient(k)
+        linking = linking_numbers(k)
+        for _ in range(10):
+            assert writhe(k) == _writhe(k)
+            k = random_reidemeister_move(k, inplace=random.random() < 0.5)
+            assert k._writhe() == _writhe(k)
+            assert all(k.sign(c) == k.nodes[c].sign() for c in k.crossings)
+            assert sorted(sum(linking_numbers(k), ())) == sorted(sum(linking, ()))
+
+
+def test_writhe_speed():
+    diagrams = [kp.orient(k) for k in kp.links(crossings=[6, 7, 8])]
+    t = time()
+    for k in diagrams:
+        _writhe(k)
+    uncached = time() - t
+    t = time()
+    for _ in range(10):
+        for k in diagrams:
+            writhe(k)
+    cached = (time() - t) / 10
+
+    unoriented = list(kp.links(crossings=[6, 7, 8]))
+    t = time()
+    for k in unoriented:
+        min(_writhe(o) for o in orientations(k))
+    all_orientations = time() - t
+    t = time()
+    for k in unoriented:
+        writhe(k)
+    minimal = time() - t
+    print(f"Writhe of {len(diagrams)} oriented links: {uncached:.4f}s (uncached), {cached:.4f}s (cached)")
+    print(f"Writhe of {len(unoriented)} unoriented links: {all_orientations:.2f}s (all orientations), "
+          f"{minimal:.2f}s (edge reversals)")
+
+
+if __name__ == '__main__':
+    test_writhe_unoriented()
+    test_linking_numbers()
+    test_sign_cache_reidemeister()
+    test_writhe_speed()
@@ -225,6 +225,32 @@ def test_thetas_recursive():
         if yr != yo:
             raise ValueError("Invalid Yamada")
 
+def test_yamada_planar_graphs():
+    from knotpy.invariants.yamada import _yamada_graph
+    from knotpy.invariants._graph_polynomials import _flow_polynomial, _canonical_form, _adjacency
+
+    # flow polynomials of the theta graph, K4 and the Petersen graph
+    assert _flow_polynomial([(0, 1)] * 3) == (2, -3, 1)
+    assert _flow_polynomial([(a, b) for a in range(4) for b in range(a + 1, 4)]) == (-6, 11, -6, 1)
+    petersen = [(i, (i + 1) % 5) for i in range(5)] + [(i, i + 5) for i in range(5)] + [(5 + i, 5 + (i + 2) % 5) for i in range(5)]
+    assert _flow_polynomial(petersen) == (240, -620, 624, -325, 95, -15, 1)
+    assert _flow_polynomial([(0, 1), (1, 2), (2, 0), (2, 3), (3, 3)]) == ()  # bridge
+
+    # canonical forms do not depend on vertex labels
+    relabeled = [((3 * u + 1) % 10, (3 * v + 1) % 10) for u, v in petersen]
+    assert _canonical_form(_adjacency(petersen)) == _canonical_form(_adjacency(relabeled))
+
+    for notation in ["a=V(c0 d1 b0) b=V(a2 d0) c=V(a0 d2) d=V(b1 a1 c1)",  # square with a diagonal
+                     "a=V(b0 b2 b1) b=V(a0 a2 a1)",  # theta
+                     "a=V(a1 a0 b2) b=V(b1 b0 a2)"]:  # handcuff
+        g = from_knotpy_notation(notation)
+        assert expand(_yamada_graph(g.copy()) - _naive_yamada_polynomial(g, normalize=False)) == 0, notation
+
+    # H(K4) = F(σ + 1) = σ (σ - 1) (σ - 2)
+    k4 = from_knotpy_notation("a=V(b0 c0 d0) b=V(a0 d2 c1) c=V(a1 b2 d1) d=V(a2 c2 b1)")
+    sigma = sympify("A + 1 + 1/A")
+    assert expand(_yamada_graph(k4) - sigma * (sigma - 1) * (sigma - 2)) == 0
+
 if __name__ == '__main__':
     print("Yamada from paper")
     test_yamada_examples_from_paper()
@@ -2,9 +2,13 @@
 """
 Tutte polynomial for planar graphs represented as ``PlanarDiagram`` objects.
 
-This computes the Tutte polynomial ``T(_x, _y)`` for planar graphs (no crossings)
-using the standard deletion–contraction recursion until only loops and bridges remain,
-where each terminal graph contributes ``_x^(#bridges) * _y^(#loops)``.
+The Tutte polynomial ``T(_x, _y)`` of a planar graph (no crossings) is computed on the underlying multigraph by
+:func:`knotpy.invariants._graph_polynomials._tutte_polynomial`: loops and bridges are factored out, the polynomial is
+multiplied over blocks (2-connected components), cycles, parallel classes and series paths are resolved by closed
+formulas, and the remaining deletion–contraction minors are cached by their canonical forms.
+
+The plain deletion–contraction expansion into diagrams with only loops and bridges, where each terminal graph
+contributes ``_x^(#bridges) * _y^(#loops)``, is available as :func:`deletion_contraction`.
 """
 
 from __future__ import annotations
@@ -18,16 +22,10 @@ import sympy as sp
 
 from knotpy.invariants._symbols import _x, _y
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
-from knotpy.algorithms.topology import (
-    is_planar_graph,
-    is_loop,
-    is_bridge,
-    bridges,
-    loops,
-)
+from knotpy.algorithms.topology import is_planar_graph, is_loop, is_bridge
 from knotpy.algorithms.contract import contract_arc
 from knotpy.algorithms.remove import remove_arc
-from knotpy.algorithms.orientation import unorient
+from knotpy.invariants._graph_polynomials import _multigraph, _tutte_polynomial
 
 
 def deletion_contraction(k: PlanarDiagram, *, contract_bridges: bool = True) -> list[PlanarDiagram]:
@@ -87,26 +85,8 @@ def tutte(k: PlanarDiagram | OrientedPlanarDiagram) -> sp.Expr:
     if not is_planar_graph(k):
         raise ValueError("Tutte polynomial can only be computed on planar graphs without crossings.")
 
-    # Work on an unoriented copy; ensure framing exists
-    k = unorient(k) if k.is_oriented() else k.copy()
-    if not k.is_framed():
-        k.framing = 0
-    k.attr["_deletions"] = 0
-    k.attr["_contractions"] = 0
-
-    # Expand via deletion–contraction without contracting bridges in the recursion
-    terminal_graphs = deletion_contraction(k, contract_bridges=False)
-
-    # Each terminal graph contributes _x^(#bridges) * _y^(#loops)
-    polynomial = sp.Integer(0)
-    for g in terminal_graphs:
-        b = len(bridges(g))
-        l = len(loops(g))
-        if b + l != len(g.arcs):
-            raise ValueError("Terminal diagram contains a non-loop, non-bridge arc.")
-        polynomial += (_x ** b) * (_y ** l)
-
-    return polynomial
+    polynomial = _tutte_polynomial(_multigraph(k))
+    return sp.Add(*(c * _x ** i * _y ** j for (i, j), c in polynomial.items()))
 
 
 if __name__ == "__main__":
@@ -1,19 +1,59 @@
 """
-Writhe of a knot or link diagram.
+Writhe and linking numbers of a knot or link diagram.
 
 The writhe is the number of positive crossings minus the number of negative crossings.
 For oriented diagrams this is computed directly. For unoriented diagrams, we take the
 minimum over all orientations.
+
+The crossing signs of oriented diagrams are cached on the diagram and updated locally by
+the mutation methods (and thus by Reidemeister moves), so the writhe of a diagram is
+recomputed only at the modified crossings. The writhe of an unoriented diagram and the
+linking numbers are cached until the diagram is modified.
 """
 
 from __future__ import annotations
 
-__all__ = ["writhe"]
-__version__ = "0.1"
+__all__ = ["writhe", "linking_numbers"]
+__version__ = "0.2"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
+from itertools import product
+
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
-from knotpy.algorithms.orientation import orientations
+from knotpy.algorithms.orientation import orient_edges
+from knotpy.algorithms.topology import edges
+from knotpy.algorithms.components_link import link_components_endpoints
+
+
+def _minimal_writhe(k: PlanarDiagram) -> int:
+    """Return the minimal writhe over all orientations of an unoriented diagram.
+
+    Reversing the orientation of an edge flips the signs of the crossings between the edge
+    and other edges, so the diagram is oriented only once and the writhe of each orientation
+    is obtained from the sums of signs between pairs of edges.
+    """
+    edge_list = sorted(edges(k))
+    if not edge_list:
+        return 0
+    o = orient_edges(k, edge_list)
+    edge_index = {(ep.node, ep.position): i for i, edge in enumerate(edge_list) for ep in edge}
+
+    self_writhe = 0
+    pair_writhe = {}  # (i, j) -> sum of signs of crossings between edges i < j
+    for c, sign in o._crossing_signs().items():
+        i, j = sorted((edge_index[(c, 0)], edge_index[(c, 1)]))
+        if i == j:
+            self_writhe += sign
+        else:
+            pair_writhe[i, j] = pair_writhe.get((i, j), 0) + sign
+
+    if not pair_writhe:
+        return self_writhe
+    # reversing all edges does not change the writhe, so the first edge is kept
+    return self_writhe + min(
+        sum(w if flips[i] == flips[j] else -w for (i, j), w in pair_writhe.items())
+        for flips in ((False,) + rest for rest in product((False, True), repeat=len(edge_list) - 1))
+    )
 
 
 def writhe(k: PlanarDiagram | OrientedPlanarDiagram) -> int:
@@ -31,10 +71,51 @@ def writhe(k: PlanarDiagram | OrientedPlanarDiagram) -> int:
         The writhe as an integer.
     """
     if k.is_oriented():
-        return sum(k.nodes[c].sign() for c in k.crossings)
-    # TODO: optimize for multi-component links (avoid enumerating all orientations if possible)
-    return min(sum(o.nodes[c].sign() for c in o.crossings) for o in orientations(k))
+        return k._writhe()
+    cache = k._endpoint_cache
+    if "writhe" not in cache:
+        cache["writhe"] = _minimal_writhe(k)
+    return cache["writhe"]
+
 
+def linking_numbers(k: OrientedPlanarDiagram) -> tuple[tuple[int, ...], ...]:
+    """Return the matrix of linking numbers between the components of an oriented link diagram.
+
+    The components are ordered by decreasing number of endpoints (and by their endpoints), as in
+    :func:`knotpy.algorithms.components_link.enumerate_link_components`. The entry ``(i, j)`` is the
+    linking number of the ``i``-th and ``j``-th component (half of the sum of signs of the crossings
+    between them), the diagonal entries are zero. The matrix is cached on the diagram until the diagram
+    is modified.
+
+    Args:
+        k: Oriented knot or link diagram.
+
+    Returns:
+        The symmetric matrix of linking numbers as a tuple of rows.
+
+    Raises:
+        ValueError: If the diagram is not oriented.
+
+    Example:
+        >>> linking_numbers(orient(from_pd_notation("X[1,3,2,4],X[3,1,4,2]")))  # Hopf link
+        ((0, -1), (-1, 0))
+    """
+    if not k.is_oriented():
+        raise ValueError("Linking numbers are defined for oriented diagrams.")
+    cache = k._endpoint_cache
+    if "linking_numbers" not in cache:
+        components = sorted((tuple(sorted(component)) for component in link_components_endpoints(k)),
+                            key=lambda component: (-len(component), component))
+        index = {(ep.node, ep.position): i for i, component in enumerate(components) for ep in component}
+        matrix = [[0] * len(components) for _ in components]
+        for c, sign in k._crossing_signs().items():
+            # the endpoints of the two strands at the crossing
+            i, j = index[(c, 0)], index[(c, 1)]
+            if i != j:
+                matrix[i][j] += sign
+                matrix[j][i] += sign
+        cache["linking_numbers"] = tuple(tuple(w // 2 for w in row) for row in matrix)
+    return cache["linking_numbers"]
 
 # def crossing_signs_dict(k: PlanarDiagram | OrientedPlanarDiagram) -> dict:
 #     """ If the knot or link is oriented, compute all crossing signs directly from the crossings.
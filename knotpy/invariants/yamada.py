@@ -6,7 +6,9 @@ Compute the Yamada polynomial of a knotted planar diagram described in
 Optimizations:
 * precomputed powers of sigma = A + 1 + 1/A,
 * simplification of the knotted graphs mid-computation (reducing crossings via R1 unkinks and R2 unpokes,...)
-* caching of the Yamada polynomials for planar graphs,
+* evaluation of planar graphs through the flow polynomial with integer coefficients: for a planar graph G,
+  H(G) = (-1)^(|E| + |V|) F_G(σ + 1), where F_G is the flow polynomial (see :mod:`knotpy.invariants._graph_polynomials`,
+  which caches the blocks of all graph states by their canonical forms),
 * caching of the Yamada polynomials for knotted graphs.
 """
 
@@ -16,7 +18,8 @@ __all__ = ["yamada", "yamada_mirror"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
-from collections import deque
+from collections import deque, defaultdict
+from math import comb
 import sympy as sp
 
 from knotpy.algorithms.canonical import canonical
@@ -25,27 +28,25 @@ from knotpy.algorithms.orientation import unorient
 from knotpy.invariants.skein import smoothen_crossing, crossing_to_vertex
 from knotpy.reidemeister.simplify import simplify_decreasing
 from knotpy.algorithms.topology import bridges, loops
-from knotpy.algorithms.remove import remove_arc, remove_bivalent_vertices
+from knotpy.algorithms.remove import remove_arc
 from knotpy.algorithms.contract import contract_arc
 from knotpy.utils.cache import Cache
 from knotpy._settings import settings
 from knotpy.classes.freezing import freeze
 from knotpy.invariants._symbols import _A, _YAMADA_SIGMA
+from knotpy.invariants.persistent_cache import persistent_invariant
+from knotpy.invariants._graph_polynomials import (_flow_polynomial, _flow_cache, _multigraph, _poly_add, _poly_mul,
+                                                  _poly_pow, _Q_MINUS_ONE)
 
 # Yamada settings
 _YAMADA_KNOTTED_CACHE = True
-_YAMADA_GRAPH_CACHE = True
 _YAMADA_SIMPLIFY = True  # simplify the diagrams during computation
 
 _sigma_power = [sp.Integer(1)]  # dynamically expanded: [σ^0, σ^1, σ^2, ...]
 
-# The global cache storing precomputed Yamada polynomials of planar graphs (≈7KB per diagram).
-# 'max_key_length' limits the number of vertices for caching.
-_yamada_graph_cache = Cache(max_cache_size=10000, max_key_length=6)
-
 # The global cache storing precomputed Yamada polynomials of knotted graphs (≈7KB per diagram).
 # 'max_key_length' limits the number of vertices for caching.
-_yamada_knotted_cache = Cache(max_cache_size=1000, max_key_length=5)
+_yamada_knotted_cache = Cache(max_cache_size=1000, max_key_length=5, name="yamada_knotted")
 
 def yamada_mirror(expr, normalize: bool = True) -> PlanarDiagram:
     """Return the yamada of the mirror diagram."""
@@ -57,6 +58,7 @@ def yamada_mirror(expr, normalize: bool = True) -> PlanarDiagram:
     return polynomial
 
 
+@persistent_invariant("yamada")
 def yamada(k: PlanarDiagram, normalize: bool = True) -> sp.Expr:
     """Return the Yamada polynomial of a given planar diagram.
 
@@ -131,53 +133,41 @@ def _compute_yamada(k: PlanarDiagram, first_pass_use_cache: bool = True) -> sp.E
             graphs.append(k)
 
     # Phase 2: evaluate planar graphs (no crossings).
-    polynomial += sum(_yamada_graph(g) for g in graphs)
+    polynomial += _yamada_graphs(graphs)
 
     return sp.expand(polynomial)
 
 
-def _yamada_graph(g: PlanarDiagram) -> sp.Expr:
-    """Compute the Yamada polynomial of a planar graph (without crossings).
+def _yamada_graphs(graphs: list[PlanarDiagram]) -> sp.Expr:
+    """Compute the sum of the Yamada polynomials of planar graphs (states without crossings) with their state factors.
 
-    Warning:
-        Modifies ``g`` in-place during evaluation.
+    The graphs are evaluated as flow polynomials with integer coefficients in ``q = σ + 1``, which are collected by the
+    power of ``A`` of the state and converted to a Laurent polynomial in ``A`` once.
     """
-    g.attr["_A"] = g.attr.get("_A", 0)
-    g.attr["_B"] = g.attr.get("_B", 0)
-    g.attr["_X"] = g.attr.get("_X", 0)
-    g.attr["_loops"] = g.attr.get("_loops", 0)
-    g.attr["_isolated_vertices"] = g.attr.get("_isolated_vertices", 0)
-    g.attr["framing"] = g.attr.get("framing", 0) or 0
-
-    stack: deque[PlanarDiagram] = deque([g])
-    polynomial = sp.Integer(0)
+    terms = defaultdict(tuple)  # exponent of A -> integer polynomial in q
+    for g in graphs:
+        attr = g.attr
+        edges = _multigraph(g)
+        loops = attr.get("_loops", 0)
+        twists = int(2 * (attr.get("framing", 0) or 0))  # (-A)^(-2 framing)
+        sign = -1 if (attr.get("_isolated_vertices", 0) + loops + len(edges) + len(g) + twists) % 2 else 1
+        polynomial = _poly_mul((sign,), _poly_mul(_poly_pow(_Q_MINUS_ONE, loops), _flow_polynomial(edges)))
+        exponent = attr.get("_A", 0) - attr.get("_B", 0) - twists
+        terms[exponent] = _poly_add(terms[exponent], polynomial)
+
+    # q^j = (A + 2 + A^-1)^j = sum_i binomial(2j, i) A^(i - j)
+    coefficients = defaultdict(int)
+    for exponent, polynomial in terms.items():
+        for j, c in enumerate(polynomial):
+            if c:
+                for i in range(2 * j + 1):
+                    coefficients[exponent + i - j] += c * comb(2 * j, i)
+    return sp.Add(*(c * _A ** e for e, c in coefficients.items() if c))
 
-    while stack:
-        g = stack.pop()
-        _remove_loops_isolated_and_bivalent_vertices(g)
-
-        if bridges(g):
-            continue  # graphs with bridges evaluate to 0
-
-        # contraction-deletion on a remaining edge
-        arc = next(iter(g.arcs), None)
-        if arc is not None:
-            if _YAMADA_GRAPH_CACHE and len(g) <= _yamada_graph_cache.max_key_length:
-                polynomial += _yamada_graph_from_cache(g)
-            else:
-                g_delete = remove_arc(g, arc_for_removing=arc, inplace=False)
-                g_contract = contract_arc(g, arc_for_contracting=arc, inplace=False)
-                stack.extend([g_delete, g_contract])
-        else:
-            # Only isolated vertices and loops remain (final state).
-            polynomial += (
-                (-1 if (g.attr["_isolated_vertices"] + g.attr["_loops"]) % 2 else 1)
-                * _sigma_power[g.attr["_loops"]]
-                * _A ** (g.attr["_A"] - g.attr["_B"])
-                * (-_A) ** int(-2 * g.framing)
-            )
 
-    return polynomial
+def _yamada_graph(g: PlanarDiagram) -> sp.Expr:
+    """Compute the Yamada polynomial of a planar graph (without crossings)."""
+    return _yamada_graphs([g])
 
 
 def _yamada_knotted_from_cache(k: PlanarDiagram) -> sp.Expr:
@@ -200,49 +190,6 @@ def _yamada_knotted_from_cache(k: PlanarDiagram) -> sp.Expr:
     return polynomial
 
 
-def _yamada_graph_from_cache(g: PlanarDiagram) -> sp.Expr:
-    """Retrieve or compute the Yamada polynomial for a planar graph from cache.
-
-    Warning:
-        Modifies ``g`` in-place during evaluation.
-    """
-    global _yamada_graph_cache
-
-    attr = g.attr
-    g = canonical(g)  # makes a copy
-    g.attr = {}
-
-    polynomial = _yamada_graph_cache.get(g, None)
-    if polynomial is None:
-        arc = next(iter(g.arcs))
-        _yamada_graph_cache[freeze(g)] = polynomial = (
-            _yamada_graph(remove_arc(g, arc_for_removing=arc, inplace=False))
-            + _yamada_graph(contract_arc(g, arc_for_contracting=arc, inplace=False))
-        )
-
-    polynomial *= (
-        (-1 if (attr["_isolated_vertices"] + attr["_loops"]) % 2 else 1)
-        * _sigma_power[attr["_loops"]]
-        * _A ** (attr["_A"] - attr["_B"])
-        * (-_A) ** int(-2 * attr["framing"])
-    )
-
-    return sp.expand(polynomial)
-
-
-def _remove_loops_isolated_and_bivalent_vertices(g: PlanarDiagram) -> None:
-    """Remove all loops and isolated vertices (and bivalent vertices) in-place, updating counters."""
-    remove_bivalent_vertices(g)
-
-    while (L := loops(g)):
-        remove_arc(g, arc_for_removing=L[0], inplace=True)
-        g.attr["_loops"] += 1
-
-    for v in [v for v in g.vertices if g.degree(v) == 0]:
-        g.remove_node(v, remove_incident_endpoints=False)
-        g.attr["_isolated_vertices"] += 1
-
-
 def _print_cache() -> None:
     import sys
 
@@ -250,8 +197,8 @@ def _print_cache() -> None:
     for k in sorted(_yamada_knotted_cache)[:25]:
         print("  ", k)
 
-    print("  Graph cache size:", len(_yamada_graph_cache), "items", f"({sys.getsizeof(_yamada_graph_cache) / 1024} KB)")
-    for k in sorted(_yamada_graph_cache)[:25]:
+    print("  Graph cache size:", len(_flow_cache), "items", f"({_flow_cache.bytes / 1024} KB)")
+    for k in sorted(_flow_cache)[:25]:
         print("  ", k)
 
 
@@ -3,3 +3,4 @@ from .native import *
 from .em import *
 from .pd import *
 from .plantri import *
+from .binary import *
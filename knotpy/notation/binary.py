@@ -0,0 +1,422 @@
+# knotpy/notation/binary.py
+"""Compact binary encoding of planar diagrams.
+
+The encoding is a sequence of unsigned varints (LEB128, 7 bits per byte, the high bit marks a continuation), so that
+small diagrams are encoded by one byte per value:
+
+    version | flags | number of nodes n |
+    node types (n) | degrees (n) |
+    twin indices (one per endpoint) |
+    orientation bits (7 bits per varint, only for oriented diagrams) |
+    node labels (only if the labels are not the default labels) |
+    attributes (only if requested)
+
+Nodes are ordered by the default labels ``a, b, ..., z, A, ..., Z, aa, ab, ...`` (the labels of canonical diagrams),
+otherwise by sorting the labels. Endpoints are numbered consecutively through the nodes, the twin index of an endpoint
+position is the index of the endpoint stored at that position (the adjacent endpoint). A label is a tag followed by
+its value (``0``: a string given by its length and code points, ``1``: an integer in zigzag encoding). Attributes are
+the length and the code points of the ``repr`` of the sorted diagram, node and endpoint attributes (attribute values
+must be Python literals).
+
+There is no limit on the number of nodes and the encoding of a diagram does not depend on the insertion order of its
+nodes, so canonical diagrams (see :func:`knotpy.algorithms.canonical.canonical`) are equal if and only if their
+encodings are equal, and the encodings can be used as hash keys. Batch functions encode and decode many diagrams
+through a single (NumPy) buffer. Diagrams are pickled through the encoding (see :meth:`PlanarDiagram.__reduce__`),
+which speeds up the transfer of diagrams to the workers of a process pool.
+
+Example:
+    >>> from knotpy.notation.native import from_knotpy_notation
+    >>> k = from_knotpy_notation("a=X(b3 b2 c3 c2) b=X(c1 c0 a1 a0) c=X(b1 b0 a3 a2)")
+    >>> to_bytes(k)
+    b'\\x01\\x00\\x03\\x00\\x00\\x00\\x04\\x04\\x04\\x07\\x06\\x0b\\n\\t\\x08\\x01\\x00\\x05\\x04\\x03\\x02'
+    >>> from_bytes(to_bytes(k)) == k
+    True
+"""
+
+from __future__ import annotations
+
+import string
+from ast import literal_eval
+from itertools import accumulate
+from typing import Any, Iterable, Sequence
+
+from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
+from knotpy.classes.node import Crossing, Vertex, VirtualCrossing
+from knotpy.classes.endpoint import Endpoint, IngoingEndpoint, OutgoingEndpoint
+from knotpy.classes.freezing import freeze, lock
+from knotpy.utils.decorators import paused_garbage_collection
+
+__all__ = ["to_bytes", "from_bytes", "to_bytes_batch", "from_bytes_batch"]
+__version__ = "1.0"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+_FORMAT_VERSION = 1
+
+_ORIENTED = 1
+_LABELS = 2
+_ATTRIBUTES = 4
+
+_NODE_TYPES = (Crossing, Vertex, VirtualCrossing)
+_NODE_TYPE_CODES = {node_type: code for code, node_type in enumerate(_NODE_TYPES)}
+
+_STRING_LABEL = 0
+_INTEGER_LABEL = 1
+
+# orientation group (a varint of 7 orientation bits) -> endpoint types of the 7 endpoints
+_ORIENTATION_GROUPS = [tuple(OutgoingEndpoint if group >> i & 1 else IngoingEndpoint for i in range(7))
+                       for group in range(128)]
+
+_MAX_CACHED_SLOTS = 1 << 12
+# degrees of the nodes (with default labels) -> node and position of each endpoint
+_slots: dict[tuple[int, ...], tuple[list[str], list[int]]] = {}
+
+
+def _default_labels(n: int) -> list[str]:
+    """Return the default node labels ``a, b, ..., Z, aa, ab, ...`` (the labels of canonical diagrams)."""
+    if n <= len(string.ascii_letters):
+        return list(string.ascii_letters[:n])
+    from knotpy.algorithms.naming import number_to_alpha
+    return [number_to_alpha(i) for i in range(n)]
+
+
+def _encode_varints(values: list[int]) -> bytes:
+    """Encode non-negative integers as LEB128 varints."""
+    if max(values) < 128:
+        return bytes(values)  # all values are single bytes
+    data = bytearray()
+    for value in values:
+        while value >= 128:
+            data.append(value & 127 | 128)
+            value >>= 7
+        data.append(value)
+    return bytes(data)
+
+
+def _decode_varints(data: bytes | bytearray | memoryview) -> list[int]:
+    """Decode LEB128 varints into the list of integers."""
+    data = bytes(data)
+    if data.isascii():
+        return list(data)  # all values are single bytes
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 127) << shift
+        if byte < 128:
+            values.append(value)
+            value = shift = 0
+        else:
+            shift += 7
+    if shift:
+        raise ValueError("Truncated varint in the binary encoding of a diagram.")
+    return values
+
+
+def _zigzag(value: int) -> int:
+    return 2 * value if value >= 0 else -2 * value - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+def _encode_string(text: str) -> list[int]:
+    return [len(text)] + [ord(char) for char in text]
+
+
+def _sorted_attr(attr: dict) -> list[tuple[Any, Any]]:
+    return sorted(attr.items(), key=lambda item: str(item[0]))
+
+
+def _ordered_labels(k: PlanarDiagram) -> tuple[list, bool]:
+    """Return the node labels in the order of the encoding and whether they are the default labels."""
+    labels = _default_labels(len(k._nodes))
+    if k._nodes.keys() == set(labels):
+        return labels, True
+    try:
+        return sorted(k._nodes), False
+    except TypeError as e:
+        raise TypeError("The binary encoding requires nodes of a single, mutually comparable type.") from e
+
+
+def _diagram_values(k: PlanarDiagram, attributes: bool = False, labels: tuple[list, bool] | None = None) -> list[int]:
+    """Return the varint values of the encoding of a diagram (see the module docstring)."""
+    n = len(k._nodes)
+    labels, default_labels = labels or _ordered_labels(k)
+
+    nodes = [k._nodes[node] for node in labels]
+    offset = dict(zip(labels, accumulate((len(node_inst) for node_inst in nodes), initial=0)))
+    oriented = k.is_oriented()
+    flags = oriented * _ORIENTED + (not default_labels) * _LABELS + attributes * _ATTRIBUTES
+
+    values = [_FORMAT_VERSION, flags, n]
+    values += [_NODE_TYPE_CODES[type(node_inst)] for node_inst in nodes]
+    values += [len(node_inst) for node_inst in nodes]
+    endpoints = [ep for node_inst in nodes for ep in node_inst._inc]
+    values += [offset[ep.node] + ep.position for ep in endpoints]
+
+    if oriented:
+        bits = [type(ep) is OutgoingEndpoint for ep in endpoints]
+        values += [sum(bit << i for i, bit in enumerate(bits[j:j + 7])) for j in range(0, len(bits), 7)]
+
+    if not default_labels:
+        for label in labels:
+            if isinstance(label, str):
+                values += [_STRING_LABEL] + _encode_string(label)
+            elif isinstance(label, int):
+                values += [_INTEGER_LABEL, _zigzag(label)]
+            else:
+                raise TypeError(f"The binary encoding supports string and integer node labels, not {type(label)}.")
+
+    if attributes:
+        node_attr = [(i, _sorted_attr(node_inst.attr)) for i, node_inst in enumerate(nodes) if node_inst.attr]
+        endpoint_attr = [(i, _sorted_attr(ep.attr)) for i, ep in enumerate(endpoints) if ep.attr]
+        values += _encode_string(repr((_sorted_attr(k.attr), node_attr, endpoint_attr)))
+
+    return values
+
+
+def _diagram_from_values(values: Sequence[int], attributes: tuple | None = None,
+                         create_using: type[PlanarDiagram] | None = None) -> PlanarDiagram | OrientedPlanarDiagram:
+    """Build a diagram from the varint values of its encoding (see the module docstring).
+
+    Args:
+        values: The varint values.
+        attributes: The triple (diagram attributes, node attributes, endpoint attributes) given as Python objects
+            (see :func:`_reduce_diagram`), used instead of the attributes of the encoding.
+        create_using: The class of the diagram (by default determined by the orientation flag).
+    """
+    try:
+        version, flags, n = values[0], values[1], values[2]
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported binary encoding version {version} (expected {_FORMAT_VERSION}).")
+        node_types = [_NODE_TYPES[code] for code in values[3:3 + n]]
+        degrees = values[3 + n:3 + 2 * n]
+        number_of_endpoints = sum(degrees)
+        i = 3 + 2 * n
+        twins = values[i:i + number_of_endpoints]
+        i += number_of_endpoints
+
+        oriented = flags & _ORIENTED
+        if oriented:
+            groups = values[i:i + (number_of_endpoints + 6) // 7]
+            i += len(groups)
+            endpoint_types = [ep_type for group in groups for ep_type in _ORIENTATION_GROUPS[group]]
+
+        if flags & _LABELS:
+            labels = []
+            for _ in range(n):
+                if values[i] == _STRING_LABEL:
+                    length = values[i + 1]
+                    labels.append("".join(map(chr, values[i + 2:i + 2 + length])))
+                    i += 2 + length
+                elif values[i] == _INTEGER_LABEL:
+                    labels.append(_unzigzag(values[i + 1]))
+                    i += 2
+                else:
+                    raise ValueError(f"Invalid node label tag {values[i]} in the binary encoding of a diagram.")
+        else:
+            labels = _default_labels(n)
+
+        slots = None if flags & _LABELS else _slots.get(degrees := tuple(degrees))
+        if slots is None:
+            slots = ([labels[node] for node, degree in enumerate(degrees) for _ in range(degree)],
+                     [position for degree in degrees for position in range(degree)])
+            if not flags & _LABELS and len(_slots) < _MAX_CACHED_SLOTS:
+                _slots[degrees] = slots
+        slot_node, slot_position = slots
+        if oriented:
+            endpoints = [ep_type(slot_node[t], slot_position[t]) for ep_type, t in zip(endpoint_types, twins)]
+        else:
+            endpoints = [Endpoint(slot_node[t], slot_position[t]) for t in twins]
+
+        attr = node_attr = endpoint_attr = ()
+        if flags & _ATTRIBUTES:
+            length = values[i]
+            attr, node_attr, endpoint_attr = literal_eval("".join(map(chr, values[i + 1:i + 1 + length])))
+            i += 1 + length
+    except (IndexError, KeyError, TypeError, SyntaxError) as e:
+        raise ValueError("Malformed binary encoding of a diagram.") from e
+    if len(twins) != number_of_endpoints or i != len(values):
+        raise ValueError("Malformed binary encoding of a diagram.")
+
+    # build the nodes directly, bypassing the mutation API of the diagram
+    nodes = {}
+    start = 0
+    for label, node_type, degree in zip(labels, node_types, degrees):
+        nodes[label] = node_inst = node_type.__new__(node_type)
+        node_inst.attr = {}
+        node_inst._inc = endpoints[start:start + degree]
+        start += degree
+    if attributes is not None:
+        attr, node_attr, endpoint_attr = attributes
+    for index, node_attributes in node_attr:
+        nodes[labels[index]].attr.update(node_attributes)
+    for index, endpoint_attributes in endpoint_attr:
+        endpoints[index].attr.update(endpoint_attributes)
+
+    if create_using is None:
+        create_using = OrientedPlanarDiagram if oriented else PlanarDiagram
+    k = create_using()
+    k._nodes = nodes
+    k.attr.update(attr)
+    return k
+
+
+def to_bytes(k: PlanarDiagram, attributes: bool = False) -> bytes:
+    """Return the binary encoding of a diagram.
+
+    Args:
+        k: Planar diagram (unoriented or oriented) with string or integer node labels.
+        attributes: Whether to include the diagram, node and endpoint attributes (e.g. the name, framing and colors).
+            Without attributes, equal canonical diagrams have equal encodings.
+
+    Returns:
+        bytes: The encoding.
+
+    Raises:
+        TypeError: If the node labels are not all strings or all integers.
+    """
+    return _encode_varints(_diagram_values(k, attributes))
+
+
+def from_bytes(data: bytes | bytearray | memoryview) -> PlanarDiagram | OrientedPlanarDiagram:
+    """Return the diagram of a binary encoding (see :func:`to_bytes`).
+
+    Args:
+        data: The encoding.
+
+    Returns:
+        PlanarDiagram | OrientedPlanarDiagram: The (unfrozen) diagram.
+
+    Raises:
+        ValueError: If the data is not a valid encoding.
+    """
+    return _diagram_from_values(_decode_varints(data))
+
+
+def _reduce_diagram(k: PlanarDiagram) -> tuple:
+    """Return the reduction of a diagram for pickling (see :meth:`PlanarDiagram.__reduce__`).
+
+    The diagram is pickled as its encoding without attributes. The attributes are passed as Python objects (pickled by
+    :mod:`pickle`, so any picklable value is supported) and only if there are any, the frozen state is passed as well.
+
+    Raises:
+        TypeError: If the node labels are not all strings or all integers (the diagram cannot be encoded).
+    """
+    labels = _ordered_labels(k)
+    data = _encode_varints(_diagram_values(k, False, labels))
+    nodes = [k._nodes[node] for node in labels[0]]
+    node_attr = [(i, node_inst.attr) for i, node_inst in enumerate(nodes) if node_inst.attr]
+    endpoint_attr = [(i, ep.attr) for i, ep in enumerate(ep for node_inst in nodes for ep in node_inst._inc) if ep.attr]
+    attributes = (k.attr, node_attr, endpoint_attr) if k.attr or node_attr or endpoint_attr else None
+    return _rebuild_diagram, (type(k), data, attributes, getattr(k, "frozen", False))
+
+
+def _rebuild_diagram(create_using: type[PlanarDiagram], data: bytes, attributes: tuple | None = None,
+                     frozen: bool | str = False) -> PlanarDiagram:
+    """Rebuild a pickled diagram (see :func:`_reduce_diagram`)."""
+    k = _diagram_from_values(_decode_varints(data), attributes, create_using)
+    if frozen == "locked":
+        lock(k)
+    elif frozen:
+        freeze(k)
+    return k
+
+
+def _encode_varint_array(values):
+    """Encode a NumPy array of non-negative integers as LEB128 varints (vectorized), return the bytes as an uint8
+    array and the number of bytes of each value."""
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.uint64)
+    lengths = np.ones(len(values), dtype=np.int64)
+    shifted = values >> np.uint64(7)
+    while shifted.any():
+        lengths += shifted > 0
+        shifted >>= np.uint64(7)
+    ends = np.cumsum(lengths)
+    data = np.empty(int(ends[-1]) if len(ends) else 0, dtype=np.uint8)
+    if len(values) and int(lengths.max()) == 1:
+        data[:] = values
+        return data, lengths
+    for j in range(int(lengths.max()) if len(values) else 0):
+        mask = lengths > j
+        byte = (values[mask] >> np.uint64(7 * j)) & np.uint64(127)
+        byte |= np.where(lengths[mask] > j + 1, np.uint64(128), np.uint64(0))
+        data[ends[mask] - lengths[mask] + j] = byte
+    return data, lengths
+
+
+def _decode_varint_array(data):
+    """Decode an uint8 NumPy array of LEB128 varints (vectorized), return the values and the index of the first
+    value of each byte."""
+    import numpy as np
+
+    data = np.asarray(data, dtype=np.uint8)
+    last = data < 128
+    value_index = np.cumsum(last) - last  # index of the value containing the byte
+    if last.all():
+        return data.astype(np.int64), value_index
+    if len(data) and not last[-1]:
+        raise ValueError("Truncated varint in the binary encoding of a diagram.")
+    starts = np.flatnonzero(np.concatenate(([True], last[:-1])))
+    shifts = (np.arange(len(data)) - starts[value_index]) * 7
+    values = np.add.reduceat((data & 127).astype(np.uint64) << shifts.astype(np.uint64), starts)
+    return values.astype(np.int64), value_index
+
+
+def to_bytes_batch(diagrams: Iterable[PlanarDiagram], attributes: bool = False) -> tuple[Any, Any]:
+    """Encode many diagrams into a single buffer (requires NumPy).
+
+    The varints of all diagrams are encoded at once by vectorized operations. The encoding of the ``i``-th diagram is
+    ``buffer[offsets[i]:offsets[i + 1]]`` and equals :func:`to_bytes` of the diagram.
+
+    Args:
+        diagrams: Planar diagrams.
+        attributes: Whether to include the attributes (see :func:`to_bytes`).
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The buffer (``uint8``) and the offsets (``int64``, one more than the number
+        of diagrams).
+    """
+    import numpy as np
+
+    values, counts = [], [0]
+    for k in diagrams:
+        diagram_values = _diagram_values(k, attributes)
+        values += diagram_values
+        counts.append(len(diagram_values))
+    data, lengths = _encode_varint_array(np.array(values, dtype=np.uint64))
+    value_offsets = np.cumsum(counts)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))[value_offsets]
+    return data, offsets.astype(np.int64)
+
+
+def from_bytes_batch(buffer, offsets) -> list[PlanarDiagram | OrientedPlanarDiagram]:
+    """Decode many diagrams from a single buffer (requires NumPy), the inverse of :func:`to_bytes_batch`.
+
+    Args:
+        buffer: The encodings (bytes or an ``uint8`` array).
+        offsets: Offsets of the encodings in the buffer (one more than the number of diagrams).
+
+    Returns:
+        list[PlanarDiagram | OrientedPlanarDiagram]: The diagrams.
+
+    Raises:
+        ValueError: If the buffer contains an invalid encoding.
+    """
+    import numpy as np
+
+    data = np.frombuffer(buffer, dtype=np.uint8) if isinstance(buffer, (bytes, bytearray, memoryview)) else buffer
+    offsets = np.asarray(offsets, dtype=np.int64)
+    values, value_index = _decode_varint_array(data)
+    if len(offsets) and (offsets[-1] != len(data) or offsets[0] != 0):
+        raise ValueError("The offsets do not cover the buffer of the binary encodings.")
+    value_offsets = np.append(value_index, len(values))[offsets].tolist()
+    values = values.tolist()
+    with paused_garbage_collection():
+        return [_diagram_from_values(values[a:b]) for a, b in zip(value_offsets, value_offsets[1:])]
+
+
+if __name__ == "__main__":
+    pass
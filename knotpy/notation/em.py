@@ -24,7 +24,6 @@ neighbor-position pairs (CCW). For the example above:
     "b0c1,a0d0c0,b2a1,b1"
 """
 
-import re
 import string
 from ast import literal_eval
 from typing import Any, Dict, Iterable, Mapping, Tuple
@@ -32,8 +31,10 @@ from typing import Any, Dict, Iterable, Mapping, Tuple
 from knotpy.classes.planardiagram import OrientedPlanarDiagram, PlanarDiagram
 from knotpy.classes.node import Crossing, Vertex
 from knotpy.classes.endpoint import Endpoint
+from knotpy.utils.decorators import paused_garbage_collection
 
-__all__ = ["to_em_notation", "from_em_notation", "to_condensed_em_notation", "from_condensed_em_notation"]
+__all__ = ["to_em_notation", "from_em_notation", "to_condensed_em_notation", "from_condensed_em_notation",
+           "from_condensed_em_notation_batch"]
 __version__ = "1.0"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovšek@pef.uni-lj.si>"
 
@@ -152,6 +153,40 @@ def to_condensed_em_notation(g: PlanarDiagram, separator: str = ",") -> str:
     return separator.join(tokens)
 
 
+_MAX_CACHED_TOKENS = 1 << 16
+
+# token (e.g. "b0c1d3e2") -> (node type, ((neighbor, neighbor position), ...)), tokens repeat across diagrams
+_condensed_em_tokens: dict[str, tuple[type, tuple[tuple[str, int], ...]]] = {}
+
+
+def _parse_condensed_em_token(token: str) -> tuple[type, tuple[tuple[str, int], ...]]:
+    """Parse a condensed EM token ``<neighbor-letter><neighbor-position>...`` into the node type (a crossing if the
+    node has degree four) and the pairs (neighbor, position).
+
+    Positions of nodes of degree at most 10 are single digits, so a token is usually split by slicing into letters and
+    digits; longer positions are read by a scan over the token.
+    """
+    letters, digits = token[0::2], token[1::2]
+    if letters.isalpha() and digits.isdigit() and len(letters) == len(digits) and letters.isascii():
+        pairs = tuple(zip(letters, map(int, digits)))
+    else:
+        pairs = []
+        i, n = 0, len(token)
+        while i < n:
+            j = i + 1
+            while j < n and token[j].isdigit():
+                j += 1
+            if j == i + 1 or not token[i].isalpha() or not token[i].isascii():
+                raise ValueError(f"Malformed condensed EM token: {token!r}")
+            pairs.append((token[i], int(token[i + 1:j])))
+            i = j
+        pairs = tuple(pairs)
+    parsed = (Crossing if len(pairs) == 4 else Vertex, pairs)
+    if len(_condensed_em_tokens) < _MAX_CACHED_TOKENS:
+        _condensed_em_tokens[token] = parsed
+    return parsed
+
+
 def from_condensed_em_notation(data: str, separator: str = ",", oriented: bool = False) -> PlanarDiagram:
     """Parse condensed EM notation into a planar diagram.
 
@@ -173,27 +208,43 @@ def from_condensed_em_notation(data: str, separator: str = ",", oriented: bool =
     if oriented:
         raise NotImplementedError("Oriented condensed EM import not implemented yet.")
 
-    s = (" " if separator == " " else "").join(data.split())
+    s = data if data.isprintable() and " " not in data else (" " if separator == " " else "").join(data.split())
     tokens = s.split(separator) if s else []
-    g = PlanarDiagram()
+    if len(tokens) > len(string.ascii_letters):
+        raise ValueError(f"Condensed EM notation is undefined for > {len(string.ascii_letters)} nodes.")
 
-    for idx, token in enumerate(tokens):
-        node = string.ascii_letters[idx]
-        # Split into letters and integers
-        adj_nodes = re.findall(r"[a-zA-Z]", token)
-        adj_positions = re.findall(r"\d+", token)
+    # build the nodes directly from the cached (node type, pairs) of the tokens, bypassing the mutation API
+    nodes = {}
+    cached = _condensed_em_tokens
+    new = object.__new__
+    for node, token in zip(string.ascii_letters, tokens):
+        node_type, pairs = cached.get(token) or _parse_condensed_em_token(token)
+        nodes[node] = node_inst = new(node_type)
+        node_inst.attr = {}
+        node_inst._inc = inc = []
+        for u, u_pos in pairs:  # endpoints without calling the constructor (positions are already integers)
+            ep = new(Endpoint)
+            ep.node, ep.position, ep.attr = u, u_pos, {}
+            inc.append(ep)
 
-        if len(adj_nodes) != len(adj_positions):
-            raise ValueError(f"Malformed condensed EM token: {token!r}")
+    g = PlanarDiagram()
+    g._nodes = nodes
+    return g
 
-        degree = len(adj_nodes)
-        node_type = Crossing if degree == 4 else Vertex
-        g.add_node(node_for_adding=node, create_using=node_type, degree=degree)
 
-        for pos, (u, u_pos) in enumerate(zip(adj_nodes, adj_positions)):
-            g.set_endpoint((node, pos), (u, int(u_pos)), create_using=Endpoint)
+def from_condensed_em_notation_batch(data: Iterable[str], separator: str = ",") -> list[PlanarDiagram]:
+    """Parse a sequence of condensed EM strings into a list of planar diagrams (see
+    :func:`from_condensed_em_notation`).
 
-    return g
+    Args:
+        data: Condensed EM strings.
+        separator: Token separator used in the strings (default: comma).
+
+    Returns:
+        list[PlanarDiagram]: Parsed diagrams, in the order of the strings.
+    """
+    with paused_garbage_collection():
+        return [from_condensed_em_notation(item, separator) for item in data]
 
 
 if __name__ == "__main__":
@@ -20,17 +20,19 @@ Vertex v [('a',3,{'color':'Orange'})] {}
 See "Ewing, B. & Millett, K. C. in The mathematical heritage of CF Gauss 225–266 (World Scientific, 1991)".
 """
 
-__all__ = ["to_knotpy_notation", "from_knotpy_notation"]
+__all__ = ["to_knotpy_notation", "from_knotpy_notation", "from_knotpy_notation_batch"]
 __version__ = "1.0"
 __author__ = "Boštjan Gabrovšek"
 
 import re
 from ast import literal_eval
+from typing import Iterable
 # literal_eval = eval  # unsafe, kept for potential legacy reasons
 
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
 from knotpy.classes.node import Vertex, Crossing, Node
 from knotpy.classes.endpoint import OutgoingEndpoint, IngoingEndpoint, Endpoint
+from knotpy.utils.decorators import paused_garbage_collection
 
 
 def _attr_to_str(attr: dict) -> str:
@@ -95,49 +97,96 @@ def to_knotpy_notation(k: PlanarDiagram) -> str:
         return None
 
 
-def _parse_attributes_dict(attr_string: str) -> dict:
-    """Parse a string of key=value pairs into a dictionary using regex."""
-    pattern = re.compile(r"'?(\w+)'?\s*=\s*('[^']*'|\d+|\[.*?\]|\{.*?\})")
-    result = {}
-    for key, value in pattern.findall(attr_string):
-        result[key] = literal_eval(value)
-    return result
-
+_NODE_TYPES = {"X": Crossing, "V": Vertex}
+_ENDPOINT_TYPES = {"o": OutgoingEndpoint, "i": IngoingEndpoint}
+_DIGITS = "0123456789"
+_MAX_CACHED_DEFINITIONS = 1 << 16
 
-def _parse_compact(notation: str) -> PlanarDiagram | OrientedPlanarDiagram:
-    """Parse compact KnotPy notation into a PlanarDiagram."""
-    if "→" in notation:
-        notation = notation.replace(" → ", "=").replace("→", "=").replace("),", ")")
+# node definition (e.g. " b=X(a0 d2 e3 f0") -> (node, node type, endpoint types, nodes and positions), separately for
+# unoriented and oriented diagrams; definitions repeat across diagrams (the nodes of table diagrams are single letters)
+_node_definitions: dict[bool, dict[str, tuple[str, type, tuple[tuple[type, str, int], ...]]]] = {False: {}, True: {}}
+# endpoint token (e.g. "b3" or "b3i") -> (endpoint type, node, position)
+_endpoint_tokens: dict[bool, dict[str, tuple[type, str, int]]] = {False: {}, True: {}}
 
-    _node_abbr = {"X": Crossing, "V": Vertex}
-    definition_part, *attribute_parts = notation.split("[")
-    attribute_string = "[".join(attribute_parts).rstrip("]") if attribute_parts else ""
+_ATTRIBUTES_PATTERN = re.compile(r"'?(\w+)'?\s*=\s*('[^']*'|\d+|\[.*?\]|\{.*?\})")
+_ELEMENT_ATTRIBUTES_PATTERN = re.compile(r"(\w+)\s*:\s*\{([^}]*)\}")
+_ENDPOINT_PATTERN = re.compile(r"([a-zA-Z]+)(\d+)")
 
-    node_pattern = re.compile(r"(\w+)=([VX])\(([^)]+)\)")
-    oriented = "i)" in notation or "o)" in notation
-    k = OrientedPlanarDiagram() if oriented else PlanarDiagram()
 
+def _parse_attributes_dict(attr_string: str) -> dict:
+    """Parse a string of key=value pairs into a dictionary using regex."""
+    result = {}
+    for key, value in _ATTRIBUTES_PATTERN.findall(attr_string):
+        if value[0] == "'" and "\\" not in value:
+            result[key] = value[1:-1]  # plain string, no need to evaluate
+        elif value.isdigit():
+            result[key] = int(value)
+        else:
+            result[key] = literal_eval(value)
+    return result
 
-    for match in node_pattern.finditer(definition_part):
-        node, node_type, endpoints = match.groups()
-        endpoints = endpoints.strip().split()
-        #print(node,_node_abbr[node_type],len(endpoints))
-        k.add_node(node, create_using=_node_abbr[node_type], degree=len(endpoints))
-
-        for pos, ep_str in enumerate(endpoints):
-            if oriented:
-                triple = tuple(
-                    re.match(r"([a-zA-Z]+)(\d+)([io])", ep_str.strip()).groups()
-                )
-                k.set_endpoint(
-                    (node, pos),
-                    (triple[0], int(triple[1])),
-                    create_using=OutgoingEndpoint if triple[2] == "o" else IngoingEndpoint,
-                )
-            else:
-                pair = tuple(re.match(r"([a-zA-Z]+)(\d+)", ep_str.strip()).groups())
-                k.set_endpoint((node, pos), (pair[0], int(pair[1])), create_using=Endpoint)
 
+def _parse_endpoint_token(token: str, oriented: bool) -> tuple[type, str, int]:
+    """Split an endpoint token (e.g. ``"b3"`` or ``"b3i"``) into the endpoint type, the node and the position."""
+    if oriented:
+        ep_type = _ENDPOINT_TYPES.get(token[-1:])
+        if ep_type is None:
+            raise ValueError(f"Invalid oriented endpoint {token!r} in KnotPy notation.")
+        ep_str = token[:-1]
+    else:
+        ep_type, ep_str = Endpoint, token
+    node = ep_str.rstrip(_DIGITS)
+    if not node or len(node) == len(ep_str) or not node.isalpha():
+        raise ValueError(f"Invalid endpoint {token!r} in KnotPy notation.")
+    parsed = (ep_type, node, int(ep_str[len(node):]))
+    if len(_endpoint_tokens[oriented]) < _MAX_CACHED_DEFINITIONS:
+        _endpoint_tokens[oriented][token] = parsed
+    return parsed
+
+
+def _parse_node_definition(part: str, oriented: bool) -> tuple[str, type, tuple[tuple[type, str, int], ...]]:
+    """Parse a node definition ``a=X(b0 c1 ...`` (without the closing parenthesis)."""
+    node_str, sep, endpoints_str = part.partition("(")
+    node, _, node_type = node_str.strip().partition("=")
+    node_class = _NODE_TYPES.get(node_type)
+    if not sep or node_class is None or not node:
+        raise ValueError(f"Invalid node definition {part.strip()!r} in KnotPy notation.")
+    tokens = _endpoint_tokens[oriented]
+    parsed = tuple([tokens.get(token) or _parse_endpoint_token(token, oriented) for token in endpoints_str.split()])
+    if node_class is Crossing and len(parsed) != 4:
+        raise ValueError("Cannot create a crossing with degree not equal to four.")
+    definition = (node, node_class, parsed)
+    if len(_node_definitions[oriented]) < _MAX_CACHED_DEFINITIONS:
+        _node_definitions[oriented][part] = definition
+    return definition
+
+
+def _parse_nodes(definition: str, oriented: bool) -> dict:
+    """Parse the node definitions ``a=X(b0 c1 ...) b=V(...) ...`` in a single pass into the dictionary of nodes.
+
+    The node instances are created directly (without the mutation API of the diagram). Parsed node definitions are
+    cached, so a node usually costs a dictionary lookup and the creation of its endpoints.
+    """
+    *parts, rest = definition.split(")")
+    if rest.strip():
+        raise ValueError(f"Invalid node definition {rest.strip()!r} in KnotPy notation.")
+    nodes = {}
+    definitions = _node_definitions[oriented]
+    new = object.__new__
+    for part in parts:
+        node, node_class, parsed = definitions.get(part) or _parse_node_definition(part, oriented)
+        nodes[node] = node_inst = new(node_class)
+        node_inst.attr = {}
+        node_inst._inc = inc = []
+        for ep_type, adj_node, position in parsed:  # endpoints without calling the constructor
+            ep = new(ep_type)
+            ep.node, ep.position, ep.attr = adj_node, position, {}
+            inc.append(ep)
+    return nodes
+
+
+def _parse_attributes(k: PlanarDiagram, attribute_string: str) -> None:
+    """Parse the attribute part ``diagram attributes; node attributes; endpoint attributes`` into the diagram."""
     attr_split = attribute_string.split(";")
     if len(attr_split) > 3:
         raise ValueError("Invalid attribute string format.")
@@ -146,21 +195,43 @@ def _parse_compact(notation: str) -> PlanarDiagram | OrientedPlanarDiagram:
     diagram_attr, node_attr, endpoint_attr = attr_split
     k.attr.update(_parse_attributes_dict(diagram_attr.strip()))
 
-    node_attribute_pattern = re.compile(r"(\w+)\s*:\s*\{([^}]*)\}")
-    for node, attr_str in node_attribute_pattern.findall(node_attr):
+    for node, attr_str in _ELEMENT_ATTRIBUTES_PATTERN.findall(node_attr):
         k.nodes[node].attr.update(_parse_attributes_dict(attr_str.strip()))
 
-    for ep, attr_str in node_attribute_pattern.findall(endpoint_attr):
-        pair = tuple(re.match(r"([a-zA-Z]+)(\d+)", ep).groups())
+    for ep, attr_str in _ELEMENT_ATTRIBUTES_PATTERN.findall(endpoint_attr):
+        pair = tuple(_ENDPOINT_PATTERN.match(ep).groups())
         k.endpoint_from_pair((pair[0], int(pair[1]))).attr.update(
             _parse_attributes_dict(attr_str.strip())
         )
 
+
+def _parse_compact(notation: str) -> PlanarDiagram | OrientedPlanarDiagram:
+    """Parse compact KnotPy notation into a PlanarDiagram."""
+    if "→" in notation:
+        notation = notation.replace(" → ", "=").replace("→", "=").replace("),", ")")
+
+    definition_part, bracket, attribute_string = notation.partition("[")
+    oriented = "i)" in definition_part or "o)" in definition_part
+    k = OrientedPlanarDiagram() if oriented else PlanarDiagram()
+    k._nodes = _parse_nodes(definition_part, oriented)
+    if bracket:
+        _parse_attributes(k, attribute_string.rstrip().rstrip("]"))
     return k
 
 
 def from_knotpy_notation(notation: str) -> PlanarDiagram | OrientedPlanarDiagram:
-    """Convert notation string into a PlanarDiagram."""
+    """Convert notation string into a PlanarDiagram.
+
+    Args:
+        notation: KnotPy notation string, e.g. ``"a=X(b3 b2 c3 c2) b=X(...) ... ['name'='3_1']"``.
+
+    Returns:
+        PlanarDiagram | OrientedPlanarDiagram: The parsed diagram (oriented if the endpoints have orientation
+        suffixes ``i``/``o``).
+
+    Raises:
+        ValueError: If the notation is malformed.
+    """
     compact_notation = True
     if compact_notation:
         return _parse_compact(notation)
@@ -168,5 +239,18 @@ def from_knotpy_notation(notation: str) -> PlanarDiagram | OrientedPlanarDiagram
         raise NotImplementedError()
 
 
+def from_knotpy_notation_batch(notations: Iterable[str]) -> list[PlanarDiagram | OrientedPlanarDiagram]:
+    """Convert a sequence of notation strings into a list of diagrams (see :func:`from_knotpy_notation`).
+
+    Args:
+        notations: KnotPy notation strings.
+
+    Returns:
+        list[PlanarDiagram | OrientedPlanarDiagram]: The parsed diagrams, in the order of the notations.
+    """
+    with paused_garbage_collection():
+        return [_parse_compact(notation) for notation in notations]
+
+
 if __name__ == "__main__":
     pass
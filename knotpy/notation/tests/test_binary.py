@@ -0,0 +1,183 @@
+import copyreg
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from time import time
+
+import knotpy as kp
+from knotpy.notation.binary import to_bytes, from_bytes, to_bytes_batch, from_bytes_batch
+from knotpy.notation.em import to_condensed_em_notation
+from knotpy.algorithms.disjoint_union import disjoint_union
+from knotpy.classes.freezing import freeze, lock
+from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
+
+
+def _same(k, k_) -> bool:
+    return (k == k_ and type(k) is type(k_) and k.attr == k_.attr
+            and all(k.nodes[node].attr == k_.nodes[node].attr for node in k.nodes)
+            and sorted(str(ep) for ep in k.endpoints) == sorted(str(ep) for ep in k_.endpoints))
+
+
+def _diagrams():
+    return (list(kp.knots(crossings=[0, 3, 5, 6, 7])) + list(kp.links(crossings=[2, 4, 5, 6]))
+            + [kp.orient(k) for k in kp.knots(crossings=[3, 4, 5, 6])] + kp.thetas(crossings=[0, 1, 2, 3, 4]))
+
+
+def test_bytes_to_from():
+    for k in _diagrams():
+        assert from_bytes(to_bytes(k))._compare(k, compare_attributes=False) == 0
+        k = k.copy()
+        node = next(iter(k.nodes))
+        k.nodes[node].attr["color"] = 3
+        k.nodes[node][0].attr["color"] = "red"
+        k.framing = -2
+        assert _same(from_bytes(to_bytes(k, attributes=True)), k)
+
+    # labels other than the default labels, large diagrams
+    k = kp.from_pd_notation("X[1,5,2,4],X[3,1,4,6],X[5,3,6,2]")
+    k.relabel_nodes({node: i - 10 for i, node in enumerate(k.nodes)})
+    assert _same(from_bytes(to_bytes(k, attributes=True)), k)
+    k.relabel_nodes({node: f"x{node}" for node in k.nodes})
+    assert _same(from_bytes(to_bytes(k, attributes=True)), k)
+
+    k = kp.canonical(disjoint_union(*[kp.knot("12a_1")] * 6))
+    assert len(k) == 72 and from_bytes(to_bytes(k)) == k
+
+    for malformed in [b"", b"\x02\x00\x00", to_bytes(k)[:-1], to_bytes(k) + b"\x00", b"\x01\x00\x01\x07\x01\x00"]:
+        try:
+            from_bytes(malformed)
+            assert False, malformed
+        except ValueError:
+            pass
+
+
+def test_bytes_canonical():
+    """Equal canonical diagrams have equal encodings."""
+    random.seed(0)
+    for k in _diagrams():
+        nodes = list(k.nodes)
+        k_ = k.copy()
+        k_.relabel_nodes(dict(zip(nodes, random.sample(nodes, len(nodes)))))
+        k_._nodes = dict(reversed(list(k_._nodes.items())))  # insertion order does not matter
+        assert to_bytes(kp.canonical(k)) == to_bytes(kp.canonical(k_))
+    encodings = {to_bytes(kp.canonical(k)) for k in kp.knots(crossings=[3, 4, 5, 6, 7, 8])}
+    assert len(encodings) == len(list(kp.knots(crossings=[3, 4, 5, 6, 7, 8])))
+
+
+def test_bytes_batch():
+    diagrams = _diagrams()
+    for attributes in (False, True):
+        buffer, offsets = to_bytes_batch(diagrams, attributes=attributes)
+        assert len(offsets) == len(diagrams) + 1
+        assert [bytes(buffer[a:b]) for a, b in zip(offsets, offsets[1:])] == [to_bytes(k, attributes) for k in diagrams]
+        assert from_bytes_batch(buffer.tobytes(), offsets) == [from_bytes(to_bytes(k, attributes)) for k in diagrams]
+
+    # multibyte varints
+    k = kp.canonical(disjoint_union(*[kp.knot("12a_1")] * 6))
+    buffer, offsets = to_bytes_batch([k, kp.knot("3_1"), k])
+    assert from_bytes_batch(buffer, offsets)[2] == k
+    assert to_bytes_batch([])[0].size == 0 and from_bytes_batch(b"", [0]) == []
+
+
+def test_pickle():
+    for k in _diagrams():
+        assert _same(pickle.loads(pickle.dumps(k)), k)
+        k = k.copy()
+        node = next(iter(k.nodes))
+        k.nodes[node].attr["color"] = {3, 4}  # not a literal
+        k.nodes[node][0].attr["color"] = "red"
+        k.framing = -2
+        for protocol in (0, pickle.HIGHEST_PROTOCOL):
+            assert _same(pickle.loads(pickle.dumps(k, protocol=protocol)), k)
+
+    k, k_locked = freeze(kp.orient(kp.knot("5_2")), inplace=False), lock(kp.knot("5_2"), inplace=False)
+    for k_ in pickle.loads(pickle.dumps([k, k_locked])):
+        assert k_.is_frozen()
+        try:
+            k_.add_crossing("x")
+            assert False
+        except RuntimeError:
+            pass
+    assert pickle.loads(pickle.dumps(k)).frozen is True and pickle.loads(pickle.dumps(k_locked)).frozen == "locked"
+    assert not pickle.loads(pickle.dumps(kp.knot("5_2"))).is_frozen()
+
+    # node labels that cannot be encoded
+    k = kp.from_pd_notation("X[1,5,2,4],X[3,1,4,6],X[5,3,6,2]")
+    k.relabel_nodes({node: (i,) for i, node in enumerate(k.nodes)})
+    assert _same(pickle.loads(pickle.dumps(k)), k)
+
+
+def _dumps_instance_dict(diagrams) -> bytes:
+    """Pickle diagrams by their instance dictionaries (the default pickling of objects)."""
+    f = BytesIO()
+    pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    for cls in (PlanarDiagram, OrientedPlanarDiagram):
+        pickler.dispatch_table[cls] = lambda k: (copyreg.__newobj__, (type(k),), k.__dict__)
+    pickler.dump(diagrams)
+    return f.getvalue()
+
+
+def test_pickle_speed():
+    diagrams = list(kp.knots(crossings=[9, 10, 11])) + [kp.orient(k) for k in kp.knots(crossings=[9, 10])]
+
+    t = time()
+    data_dict = _dumps_instance_dict(diagrams)
+    assert len(pickle.loads(data_dict)) == len(diagrams)
+    dict_time = time() - t
+
+    t = time()
+    data = pickle.dumps(diagrams, protocol=pickle.HIGHEST_PROTOCOL)
+    unpickled = pickle.loads(data)
+    compact_time = time() - t
+    assert unpickled == diagrams
+
+    # transfer to the workers of a process pool and back
+    chunks = [diagrams[i:i + 100] for i in range(0, len(diagrams), 100)]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        list(executor.map(len, chunks[:2]))  # start the workers
+        t = time()
+        assert sum(executor.map(len, chunks)) == len(diagrams)
+        pool_time = time() - t
+
+    print(f"Pickle {len(diagrams)} diagrams: {dict_time:.2f}s, {len(data_dict) / 1e6:.1f}MB (instance dictionaries), "
+          f"{compact_time:.2f}s, {len(data) / 1e6:.1f}MB (binary encoding)")
+    print(f"Process pool transfer: {len(diagrams) / pool_time:.0f} diagrams/s")
+
+
+def test_bytes_speed():
+    diagrams = list(kp.knots(crossings=[9, 10, 11])) + [kp.orient(k) for k in kp.knots(crossings=[9, 10])]
+
+    # baseline: the default pickling of objects (pickle.dumps itself uses the binary encoding)
+    t = time()
+    pickled = [_dumps_instance_dict(k) for k in diagrams]
+    unpickled = [pickle.loads(data) for data in pickled]
+    pickle_time = time() - t
+
+    t = time()
+    encoded = [to_bytes(k) for k in diagrams]
+    decoded = [from_bytes(data) for data in encoded]
+    bytes_time = time() - t
+
+    t = time()
+    buffer, offsets = to_bytes_batch(diagrams)
+    batch = from_bytes_batch(buffer, offsets)
+    batch_time = time() - t
+    assert len(unpickled) == len(decoded) == len(batch)
+
+    size = sum(map(len, encoded)) / len(diagrams)
+    size_pickle = sum(map(len, pickled)) / len(diagrams)
+    size_em = sum(len(to_condensed_em_notation(k)) for k in diagrams) / len(diagrams)
+    print(f"Encode and decode {len(diagrams)} diagrams: {pickle_time:.2f}s (pickle), {bytes_time:.2f}s (bytes), "
+          f"{batch_time:.2f}s (batch)")
+    print(f"Average size: {size_pickle:.0f} (pickle), {size_em:.0f} (condensed EM), {size:.0f} (bytes)")
+
+
+if __name__ == '__main__':
+    test_bytes_to_from()
+    test_bytes_canonical()
+    test_bytes_batch()
+    test_pickle()
+    test_bytes_speed()
+    test_pickle_speed()
@@ -1,6 +1,76 @@
 
-from knotpy.classes.planardiagram import PlanarDiagram
-from knotpy.notation.native import to_knotpy_notation, from_knotpy_notation
+import gc
+import re
+from ast import literal_eval
+from pathlib import Path
+from time import time
+
+import knotpy as kp
+from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
+from knotpy.classes.node import Crossing, Vertex
+from knotpy.classes.endpoint import Endpoint, IngoingEndpoint, OutgoingEndpoint
+from knotpy.notation.native import (to_knotpy_notation, from_knotpy_notation, from_knotpy_notation_batch,
+                                    _parse_attributes, _parse_attributes_dict)
+from knotpy.notation import native, em
+from knotpy.notation.em import to_condensed_em_notation, from_condensed_em_notation, from_condensed_em_notation_batch
+from knotpy.tables.invariant_reader import load_invariant_table
+
+_DATA_DIR = Path(kp.__file__).parent / "tables" / "data"
+_TABLES = ["knots_[0-9]*.csv.gz", "links_[0-9]*.csv.gz", "theta_curves.csv.gz"]
+
+
+def _table_notations() -> list[str]:
+    """Return the native notations of all table rows."""
+    notations = []
+    for pattern in _TABLES:
+        for filename in sorted(_DATA_DIR.glob(pattern)):
+            rows = load_invariant_table(filename, evaluate=False, only_field_name="native notation")
+            notations += [notation for notation in rows.values() if notation]
+    return notations
+
+
+def _from_knotpy_notation_reference(notation: str) -> PlanarDiagram:
+    """Parse native notation by regular expressions and the mutation API of the diagram (the previous parser)."""
+    definition, _, attributes = notation.partition("[")
+    oriented = "i)" in notation or "o)" in notation
+    k = OrientedPlanarDiagram() if oriented else PlanarDiagram()
+    for match in re.compile(r"(\w+)=([VX])\(([^)]+)\)").finditer(definition):
+        node, node_type, endpoints = match.groups()
+        endpoints = endpoints.strip().split()
+        k.add_node(node, create_using={"X": Crossing, "V": Vertex}[node_type], degree=len(endpoints))
+        for pos, ep_str in enumerate(endpoints):
+            if oriented:
+                triple = tuple(re.match(r"([a-zA-Z]+)(\d+)([io])", ep_str.strip()).groups())
+                k.set_endpoint((node, pos), (triple[0], int(triple[1])),
+                               create_using=OutgoingEndpoint if triple[2] == "o" else IngoingEndpoint)
+            else:
+                pair = tuple(re.match(r"([a-zA-Z]+)(\d+)", ep_str.strip()).groups())
+                k.set_endpoint((node, pos), (pair[0], int(pair[1])), create_using=Endpoint)
+    diagram_attributes = attributes.rstrip("]").split(";")[0]
+    for key, value in re.compile(r"'?(\w+)'?\s*=\s*('[^']*'|\d+|\[.*?\]|\{.*?\})").findall(diagram_attributes):
+        k.attr[key] = literal_eval(value)
+    if ";" in attributes:
+        _parse_attributes(k, attributes.rstrip().rstrip("]"))
+    return k
+
+
+def _from_condensed_em_notation_reference(data: str) -> PlanarDiagram:
+    """Parse condensed EM notation by regular expressions and the mutation API of the diagram (the previous parser)."""
+    k = PlanarDiagram()
+    for node, token in zip("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ", data.split(",")):
+        adj_nodes = re.findall(r"[a-zA-Z]", token)
+        adj_positions = re.findall(r"\d+", token)
+        k.add_node(node, create_using=Crossing if len(adj_nodes) == 4 else Vertex, degree=len(adj_nodes))
+        for pos, (adj_node, adj_pos) in enumerate(zip(adj_nodes, adj_positions)):
+            k.set_endpoint((node, pos), (adj_node, int(adj_pos)), create_using=Endpoint)
+    return k
+
+
+def _same(k, k_) -> bool:
+    return (k == k_ and type(k) is type(k_) and k.attr == k_.attr
+            and all(k.nodes[node].attr == k_.nodes[node].attr for node in k.nodes)
+            and sorted(str(ep) for ep in k.endpoints) == sorted(str(ep) for ep in k_.endpoints))
+
 
 def test_native_notation_to_from():
 
@@ -113,7 +183,90 @@ def test_native_notation_to():
     assert set(notation_e[1].replace("]","").split(" ")) == set(notation_e_[1].replace("]","").split(" "))
 
 
+def test_native_notation_parser_tables():
+    notations = _table_notations()
+    diagrams = from_knotpy_notation_batch(notations)
+    assert len(diagrams) == len(notations)
+    for notation, k in zip(notations, diagrams):
+        assert _same(k, _from_knotpy_notation_reference(notation)), notation
+        assert _same(k, from_knotpy_notation(to_knotpy_notation(k))), notation
+
+    attributes = "'name'='3_1','color'='a\\tb','list'=[1, 2],'n'=12"
+    assert _parse_attributes_dict(attributes) == {"name": "3_1", "color": "a\tb", "list": [1, 2], "n": 12}
+
+    # oriented diagrams and the notation of printed diagrams
+    k = from_knotpy_notation("a → X(b0i b3o c0i c3o), b → X(a0o c2i c1o a1i), c → X(a2o b2i b1o a3i)")
+    assert k.is_oriented() and _same(k, _from_knotpy_notation_reference(str(k).replace("Diagram ", "")
+                                                                       .replace(" → ", "=").replace("),", ")")))
+
+    for malformed in ["a=X(b0 b1 b2) b=X(a0 a1 a2 a3)", "a=Y(a1 a0)", "a=V(a1 a0", "a=V(a1 0)", "a=V(a1i a0)"]:
+        try:
+            from_knotpy_notation(malformed)
+            assert False, malformed
+        except ValueError:
+            pass
+
+
+def test_condensed_em_notation_parser():
+    for k in list(kp.knots(crossings=[0, 3, 5, 7])) + list(kp.links(crossings=[2, 4, 6])):
+        k = k.copy()
+        k.attr = {}
+        notation = to_condensed_em_notation(k)
+        assert from_condensed_em_notation(notation) == k == _from_condensed_em_notation_reference(notation)
+    assert from_condensed_em_notation_batch(["b0,a0", "b10a0,a1"]) == [_from_condensed_em_notation_reference("b0,a0"),
+                                                                     _from_condensed_em_notation_reference("b10a0,a1")]
+    assert from_condensed_em_notation("b0 a0", separator=" ") == from_condensed_em_notation("b0,a0")
+
+    for malformed in ["b0,a", "0b,a0", "b0,a0x", "b0,a-1"]:
+        try:
+            from_condensed_em_notation(malformed)
+            assert False, malformed
+        except ValueError:
+            pass
+
+
+def _best_times(reference, function, repeat: int = 5) -> tuple[float, float]:
+    """Return the best times of several runs of the reference parser and of the parser (with cold parser caches). The
+    runs alternate, so that the timing noise of the machine affects both."""
+    times = {reference: [], function: []}
+    for _ in range(repeat):
+        for f in (reference, function):
+            for cache in (*native._node_definitions.values(), *native._endpoint_tokens.values(),
+                          em._condensed_em_tokens):
+                cache.clear()
+            gc.collect()  # garbage of the previous run is not collected in this run
+            t = time()
+            f()
+            times[f].append(time() - t)
+    return min(times[reference]), min(times[function])
+
+
+def test_notation_parser_speed():
+    notations = _table_notations()
+    diagrams = from_knotpy_notation_batch(notations)
+    assert diagrams == [_from_knotpy_notation_reference(notation) for notation in notations]
+    reference_time, batch_time = _best_times(
+        lambda: [_from_knotpy_notation_reference(notation) for notation in notations],
+        lambda: from_knotpy_notation_batch(notations))
+    print(f"Native notation of {len(notations)} table diagrams: {reference_time:.2f}s (regex + mutation API), "
+          f"{batch_time:.2f}s (batch parser), {reference_time / batch_time:.1f}x")
+    assert reference_time / batch_time >= 5
+
+    condensed = [to_condensed_em_notation(k) for k in diagrams if not k.is_oriented()]
+    assert from_condensed_em_notation_batch(condensed) == [_from_condensed_em_notation_reference(notation)
+                                                           for notation in condensed]
+    reference_time, batch_time = _best_times(
+        lambda: [_from_condensed_em_notation_reference(notation) for notation in condensed],
+        lambda: from_condensed_em_notation_batch(condensed))
+    print(f"Condensed EM notation of {len(condensed)} table diagrams: {reference_time:.2f}s (regex + mutation API), "
+          f"{batch_time:.2f}s (batch parser), {reference_time / batch_time:.1f}x")
+    assert reference_time / batch_time >= 5
+
+
 if __name__ == "__main__":
     test_native_notation_to_from()
     test_native_notation_from()
-    test_native_notation_to()
\ No newline at end of file
+    test_native_notation_to()
+    test_native_notation_parser_tables()
+    test_condensed_em_notation_parser()
+    test_notation_parser_speed()
@@ -16,7 +16,7 @@ Notes
 
 from itertools import combinations
 
-from knotpy.notation.em import to_condensed_em_notation, from_condensed_em_notation
+from knotpy.notation.binary import to_bytes, from_bytes
 from knotpy.classes.planardiagram import PlanarDiagram, Diagram
 from knotpy.algorithms.canonical import canonical
 from knotpy.utils.set_utils import LeveledSet
@@ -143,10 +143,8 @@ def simplify(k: Diagram | set | list | tuple, depth: int = 1, flype: bool = Fals
         return [simplify(_, depth, flype=flype) for _ in k]
 
     # From here on, k is a single diagram.
-    memory_efficient = True if k.number_of_crossings + 2 * depth < 26 * 2 - 2 else False
-
-    if keep_attributes:
-        memory_efficient = False
+    # diagrams are stored by their binary encodings (without attributes)
+    memory_efficient = not keep_attributes
 
     if _DEBUG_SIMPLIFY: print("Memory efficient:", memory_efficient)
 
@@ -178,8 +176,8 @@ def simplify(k: Diagram | set | list | tuple, depth: int = 1, flype: bool = Fals
     if memory_efficient:
         ls = LeveledSet(
             items=crossing_non_increasing_space(k, greediness=0, assume_canonical=True),
-            to_string=to_condensed_em_notation,
-            from_string=from_condensed_em_notation,
+            to_string=to_bytes,
+            from_string=from_bytes,
         )
     else:
         ls = LeveledSet(crossing_non_increasing_space(k, greediness=0, assume_canonical=True))
@@ -321,8 +319,8 @@ def reduce_equivalent_diagrams(diagrams: set | list, depth: int = 1, flype: bool
     if flype:
         settings.add_allowed_move("FLYPE")
 
-    # put the diagram strings in a disjoint set union (equivalence relation)
-    DSU = DisjointSetUnion([to_condensed_em_notation(k) for k in diagrams])
+    # put the diagram encodings in a disjoint set union (equivalence relation)
+    DSU = DisjointSetUnion([to_bytes(k) for k in diagrams])
 
     # Store each diagram as a leveled set (levels are Reidemeister depths); keys are original diagrams and
     # values are the leveled sets. If flips are allowed, include flips at the beginning.
@@ -330,9 +328,9 @@ def reduce_equivalent_diagrams(diagrams: set | list, depth: int = 1, flype: bool
     if "FLIP" in settings.allowed_moves:
         leveled_sets = {
             k_str: LeveledSet(
-                items=crossing_non_increasing_space({canonical(from_condensed_em_notation(k_str)), canonical(flip(from_condensed_em_notation(k_str)))}, greediness=0, assume_canonical=True),
-                to_string=to_condensed_em_notation,
-                from_string=from_condensed_em_notation,
+                items=crossing_non_increasing_space({canonical(from_bytes(k_str)), canonical(flip(from_bytes(k_str)))}, greediness=0, assume_canonical=True),
+                to_string=to_bytes,
+                from_string=from_bytes,
             )
             for k_str in DSU.elements
         }
@@ -340,9 +338,9 @@ def reduce_equivalent_diagrams(diagrams: set | list, depth: int = 1, flype: bool
         # TODO: can we assume canonical? (check crossing_non_increasing_space)
         leveled_sets = {
             k_str: LeveledSet(
-                items=crossing_non_increasing_space(canonical(from_condensed_em_notation(k_str)), greediness=0, assume_canonical=True),
-                to_string=to_condensed_em_notation,
-                from_string=from_condensed_em_notation,
+                items=crossing_non_increasing_space(canonical(from_bytes(k_str)), greediness=0, assume_canonical=True),
+                to_string=to_bytes,
+                from_string=from_bytes,
             )
             for k_str in DSU.elements
         }
@@ -456,8 +454,8 @@ def reduce_equivalent_diagrams(diagrams: set | list, depth: int = 1, flype: bool
 
 
     # reconstruct the return dictionary
-    keys = [from_condensed_em_notation(_) for _ in DSU_dict.keys()]
-    values = [{from_condensed_em_notation(_) for _ in value} for value in DSU_dict.values()]
+    keys = [from_bytes(_) for _ in DSU_dict.keys()]
+    values = [{from_bytes(_) for _ in value} for value in DSU_dict.values()]
 
     result = {k if not v else min(k, min(v)): v for k, v in zip(keys, values)}
 
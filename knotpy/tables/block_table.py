@@ -0,0 +1,331 @@
+# knotpy/tables/block_table.py
+"""
+Block-compressed tables with on-disk indexes, for tables too large to be loaded into memory (e.g. the knots with
+13-16 crossings, which have from about ten thousand to over a million rows).
+
+The rows of a block table are split into blocks of a fixed number of rows, each block is compressed separately
+(zlib). Two sorted arrays of fixed-size records map the (64-bit) hashes of the row names and of the row keys (e.g.
+the key of the table diagram, see :func:`knotpy.tables.table_index.diagram_key`) to the positions of the rows. The
+file is memory-mapped, so that
+
+- accessing a row by its name or key is a binary search in the mapped index and the decompression of one block,
+- iterating over the table decompresses one block at a time (the table is never materialized).
+
+Block tables are not shipped with the package, they are installed as optional *data packs*. The tables are searched
+for in the directory ``settings.data_pack_dir``, in the directories of the packages registered under the entry point
+group ``knotpy.data_packs`` and in the data directory of the package (see :func:`find_data_file`). A block table is
+built from a CSV table by :func:`compile_block_table`, e.g.
+``python -m knotpy.tables.block_table knots_15.csv.gz knots_15.kpb``.
+
+File format (integers are little-endian)::
+
+    magic (4 bytes) | format version (uint32) | offset of the footer (uint64) | blocks | name index | key index |
+    footer (JSON: columns, number of rows, rows per block, (offset, length) of blocks and indexes)
+
+A record of an index is the triple ``(hash, block, row in the block)`` packed as ``<QII``.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BlockTable", "write_block_table", "compile_block_table", "find_data_file"]
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+import csv
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from knotpy._settings import settings
+
+_MAGIC = b"KPBK"
+_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<4sIQ")
+_RECORD = struct.Struct("<QII")
+_DEFAULT_BLOCK_SIZE = 512  # rows per block
+_CACHED_BLOCKS = 4
+
+_DATA_DIR = Path(__file__).parent / "data"
+_ENTRY_POINT_GROUP = "knotpy.data_packs"
+
+
+def _hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+class _Hashes:
+    """Sequence view of the hashes of a memory-mapped index (for the binary search)."""
+
+    def __init__(self, buffer, offset: int, count: int):
+        self.buffer, self.offset, self.count = buffer, offset, count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> int:
+        return _RECORD.unpack_from(self.buffer, self.offset + i * _RECORD.size)[0]
+
+    def records(self, h: int) -> Iterator[tuple[int, int]]:
+        """Yield the positions (block, row) of the records with the hash ``h``."""
+        i = bisect_left(self, h)
+        while i < self.count:
+            h_, block, row = _RECORD.unpack_from(self.buffer, self.offset + i * _RECORD.size)
+            if h_ != h:
+                break
+            yield block, row
+            i += 1
+
+
+class BlockTable:
+    """A memory-mapped block-compressed table (read-only).
+
+    Rows are dictionaries ``{column: value}`` of strings, as in the CSV tables (see
+    :func:`knotpy.tables.invariant_reader.load_invariant_table` with ``evaluate=False``).
+
+    Args:
+        filename: Path of the block table.
+
+    Raises:
+        ValueError: If the file is not a block table of a supported format.
+    """
+
+    def __init__(self, filename: str | Path):
+        self.filename = Path(filename)
+        with open(self.filename, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, footer_offset = _PREAMBLE.unpack_from(self._buffer, 0)
+            if magic != _MAGIC or version != _FORMAT_VERSION:
+                raise ValueError(f"{self.filename} is not a block table (version {_FORMAT_VERSION})")
+            footer = json.loads(self._buffer[footer_offset:].decode())
+        except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+            self._buffer.close()
+            raise ValueError(f"{self.filename} is not a block table") from e
+        self.columns: list[str] = footer["columns"]
+        self.block_size: int = footer["block_size"]
+        self._length: int = footer["rows"]
+        self._blocks: list[list[int]] = footer["blocks"]
+        self._names = _Hashes(self._buffer, *footer["names"])
+        self._keys = _Hashes(self._buffer, *footer["keys"])
+        self._cache: OrderedDict[int, list[list[str]]] = OrderedDict()
+        self.blocks_read = 0  # number of decompressed blocks
+
+    def _block(self, index: int) -> list[list[str]]:
+        """Return the rows (lists of the name and the values) of a block."""
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        offset, length = self._blocks[index]
+        lines = zlib.decompress(self._buffer[offset:offset + length]).decode().split("\n")
+        rows = [line.split("\t") for line in lines]
+        self.blocks_read += 1
+        self._cache[index] = rows
+        if len(self._cache) > _CACHED_BLOCKS:
+            self._cache.popitem(last=False)
+        return rows
+
+    def _row(self, block: int, row: int) -> list[str]:
+        return self._block(block)[row]
+
+    def _find(self, name: str) -> list[str] | None:
+        for block, row in self._names.records(_hash(name)):
+            if (values := self._row(block, row))[0] == name:
+                return values
+        return None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def __getitem__(self, name: str) -> dict[str, str]:
+        if (values := self._find(name)) is None:
+            raise KeyError(name)
+        return dict(zip(self.columns, values[1:]))
+
+    def get(self, name: str, default=None) -> dict[str, str] | None:
+        values = self._find(name)
+        return default if values is None else dict(zip(self.columns, values[1:]))
+
+    def names_by_key(self, key: str) -> list[str]:
+        """Return the names of the rows with the given key (only the blocks of these rows are decompressed).
+
+        The rows are found by the 64-bit hash of the key, so (with a negligible probability) a row with a different
+        key can be returned.
+        """
+        rows = [self._row(block, row) for block, row in self._keys.records(_hash(key))]
+        return [values[0] for values in rows]
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self.items())
+
+    def items(self) -> Iterator[tuple[str, dict[str, str]]]:
+        """Yield the pairs (name, row) in the order of the table, decompressing one block at a time."""
+        for index in range(len(self._blocks)):
+            offset, length = self._blocks[index]
+            for line in zlib.decompress(self._buffer[offset:offset + length]).decode().split("\n"):
+                values = line.split("\t")
+                yield values[0], dict(zip(self.columns, values[1:]))
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def write_block_table(filename: str | Path, columns: list[str], rows: Iterable[tuple[str, dict[str, str]]],
+                      key_function: Callable[[dict[str, str]], str | None] | None = None,
+                      block_size: int = _DEFAULT_BLOCK_SIZE) -> Path:
+    """Write a block table from an iterable of rows.
+
+    The rows are streamed and only the text of the current block is kept in memory, together with the index records of
+    all rows (a tuple of three integers per name and per key), which are sorted and written after the blocks.
+
+    Args:
+        filename: Path of the block table (written atomically).
+        columns: Names of the columns (without the name column).
+        rows: Pairs (name, row), where a row is a dictionary ``{column: value}`` of strings.
+        key_function: Function returning the key of a row (``None`` for rows without a key), e.g. the key of the
+            table diagram. If ``None``, the key index is empty.
+        block_size: Number of rows per block.
+
+    Returns:
+        Path: The path of the block table.
+
+    Raises:
+        ValueError: If a value contains a tab or a newline.
+    """
+    filename = Path(filename)
+    temporary = filename.with_name(f"{filename.name}.{os.getpid()}.tmp")
+    names, keys, blocks, block = [], [], [], []
+    number_of_rows = 0
+
+    try:
+        with open(temporary, "wb") as f:
+            f.write(_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, 0))
+
+            def flush():
+                data = zlib.compress("\n".join(block).encode(), 9)
+                blocks.append([f.tell(), len(data)])
+                f.write(data)
+                block.clear()
+
+            for name, row in rows:
+                values = [name] + [row.get(column, "") for column in columns]
+                if any("\t" in value or "\n" in value for value in values):
+                    raise ValueError(f"Values of the row {name} contain tabs or newlines")
+                position = (len(blocks), len(block))
+                names.append((_hash(name),) + position)
+                if key_function is not None and (key := key_function(row)) is not None:
+                    keys.append((_hash(key),) + position)
+                block.append("\t".join(values))
+                number_of_rows += 1
+                if len(block) == block_size:
+                    flush()
+            if block:
+                flush()
+
+            indexes = []
+            for records in (names, keys):
+                indexes.append([f.tell(), len(records)])
+                f.write(b"".join(_RECORD.pack(*record) for record in sorted(records)))
+
+            footer_offset = f.tell()
+            f.write(json.dumps({"columns": columns, "rows": number_of_rows, "block_size": block_size, "blocks": blocks,
+                                "names": indexes[0], "keys": indexes[1]}).encode())
+            f.seek(0)
+            f.write(_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, footer_offset))
+        temporary.replace(filename)
+    except BaseException:
+        temporary.unlink(missing_ok=True)  # e.g. a value with a tab or an interrupted write
+        raise
+    return filename
+
+
+def _diagram_key_of_row(row: dict[str, str]) -> str | None:
+    """Return the key of the diagram of a table row (the native notation without attributes)."""
+    notation = row.get("native notation")
+    return None if not notation else notation.split(" [", 1)[0]
+
+
+def compile_block_table(source: str | Path, filename: str | Path | None = None,
+                        block_size: int = _DEFAULT_BLOCK_SIZE) -> Path:
+    """Compile a CSV table (optionally gzipped) with the columns ``name``, ``native notation``, ... into a block
+    table. The keys of the rows are the keys of the table diagrams.
+
+    Args:
+        source: Path of the CSV table.
+        filename: Path of the block table, by default the path of the source with the extension ``.kpb``.
+        block_size: Number of rows per block.
+
+    Returns:
+        Path: The path of the block table.
+    """
+    source = Path(source)
+    if filename is None:
+        filename = source.with_name(source.name.removesuffix(".gz").removesuffix(".csv") + ".kpb")
+    opener = gzip.open if source.suffix == ".gz" else open
+    csv.field_size_limit(sys.maxsize)
+    with opener(source, "rt", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        columns = header[1:]
+        rows = ((values[0], dict(zip(columns, values[1:]))) for values in reader if values)
+        return write_block_table(filename, columns, rows, key_function=_diagram_key_of_row, block_size=block_size)
+
+
+@lru_cache(maxsize=None)
+def _entry_point_directories() -> tuple[Path, ...]:
+    """Return the directories of the data packs registered under the entry point group ``knotpy.data_packs`` (an entry
+    point refers to a package containing the tables or to a path)."""
+    from importlib.metadata import entry_points
+
+    directories = []
+    for entry_point in entry_points(group=_ENTRY_POINT_GROUP):
+        try:
+            pack = entry_point.load()
+        except (ImportError, AttributeError):
+            continue  # a broken data pack does not break the tables
+        if isinstance(pack, (str, os.PathLike)):
+            directories.append(Path(pack))
+        elif getattr(pack, "__file__", None):
+            directories.append(Path(pack.__file__).parent)
+    return tuple(directories)
+
+
+def data_pack_directories() -> list[Path]:
+    """Return the directories searched for table files: ``settings.data_pack_dir``, the directories of the installed
+    data packs and the data directory of the package."""
+    directories = [] if settings.data_pack_dir is None else [Path(settings.data_pack_dir)]
+    return directories + list(_entry_point_directories()) + [_DATA_DIR]
+
+
+def find_data_file(filename: str) -> Path | None:
+    """Return the path of a table file in the data pack directories (``None`` if it is not installed).
+
+    Args:
+        filename: Name of the file, e.g. ``"knots_15.kpb"``.
+    """
+    for directory in data_pack_directories():
+        if (path := directory / filename).is_file():
+            return path
+    return None
+
+
+if __name__ == "__main__":
+    compile_block_table(*sys.argv[1:3])
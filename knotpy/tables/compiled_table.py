@@ -0,0 +1,336 @@
+# knotpy/tables/compiled_table.py
+"""
+Binary (compiled) versions of the knot and link tables.
+
+Reading a CSV table requires decompressing it, and every accessed row has to be parsed: diagrams by the regular
+expressions of the native notation and polynomials by SymPy's ``sympify``, which takes minutes for the larger tables.
+Since this is repeated in every process (e.g. in every worker of a pool), the tables are compiled into a binary format:
+
+- diagrams are stored as packed integer arrays (nodes, node types, endpoints and orientations),
+- polynomials are stored as integer arrays of exponents and coefficients,
+- other values (e.g. symmetry types) and the row names are stored in a small JSON header.
+
+A compiled table is memory-mapped, so all processes share the same pages and accessing a row only slices the
+mapped array (the values are unpacked to diagrams and SymPy expressions when they are evaluated).
+
+A table is compiled on first use and stored next to the CSV table (with the extension ``.bin``). It is recompiled if
+the size or the modification time of the CSV table or the format changes. To compile all tables in advance, run
+``python -m knotpy.tables.compiled_table``.
+
+Tables computed from other tables (e.g. the canonical oriented and mirrored variants of the table knots) are compiled
+in the same format by :func:`load_derived_table`.
+"""
+
+from __future__ import annotations
+
+__all__ = []
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple
+
+import sympy as sp
+
+from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
+from knotpy.classes.node import Crossing, Vertex
+from knotpy.classes.endpoint import Endpoint, IngoingEndpoint, OutgoingEndpoint
+from knotpy.classes.freezing import lock
+from knotpy.notation.native import from_knotpy_notation_batch
+from knotpy.tables.invariant_reader import load_invariant_table, _eval_diagram, _eval_poly
+from knotpy.tables.table_index import polynomial_terms, source_stamp
+from knotpy.invariants._symbols import SYMBOL_LOCALS
+
+_MAGIC = b"KPTB"
+_FORMAT_VERSION = 1
+_INT_MIN, _INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+_NODE_TYPES = (Crossing, Vertex)
+_ENDPOINT_TYPES = (Endpoint, IngoingEndpoint, OutgoingEndpoint)
+
+
+class PackedDiagram(NamedTuple):
+    """A diagram of a compiled table: the packed integer array and the diagram attributes."""
+    data: memoryview
+    attr: dict
+
+
+class PackedPolynomial(NamedTuple):
+    """A polynomial of a compiled table: the packed integer array and the names of the variables."""
+    data: memoryview
+    variables: tuple
+
+
+def _pack_diagram(k: PlanarDiagram) -> list[int] | None:
+    """Pack a diagram into the list ``[oriented, number of nodes, node, type, degree, endpoints..., ...]``, where each
+    endpoint is given by the triple ``(node, position, type)`` and nodes are given by their character codes.
+
+    Returns ``None`` if the diagram cannot be packed (nodes that are not characters, node or endpoint attributes).
+    """
+    if not all(isinstance(node, str) and len(node) == 1 for node in k.nodes):
+        return None
+    if any(k.nodes[node].attr for node in k.nodes) or any(ep.attr for ep in k.endpoints):
+        return None
+    data = [int(k.is_oriented()), len(k.nodes)]
+    for node in sorted(k.nodes):
+        data += [ord(node), _NODE_TYPES.index(type(k.nodes[node])), len(k.nodes[node])]
+        for ep in k.nodes[node]:
+            data += [ord(ep.node), ep.position, _ENDPOINT_TYPES.index(type(ep))]
+    return data
+
+
+def unpack_diagram(packed: PackedDiagram) -> PlanarDiagram | OrientedPlanarDiagram:
+    """Return the (unlocked) diagram of a compiled table."""
+    data = packed.data
+    k = OrientedPlanarDiagram() if data[0] else PlanarDiagram()
+    i = 2
+    for _ in range(data[1]):
+        node, degree = chr(data[i]), data[i + 2]
+        k.add_node(node, create_using=_NODE_TYPES[data[i + 1]], degree=degree)
+        i += 3
+        for position in range(degree):
+            k.set_endpoint((node, position), (chr(data[i]), data[i + 1]), create_using=_ENDPOINT_TYPES[data[i + 2]])
+            i += 3
+    k.attr.update(packed.attr)
+    return k
+
+
+def _pack_polynomial(terms: tuple, variables: list[str]) -> list[int] | None:
+    """Pack the terms of a polynomial into the list ``[number of terms, exponents..., coefficient, ...]``.
+
+    Returns ``None`` if the polynomial cannot be packed (non-integer or too large coefficients).
+    """
+    data = [len(terms)]
+    for monomial, coefficient in terms:
+        if not isinstance(coefficient, int) or not _INT_MIN <= coefficient <= _INT_MAX:
+            return None
+        exponents = dict(monomial)
+        data += [exponents.get(variable, 0) for variable in variables] + [coefficient]
+    return data
+
+
+def packed_terms(packed: PackedPolynomial | str) -> tuple:
+    """Return the terms of a polynomial of a compiled table (see :func:`knotpy.tables.table_index.polynomial_terms`)."""
+    if not isinstance(packed, PackedPolynomial):
+        return polynomial_terms(packed)
+    data, variables = packed.data, packed.variables
+    step = len(variables) + 1
+    return tuple(sorted(
+        (tuple((variable, e) for variable, e in zip(variables, data[i: i + step - 1]) if e), data[i + step - 1])
+        for i in range(1, 1 + data[0] * step, step)))
+
+
+def unpack_polynomial(packed: PackedPolynomial) -> sp.Expr:
+    """Return the SymPy expression of a polynomial of a compiled table."""
+    data, variables = packed.data, packed.variables
+    symbols = [SYMBOL_LOCALS.get(variable) or sp.Symbol(variable) for variable in packed.variables]
+    step = len(variables) + 1
+    return sp.Add(*(
+        sp.Mul(sp.Integer(data[i + step - 1]), *(s ** e for s, e in zip(symbols, data[i: i + step - 1]) if e))
+        for i in range(1, 1 + data[0] * step, step)))
+
+
+def _is_polynomial_value(value: str) -> bool:
+    value = value.strip()
+    return not (value.lower() == "none" or value.lstrip("-").isdigit() or "_" in value
+                or (value.replace(" ", "").isalpha() and len(value) > 1))
+
+
+def _compile_table(source: Path, stamp: list) -> bytes:
+    """Compile a CSV table into the binary format."""
+    return _compile_rows(load_invariant_table(source, evaluate=False), stamp)
+
+
+def _compile_rows(rows: dict[str, dict], stamp: list) -> bytes:
+    """Compile rows ``{name: {field: value}}`` into the binary format. Values are strings, as in the CSV tables, or
+    diagrams (in the fields of notations)."""
+    names = list(rows)
+    fields = list(next(iter(rows.values()))) if rows else []
+    data = array("i")
+    columns = {}
+    attributes = {}
+    for field in fields:
+        values = [rows[name][field] for name in names]
+        packed = None
+        if "notation" in field:
+            parsed = iter(from_knotpy_notation_batch([value for value in values if not isinstance(value, PlanarDiagram)]))
+            diagrams = [value if isinstance(value, PlanarDiagram) else next(parsed) for value in values]
+            packed = [_pack_diagram(k) for k in diagrams]
+            column = {"type": "diagram"}
+            for i, k in enumerate(diagrams):
+                if k.attr != {"name": names[i]}:
+                    attributes[str(i)] = k.attr
+        elif values and all(_is_polynomial_value(value) for value in values):
+            try:
+                terms = [polynomial_terms(value) for value in values]
+            except (ValueError, SyntaxError):
+                terms = None
+            if terms is not None:
+                variables = sorted({variable for t in terms for monomial, _ in t for variable, _ in monomial})
+                packed = [_pack_polynomial(t, variables) for t in terms]
+                column = {"type": "polynomial", "variables": variables}
+
+        if packed is None or any(p is None for p in packed):
+            columns[field] = {"type": "value", "values": values}  # keep the strings
+            continue
+        column["offsets"] = len(data)
+        data.extend([0] * (len(names) + 1))
+        for i, p in enumerate(packed):
+            data[column["offsets"] + i] = len(data)
+            data.extend(p)
+        data[column["offsets"] + len(names)] = len(data)
+        columns[field] = column
+
+    header = json.dumps({"stamp": stamp, "names": names, "columns": columns, "attributes": attributes},
+                        separators=(",", ":")).encode()
+    header += b" " * (-(len(_MAGIC) + 4 + len(header)) % 4)  # align the data
+    return _MAGIC + struct.pack("<I", len(header)) + header + data.tobytes()
+
+
+def _read_compiled_table(buffer, stamp: list) -> dict | None:
+    """Return the rows of a compiled table as dictionaries ``{field: packed value}`` or ``None`` if outdated."""
+    if bytes(buffer[:len(_MAGIC)]) != _MAGIC:
+        return None
+    header_length, = struct.unpack_from("<I", buffer, len(_MAGIC))
+    start = len(_MAGIC) + 4
+    header = json.loads(bytes(buffer[start: start + header_length]))
+    if header["stamp"] != stamp:
+        return None
+    data = memoryview(buffer)[start + header_length:].cast("i")
+
+    names = header["names"]
+    rows = {name: {} for name in names}
+    for field, column in header["columns"].items():
+        if column["type"] == "value":
+            for name, value in zip(names, column["values"]):
+                rows[name][field] = value
+            continue
+        offsets = column["offsets"]
+        variables = tuple(column.get("variables", ()))
+        for i, name in enumerate(names):
+            row_data = data[data[offsets + i]: data[offsets + i + 1]]
+            if column["type"] == "diagram":
+                rows[name][field] = PackedDiagram(row_data, header["attributes"].get(str(i), {"name": name}))
+            else:
+                rows[name][field] = PackedPolynomial(row_data, variables)
+    return rows
+
+
+def compiled_filename(source: str | Path) -> Path:
+    """Return the filename of the compiled table of a CSV table (e.g. ``knots_3.bin`` for ``knots_3.csv.gz``)."""
+    source = Path(source)
+    return source.with_name(source.name.split(".")[0] + ".bin")
+
+
+def load_compiled_table(filename: str | Path, only_field_name: str | None = None) -> dict[str, Any]:
+    """Load a table from its compiled (memory-mapped) version, compiling the CSV table if necessary.
+
+    Diagrams and polynomials are returned packed (evaluate them by :func:`_eval_packed_diagram` and
+    :func:`_eval_packed_poly`), other values are returned as strings.
+
+    Args:
+        filename: Path to the CSV table (the compiled table is stored next to it).
+        only_field_name: If provided, return a dict mapping names to the value from this single column.
+
+    Returns:
+        dict: Mapping names to rows (dictionaries ``{field: value}``) or to single values.
+
+    Raises:
+        ValueError: If ``only_field_name`` is not a column of the table.
+    """
+    source = Path(filename)
+    stamp = [_FORMAT_VERSION, sys.byteorder, *source_stamp(source)]
+    rows = _load_or_compile(compiled_filename(source), stamp, lambda: _compile_table(source, stamp))
+    return _select_field(rows, only_field_name)
+
+
+def load_derived_table(filename: str | Path, sources: Iterable[str | Path], build_function: Callable[[], dict],
+                       version: int = 1, only_field_name: str | None = None) -> dict[str, Any]:
+    """Load a compiled table that is computed from other tables (e.g. precomputed variants of the table diagrams),
+    building and compiling it if the file is missing or outdated.
+
+    Args:
+        filename: Path of the compiled table.
+        sources: Table files the table is computed from (a change of their sizes or modification times triggers a
+            rebuild).
+        build_function: Function returning the rows ``{name: {field: value}}`` (see :func:`_compile_rows`).
+        version: Version of the table (increase it when the build function changes).
+        only_field_name: If provided, return a dict mapping names to the value from this single column.
+
+    Returns:
+        dict: Mapping names to rows (dictionaries ``{field: packed value}``) or to single values.
+    """
+    stamp = [_FORMAT_VERSION, sys.byteorder, version, [list(source_stamp(s)) for s in sources]]
+    rows = _load_or_compile(Path(filename), stamp, lambda: _compile_rows(build_function(), stamp))
+    return _select_field(rows, only_field_name)
+
+
+def _load_or_compile(target: Path, stamp: list, compile_function: Callable[[], bytes]) -> dict:
+    """Return the rows of the memory-mapped compiled table, compiling (and storing) it if it is missing or outdated."""
+    rows = None
+    try:
+        with open(target, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # the mapping stays valid after closing
+        rows = _read_compiled_table(buffer, stamp)
+    except (OSError, ValueError, struct.error):
+        pass
+
+    if rows is None:
+        compiled = compile_function()
+        try:
+            temporary = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            temporary.write_bytes(compiled)
+            temporary.replace(target)  # atomic, concurrent processes do not read partial files
+        except OSError:
+            pass  # read-only installation, use the table from memory
+        rows = _read_compiled_table(compiled, stamp)
+    return rows
+
+
+def _select_field(rows: dict, only_field_name: str | None) -> dict:
+    if only_field_name is None:
+        return rows
+    if rows and only_field_name not in next(iter(rows.values())):
+        raise ValueError(f"Cannot find column '{only_field_name}'")
+    return {name: row[only_field_name] for name, row in rows.items()}
+
+
+def _eval_packed_diagram(value: PackedDiagram | str) -> PlanarDiagram | OrientedPlanarDiagram:
+    """Evaluate a diagram of a compiled table (a packed diagram or a native notation string)."""
+    return lock(unpack_diagram(value)) if isinstance(value, PackedDiagram) else _eval_diagram(value)
+
+
+def _eval_packed_diagram_symmetry_dict(row: dict) -> dict:
+    """Evaluate a row of a compiled table containing a diagram and a symmetry descriptor."""
+    return {"diagram": _eval_packed_diagram(row["native notation"]), "symmetry": row["symmetry"]}
+
+
+def _eval_packed_poly(value: PackedPolynomial | str) -> sp.Expr:
+    """Evaluate a polynomial of a compiled table (a packed polynomial or a SymPy string)."""
+    return unpack_polynomial(value) if isinstance(value, PackedPolynomial) else _eval_poly(value)
+
+
+def compile_tables(directory: str | Path | None = None) -> list[Path]:
+    """Compile the knot and link tables of a directory (by default the data directory of KnotPy).
+
+    Returns:
+        list[Path]: The compiled tables.
+    """
+    directory = Path(directory) if directory is not None else Path(__file__).parent / "data"
+    compiled = []
+    for source in sorted(directory.glob("*.csv.gz")):
+        if source.name.startswith(("knots", "links")):
+            load_compiled_table(source)
+            compiled.append(compiled_filename(source))
+    return compiled
+
+
+if __name__ == "__main__":
+    for path in compile_tables():
+        print(path)
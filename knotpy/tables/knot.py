@@ -11,32 +11,50 @@ __all__ = ["knot", "knots", "identify", "knots_generator", "symmetry_type"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek"
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from math import comb
 from pathlib import Path
 from functools import partial
+from time import perf_counter
 
 from knotpy import from_knotpy_notation
 from knotpy.classes.planardiagram import Diagram, PlanarDiagram, OrientedPlanarDiagram
 from knotpy.utils.dict_utils import LazyDict
-from knotpy.tables.invariant_reader import load_invariant_table
-from knotpy.classes.freezing import unfreeze
+from knotpy.tables.compiled_table import load_compiled_table, load_derived_table, unpack_diagram, packed_terms
+from knotpy.classes.freezing import unfreeze, lock
 from knotpy.algorithms.canonical import canonical
 from knotpy.algorithms.symmetry import mirror as mirror_diagram
-from knotpy.tables.invariant_reader import _eval_diagram_symmetry_dict, _eval_poly
+from knotpy.tables.compiled_table import _eval_packed_diagram_symmetry_dict, _eval_packed_poly, _eval_packed_diagram
+from knotpy.tables.block_table import BlockTable, find_data_file
 from knotpy.algorithms.orientation import orient, reverse, unorient
 from knotpy.tables.link import link
-from knotpy.tables.theta import theta
+from knotpy.tables.theta import theta, _graph_type, _identify_theta_curve
 from knotpy.tables.name import _named, safe_clean_and_parse_name
 from knotpy._settings import settings
 from knotpy.algorithms.topology import is_knot, is_link
 from knotpy.reidemeister.simplify import simplify_decreasing
 from knotpy.invariants.homflypt import homflypt, _homflypt_xyz_mirror
+from knotpy.invariants.goeritz import determinant
+from knotpy.invariants.alexander import alexander
+from knotpy.invariants.jones import jones
+from knotpy.invariants.kauffman import kauffman
+from knotpy.tables.table_index import load_table_index, diagram_key, polynomial_key, polynomial_terms, substitute_terms, cascade_candidates
 
 # Data store configuration
 _DATA_DIR = Path(__file__).parent / "data"
 _KNOT_TABLE_CROSSINGS = [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
 
+# Knots with 13-16 crossings are stored in block tables "knots_{n}.kpb" of optional data packs (see
+# knotpy.tables.block_table), which are opened on first use and never loaded into memory
+_EXTENDED_KNOT_TABLE_CROSSINGS = [13, 14, 15, 16]
+_MAX_KNOT_CROSSINGS = max(_EXTENDED_KNOT_TABLE_CROSSINGS)
+_extended_knot_table: dict[int, BlockTable] = {}
+_missing_extended_knot_tables: set[tuple[int, str | None]] = set()  # (crossings, settings.data_pack_dir)
+
 # Lazy dictionaries: indexed by crossing count
 _knot_table: list[dict] = [{} for _ in range(max(_KNOT_TABLE_CROSSINGS) + 1)]
+_knot_variants_table: dict[int, LazyDict] = {}  # precomputed canonical mirrors and oriented knots
 _knot_precomputed_homflypt: list[dict] = [{} for _ in range(max(_KNOT_TABLE_CROSSINGS) + 1)]
 _knot_precomputed_kauffman: list[dict] = [{} for _ in range(max(_KNOT_TABLE_CROSSINGS) + 1)]
 
@@ -50,37 +68,201 @@ def _load_knot_table() -> None:
 
     for n in _KNOT_TABLE_CROSSINGS:
         _knot_table[n] = LazyDict(
-            load_function=partial(
-                load_invariant_table,
-                filename=_DATA_DIR / f"knots_{n}.csv.gz",
-                evaluate=False,
-            ),
-            eval_function=_eval_diagram_symmetry_dict,
+            load_function=partial(load_compiled_table, filename=_DATA_DIR / f"knots_{n}.csv.gz"),
+            eval_function=_eval_packed_diagram_symmetry_dict,
         )
 
         _knot_precomputed_homflypt[n] = LazyDict(
             load_function=partial(
-                load_invariant_table,
+                load_compiled_table,
                 filename=_DATA_DIR / f"knots_homflypt_{n}.csv.gz",
-                evaluate=False,
                 only_field_name="homflypt"
             ),
-            eval_function=_eval_poly,
+            eval_function=_eval_packed_poly,
         )
 
         _knot_precomputed_kauffman[n] = LazyDict(
             load_function=partial(
-                load_invariant_table,
+                load_compiled_table,
                 filename=_DATA_DIR / f"knots_kauffman_{n}.csv.gz",
-                evaluate=False,
                 only_field_name="kauffman"
             ),
-            eval_function=_eval_poly,
+            eval_function=_eval_packed_poly,
         )
 
     _loaded_knot_table = True
 
 
+def _extended_knot_block_table(n: int) -> BlockTable:
+    """Return the block table of knots with n crossings (13-16) from an installed data pack.
+
+    Raises:
+        ValueError: If the data pack with the table is not installed.
+    """
+    if n not in _extended_knot_table:
+        # a missing table is not searched for again (e.g. on every identification), unless the data pack directory
+        # changes
+        missing = (n, settings.data_pack_dir)
+        if missing in _missing_extended_knot_tables or (filename := find_data_file(f"knots_{n}.kpb")) is None:
+            _missing_extended_knot_tables.add(missing)
+            raise ValueError(f"The table of knots with {n} crossings (knots_{n}.kpb) is not installed, install the data "
+                             f"pack or set settings.data_pack_dir")
+        _extended_knot_table[n] = BlockTable(filename)
+    return _extended_knot_table[n]
+
+
+def _eval_block_row(row: dict) -> dict:
+    """Evaluate a row of a block table of knots (the symmetry is ``None`` if the table has no symmetry types)."""
+    return {"diagram": _eval_packed_diagram(row["native notation"]), "symmetry": row.get("symmetry") or None}
+
+
+def _knot_row(n: int, base_name: str) -> dict | None:
+    """Return the dictionary with the diagram and the symmetry type of a table knot (``None`` if it does not exist)."""
+    if n in _EXTENDED_KNOT_TABLE_CROSSINGS:
+        row = _extended_knot_block_table(n).get(base_name)
+        return None if row is None else _eval_block_row(row)
+    if n not in _KNOT_TABLE_CROSSINGS or base_name not in _knot_table[n]:
+        return None
+    return _knot_table[n][base_name]
+
+
+def _knot_rows(n: int):
+    """Yield the dictionaries with the diagrams and the symmetry types of the table knots with n crossings (the blocks
+    of the extended tables are decompressed one at a time)."""
+    if n in _EXTENDED_KNOT_TABLE_CROSSINGS:
+        for _, row in _extended_knot_block_table(n).items():
+            yield _eval_block_row(row)
+    elif n in _KNOT_TABLE_CROSSINGS:
+        yield from _knot_table[n].values()
+
+
+def _extended_knot_name(k: PlanarDiagram) -> str | None:
+    """Return the name of a canonical diagram in the extended knot tables (``None`` if the table is not installed or the
+    diagram is not in the table)."""
+    n = k.number_of_crossings
+    if n not in _EXTENDED_KNOT_TABLE_CROSSINGS:
+        return None
+    try:
+        table = _extended_knot_block_table(n)
+    except ValueError:
+        return None
+    key = diagram_key(k)
+    for name in table.names_by_key(key):
+        if table[name]["native notation"].split(" [", 1)[0] == key:
+            return name
+    return None
+
+
+# The mirror image of K has the HOMFLY-PT polynomial P(K)(y, x, z), the Kauffman polynomial F(K)(1/a, z) and the
+# Jones polynomial V(K)(1/t)
+_HOMFLYPT_MIRROR = {"rename": {"x": "y", "y": "x"}}
+_KAUFFMAN_MIRROR = {"invert": ("a",)}
+_JONES_MIRROR = {"invert": ("t",)}
+
+
+def _homflypt_specialization(terms: tuple, x: tuple[int, int], y: tuple[int, int], z_sign: int) -> tuple:
+    """Return the terms of the HOMFLY-PT polynomial (in variables ``x, y, z``) of a knot after the substitution
+    ``x = sx * t**ex``, ``y = sy * t**ey`` and ``z = z_sign * (t**(1/2) - t**(-1/2))``, where ``x = (sx, ex)`` and
+    ``y = (sy, ey)``.
+    """
+    doubled = {}  # 2 * exponent of t -> coefficient
+    for monomial, coefficient in terms:
+        exponents = dict(monomial)
+        a, b, n = exponents.get("x", 0), exponents.get("y", 0), exponents.get("z", 0)
+        if n < 0:
+            raise ValueError("The HOMFLY-PT polynomial of a knot is a polynomial in z")
+        coefficient *= x[0] ** (a % 2) * y[0] ** (b % 2) * z_sign ** (n % 2)
+        for i in range(n + 1):  # (t^(1/2) - t^(-1/2))^n
+            e = 2 * (x[1] * a + y[1] * b) + n - 2 * i
+            doubled[e] = doubled.get(e, 0) + coefficient * comb(n, i) * (-1) ** i
+    if any(e % 2 for e, c in doubled.items() if c):
+        raise ValueError("The specialization of the HOMFLY-PT polynomial of a knot is a Laurent polynomial in t")
+    return tuple(sorted(((("t", e // 2),) if e else (), c) for e, c in doubled.items() if c))
+
+
+def _jones_terms(homflypt_terms: tuple) -> tuple:
+    """Return the terms of the Jones polynomial from the terms of the HOMFLY-PT polynomial of a knot."""
+    return _homflypt_specialization(homflypt_terms, x=(1, -1), y=(-1, 1), z_sign=1)
+
+
+def _alexander_terms(terms: tuple) -> tuple:
+    """Return the terms of the Alexander polynomial normalized up to multiplication by units ``±t**n`` (the lowest
+    term is a positive constant)."""
+    if not terms:
+        return terms
+    shift = min(dict(monomial).get("t", 0) for monomial, _ in terms)
+    sign = 1 if min(terms, key=lambda term: dict(term[0]).get("t", 0))[1] > 0 else -1
+    return tuple(sorted(
+        ((("t", dict(monomial).get("t", 0) - shift),) if dict(monomial).get("t", 0) != shift else (), sign * c)
+        for monomial, c in terms))
+
+
+def _build_knot_index() -> dict:
+    """Return the index of the knot table.
+
+    The index is a dictionary with the dictionaries:
+        - ``"diagram"``: key of a (canonical) table diagram -> knot name,
+        - ``"crossings"``: name of a knot or mirror -> number of crossings (the knots in the order of the tables are
+          followed by the mirrors),
+        - ``"determinant"``, ``"alexander"``, ``"jones"``, ``"homflypt"``, ``"kauffman"``: key of the invariant ->
+          list of names of knots and mirrors (marked by "*"), the knots are listed before the mirrors,
+        - ``"keys"``: name of a knot or mirror -> dictionary of the keys of its invariants.
+    The keys of polynomials are the keys of :func:`polynomial_key`, the Alexander polynomial is normalized by
+    :func:`_alexander_terms`.
+    """
+    index = {"diagram": {}, "crossings": {}, "keys": {}} | {invariant: {} for invariant in _CASCADE_INVARIANTS}
+    mirrors = []
+    for n in _KNOT_TABLE_CROSSINGS:
+        rows = load_compiled_table(_DATA_DIR / f"knots_{n}.csv.gz", only_field_name="native notation")
+        polynomials = {
+            "homflypt": load_compiled_table(_DATA_DIR / f"knots_homflypt_{n}.csv.gz", only_field_name="homflypt"),
+            "kauffman": load_compiled_table(_DATA_DIR / f"knots_kauffman_{n}.csv.gz", only_field_name="kauffman"),
+        }
+        for name, packed_diagram in rows.items():
+            k = unpack_diagram(packed_diagram)
+            index["diagram"][diagram_key(k)] = name
+            index["crossings"][name] = n
+
+            homflypt_terms = packed_terms(polynomials["homflypt"][name])
+            kauffman_terms = packed_terms(polynomials["kauffman"][name])
+            jones_terms = _jones_terms(homflypt_terms)
+            alexander_key = polynomial_key(_alexander_terms(_homflypt_specialization(homflypt_terms, x=(1, 0),
+                                                                                     y=(-1, 0), z_sign=-1)))
+            index["keys"][name] = {
+                "determinant": determinant(k),
+                "alexander": alexander_key,
+                "jones": polynomial_key(jones_terms),
+                "homflypt": polynomial_key(homflypt_terms),
+                "kauffman": polynomial_key(kauffman_terms),
+            }
+            index["keys"][name + "*"] = index["keys"][name] | {
+                "jones": polynomial_key(substitute_terms(jones_terms, **_JONES_MIRROR)),
+                "homflypt": polynomial_key(substitute_terms(homflypt_terms, **_HOMFLYPT_MIRROR)),
+                "kauffman": polynomial_key(substitute_terms(kauffman_terms, **_KAUFFMAN_MIRROR)),
+            }
+            mirrors.append(name + "*")
+
+    for name in mirrors:
+        index["crossings"][name] = index["crossings"][name[:-1]]
+    for name in index["crossings"]:
+        for invariant, key in index["keys"][name].items():
+            index[invariant].setdefault(key, []).append(name)
+    return index
+
+
+# Index of the knot table (built on first use and stored next to the tables)
+_knot_index = LazyDict(
+    load_function=partial(
+        load_table_index,
+        filename=_DATA_DIR / "knots_index.pickle",
+        sources=[_DATA_DIR / f"knots{infix}_{n}.csv.gz"
+                 for infix in ("", "_homflypt", "_kauffman") for n in _KNOT_TABLE_CROSSINGS],
+        build_function=_build_knot_index,
+        version=3,
+    )
+)
+
+
 
 
 """
@@ -118,9 +300,10 @@ def symmetry_type(knot_or_name: str | Diagram):
 
     base_name = f"{number_of_crossings}{'' if not alt_type else alt_type}_{index}"
     try:
-        return _knot_table[number_of_crossings][base_name]["symmetry"]
-    except KeyError:
-        return None
+        knot_dict = _knot_row(number_of_crossings, base_name)
+    except ValueError:
+        return None  # the table is not installed
+    return None if knot_dict is None else knot_dict["symmetry"]
 
 
 
@@ -187,16 +370,22 @@ def knot(name: str) -> Diagram:
         return theta(name)
     if type_name != "knot":
         raise ValueError(f"Invalid knot type: {name}")
-    if number_of_crossings > max(_KNOT_TABLE_CROSSINGS):
-        raise ValueError(f"Only knots with up to {max(_KNOT_TABLE_CROSSINGS)} crossings are supported (got: {name})")
+    if number_of_crossings > _MAX_KNOT_CROSSINGS:
+        raise ValueError(f"Only knots with up to {_MAX_KNOT_CROSSINGS} crossings are supported (got: {name})")
 
-    # reconstruct the knot name and retrieve the knot
+    # reconstruct the knot name and retrieve the knot (from one block of an extended table)
     base_name = f"{number_of_crossings}{'' if not alt_type else alt_type}_{index}"
-    if base_name not in _knot_table[number_of_crossings]:
+    if (knot_dict := _knot_row(number_of_crossings, base_name)) is None:
         raise ValueError(f"Knot {name} not found in the knot table")
-    knot_dict = _knot_table[number_of_crossings][base_name]
     k, symmetry = knot_dict["diagram"], knot_dict["symmetry"]
 
+    # take the variant from the precomputed variants, if they were already computed
+    variant_name = (orientation or "") + base_name + ("*" if mirror else "")
+    if (mirror or orientation) and number_of_crossings in _KNOT_TABLE_CROSSINGS and (
+            number_of_crossings in _knot_variants_table or _knot_variants_filename(number_of_crossings).exists()):
+        if variant_name in (variants := _load_knot_variants(number_of_crossings)):
+            return unfreeze(variants[variant_name], inplace=False)
+
     if not orientation:
         # unoriented
         if not mirror:
@@ -204,7 +393,7 @@ def knot(name: str) -> Diagram:
         else:
             if symmetry in ("fully amphicheiral", "negative amphicheiral", "positive amphicheiral"):
                 return _named(unfreeze(k, inplace=False), base_name + "*")
-            elif symmetry in ("chiral", "reversible"):
+            elif symmetry in ("chiral", "reversible", None):
                 return canonical(mirror_diagram(k, inplace=False))  # mirror should add a '*' to the name
             else:
                 raise ValueError(f"Invalid symmetry: {symmetry}")
@@ -223,13 +412,108 @@ def knot(name: str) -> Diagram:
             raise ValueError(f"Invalid orientation: {orientation}")
 
 
+def _knot_variants(k: PlanarDiagram, symmetry: str | None, mirror: bool = True,
+                   oriented: bool = True) -> list[PlanarDiagram | OrientedPlanarDiagram]:
+    """Return the canonical variants of a table knot (``K*`` if unoriented, ``+K``, ``-K``, ``+K*``, ``-K*`` if
+    oriented) that are different up to isotopy, following the symmetry type of the knot:
+
+                                                     +  -  +* -*
+        chiral:                +K, +K*, -K, -K*      x  x  x  x
+        fully amphicheiral:    +K = +K* = -K = -K*   x  -  -  -
+        negative amphicheiral: +K = -K*, +K* = -K    x  x  -  -
+        positive amphicheiral: +K = +K*, -K = -K*    x  x  -  -
+        reversible:            +K = -K. +K* = -K*    x  -  x  -
+
+    A knot without a symmetry type (``None``) is treated as chiral.
+    """
+    base_name = k.name
+    if not oriented:
+        if mirror and symmetry in ("chiral", "reversible", None):
+            return [canonical(mirror_diagram(k, inplace=False))]  # adds '*' to the name
+        return []
+
+    k = orient(k)  # unfreezes
+    variants = [_named(canonical(k), "+" + base_name)]
+    if symmetry in ("chiral", "negative amphicheiral", "positive amphicheiral", None):
+        variants.append(_named(canonical(reverse(k, inplace=False)), "-" + base_name))
+    if mirror and symmetry in ("chiral", "reversible", None):
+        variants.append(_named(canonical(mirror_diagram(k, inplace=False)), "+" + base_name + "*"))
+    if mirror and symmetry in ("chiral", None):
+        variants.append(_named(canonical(mirror_diagram(reverse(k, inplace=False))), "-" + base_name + "*"))
+    return variants
+
+
+def _table_knot_variants(n: int, name: str) -> list[PlanarDiagram | OrientedPlanarDiagram]:
+    """Return all the canonical unoriented mirror and oriented variants of a knot of the knot table."""
+    _load_knot_table()
+    knot_dict = _knot_table[n][name]
+    return (_knot_variants(knot_dict["diagram"], knot_dict["symmetry"], oriented=False) +
+            _knot_variants(knot_dict["diagram"], knot_dict["symmetry"], oriented=True))
+
+
+def _build_knot_variants(n: int, workers: int | None = 1) -> dict:
+    """Return the rows ``{name: {"native notation": diagram}}`` of the variants of the knots with n crossings (e.g.
+    "3_1*", "+3_1", "-3_1", "+3_1*", "-3_1*"), in the order of the knot table.
+
+    Args:
+        n: Number of crossings.
+        workers: Number of worker processes (``None`` or ``<= 0`` for the number of CPUs).
+    """
+    names = list(_knot_table[n])
+    if workers is None or workers <= 0:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        variants = map(partial(_table_knot_variants, n), names)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            variants = list(executor.map(partial(_table_knot_variants, n), names, chunksize=32))
+    return {k.name: {"native notation": k} for diagrams in variants for k in diagrams}
+
+
+def _knot_variants_filename(n: int) -> Path:
+    return _DATA_DIR / f"knots_variants_{n}.bin"
+
+
+def _load_knot_variants(n: int, workers: int | None = 1) -> LazyDict:
+    """Return the (lazy) table of the precomputed canonical variants of the knots with n crossings. The table is
+    computed on first use (by ``workers`` processes) and stored next to the knot table."""
+    if n not in _knot_variants_table:
+        _knot_variants_table[n] = LazyDict(
+            load_function=partial(
+                load_derived_table,
+                filename=_knot_variants_filename(n),
+                sources=[_DATA_DIR / f"knots_{n}.csv.gz"],
+                build_function=partial(_build_knot_variants, n, workers=workers),
+                only_field_name="native notation",
+            ),
+            eval_function=_eval_packed_diagram,
+        )
+    return _knot_variants_table[n]
+
+
 def knots_generator(
     crossings: int | list[int] | tuple[int, ...] | None = None,
     mirror: bool = False,
-    oriented: bool = False
+    oriented: bool = False,
+    frozen: bool = False,
+    workers: int | None = 1,
 ):
     """
     Yield knots with the given number(s) of crossings.
+
+    The canonical mirrors and oriented variants of the table knots are precomputed (on first use) and stored in
+    compiled tables next to the knot table, so they are streamed without being oriented, mirrored and canonicalized
+    again. Knots with 13-16 crossings are streamed from the block tables of the extended knot table data pack (only
+    one block of the table is decompressed at a time), their variants are computed on the fly. Their mirrors are
+    generated unless the table gives an amphicheiral symmetry type.
+
+    Args:
+        crossings: Number(s) of crossings, by default all the numbers of the knot table.
+        mirror: Also yield the mirrors of chiral knots.
+        oriented: Yield the oriented knots (both orientations of non-reversible knots).
+        frozen: Yield the (locked) table diagrams themselves instead of modifiable copies.
+        workers: Number of worker processes computing the variants of the tables on first use (``None`` or ``<= 0``
+            for the number of CPUs).
     """
     _load_knot_table()  # Lazy load here
 
@@ -238,60 +522,44 @@ def knots_generator(
 
     crossings = [crossings] if isinstance(crossings, int) else list(crossings)
 
-    if any(n > max(_KNOT_TABLE_CROSSINGS) for n in crossings):
-        over = min(n for n in crossings if n > max(_KNOT_TABLE_CROSSINGS))
+    if any(n > _MAX_KNOT_CROSSINGS for n in crossings):
+        over = min(n for n in crossings if n > _MAX_KNOT_CROSSINGS)
         raise ValueError(
-            f"Only knots with up to {max(_KNOT_TABLE_CROSSINGS)} crossings are supported (got: {over})"
+            f"Only knots with up to {_MAX_KNOT_CROSSINGS} crossings are supported (got: {over})"
         )
     if any(n < 0 for n in crossings):
         raise ValueError("Knots with negative number of crossings are not supported")
 
-    if not oriented:
-        # oriented = False
-        for n in crossings:
-            for knot_dict in _knot_table[n].values():
-                k, symmetry = knot_dict["diagram"], knot_dict["symmetry"]
-                yield unfreeze(k, inplace=False)
-                if mirror and symmetry in ("chiral", "reversible"):
-                    yield canonical(mirror_diagram(k, inplace=False))  # adds '*' to the name
-    else:
-        # oriented = True
-        for n in crossings:
-            for knot_dict in _knot_table[n].values():
+    copy = (lambda k: k) if frozen else (lambda k: unfreeze(k, inplace=False))
+    for n in crossings:
+        if n in _EXTENDED_KNOT_TABLE_CROSSINGS:
+            for knot_dict in _knot_rows(n):
                 k, symmetry = knot_dict["diagram"], knot_dict["symmetry"]
-                base_name = k.name
-                k = orient(k)  # unfreezes
-
-                # + orientation
-                yield _named(canonical(k), "+" + base_name)
-
-                # - orientation
-                if symmetry in ("chiral", "negative amphicheiral", "positive amphicheiral"):
-                    yield _named(canonical(reverse(k, inplace=False)), "-" + base_name)
-
-                if mirror:
-                    # mirror + orientation
-                    if symmetry in ("chiral", "reversible"):
-                        yield _named(canonical(mirror_diagram(k, inplace=False)), "+" + base_name + "*")
-
-                    if symmetry == "chiral":
-                        yield _named(canonical(mirror_diagram(reverse(k, inplace=False))), "-" + base_name + "*")
-
-                """
-                                                             +  -  +* -*
-                chiral:                +K, +K*, -K, -K*      x  x  x  x
-                fully amphicheiral:    +K = +K* = -K = -K*   x  -  -  -
-                negative amphicheiral: +K = -K*, +K* = -K    x  x  -  -
-                positive amphicheiral: +K = +K*, -K = -K*    x  x  -  -
-                reversible:            +K = -K. +K* = -K*    x  -  x  -
-                """
+                if not oriented:
+                    yield copy(k)
+                for k_ in _knot_variants(k, symmetry, mirror=mirror, oriented=oriented):
+                    yield k_ if not frozen else lock(k_)
+            continue
+
+        variants = _load_knot_variants(n, workers) if mirror or oriented else {}
+        for name, knot_dict in _knot_table[n].items():
+            if not oriented:
+                yield copy(knot_dict["diagram"])
+                names = [name + "*"] if mirror else []
+            else:
+                names = ["+" + name, "-" + name] + (["+" + name + "*", "-" + name + "*"] if mirror else [])
+            for name_ in names:
+                if name_ in variants:
+                    yield copy(variants[name_])
 
 
-def knots(crossings=None, mirror: bool = False, oriented: bool = False) -> list:
+def knots(crossings=None, mirror: bool = False, oriented: bool = False, frozen: bool = False,
+          workers: int | None = 1) -> list:
     """
-    Return a list of knots with the given number(s) of crossings.
+    Return a list of knots with the given number(s) of crossings (see :func:`knots_generator`).
     """
-    return list(knots_generator(crossings=crossings, mirror=mirror, oriented=oriented))
+    return list(knots_generator(crossings=crossings, mirror=mirror, oriented=oriented, frozen=frozen,
+                                workers=workers))
 
 
 def knot_precomputed_homflypt(k: Diagram):
@@ -357,67 +625,101 @@ def _candidates(k: Diagram):
     #print("sk*", canonical(mirror_diagram(k, inplace=False)))
     yield canonical(mirror_diagram(k, inplace=False)), "*"
 
+# Invariants of the identification cascade: functions returning the key of the invariant of a knot diagram, which
+# is compared to the keys of the table knots in the knot index
+_CASCADE_INVARIANTS = {
+    "determinant": determinant,
+    "alexander": lambda k: polynomial_key(_alexander_terms(polynomial_terms(alexander(k)))),
+    "jones": lambda k: polynomial_key(jones(k)),
+    "homflypt": lambda k: polynomial_key(homflypt(k, "xyz")),
+    "kauffman": lambda k: polynomial_key(kauffman(k)),
+}
+
+# The default cascade (cheap invariants first). The Alexander polynomial is computed from the HOMFLY-PT polynomial and
+# the Jones polynomial (through the bracket) is slower than the HOMFLY-PT polynomial, so they are not included.
+_IDENTIFY_CASCADE = ("determinant", "homflypt", "kauffman")
+
+
+def _cascade_candidates(k: Diagram, cascade: tuple[str, ...] | list[str] | None = None, debug: bool = False) -> list:
+    """Return names of table knots (and mirrors, marked by "*") that have the same invariants as ``k``.
+
+    The candidates are table knots with at most as many crossings as ``k``. The invariants of ``k`` are computed one by
+    one (in the order of the cascade) and the candidates with different invariants are discarded. The cascade stops
+    when the candidates are a single knot (up to symmetries, see :func:`_remove_symmetry_duplicates`). An invariant is
+    skipped if all candidates have the same invariant.
+
+    Args:
+        k: Knot diagram (usually simplified).
+        cascade: Names of the invariants (``"determinant"``, ``"alexander"``, ``"jones"``, ``"homflypt"``,
+            ``"kauffman"``), by default ``_IDENTIFY_CASCADE``.
+        debug: Print the number of candidates and the time of each stage.
+
+    Returns:
+        list: The candidates, the knots are listed before the mirrors (in the order of the tables).
+
+    Raises:
+        ValueError: If an invariant is unknown.
+    """
+    return cascade_candidates(
+        k, _knot_index, _CASCADE_INVARIANTS,
+        cascade=_IDENTIFY_CASCADE if cascade is None else cascade,
+        max_crossings=min(k.number_of_crossings, max(_KNOT_TABLE_CROSSINGS)),
+        is_determined=lambda candidates: isinstance(_remove_symmetry_duplicates(candidates), str),
+        debug=debug,
+    )
+
+
 def _remove_symmetry_duplicates(list_of_knot_names: list):
     # clean up the results based on symmetry
     #print("rsd", list_of_knot_names)
     result = []
     for name in list_of_knot_names:
         #print("vars", _knot_variations(name))
-        if name in _knot_variations(name):
+        if (variations := _knot_variations(name)) is None or name in variations:
             result.append(name)
     return result[0] if len(result) == 1 else result
 
 
-def _identify_unoriented_knot(k: PlanarDiagram) -> str | list:
+def _identify_unoriented_knot(k: PlanarDiagram, cascade=None, debug: bool = False) -> str | list:
     """Try to get the knot name, e.g. '3_1' of 'k'."""
     # TODO: do not return mirror if it is not fully amphicheiral
 
     # find the exact knot (or the mirror) in the knot table
+    start = perf_counter()
     for k_, _ in _candidates(k):
-        if (knot_name := next((key for key, v in _knot_table[k.number_of_crossings].items() if v["diagram"] == k_), None)) is not None:
+        if (knot_name := _knot_index["diagram"].get(diagram_key(k_)) or _extended_knot_name(k_)) is not None:
             return knot_name + _
+    if debug:
+        print(f"identify: diagram lookup ({perf_counter() - start:.4f}s)")
 
-    # searching the knot table failed, find candidates by homflypt polynomial
-    knot_name_candidates = []
-    k = simplify_decreasing(k, inplace=False)
-    homflypt_polynomial = homflypt(k, "xyz")
-    # check knots
-    for n_ in range(0, k.number_of_crossings + 1):
-        knot_name_candidates += [key for key, p in _knot_precomputed_homflypt[n_].items() if p == homflypt_polynomial]
-    # check mirrors
-    for n_ in range(0, k.number_of_crossings + 1):
-        knot_name_candidates += [key + "*" for key, p in _knot_precomputed_homflypt[n_].items() if _homflypt_xyz_mirror(p) == homflypt_polynomial]
+    # searching the knot table failed, find candidates by invariants
+    knot_name_candidates = _cascade_candidates(simplify_decreasing(k, inplace=False), cascade, debug)
 
     # clean up the results based on symmetry
     return _remove_symmetry_duplicates(knot_name_candidates)
 
 
-def _identify_oriented_knot(k: OrientedPlanarDiagram) -> str | list:
+def _identify_oriented_knot(k: OrientedPlanarDiagram, cascade=None, debug: bool = False) -> str | list:
     """Try to get the knot name, e.g. '3_1' of 'k'."""
     #print("--", k)
 
     # find the exact oriented knot (or the mirror) in the knot table
+    start = perf_counter()
     for k_, _ in _candidates(k):
         u_ = canonical(unorient(k_))
         #print("u", u_)
-        if (knot_name := next((key for key, v in _knot_table[k.number_of_crossings].items() if v["diagram"] == u_), None)) is not None:
+        if (knot_name := _knot_index["diagram"].get(diagram_key(u_)) or _extended_knot_name(u_)) is not None:
 
             if knot("+" + knot_name) == k_:
                 return "+" + knot_name + _
             if knot("-" + knot_name) == k_:
                 return "-" + knot_name + _
             return _remove_symmetry_duplicates(["+" + knot_name + _, "-" + knot_name + _])
+    if debug:
+        print(f"identify: diagram lookup ({perf_counter() - start:.4f}s)")
 
-    # searching the knot table failed, find candidates by homflypt polynomial
-    knot_name_candidates = []
-    k = simplify_decreasing(k, inplace=False)
-    homflypt_polynomial = homflypt(k, "xyz")
-    # check knots
-    for n_ in range(0, k.number_of_crossings + 1):
-        knot_name_candidates += [key for key, p in _knot_precomputed_homflypt[n_].items() if p == homflypt_polynomial]
-    # check mirrors
-    for n_ in range(0, k.number_of_crossings + 1):
-        knot_name_candidates += [key + "*" for key, p in _knot_precomputed_homflypt[n_].items() if _homflypt_xyz_mirror(p) == homflypt_polynomial]
+    # searching the knot table failed, find candidates by invariants
+    knot_name_candidates = _cascade_candidates(simplify_decreasing(k, inplace=False), cascade, debug)
 
     return _remove_symmetry_duplicates([s + name for name in knot_name_candidates for s in "+-"])
 
@@ -492,14 +794,48 @@ def _identify_oriented_knot(k: OrientedPlanarDiagram) -> str | list:
     #     return [s + key for key in knot_name for s in ["+", "-"]]
 
 
-def identify(k: Diagram) -> str | list | None:
+def identify(k: Diagram, cascade: tuple[str, ...] | list[str] | None = None, debug: bool = False) -> str | list | None:
+    """Identify a knot or a link in the tables.
+
+    A knot (link) is first searched for in the knot (link) table by its (canonical) diagram and the diagram of its
+    mirror. If it is not found, the candidates (table entries with at most as many crossings as the simplified diagram)
+    are narrowed down by a cascade of invariants, cheap invariants first, until a single knot (up to symmetries) or a
+    single link remains. Links identified by invariants are named by the orientations of the table, since the
+    invariants do not detect reversing all components. Theta curves and handcuff graphs are identified by their
+    diagrams and the Yamada polynomial (the ``cascade`` is ignored).
+
+    Args:
+        k: Knot, link, theta curve or handcuff graph diagram.
+        cascade: Names of the invariants of the cascade, for knots ``"determinant"``, ``"alexander"``, ``"jones"``,
+            ``"homflypt"``, ``"kauffman"`` (by default ``("determinant", "homflypt", "kauffman")``), for links
+            ``"components"``, ``"determinant"``, ``"homflypt"``, ``"kauffman"``, ``"multivariable_alexander"`` (by
+            default all of them in this order).
+        debug: Print the time of each stage of the identification and the number of remaining candidates.
+
+    Returns:
+        str | list | None: The name of the knot, link or theta curve (e.g. ``"3_1"``, ``"3_1*"``, ``"+3_1"``,
+        ``"L6a_2*+-"`` or ``"T5_3"``), a list of names if the diagram is not determined uniquely by the invariants (an
+        empty list if there are no candidates), or ``None`` if the diagram cannot be identified.
+
+    Example:
+        >>> identify(from_pd_notation("X[1,5,2,4],X[3,1,4,6],X[5,3,6,2]"))
+        '3_1'
+        >>> identify(knot("8_17"), cascade=["determinant", "jones"])
+        '8_17'
+    """
 
     if is_knot(k):
         _load_knot_table()
-        return _identify_oriented_knot(k) if k.is_oriented() else _identify_unoriented_knot(k)
+        if k.is_oriented():
+            return _identify_oriented_knot(k, cascade=cascade, debug=debug)
+        return _identify_unoriented_knot(k, cascade=cascade, debug=debug)
     elif is_link(k):
-        from knotpy.tables.link import _identify_oriented_link
-        return _identify_oriented_link(k) if k.is_oriented() else None
+        from knotpy.tables.link import _identify_oriented_link, _identify_unoriented_link
+        if k.is_oriented():
+            return _identify_oriented_link(k, cascade=cascade, debug=debug)
+        return _identify_unoriented_link(k, cascade=cascade, debug=debug)
+    elif _graph_type(k) is not None:
+        return _identify_theta_curve(k, debug=debug)
     else:
         return None
 
@@ -9,21 +9,31 @@ __all__ = ["link", "links", "links_generator"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek"
 
+from itertools import permutations
 from pathlib import Path
 from functools import partial
+from time import perf_counter
 
 from knotpy.utils.dict_utils import LazyDict
-from knotpy.tables.invariant_reader import load_invariant_table
+from knotpy.tables.compiled_table import load_compiled_table
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram, Diagram
 from knotpy.classes.freezing import unfreeze
+from knotpy.notation.native import from_knotpy_notation
 from knotpy.algorithms.canonical import canonical
 from knotpy.algorithms.symmetry import mirror as mirror_diagram
-from knotpy.tables.invariant_reader import _eval_diagram, _eval_poly
+from knotpy.tables.compiled_table import _eval_packed_diagram, _eval_packed_poly
 from knotpy.tables.name import safe_clean_and_parse_name, _named
-from knotpy.algorithms.orientation import unorient
+from knotpy.algorithms.orientation import unorient, orient
 from knotpy.algorithms.orientation import reverse
-from knotpy.invariants.homflypt import homflypt, _homflypt_xyz_mirror
+from knotpy.algorithms.components_link import number_of_link_components
+from knotpy.invariants.homflypt import homflypt
+from knotpy.invariants.kauffman import kauffman
+from knotpy.invariants.alexander import multivariable_alexander
+from knotpy.invariants.goeritz import determinant
 from knotpy.reidemeister.simplify import simplify_decreasing
+from knotpy.tables.compiled_table import unpack_diagram, packed_terms
+from knotpy.tables.table_index import (load_table_index, diagram_key, polynomial_key, polynomial_terms,
+                                       substitute_terms, cascade_candidates)
 
 
 _DATA_DIR = Path(__file__).parent / "data"
@@ -47,36 +57,36 @@ def _load_link_table() -> None:
     for n in _LINK_TABLE_CROSSINGS:
         _link_table[n] = LazyDict(
             load_function=partial(
-                load_invariant_table, filename=_DATA_DIR / f"links_{n}.csv.gz", evaluate=False, only_field_name="native notation"
+                load_compiled_table, filename=_DATA_DIR / f"links_{n}.csv.gz", only_field_name="native notation"
             ),
-            eval_function=_eval_diagram,
+            eval_function=_eval_packed_diagram,
         )
 
         _link_precomputed_homflypt[n] = LazyDict(
             load_function=partial(
-                load_invariant_table, filename=_DATA_DIR / f"links_homflypt_{n}.csv.gz", evaluate=False, only_field_name="homflypt"
+                load_compiled_table, filename=_DATA_DIR / f"links_homflypt_{n}.csv.gz", only_field_name="homflypt"
             ),
-            eval_function=_eval_poly,
+            eval_function=_eval_packed_poly,
         )
 
         _link_precomputed_kauffman[n] = LazyDict(
             load_function=partial(
-                load_invariant_table, filename=_DATA_DIR / f"links_kauffman_{n}.csv.gz", evaluate=False, only_field_name="kauffman"
+                load_compiled_table, filename=_DATA_DIR / f"links_kauffman_{n}.csv.gz", only_field_name="kauffman"
             ),
-            eval_function=_eval_poly,
+            eval_function=_eval_packed_poly,
         )
 
         _link_precomputed_multivariable_alexander[n] = LazyDict(
             load_function=partial(
-                load_invariant_table,
-                filename=_DATA_DIR / f"links_multivariable_alexander_{n}.csv.gz", evaluate=False, only_field_name="alexander"
+                load_compiled_table,
+                filename=_DATA_DIR / f"links_multivariable_alexander_{n}.csv.gz", only_field_name="multivariable alexander"
             ),
-            eval_function=_eval_poly,
+            eval_function=_eval_packed_poly,
         )
 
         _link_precomputed_components[n] = LazyDict(
             load_function=partial(
-                load_invariant_table, filename=_DATA_DIR / f"links_components_{n}.csv.gz", evaluate=False, only_field_name="components"
+                load_compiled_table, filename=_DATA_DIR / f"links_components_{n}.csv.gz", only_field_name="components"
             ),
             eval_function=int  #_eval_components_dict,
         )
@@ -204,33 +214,217 @@ def links(crossings=None, mirror: bool = False, oriented: bool = False) -> list:
 
 
 
-def _identify_oriented_link(k: OrientedPlanarDiagram) -> str | list:
-    """Try to get the knot name, e.g. '3_1' of 'k'."""
-    #print("--", k)
-    from knotpy.tables.knot import _knot_precomputed_homflypt
+# Links of the link index: the links of the link table and the links of the tables "link_invariants_*", which also
+# contain the invariants of the links (the precomputed invariants of the link table are not always computed from the
+# diagrams of the table, e.g. some are invariants of mirrors)
+_LINK_INVARIANTS_CROSSINGS = [9, 10]
+_LINK_INDEX_CROSSINGS = _LINK_TABLE_CROSSINGS + _LINK_INVARIANTS_CROSSINGS
+
+# The mirror image of L has the HOMFLY-PT polynomial P(L)(y, x, z) and the Kauffman polynomial F(L)(1/a, z)
+_HOMFLYPT_MIRROR = {"rename": {"x": "y", "y": "x"}}
+_KAUFFMAN_MIRROR = {"invert": ("a",)}
+
+
+def _variant_name(name: str, mirror: bool = False, reverse: bool = False) -> str:
+    """Return the name of the mirror and/or the reverse (all components reversed) of a table link, e.g. the name of the
+    reversed mirror of 'L6a_2+-' is 'L6a_2*-+'."""
+    base_name = name.rstrip("+-")
+    orientation = name[len(base_name):]
+    if reverse:
+        orientation = orientation.translate(str.maketrans("+-", "-+"))
+    return base_name + ("*" if mirror else "") + orientation
+
+
+def _multivariable_alexander_key(terms: tuple) -> bytes:
+    """Return the key of the multivariable Alexander polynomial normalized up to units ``±t1**n1 * t2**n2 * ...`` and
+    the order of the variables (components)."""
+    variables = sorted({variable for monomial, _ in terms for variable, _ in monomial})
+    normalized = []
+    for permutation in permutations(variables):
+        terms_ = substitute_terms(terms, rename=dict(zip(variables, permutation)))
+        shift = {v: min(dict(monomial).get(v, 0) for monomial, _ in terms_) for v in variables}
+        terms_ = tuple(sorted(
+            (tuple((v, dict(monomial).get(v, 0) - shift[v]) for v in variables if dict(monomial).get(v, 0) != shift[v]),
+             c) for monomial, c in terms_))
+        sign = -1 if terms_ and terms_[0][1] < 0 else 1
+        normalized.append(tuple((monomial, sign * c) for monomial, c in terms_))
+    return polynomial_key(min(normalized) if normalized else terms)
+
+
+def _build_link_index() -> dict:
+    """Return the index of the link table.
+
+    The index is a dictionary with the dictionaries:
+        - ``"diagram"``: key of a canonical oriented table diagram -> link name (e.g. "L6a_2+-"),
+        - ``"unoriented diagram"``: key of a canonical unoriented table diagram -> link name (e.g. "L6a_2"),
+        - ``"names"``: link name (oriented or unoriented) -> key of its canonical table diagram,
+        - ``"crossings"``: name of a link or mirror (e.g. "L6a_2*+-") -> number of crossings (the links in the order
+          of the tables are followed by the mirrors),
+        - ``"components"``, ``"determinant"``, ``"homflypt"``, ``"kauffman"``, ``"multivariable_alexander"``: key of
+          the invariant -> list of names of links and mirrors,
+        - ``"keys"``: name of a link or mirror -> dictionary of the keys of its invariants.
+
+    The invariants of the links of the link table are computed from the diagrams, except the multivariable Alexander
+    polynomial, which is unknown (``None``).
+    """
+    index = {"diagram": {}, "unoriented diagram": {}, "names": {}, "crossings": {}, "keys": {}} | \
+            {invariant: {} for invariant in _LINK_CASCADE_INVARIANTS}
+    mirrors = []
+    for n in _LINK_INDEX_CROSSINGS:
+        if n in _LINK_INVARIANTS_CROSSINGS:
+            rows = load_compiled_table(_DATA_DIR / f"link_invariants_{n}.csv.gz")
+        else:
+            rows = {name: {"native notation": value} for name, value in
+                    load_compiled_table(_DATA_DIR / f"links_{n}.csv.gz", only_field_name="native notation").items()}
+
+        for name, row in rows.items():
+            k = canonical(unpack_diagram(row["native notation"]))
+            index["diagram"].setdefault(key := diagram_key(k), name)
+            index["unoriented diagram"].setdefault(unoriented_key := diagram_key(canonical(unorient(k))),
+                                                   name.rstrip("+-"))
+            index["names"][name] = key
+            index["names"].setdefault(name.rstrip("+-"), unoriented_key)
+            index["crossings"][name] = n
+
+            if "homflypt" in row:
+                homflypt_terms, kauffman_terms = packed_terms(row["homflypt"]), packed_terms(row["kauffman"])
+                alexander_key = _multivariable_alexander_key(packed_terms(row["multivariable alexander"]))
+            else:
+                homflypt_terms, kauffman_terms = polynomial_terms(homflypt(k, "xyz")), polynomial_terms(kauffman(k))
+                alexander_key = None
+            index["keys"][name] = {
+                "components": number_of_link_components(k),
+                "determinant": determinant(k),
+                "homflypt": polynomial_key(homflypt_terms),
+                "kauffman": polynomial_key(kauffman_terms),
+                "multivariable_alexander": alexander_key,
+            }
+            index["keys"][_variant_name(name, mirror=True)] = index["keys"][name] | {
+                "homflypt": polynomial_key(substitute_terms(homflypt_terms, **_HOMFLYPT_MIRROR)),
+                "kauffman": polynomial_key(substitute_terms(kauffman_terms, **_KAUFFMAN_MIRROR)),
+            }
+            mirrors.append((_variant_name(name, mirror=True), n))
+
+    index["crossings"].update(mirrors)
+    for name in index["crossings"]:
+        for invariant, key in index["keys"][name].items():
+            index[invariant].setdefault(key, []).append(name)
+    return index
+
+
+# Index of the link table (built on first use and stored next to the tables)
+_link_index = LazyDict(
+    load_function=partial(
+        load_table_index,
+        filename=_DATA_DIR / "links_index.pickle",
+        sources=[_DATA_DIR / f"links_{n}.csv.gz" for n in _LINK_TABLE_CROSSINGS] +
+                [_DATA_DIR / f"link_invariants_{n}.csv.gz" for n in _LINK_INVARIANTS_CROSSINGS],
+        build_function=_build_link_index,
+        version=2,
+    )
+)
+
+# Invariants of the identification cascade: functions returning the key of the invariant of an oriented link diagram
+_LINK_CASCADE_INVARIANTS = {
+    "components": number_of_link_components,
+    "determinant": determinant,
+    "homflypt": lambda k: polynomial_key(homflypt(k, "xyz")),
+    "kauffman": lambda k: polynomial_key(kauffman(k)),
+    "multivariable_alexander": lambda k: _multivariable_alexander_key(polynomial_terms(multivariable_alexander(k))),
+}
+
+_LINK_IDENTIFY_CASCADE = ("components", "determinant", "homflypt", "kauffman", "multivariable_alexander")
+
+
+def _link_cascade_candidates(k: OrientedPlanarDiagram, cascade: tuple[str, ...] | list[str] | None = None,
+                             debug: bool = False) -> list:
+    """Return names of table links (and mirrors, marked by "*") that have the same invariants as ``k``.
+
+    The invariants do not detect reversing all components, so the candidates are named by the orientations of the
+    table (the orientation of the first component is "+").
+
+    Args:
+        k: Oriented link diagram (usually simplified).
+        cascade: Names of the invariants (``"components"``, ``"determinant"``, ``"homflypt"``, ``"kauffman"``,
+            ``"multivariable_alexander"``), by default all of them in this order.
+        debug: Print the number of candidates and the time of each stage.
+    """
+    return cascade_candidates(
+        k, _link_index, _LINK_CASCADE_INVARIANTS,
+        cascade=_LINK_IDENTIFY_CASCADE if cascade is None else cascade,
+        max_crossings=min(k.number_of_crossings, max(_LINK_INDEX_CROSSINGS)),
+        is_determined=lambda candidates: len(candidates) == 1,
+        debug=debug,
+    )
+
+
+def _variant_keys(name: str) -> set | None:
+    """Return the keys of the canonical diagram of a table link, its mirror or its orientations (e.g. 'L6a_2*+-'), and
+    of its reverse (``None`` if the diagram is not in the index)."""
+    base_name = name.rstrip("+-")
+    orientation = name[len(base_name):]
+    if (key := _link_index["names"].get(base_name.rstrip("*") + orientation)) is None:
+        return None
+    if not base_name.endswith("*"):
+        keys = {key}
+        k = from_knotpy_notation(key) if orientation else None
+    else:
+        k = canonical(mirror_diagram(from_knotpy_notation(key), inplace=False))
+        keys = {diagram_key(k)}
+    if orientation:
+        keys.add(diagram_key(canonical(reverse(k, inplace=False))))
+    return keys
+
+
+def _remove_link_symmetry_duplicates(names: list) -> list:
+    """Remove the names of links with the same table diagram as a previous name, e.g. the mirror of an amphicheiral
+    link (oriented links are compared up to reversing all components, which the invariants do not detect)."""
+    result, seen = [], set()
+    for name in names:
+        keys = _variant_keys(name)
+        if keys is None or not keys & seen:
+            result.append(name)
+            seen |= keys or set()
+    return result
+
+
+def _identify_oriented_link(k: OrientedPlanarDiagram, cascade=None, debug: bool = False) -> str | list:
+    """Try to get the link name, e.g. 'L6a_2+-' of 'k'."""
+    from knotpy.tables.knot import _candidates
+
+    # find the exact oriented link, its mirror or reverse in the link index
+    start = perf_counter()
+    for k_, mirror in _candidates(k):
+        for is_reversed in (False, True):
+            k__ = canonical(reverse(k_, inplace=False)) if is_reversed else k_
+            if (link_name := _link_index["diagram"].get(diagram_key(k__))) is not None:
+                return _variant_name(link_name, mirror=bool(mirror), reverse=is_reversed)
+    if debug:
+        print(f"identify: diagram lookup ({perf_counter() - start:.4f}s)")
+
+    # searching the link table failed, find candidates by invariants
+    candidates = _link_cascade_candidates(simplify_decreasing(k, inplace=False), cascade, debug)
+    candidates = _remove_link_symmetry_duplicates(candidates)
+    return candidates[0] if len(candidates) == 1 else candidates
+
+
+def _identify_unoriented_link(k: PlanarDiagram, cascade=None, debug: bool = False) -> str | list:
+    """Try to get the link name, e.g. 'L6a_2' of 'k'."""
     from knotpy.tables.knot import _candidates
 
-    # find the exact oriented link (or the mirror) in the link table
-    for k_, _ in _candidates(k):
-        u_ = k_
-        print(u_)
-        for key, v in _link_table[k.number_of_crossings].items():
-            print(key, v, v == u_)
-        if (knot_name := next((key for key, v in _link_table[k.number_of_crossings].items() if v == u_), None)) is not None:
-            print("YAY!")
-            base_name, signs_str = "".join([c for c in knot_name if c not in "+-"]), "".join([c for c in knot_name if c in "+-"])
-            return knot_name + _ + signs_str
-
-    # searching the link table failed, find candidates by homflypt polynomial
-    link_name_candidates = []
-    k = simplify_decreasing(k, inplace=False)
-    homflypt_polynomial = homflypt(k, "xyz")
-    # check knots
-    for n_ in range(0, k.number_of_crossings + 1):
-        link_name_candidates += [key for key, p in _knot_precomputed_homflypt[n_].items() if p == homflypt_polynomial]
-    # check mirrors
-    for n_ in range(0, k.number_of_crossings + 1):
-        link_name_candidates += [key + "*" for key, p in _knot_precomputed_homflypt[n_].items() if _homflypt_xyz_mirror(p) == homflypt_polynomial]
-
-    return link_name_candidates
-    #return _remove_symmetry_duplicates([s + name for name in knot_name_candidates for s in "+-"])
\ No newline at end of file
+    # find the exact link or its mirror in the link index
+    start = perf_counter()
+    for k_, mirror in _candidates(k):
+        if (link_name := _link_index["unoriented diagram"].get(diagram_key(k_))) is not None:
+            return link_name + mirror
+    if debug:
+        print(f"identify: diagram lookup ({perf_counter() - start:.4f}s)")
+
+    # searching the link table failed, find candidates by invariants of an orientation of k
+    candidates = _link_cascade_candidates(simplify_decreasing(orient(k), inplace=True), cascade, debug)
+    candidates = _remove_link_symmetry_duplicates(list(dict.fromkeys(name.rstrip("+-") for name in candidates)))
+    return candidates[0] if len(candidates) == 1 else candidates
+
+
+if __name__ == "__main__":
+    pass
@@ -11,12 +11,14 @@ from typing import Callable, Iterable
 
 from tqdm import tqdm
 from knotpy.notation.native import to_knotpy_notation
+from knotpy.invariants.invariant_set import InvariantSet
 
 # --- Globals initialized in each worker process --------------------------------
 
 _OUT_DIR: str | None = None
 _FIELDNAMES: list[str] | None = None
 _INVARIANTS: dict[str, Callable] | None = None
+_INVARIANT_SET: InvariantSet | None = None  # built once per worker from _INVARIANTS
 
 
 def _is_gz(path: str | Path) -> bool:
@@ -41,10 +43,11 @@ def _open_text(path: str | Path, mode: str):
 
 
 def _init_worker(out_dir: str, fieldnames: list[str], invariants: dict[str, Callable]) -> None:
-    global _OUT_DIR, _FIELDNAMES, _INVARIANTS
+    global _OUT_DIR, _FIELDNAMES, _INVARIANTS, _INVARIANT_SET
     _OUT_DIR = out_dir
     _FIELDNAMES = fieldnames
     _INVARIANTS = invariants
+    _INVARIANT_SET = InvariantSet(invariants)
 
 _SAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
 
@@ -85,7 +88,7 @@ def _compute_and_write_single(idx: int, diagram) -> None:
       - write one CSV line into its own file (atomic)
       - write error file if needed (atomic)
     """
-    assert _FIELDNAMES is not None and _INVARIANTS is not None
+    assert _FIELDNAMES is not None and _INVARIANT_SET is not None
 
     name = getattr(diagram, "name", str(diagram))
     row_path = _row_path(idx, name)
@@ -104,14 +107,8 @@ def _compute_and_write_single(idx: int, diagram) -> None:
         diag_str = str(diagram)
         err_msgs.append(f"to_knotpy_notation failed: {e!r}")
 
-    # Compute invariants
-    values: dict[str, object] = {}
-    for inv_name, inv_fn in _INVARIANTS.items():
-        try:
-            values[inv_name] = inv_fn(diagram)
-        except Exception as e:
-            values[inv_name] = None
-            err_msgs.append(f"{inv_name} failed: {e!r}")
+    # Compute invariants (sharing the preprocessing and deriving dependent invariants)
+    values = _INVARIANT_SET.compute(diagram, errors=err_msgs)
 
     # Build row
     row = {"name": name, "knotpy notation": diag_str}
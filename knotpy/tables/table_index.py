@@ -0,0 +1,305 @@
+# knotpy/tables/table_index.py
+"""
+Precomputed indexes for identifying diagrams in the knot and link tables.
+
+An index maps a *key* of a diagram or of an invariant to the names of the table entries with that key, so that a
+diagram is identified by a few dictionary lookups instead of scanning (and evaluating) the table rows:
+
+- the key of a diagram is its native notation without attributes (table diagrams are stored in canonical form,
+  so a diagram is looked up by the key of its canonical form),
+- the key of a polynomial is a digest of the sorted tuple of its terms, obtained by a small parser of the polynomial
+  strings in the tables (parsing the tables with SymPy would take minutes).
+
+Indexes are built from the tables on first use and stored (pickled) in the data directory next to the tables. An
+index is rebuilt if the sizes or modification times of the table files or the version of the index change.
+
+If a diagram is not found by its key, the table entries are narrowed down by a cascade of invariants (see
+:func:`cascade_candidates`).
+"""
+
+from __future__ import annotations
+
+__all__ = []
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+import ast
+import hashlib
+import os
+import pickle
+import re
+from fractions import Fraction
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterable, Mapping
+
+from knotpy.classes.planardiagram import PlanarDiagram
+from knotpy.notation.native import to_knotpy_notation
+
+_INDEX_VERSION = 1
+
+# monomial: sorted tuple of (variable, exponent) pairs with nonzero exponents
+_Monomial = tuple
+_ONE: _Monomial = ()
+
+
+def diagram_key(k: PlanarDiagram) -> str | None:
+    """Return the native notation of a diagram without attributes (``None`` if it has no compact notation).
+
+    Args:
+        k: The diagram (usually in canonical form).
+    """
+    notation = to_knotpy_notation(k)
+    return None if notation is None else notation.split(" [", 1)[0]
+
+
+def _multiply_monomials(m1: _Monomial, m2: _Monomial) -> _Monomial:
+    exponents = dict(m1)
+    for variable, exponent in m2:
+        exponents[variable] = exponents.get(variable, 0) + exponent
+    return tuple(sorted((variable, e) for variable, e in exponents.items() if e))
+
+
+def _multiply(p1: dict, p2: dict) -> dict:
+    result = {}
+    for m1, c1 in p1.items():
+        for m2, c2 in p2.items():
+            m = _multiply_monomials(m1, m2)
+            result[m] = result.get(m, 0) + c1 * c2
+    return {m: c for m, c in result.items() if c}
+
+
+def _inverse(p: dict) -> dict:
+    if len(p) != 1:
+        raise ValueError("Only division by monomials is supported")
+    (m, c), = p.items()
+    return {tuple((variable, -e) for variable, e in m): Fraction(1) / c}
+
+
+def _power(p: dict, exponent: int) -> dict:
+    if exponent < 0:
+        p, exponent = _inverse(p), -exponent
+    result = {_ONE: 1}
+    for _ in range(exponent):
+        result = _multiply(result, p)
+    return result
+
+
+def _evaluate(node: ast.AST) -> dict:
+    """Evaluate a parsed polynomial expression into a dictionary ``{monomial: coefficient}``."""
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        # collect the terms of a (long) sum at once, walking down the left-nested additions
+        terms = []
+        while isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+            terms.append((1 if isinstance(node.op, ast.Add) else -1, node.right))
+            node = node.left
+        result = _evaluate(node)
+        for sign, term in reversed(terms):
+            for m, c in _evaluate(term).items():
+                result[m] = result.get(m, 0) + sign * c
+        return {m: c for m, c in result.items() if c}
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return {_ONE: node.value} if node.value else {}
+    if isinstance(node, ast.Name):
+        return {((node.id, 1),): 1}
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        p = _evaluate(node.operand)
+        return {m: -c for m, c in p.items()} if isinstance(node.op, ast.USub) else p
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, ast.Pow):
+            exponent = _evaluate(node.right)
+            if set(exponent) - {_ONE} or Fraction(exponent.get(_ONE, 0)).denominator != 1:
+                raise ValueError("Only integer exponents are supported")
+            return _power(_evaluate(node.left), int(exponent.get(_ONE, 0)))
+        left, right = _evaluate(node.left), _evaluate(node.right)
+        if isinstance(node.op, ast.Mult):
+            return _multiply(left, right)
+        if isinstance(node.op, ast.Div):
+            return _multiply(left, _inverse(right))
+    raise ValueError(f"Unsupported expression {ast.dump(node)}")
+
+
+_FACTOR = r"(?:[A-Za-z_]\w*|\d+)(?:\*\*(?:\d+|\(-\d+\)))?"
+_PRODUCT = re.compile(rf"{_FACTOR}(?:\*{_FACTOR})*")
+_FACTOR_PARTS = re.compile(r"([A-Za-z_]\w*|\d+)(?:\*\*\(?(-?\d+)\)?)?")
+
+
+def _parse_expanded(expression: str) -> dict | None:
+    """Parse an expanded polynomial in the format printed by SymPy, e.g. ``-2*y/x + z**3/(x*y**2)``.
+
+    Returns:
+        dict | None: The dictionary ``{monomial: coefficient}`` or ``None`` if the expression is not in the format.
+    """
+    parts = re.split(r" ([+-]) ", expression)
+    terms = {}
+    for i in range(0, len(parts), 2):
+        term = parts[i]
+        sign = -1 if i and parts[i - 1] == "-" else 1
+        if term.startswith("-"):
+            sign, term = -sign, term[1:]
+        exponents, coefficient = {}, sign
+        for j, product in enumerate(term.split("/")):
+            if j and product.startswith("(") and product.endswith(")"):
+                product = product[1:-1]
+            if not _PRODUCT.fullmatch(product):
+                return None
+            direction = -1 if j else 1
+            for base, exponent in _FACTOR_PARTS.findall(product):
+                exponent = int(exponent) if exponent else 1
+                if base[0].isdigit():
+                    coefficient *= int(base) ** exponent if direction > 0 else Fraction(1, int(base) ** exponent)
+                else:
+                    exponents[base] = exponents.get(base, 0) + exponent * direction
+        m = tuple(sorted((variable, e) for variable, e in exponents.items() if e))
+        terms[m] = terms.get(m, 0) + coefficient
+    return {m: c for m, c in terms.items() if c}
+
+
+def polynomial_terms(polynomial) -> tuple:
+    """Return the terms of a (Laurent) polynomial with rational coefficients.
+
+    Equal polynomials have equal terms, regardless of how they are written.
+
+    Args:
+        polynomial: A SymPy expression or its string representation.
+
+    Returns:
+        tuple: The sorted tuple of terms ``(monomial, coefficient)``, where a monomial is a sorted tuple of pairs
+        ``(variable name, exponent)``.
+
+    Raises:
+        ValueError: If the expression is not a Laurent polynomial.
+
+    Example:
+        >>> polynomial_terms("z**2/x**2 - 2*y/x")
+        (((('x', -2), ('z', 2)), 1), ((('x', -1), ('y', 1)), -2))
+    """
+    expression = str(polynomial).strip()
+    terms = _parse_expanded(expression)
+    if terms is None:
+        terms = _evaluate(ast.parse(expression, mode="eval"))
+    return tuple(sorted((m, int(c) if isinstance(c, int) or c.denominator == 1 else c) for m, c in terms.items()))
+
+
+def polynomial_key(polynomial) -> bytes:
+    """Return the key of a (Laurent) polynomial, a digest of its terms.
+
+    Args:
+        polynomial: A SymPy expression, its string representation, or its terms (see :func:`polynomial_terms`).
+    """
+    terms = polynomial if isinstance(polynomial, tuple) else polynomial_terms(polynomial)
+    return hashlib.blake2b(repr(terms).encode(), digest_size=16).digest()
+
+
+def substitute_terms(terms: tuple, rename: dict[str, str] | None = None, invert: Iterable[str] = ()) -> tuple:
+    """Return the terms of a polynomial after renaming variables and substituting ``v -> 1/v`` for some variables.
+
+    Args:
+        terms: Terms of a polynomial (see :func:`polynomial_terms`).
+        rename: Mapping of variable names (e.g. ``{"x": "y", "y": "x"}`` swaps ``x`` and ``y``).
+        invert: Names of variables (after renaming) that are replaced by their inverses.
+    """
+    rename = rename or {}
+    invert = set(invert)
+    return tuple(sorted(
+        (tuple(sorted((rename.get(v, v), -e if rename.get(v, v) in invert else e) for v, e in m)), c)
+        for m, c in terms))
+
+
+def source_stamp(source: str | Path) -> tuple:
+    """Return the name, size and modification time (in nanoseconds) of a table file.
+
+    The modification time detects edits that keep the size of the file, e.g. a changed coefficient of a polynomial.
+    """
+    source = Path(source)
+    stat = source.stat()
+    return source.name, stat.st_size, stat.st_mtime_ns
+
+
+def load_table_index(filename: str | Path, sources: Iterable[str | Path],
+                     build_function: Callable[[], dict], version: int = 1) -> dict:
+    """Load an index from a file or build it (and store it) if the file is missing or outdated.
+
+    Args:
+        filename: Path of the pickled index.
+        sources: Table files the index is built from (a change of their sizes or modification times triggers a
+            rebuild).
+        build_function: Function returning the index, a dictionary of dictionaries.
+        version: Version of the index (increase it when the build function changes).
+
+    Returns:
+        dict: The index.
+    """
+    filename = Path(filename)
+    stamp = (_INDEX_VERSION, version, tuple(source_stamp(s) for s in sources))
+    try:
+        with open(filename, "rb") as f:
+            stored_stamp, index = pickle.load(f)
+        if stored_stamp == stamp:
+            return index
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+
+    index = build_function()
+    try:
+        temporary = filename.with_name(f"{filename.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as f:
+            pickle.dump((stamp, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary.replace(filename)  # atomic, concurrent processes do not read partial files
+    except OSError:
+        pass  # read-only installation, keep the index in memory
+    return index
+
+
+def cascade_candidates(k: PlanarDiagram, index: dict, invariants: Mapping[str, Callable[[PlanarDiagram], object]],
+                       cascade: Iterable[str], max_crossings: int, is_determined: Callable[[list], bool],
+                       debug: bool = False) -> list:
+    """Return names of table entries that have the same invariants as ``k``.
+
+    The candidates are the entries with at most ``max_crossings`` crossings. The invariants of ``k`` are computed one
+    by one (in the order of the cascade) and the candidates with different invariants are discarded, until the
+    candidates are determined. An invariant is skipped if all candidates have the same invariant. Entries with an
+    unknown invariant (the key ``None``) are not discarded.
+
+    Args:
+        k: The diagram.
+        index: Dictionary with the dictionaries ``"crossings"`` (name -> number of crossings), ``"keys"`` (name ->
+            dictionary of keys of the invariants) and, for each invariant, a dictionary key -> list of names.
+        invariants: Functions returning the keys of the invariants of a diagram by name.
+        cascade: Names of the invariants in the order of computation.
+        max_crossings: Maximal number of crossings of candidates.
+        is_determined: Function returning ``True`` if the list of candidates determines the entry.
+        debug: Print the number of candidates and the time of each stage.
+
+    Returns:
+        list: The candidates (in the order of the lists of the index).
+
+    Raises:
+        ValueError: If an invariant is unknown.
+    """
+    if unknown := set(cascade) - set(invariants):
+        raise ValueError(f"Unknown invariants {unknown} (expected some of {', '.join(invariants)})")
+
+    crossings, keys = index["crossings"], index["keys"]
+    candidates = None  # all entries with at most max_crossings crossings
+    for invariant in cascade:
+        if candidates is not None and len({keys[name][invariant] for name in candidates}) == 1:
+            continue  # the invariant does not distinguish the candidates
+        start = perf_counter()
+        names = index[invariant].get(invariants[invariant](k), []) + index[invariant].get(None, [])
+        if candidates is None:
+            candidates = [name for name in names if crossings[name] <= max_crossings]
+        else:
+            previous = set(candidates)
+            candidates = [name for name in names if name in previous]
+        if debug:
+            print(f"identify: {invariant} ({perf_counter() - start:.4f}s), {len(candidates)} candidates")
+        if not candidates or is_determined(candidates):
+            break
+    return candidates or []
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,102 @@
+from pathlib import Path
+from time import time
+
+import knotpy as kp
+from knotpy.reidemeister.reidemeister_1 import reidemeister_1_add_kink
+from knotpy.tables.invariant_reader import load_invariant_table
+from knotpy.tables.block_table import BlockTable, compile_block_table, write_block_table, find_data_file
+from knotpy.tables.knot import _missing_extended_knot_tables
+
+_DATA_DIR = Path(kp.__file__).parent / "tables" / "data"
+
+
+def test_block_table(tmp_path):
+    source = _DATA_DIR / "knots_12.csv.gz"
+    rows = load_invariant_table(source, evaluate=False)
+    table = BlockTable(compile_block_table(source, tmp_path / "knots_12.kpb", block_size=64))
+    assert len(table) == len(rows) and table.columns == ["native notation", "symmetry"]
+    assert list(table) == list(rows)
+
+    # accessing a row decompresses a single block
+    for name in list(rows)[::97]:
+        blocks_read = table.blocks_read
+        assert table[name] == rows[name]
+        assert table.blocks_read <= blocks_read + 1
+        assert table.names_by_key(rows[name]["native notation"].split(" [", 1)[0]) == [name]
+    assert "12a_0" not in table and table.get("12a_0") is None and table.names_by_key("a=X(b0)") == []
+    try:
+        table["12a_0"]
+        assert False
+    except KeyError:
+        pass
+    table.close()
+
+    (tmp_path / "broken.kpb").write_bytes(b"KPBK")
+    try:
+        BlockTable(tmp_path / "broken.kpb")
+        assert False
+    except ValueError:
+        pass
+
+    # an aborted write does not leave a temporary file
+    try:
+        rows = [("3_1", {"symmetry": "reversible"}), ("4_1", {"symmetry": "a\tb"})]
+        write_block_table(tmp_path / "tabs.kpb", ["symmetry"], rows)
+        assert False
+    except ValueError:
+        pass
+    assert not any(path.name.startswith("tabs.kpb") for path in tmp_path.iterdir())
+
+
+def test_extended_knot_table(tmp_path):
+    # the knots with 13-16 crossings are read from data packs
+    try:
+        kp.knot("13n_2")
+        assert False
+    except ValueError as e:
+        assert "not installed" in str(e)
+    assert find_data_file("knots_13.kpb") is None
+    assert (13, None) in _missing_extended_knot_tables  # the missing table is not searched for again
+
+    # a synthetic table: 12 crossing knots with a kink
+    diagrams = []
+    for i, k in enumerate(kp.knots(crossings=12)[:300]):
+        k = kp.canonical(reidemeister_1_add_kink(k, (next(iter(k.endpoints)), 1)))
+        k.name = f"13n_{i + 1}"
+        diagrams.append(k)
+    rows = [(f"13n_{i + 1}", {"native notation": kp.to_knotpy_notation(k)}) for i, k in enumerate(diagrams)]
+    write_block_table(tmp_path / "knots_13.kpb", ["native notation"], rows,
+                      key_function=lambda row: row["native notation"].split(" [", 1)[0], block_size=16)
+
+    dump = kp.settings.dump()
+    kp.settings.data_pack_dir = tmp_path
+    assert find_data_file("knots_13.kpb") == tmp_path / "knots_13.kpb"
+    assert kp.knot("13n_2") == diagrams[1] and kp.knot("13n_2").name == "13n_2"
+    assert kp.knot("13n_2*") == kp.canonical(kp.mirror(diagrams[1], inplace=False))
+    assert kp.knots(crossings=13) == diagrams
+    assert len(kp.knots(crossings=13, mirror=True)) == 600
+    assert kp.identify(kp.from_knotpy_notation(kp.to_knotpy_notation(diagrams[5]))) == "13n_6"
+    assert kp.symmetry_type("13n_6") is None
+    kp.settings.load(dump)
+
+
+def test_block_table_speed(tmp_path):
+    source = _DATA_DIR / "knots_homflypt_12.csv.gz"
+    t = time()
+    table = BlockTable(compile_block_table(source, tmp_path / "knots_homflypt_12.kpb"))
+    compile_time = time() - t
+    names = list(load_invariant_table(source, evaluate=False))
+    t = time()
+    table = BlockTable(tmp_path / "knots_homflypt_12.kpb")
+    for name in names[::10]:
+        table[name]
+    access_time = time() - t
+    print(f"Block table of {len(names)} rows: compiled in {compile_time:.2f}s, "
+          f"{len(names[::10])} random rows in {access_time:.4f}s ({table.blocks_read} blocks decompressed)")
+
+
+if __name__ == '__main__':
+    import tempfile
+    test_block_table(Path(tempfile.mkdtemp()))
+    test_extended_knot_table(Path(tempfile.mkdtemp()))
+    test_block_table_speed(Path(tempfile.mkdtemp()))
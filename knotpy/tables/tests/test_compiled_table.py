@@ -0,0 +1,89 @@
+import os
+import shutil
+from pathlib import Path
+from time import time
+
+import knotpy as kp
+from knotpy.tables.invariant_reader import load_invariant_table, _eval_poly, _eval_diagram
+from knotpy.tables.table_index import polynomial_terms
+from knotpy.tables.compiled_table import (load_compiled_table, load_derived_table, compiled_filename, packed_terms,
+                                          PackedDiagram, PackedPolynomial, _eval_packed_diagram, _eval_packed_poly)
+
+_DATA_DIR = Path(kp.__file__).parent / "tables" / "data"
+
+
+def test_compiled_table():
+    for table in ["knots_7", "knots_homflypt_8", "knots_kauffman_7", "links_6", "links_multivariable_alexander_7",
+                  "links_components_8"]:
+        compiled = load_compiled_table(_DATA_DIR / f"{table}.csv.gz")
+        rows = load_invariant_table(_DATA_DIR / f"{table}.csv.gz", evaluate=False)
+        assert list(compiled) == list(rows)
+        for name, row in rows.items():
+            for field, value in row.items():
+                packed = compiled[name][field]
+                if isinstance(packed, PackedDiagram):
+                    k, k_ = _eval_packed_diagram(packed), _eval_diagram(value)
+                    assert k == k_ and k.attr == k_.attr and type(k) is type(k_) and k.is_frozen()
+                elif isinstance(packed, PackedPolynomial):
+                    assert packed_terms(packed) == polynomial_terms(value)
+                    assert _eval_packed_poly(packed) == _eval_poly(value)
+                else:
+                    assert packed == value
+
+
+def test_compiled_table_fallback(tmp_path):
+    # the table is compiled in memory if the compiled table cannot be stored
+    source = tmp_path / "knots_5.csv.gz"
+    shutil.copy(_DATA_DIR / "knots_5.csv.gz", source)
+    compiled_filename(source).mkdir()
+    symmetry = load_compiled_table(source, only_field_name="symmetry")
+    assert symmetry == load_invariant_table(source, evaluate=False, only_field_name="symmetry")
+    compiled_filename(source).rmdir()
+
+    # outdated compiled tables are recompiled
+    load_compiled_table(source)
+    assert compiled_filename(source).exists()
+    compiled_filename(source).write_bytes(b"KPTB")
+    assert list(load_compiled_table(source)) == ["5_1", "5_2"]
+
+    try:
+        load_compiled_table(source, only_field_name="homflypt")
+        assert False
+    except ValueError:
+        pass
+
+
+def test_derived_table_rebuild(tmp_path):
+    source, filename = tmp_path / "table.csv", tmp_path / "table.bin"
+    source.write_text("fully chiral")
+    build = lambda: {"3_1": {"symmetry": source.read_text()}}
+    assert load_derived_table(filename, [source], build)["3_1"]["symmetry"] == "fully chiral"
+
+    # an edit that keeps the size of the source recompiles the table
+    source.write_text("reversible  ")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert load_derived_table(filename, [source], build)["3_1"]["symmetry"] == "reversible  "
+
+
+def test_compiled_table_speed():
+    source = _DATA_DIR / "knots_homflypt_11.csv.gz"
+    load_compiled_table(source)  # compile
+
+    t = time()
+    rows = load_invariant_table(source, evaluate=False, only_field_name="homflypt")
+    for value in rows.values():
+        _eval_poly(value)
+    csv_time = time() - t
+
+    t = time()
+    compiled = load_compiled_table(source, only_field_name="homflypt")
+    for value in compiled.values():
+        _eval_packed_poly(value)
+    compiled_time = time() - t
+    print(f"HOMFLY-PT polynomials of {len(rows)} knots: {csv_time:.2f}s (CSV), {compiled_time:.2f}s (compiled)")
+
+
+if __name__ == '__main__':
+    test_compiled_table()
+    test_compiled_table_speed()
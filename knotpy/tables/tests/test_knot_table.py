@@ -213,6 +213,42 @@ def test_symmetry_identification():
     k = kp.knot("culprit")
     assert kp.identify(k) == "0_1"
 
+def test_knots_generator_variants():
+    from knotpy.tables.knot import _build_knot_variants, _knot_variants
+
+    for mirror, oriented in [(False, False), (True, False), (False, True), (True, True)]:
+        diagrams = kp.knots(range(9), mirror=mirror, oriented=oriented)
+        expected = []
+        for k in kp.knots(range(9)):
+            expected += ([] if oriented else [k.name]) + \
+                        [k_.name for k_ in _knot_variants(k, kp.symmetry_type(k.name), mirror, oriented)]
+        assert [k.name for k in diagrams] == expected
+        for k in diagrams:
+            assert not k.is_frozen() and k == kp.knot(k.name)
+            unoriented = kp.canonical(kp.unorient(k)) if oriented else k
+            assert unoriented == kp.knot(k.name.lstrip("+-").rstrip("*") + ("*" if k.name.endswith("*") else ""))
+
+    # frozen table diagrams are not copied
+    a, b = kp.knots(7, oriented=True, frozen=True), kp.knots(7, oriented=True, frozen=True)
+    assert all(k.is_frozen() for k in a) and all(x is y for x, y in zip(a, b))
+
+    variants = _build_knot_variants(6, workers=2)
+    assert list(variants) == list(_build_knot_variants(6))
+    assert list(variants)[:3] == ["6_1*", "+6_1", "+6_1*"]  # 6_1 is reversible
+
+
+def test_knots_generator_speed():
+    from time import time
+    for mirror, oriented in [(False, False), (True, True)]:
+        list(kp.knots_generator(12, mirror=mirror, oriented=oriented))  # precompute the variants
+        t = time()
+        copies = len(list(kp.knots_generator(12, mirror=mirror, oriented=oriented)))
+        copy_time = time() - t
+        t = time()
+        len(list(kp.knots_generator(12, mirror=mirror, oriented=oriented, frozen=True)))
+        print(f"{copies} knots (mirror={mirror}, oriented={oriented}): {copy_time:.2f}s, {time() - t:.2f}s (frozen)")
+
+
 if __name__ == "__main__":
 
     print([k.name for k in kp.knots(range(11)) if kp.symmetry_type(k) == "chiral"])
@@ -0,0 +1,220 @@
+import os
+import random
+from time import time
+
+import sympy as sp
+
+import knotpy as kp
+from knotpy.reidemeister.reidemeister_1 import reidemeister_1_add_kink
+from knotpy.tables.knot import _cascade_candidates, _knot_index, _CASCADE_INVARIANTS
+from knotpy.tables.table_index import polynomial_terms, polynomial_key, substitute_terms, diagram_key, load_table_index
+from knotpy.tables.link import _link_cascade_candidates, _link_index, _LINK_CASCADE_INVARIANTS, _DATA_DIR
+from knotpy.tables.compiled_table import load_compiled_table, unpack_diagram
+from knotpy.tables.theta import _theta_curve_index, _THETA_CASCADE_INVARIANTS, _identify_theta_curve
+from knotpy.reidemeister.reidemeister import randomize_diagram
+
+
+def test_polynomial_terms():
+    p = "-2*y/x - y**2/x**2 + z**2/x**2"
+    assert polynomial_terms(p) == polynomial_terms(sp.sympify(p)) == polynomial_terms(sp.factor(sp.sympify(p)))
+    assert polynomial_terms("x**(-2) + 3*x/2 - 1/x") == (((("x", -2),), 1), ((("x", -1),), -1), ((("x", 1),), sp.Rational(3, 2)))
+    assert polynomial_terms("(x + 1)**2 - 2*x") == polynomial_terms("x**2 + 1")
+    assert polynomial_terms("x - x") == ()
+    assert polynomial_key("a*z + 1") == polynomial_key("1 + z*a")
+    assert polynomial_key("a*z + 1") != polynomial_key("a*z - 1")
+    assert substitute_terms(polynomial_terms("x**2*y + z/a"), rename={"x": "y", "y": "x"}, invert=["a"]) == \
+        polynomial_terms("x*y**2 + a*z")
+
+
+def test_load_table_index_rebuild(tmp_path):
+    source, filename = tmp_path / "table.csv", tmp_path / "table.pickle"
+    source.write_text("a,1\n")
+    build = lambda: {"rows": source.read_text()}
+    assert load_table_index(filename, [source], build)["rows"] == "a,1\n"
+    assert load_table_index(filename, [source], lambda: None)["rows"] == "a,1\n"  # loaded from the file
+
+    # an edit that keeps the size of the table rebuilds the index
+    source.write_text("a,2\n")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert load_table_index(filename, [source], build)["rows"] == "a,2\n"
+
+
+def test_identify_index():
+    # relabeled diagrams and mirrors are found by the diagram index
+    for name in ["3_1", "5_2", "7_4", "9_42", "10_132", "12n_242"]:
+        k = kp.from_pd_notation(kp.to_pd_notation(kp.knot(name)))
+        assert kp.identify(k) == name
+        assert kp.identify(kp.mirror(k, inplace=False)) == (name if name in ("10_132",) else name + "*") or \
+               kp.symmetry_type(name) != "chiral"
+    assert diagram_key(kp.knot("3_1")) == "a=X(b3 c0 c3 b0) b=X(a3 c2 c1 a0) c=X(a1 b2 b1 a2)"
+
+    # non-reduced diagrams are found by the polynomial indexes
+    k = kp.knot("6_1")
+    ep = next(iter(k.endpoints))
+    k = reidemeister_1_add_kink(reidemeister_1_add_kink(k, (ep, 1)), (ep, -1))
+    assert len(k) == 8 and kp.identify(k) == "6_1"
+    assert _cascade_candidates(kp.knot("5_2")) == ["5_2"]
+    assert _cascade_candidates(kp.mirror(kp.knot("8_17"), inplace=False)) == ["8_17", "8_17*"]
+
+
+def test_identify_cascade(capsys):
+    # the keys of the index are the keys of the invariants of the table knots and their mirrors
+    for k in kp.knots(crossings=[3, 6, 8, 9], mirror=True)[::5]:
+        for invariant, key_function in _CASCADE_INVARIANTS.items():
+            assert _knot_index["keys"][k.name][invariant] == key_function(k), (k.name, invariant)
+
+    # the cascade stops when the knot is determined and skips invariants that do not distinguish the candidates
+    k = kp.from_pd_notation(kp.to_pd_notation(kp.knot("7_5")))
+    capsys.readouterr()
+    assert _cascade_candidates(k, cascade=["determinant", "alexander", "jones"], debug=True) == ["7_5"]
+    output = capsys.readouterr().out
+    assert "identify: determinant" in output and "identify: jones" in output and "alexander" not in output
+    assert _cascade_candidates(kp.knot("4_1"), cascade=["determinant", "jones", "homflypt"], debug=True) == \
+           ["4_1", "4_1*"]
+    assert capsys.readouterr().out.count("identify:") == 1  # the determinant of 4_1 is unique
+    assert _cascade_candidates(kp.knot("8_17"), cascade=["determinant"]) == ["8_17", "8_17*"]
+
+    # knots (and mirrors) with the same determinant and at most as many crossings
+    assert _cascade_candidates(kp.knot("5_1"), cascade=["determinant"]) == ["4_1", "5_1", "4_1*", "5_1*"]
+    assert _cascade_candidates(kp.knot("5_1"), cascade=["determinant", "homflypt"]) == ["5_1"]
+    assert _cascade_candidates(kp.knot("3_1"), cascade=[]) == []
+    try:
+        _cascade_candidates(kp.knot("3_1"), cascade=["bracket"])
+        assert False
+    except ValueError:
+        pass
+
+    k = kp.mirror(kp.from_pd_notation(kp.to_pd_notation(kp.knot("10_132"))), inplace=False)
+    k = reidemeister_1_add_kink(k, (next(iter(k.endpoints)), 1))
+    assert kp.identify(k, cascade=["determinant", "jones"]) == kp.identify(k) == "10_132*"
+
+
+def test_identify_speed():
+    diagrams = [kp.from_pd_notation(kp.to_pd_notation(k)) for k in kp.knots(crossings=[10, 11])]
+    t = time()
+    names = [kp.identify(k) for k in diagrams]
+    print(f"Identified {len(diagrams)} knots in {time() - t:.2f}s")
+    assert names == [k.name for k in kp.knots(crossings=[10, 11])]
+
+
+def test_identify_cascade_speed():
+    diagrams = []
+    for k in kp.knots(crossings=[11, 12])[::100]:
+        k = kp.from_pd_notation(kp.to_pd_notation(k))
+        diagrams.append(reidemeister_1_add_kink(k, (next(iter(k.endpoints)), 1)))
+    for cascade in [["homflypt"], ["determinant", "homflypt"], None, ["determinant", "alexander", "jones", "homflypt"]]:
+        t = time()
+        for k in diagrams:
+            _cascade_candidates(k, cascade=cascade)
+        print(f"Cascade {cascade or 'default'} for {len(diagrams)} knots: {time() - t:.2f}s")
+
+
+def test_identify_link(capsys):
+    # oriented links, their mirrors and reverses are found by the diagram index (links with the same diagram, e.g.
+    # L8n_3+-- and L8n_3++-, are not distinguished)
+    capsys.readouterr()
+    for k in kp.links(crossings=[2, 4, 5, 6, 7], oriented=True, mirror=True)[::3]:
+        name = kp.identify(k)
+        assert kp.canonical(kp.link(name)) == kp.canonical(k), (k.name, name)
+        k_ = kp.reverse(k, inplace=False)
+        assert kp.canonical(kp.link(kp.identify(k_))) == kp.canonical(k_), (k.name, name)
+    assert capsys.readouterr().out == ""
+
+    # unoriented links
+    for name in ["L2a_1", "L6a_4", "L7n_1*", "L8a_14"]:
+        k = kp.from_pd_notation(kp.to_pd_notation(kp.link(name)))
+        assert kp.identify(k) == name
+
+    # links with 9 and 10 crossings
+    rows = load_compiled_table(_DATA_DIR / "link_invariants_10.csv.gz")
+    for name in list(rows)[::150]:
+        k = unpack_diagram(rows[name]["native notation"])
+        assert kp.identify(k) == name
+        assert kp.identify(kp.mirror(k, inplace=False)).replace("*", "").rstrip("+-") == name.rstrip("+-")
+
+
+def test_identify_link_cascade():
+    # the keys of the index are the keys of the invariants of the table links
+    rows = load_compiled_table(_DATA_DIR / "link_invariants_9.csv.gz")
+    for name in list(rows)[::200]:
+        k = unpack_diagram(rows[name]["native notation"])
+        for invariant, key_function in _LINK_CASCADE_INVARIANTS.items():
+            assert _link_index["keys"][name][invariant] == key_function(k), (name, invariant)
+    for k in kp.links(crossings=[4, 6], oriented=True, mirror=True)[::7]:
+        for invariant, key_function in _LINK_CASCADE_INVARIANTS.items():
+            if invariant != "multivariable_alexander":
+                assert _link_index["keys"][k.name][invariant] == key_function(k), (k.name, invariant)
+
+    # non-reduced diagrams are found by the invariants (up to reversing all components)
+    k = unpack_diagram(rows["L9a_12+-"]["native notation"])
+    k = reidemeister_1_add_kink(k, (next(iter(k.endpoints)), 1))
+    assert kp.identify(k) == "L9a_12+-"
+    assert kp.identify(kp.unorient(k)) == "L9a_12"
+    assert _link_cascade_candidates(kp.link("L4a_1++"), cascade=["components"])[:2] == ["L2a_1++", "L2a_1+-"]
+
+    # the mirror of an amphicheiral link is not a separate candidate
+    k = kp.link("L6a_2")
+    k = reidemeister_1_add_kink(k, (next(iter(k.endpoints)), 1))
+    assert kp.identify(k) == "L6a_2"
+    assert isinstance(kp.identify(kp.orient(k)), str)
+    try:
+        _link_cascade_candidates(kp.link("L4a_1++"), cascade=["jones"])
+        assert False
+    except ValueError:
+        pass
+
+
+def test_identify_link_speed():
+    diagrams = list(kp.links(crossings=[6, 7, 8], oriented=True))
+    t = time()
+    for k in diagrams:
+        kp.identify(k)
+    print(f"Identified {len(diagrams)} oriented links in {time() - t:.2f}s")
+
+
+def test_identify_theta_curve():
+    # theta curves, handcuff graphs and their mirrors are found by the diagram index
+    for k in kp.thetas() + kp.handcuffs():
+        assert kp.identify(k) == k.name
+        mirror = kp.identify(kp.mirror(k, inplace=False))
+        assert mirror in (k.name, k.name + "*")
+        assert kp.canonical(kp.theta(mirror)) == kp.canonical(kp.mirror(k, inplace=False))
+    assert kp.identify(kp.theta("H4_1*")) == "H4_1*"
+
+    # the keys of the index are the keys of the invariants of the table diagrams and their mirrors
+    for name in ["T3_1", "T5_6", "H5_1"]:
+        for name_ in [name, name + "*"]:
+            for invariant, key_function in _THETA_CASCADE_INVARIANTS.items():
+                assert _theta_curve_index["keys"][name_][invariant] == key_function(kp.theta(name_))
+
+    # diagrams that do not simplify to the table diagrams are found by the Yamada polynomial
+    dump = kp.settings.dump()
+    kp.settings.allowed_moves = "r1,r2,r3,r4,r5"
+    random.seed(3)
+    for name in ["T4_1", "T5_3*", "H5_1"]:
+        k = randomize_diagram(kp.theta(name), max_crossings_increase=3)
+        assert _identify_theta_curve(k) == name
+    kp.settings.load(dump)
+    assert kp.identify(kp.from_pd_notation("V[0,1,2],V[0,2,1]")) == "T0_1"
+
+
+def test_identify_theta_curve_speed():
+    diagrams = [kp.from_knotpy_notation(kp.to_knotpy_notation(k)) for k in kp.thetas() + kp.handcuffs()]
+    t = time()
+    for k in diagrams * 10:
+        kp.identify(k)
+    print(f"Identified {len(diagrams) * 10} theta curves and handcuff graphs in {time() - t:.2f}s")
+
+
+if __name__ == '__main__':
+    test_polynomial_terms()
+    test_identify_index()
+    test_identify_cascade()
+    test_identify_speed()
+    test_identify_cascade_speed()
+    test_identify_link()
+    test_identify_link_cascade()
+    test_identify_link_speed()
+    test_identify_theta_curve()
+    test_identify_theta_curve_speed()
@@ -9,15 +9,21 @@ __author__ = "Boštjan Gabrovšek"
 
 from pathlib import Path
 from functools import partial
+from time import perf_counter
 
 from knotpy.utils.dict_utils import LazyDict
 from knotpy.tables.invariant_reader import load_invariant_table
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
+from knotpy.classes.node import Vertex
 from knotpy.tables.name import clean_name, parse_name
 from knotpy.classes.freezing import unfreeze
 from knotpy.algorithms.canonical import canonical
 from knotpy.algorithms.symmetry import mirror as mirror_diagram
 from knotpy.tables.invariant_reader import _eval_diagram_dict, _eval_yamada_dict
+from knotpy.tables.table_index import load_table_index, diagram_key, polynomial_key, cascade_candidates
+from knotpy.algorithms.orientation import unorient
+from knotpy.algorithms.topology import edges
+from knotpy.invariants.yamada import yamada, yamada_mirror
 
 _DATA_DIR = Path(__file__).parent / "data"
 _THETA_CURVE_TABLE_CROSSINGS = [0, 3, 4, 5]
@@ -185,4 +191,97 @@ def handcuff_generator(crossings=None, mirror: bool = False, oriented: bool = Fa
 
 def handcuffs(crossings=None, mirror: bool = False, oriented: bool = False) -> list:
     """Return a list of handcuff links for the requested crossings."""
-    return list(handcuff_generator(crossings=crossings, mirror=mirror, oriented=oriented))
\ No newline at end of file
+    return list(handcuff_generator(crossings=crossings, mirror=mirror, oriented=oriented))
+
+
+def _graph_type(k: PlanarDiagram) -> str | None:
+    """Return "T" if the diagram is a theta curve, "H" if it is a handcuff graph, and None otherwise.
+
+    The diagram is a theta curve or a handcuff graph if it has two trivalent vertices (and crossings) and no closed
+    components. The three edges of a theta curve join the two vertices, the handcuff graph has two loops.
+    """
+    vertices = [node for node in k.nodes if isinstance(k.nodes[node], Vertex)]
+    if len(vertices) != 2 or any(k.degree(v) != 3 for v in vertices):
+        return None
+    ends = [{ep.node for ep in strand if ep.node in vertices} for strand in edges(k)]
+    if len(ends) != 3 or not all(ends):
+        return None  # closed components
+    return "H" if sum(len(e) == 1 for e in ends) == 2 else "T"
+
+
+def _build_theta_curve_index() -> dict:
+    """Return the index of the theta curve (and handcuff) table.
+
+    The index is a dictionary with the dictionaries:
+        - ``"diagram"``: key of a canonical table diagram -> name (e.g. "T5_3"),
+        - ``"crossings"``: name of a theta curve or its mirror (e.g. "T5_3*") -> number of crossings,
+        - ``"graph"``, ``"yamada"``: key of the invariant -> list of names (theta curves and mirrors),
+        - ``"keys"``: name -> dictionary of the keys of the invariants.
+    """
+    index = {"diagram": {}, "crossings": {}, "keys": {}, "graph": {}, "yamada": {}}
+    rows = load_invariant_table(_DATA_DIR / "theta_curves.csv.gz", evaluate=False)
+    mirrors = []
+    for name, row in rows.items():
+        number_of_crossings = int(name[1:name.find("_")])
+        if number_of_crossings not in _THETA_CURVE_TABLE_CROSSINGS:
+            continue
+        k = canonical(_eval_diagram_dict(row)["diagram"])
+        index["diagram"].setdefault(diagram_key(k), name)
+        index["crossings"][name] = number_of_crossings
+        polynomial = yamada(k)
+        index["keys"][name] = {"graph": name[0], "yamada": polynomial_key(polynomial)}
+        index["keys"][name + "*"] = {"graph": name[0], "yamada": polynomial_key(yamada_mirror(polynomial))}
+        mirrors.append((name + "*", number_of_crossings))
+
+    index["crossings"].update(mirrors)
+    for name in index["crossings"]:
+        for invariant, key in index["keys"][name].items():
+            index[invariant].setdefault(key, []).append(name)
+    return index
+
+
+# Index of the theta curve table (built on first use and stored next to the table)
+_theta_curve_index = LazyDict(
+    load_function=partial(
+        load_table_index,
+        filename=_DATA_DIR / "theta_curves_index.pickle",
+        sources=[_DATA_DIR / "theta_curves.csv.gz"],
+        build_function=_build_theta_curve_index,
+    )
+)
+
+# Invariants of the identification cascade: functions returning the key of the invariant of a diagram
+_THETA_CASCADE_INVARIANTS = {
+    "graph": _graph_type,
+    "yamada": lambda k: polynomial_key(yamada(k)),
+}
+
+
+def _identify_theta_curve(k: PlanarDiagram, debug: bool = False) -> str | list:
+    """Try to get the name of a theta curve or a handcuff graph, e.g. 'T5_3' or 'H4_1*'."""
+    from knotpy.tables.knot import _candidates
+
+    if k.is_oriented():
+        k = unorient(k)
+
+    # find the exact diagram or its mirror in the index
+    start = perf_counter()
+    for k_, mirror in _candidates(k):
+        if (name := _theta_curve_index["diagram"].get(diagram_key(k_))) is not None:
+            return name + mirror
+    if debug:
+        print(f"identify: diagram lookup ({perf_counter() - start:.4f}s)")
+
+    # searching the table failed, find candidates by the Yamada polynomial
+    candidates = cascade_candidates(
+        k, _theta_curve_index, _THETA_CASCADE_INVARIANTS,
+        cascade=("graph", "yamada"),
+        max_crossings=len(k.crossings),
+        is_determined=lambda c: len(c) == 1,
+        debug=debug,
+    )
+    return candidates[0] if len(candidates) == 1 else candidates
+
+
+if __name__ == "__main__":
+    pass
@@ -11,6 +11,7 @@ from .dict_utils import *
 from .geometry import *
 from .set_utils import *
 from .laurent import *
+from .integer_matrix import *
 from .disjoint_union_set import *
 from .progressbar import *
 from .parsing import *
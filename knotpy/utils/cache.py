@@ -1,20 +1,290 @@
 """
-Provides an in-memory dictionary-style cache for intermediate storage in KnotPy.
+Provides in-memory bounded caches for intermediate storage in KnotPy.
 
-This cache limits the number of entries and key lengths, and replaces the longest key when full.
-Designed for fast, dependency-free use in performance-sensitive contexts.
+All caches are instances of :class:`BoundedCache`, which supports three eviction policies with O(1) operations:
+
+- ``"lru"``: evict the least recently used entry,
+- ``"lfu"``: evict the least frequently used entry (frequency buckets, ties are broken by age),
+- ``"length"``: cost-aware eviction, evict the entry with the longest key (e.g. the diagram with most nodes), but only
+  if the incoming key is strictly shorter.
+
+The caches are thread-safe, limit the number of entries, the key lengths and (optionally) the total size of the
+values, and count hits, misses, evictions and (shallow) bytes. Named caches are registered, so that the statistics of
+all caches can be read through :func:`cache_stats`.
 """
 
 from __future__ import annotations
 
-from typing import Any, Hashable
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Callable, Hashable, Iterator
 
-__all__ = ["Cache"]
-__version__ = "1.0"
+__all__ = ["BoundedCache", "Cache", "cache_stats", "register_cache"]
+__version__ = "1.1"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovšek@pef.uni-lj.si>"
 
+_POLICIES = ("lru", "lfu", "length")
+_NO_KEY = object()  # marker for "no protected key"
+
+# registered caches (or other objects with a stats() method) by name
+_registry: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+
+
+def register_cache(name: str, cache: Any) -> None:
+    """Register a cache (any object with a ``stats()`` method) under ``name`` for :func:`cache_stats`."""
+    _registry[name] = cache
+
+
+def cache_stats() -> dict[str, dict]:
+    """Return the statistics of all registered caches.
+
+    Returns:
+        dict: A dictionary mapping cache names to dictionaries of counters (hits, misses, evictions, hit rate,
+        number of entries, bytes, ...).
+
+    Example:
+        >>> import knotpy as kp
+        >>> sorted(kp.cache_stats())
+        ['bracket_skein', 'flow_polynomial', 'homflypt_skein', 'kauffman_skein', 'kbsm', 'tutte_polynomial',
+         'yamada_knotted']
+    """
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
+
+
+def _length(key) -> int | None:
+    try:
+        return len(key)
+    except TypeError:
+        return None
+
+
+class BoundedCache:
+    """Thread-safe bounded cache with O(1) LRU, LFU or longest-key eviction.
+
+    Args:
+        max_entries: Maximum number of entries (``None`` for no limit, ``<= 0`` disables caching).
+        max_key_length: Keys with ``len(key) > max_key_length`` (or without a length) are not cached
+            (``None`` for no limit).
+        policy: Eviction policy, ``"lru"``, ``"lfu"`` or ``"length"``.
+        max_total_size: Maximum total size of the values as measured by ``size`` (``None`` for no limit). Values
+            larger than the limit are not cached.
+        size: Callable returning the size of a value (each value has size 1 by default).
+        name: If given, the cache is registered for :func:`cache_stats` under this name.
+
+    Attributes:
+        hits: Number of successful lookups.
+        misses: Number of failed lookups.
+        evictions: Number of evicted entries.
+        total_size: Total size of the cached values.
+        bytes: Approximate (shallow) memory used by the keys and values.
+    """
+
+    def __init__(self, max_entries: int | None = None, max_key_length: int | None = None, policy: str = "lru",
+                 max_total_size: int | None = None, size: Callable[[Any], int] | None = None,
+                 name: str | None = None) -> None:
+        if policy not in _POLICIES:
+            raise ValueError(f"Unknown cache policy {policy} (expected one of {', '.join(_POLICIES)})")
+        self.max_entries = max_entries
+        self.max_key_length = max_key_length
+        self.policy = policy
+        self.max_total_size = max_total_size
+        self.size = size
+        self.name = name
+        self._lock = threading.RLock()
+        self._data: dict[Hashable, list] = {}  # key -> [value, bucket, size, bytes]
+        self._buckets: dict[int, OrderedDict] = {}  # frequency (lfu) or key length (length) -> keys in order of age
+        self._order: OrderedDict = OrderedDict()  # lru order
+        self._min_frequency = 0
+        self._max_length = 0
+        self.hits = self.misses = self.evictions = 0
+        self.total_size = self.bytes = 0
+        if name is not None:
+            register_cache(name, self)
+
+    # lookup
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` (marking it as used), or ``default`` if missing."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._touch(key, item)
+            return item[0]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                raise KeyError(key)
+            return self.get(key)
+
+    def _touch(self, key: Hashable, item: list) -> None:
+        """Mark ``key`` as used."""
+        if self.policy == "lru":
+            self._order.move_to_end(key)
+        elif self.policy == "lfu":
+            bucket = self._buckets[item[1]]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[item[1]]
+                if self._min_frequency == item[1]:
+                    self._min_frequency += 1
+            item[1] += 1
+            self._buckets.setdefault(item[1], OrderedDict())[key] = None
+
+    # insertion
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert or update ``key`` with ``value``, evicting entries if the cache is full.
 
-class Cache(dict[Hashable, Any]):
+        Keys that are too long and values that are too large are ignored. With the ``"length"`` policy, a full cache
+        accepts a new key only if it is strictly shorter than the longest cached key.
+        """
+        with self._lock:
+            if self.max_entries is not None and self.max_entries <= 0:
+                return
+            length = _length(key)
+            if (self.max_key_length is not None or self.policy == "length") and length is None:
+                return
+            if self.max_key_length is not None and length > self.max_key_length:
+                return
+            value_size = self.size(value) if self.size is not None else 1
+            if self.max_total_size is not None and value_size > self.max_total_size:
+                return
+
+            if key in self._data:
+                item = self._data[key]
+                self.total_size += value_size - item[2]
+                self.bytes -= item[3]
+                item[0], item[2], item[3] = value, value_size, sys.getsizeof(key) + sys.getsizeof(value)
+                self.bytes += item[3]
+                self._touch(key, item)
+                self._evict(protected=key)
+                return
+
+            if self.max_entries is not None and len(self._data) >= self.max_entries:
+                if self.policy == "length" and length >= self._max_length:
+                    return  # only shorter keys replace longer ones
+                self._evict_one()
+
+            item = [value, 0, value_size, sys.getsizeof(key) + sys.getsizeof(value)]
+            if self.policy == "lru":
+                self._order[key] = None
+            elif self.policy == "lfu":
+                item[1] = self._min_frequency = 1
+                self._buckets.setdefault(1, OrderedDict())[key] = None
+            else:
+                item[1] = length
+                self._buckets.setdefault(length, OrderedDict())[key] = None
+                self._max_length = max(self._max_length, length)
+            self._data[key] = item
+            self.total_size += value_size
+            self.bytes += item[3]
+            self._evict(protected=key)
+
+    __setitem__ = set
+
+    def _evict(self, protected: Hashable) -> None:
+        """Evict entries (except ``protected``) while the total size exceeds the limit."""
+        while self.max_total_size is not None and self.total_size > self.max_total_size and len(self._data) > 1:
+            self._evict_one(protected)
+
+    def _evict_one(self, protected: Hashable = _NO_KEY) -> Hashable:
+        """Evict a single entry (other than ``protected``) according to the policy and return its key."""
+        if self.policy == "lru":
+            key = next(iter(self._order))
+            if protected is not _NO_KEY and key == protected:  # the protected key is the most recently used one
+                key = next(islice(self._order, 1, None))
+            del self._order[key]
+            return self._remove(key)
+
+        if self.policy == "lfu":
+            while self._min_frequency not in self._buckets:
+                self._min_frequency = min(self._buckets)
+            bucket_key = self._min_frequency
+        else:
+            while self._max_length not in self._buckets:
+                self._max_length -= 1
+            bucket_key = self._max_length
+        bucket = self._buckets[bucket_key]
+        key = next(iter(bucket))
+        if protected is not _NO_KEY and key == protected:
+            if len(bucket) > 1:
+                key = next(islice(bucket, 1, None))
+            else:  # the next least frequently used (or longest) bucket
+                select = min if self.policy == "lfu" else max
+                bucket_key = select(b for b in self._buckets if b != bucket_key)
+                bucket = self._buckets[bucket_key]
+                key = next(iter(bucket))
+        del bucket[key]
+        if not bucket:
+            del self._buckets[bucket_key]
+            if self.policy == "length" and bucket_key == self._max_length:
+                self._max_length = max(self._buckets, default=0)
+        return self._remove(key)
+
+    def _remove(self, key: Hashable) -> Hashable:
+        """Remove an evicted key from the data and update the counters."""
+        item = self._data.pop(key)
+        self.total_size -= item[2]
+        self.bytes -= item[3]
+        self.evictions += 1
+        return key
+
+    # mapping interface
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+
+    def keys(self) -> list:
+        return list(self._data)
+
+    def values(self) -> list:
+        return [item[0] for item in self._data.values()]
+
+    def items(self) -> list:
+        return [(key, item[0]) for key, item in self._data.items()]
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._buckets.clear()
+            self._order.clear()
+            self._min_frequency = self._max_length = 0
+            self.hits = self.misses = self.evictions = 0
+            self.total_size = self.bytes = 0
+
+    # statistics
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the ratio of successful lookups (0 if there were no lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """Return the cache statistics (hits, misses, evictions, hit rate, number of entries, total size, bytes)."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "hit_rate": self.hit_rate,
+                "entries": len(self._data), "size": self.total_size, "bytes": self.bytes}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name or ''}{', ' if self.name else ''}{len(self)} entries, {self.policy})"
+
+
+class Cache(BoundedCache):
     """In-memory bounded-size cache for key-value pairs with limited key lengths.
 
     This cache:
@@ -41,101 +311,20 @@ class Cache(dict[Hashable, Any]):
         max_key_length (int): Maximum allowed length of any key.
     """
 
-    def __init__(self, max_cache_size: int, max_key_length: int) -> None:
+    def __init__(self, max_cache_size: int, max_key_length: int, name: str | None = None) -> None:
         """Initialize the cache.
 
         Args:
             max_cache_size: Maximum entries to retain; if <= 0, all insertions are ignored.
             max_key_length: Maximum allowed length of any key.
+            name: If given, the cache is registered for :func:`cache_stats` under this name.
         """
-        super().__init__()
-        self.max_cache_size = int(max_cache_size)
-        self.max_key_length = int(max_key_length)
-
-    def __setitem__(self, key: Hashable, value: Any) -> None:
-        """Insert or update an item, applying capacity and key-length rules.
-
-        Behavior:
-            - If ``max_cache_size <= 0`` → do nothing.
-            - If key lacks ``len`` → ignore.
-            - If ``len(key) > max_key_length`` → ignore.
-            - If key already exists → update in-place.
-            - If under capacity → insert.
-            - If at capacity → evict the **longest** existing key **only if**
-              the new key is strictly shorter; otherwise ignore.
+        super().__init__(max_entries=int(max_cache_size), max_key_length=int(max_key_length), policy="length",
+                         name=name)
 
-        Args:
-            key: Hashable key.
-            value: Value to store.
-        """
-        # Caching disabled
-        if self.max_cache_size <= 0:
-            return
-
-        # Keys without a length are ignored
-        try:
-            key_len = len(key)  # type: ignore[arg-type]
-        except TypeError:
-            return
-
-        # Ignore too-long keys
-        if key_len > self.max_key_length:
-            return
-
-        # Update existing key regardless of capacity
-        if key in self:
-            super().__setitem__(key, value)
-            return
-
-        # Insert if there is room
-        if len(self) < self.max_cache_size:
-            super().__setitem__(key, value)
-            return
-
-        # Cache full: find the longest existing key
-        longest_key: Hashable | None = None
-        longest_len = -1
-
-        for existing_key in self.keys():
-            try:
-                existing_len = len(existing_key)  # type: ignore[arg-type]
-            except TypeError:
-                # If an existing key has no length, treat it as "infinitely long" so it is preferred for eviction.
-                existing_len = float("inf")
-            if existing_len > longest_len:
-                longest_len = existing_len
-                longest_key = existing_key
-
-        # Replace only if new key is strictly shorter
-        if key_len < longest_len and longest_key is not None:
-            # Use dict.pop to avoid recursive __delitem__ logic
-            self.pop(longest_key, None)
-            super().__setitem__(key, value)
-        # else: drop the new item silently
-
-    # Optional: explicit helper (kept private; useful if policy changes later)
-    def _longest_key(self) -> Hashable | None:
-        """Return the current longest key (by ``len``), or ``None`` if empty.
-
-        Returns:
-            The key with the maximum length among present keys, or ``None`` if empty.
-
-        Note:
-            Keys without ``len`` are treated as having infinite length.
-        """
-        if not self:
-            return None
-        longest_key: Hashable | None = None
-        longest_len = -1
-        for k in self.keys():
-            try:
-                k_len = len(k)  # type: ignore[arg-type]
-            except TypeError:
-                k_len = float("inf")
-            if k_len > longest_len:
-                longest_len = k_len
-                longest_key = k
-        return longest_key
+    @property
+    def max_cache_size(self) -> int:
+        return self.max_entries
 
 
 if __name__ == "__main__":
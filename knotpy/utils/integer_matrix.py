@@ -0,0 +1,237 @@
+"""
+Exact linear algebra over the integers.
+
+Matrices are given as sequences of integer rows (lists of lists). All routines
+are fraction-free or use :class:`fractions.Fraction`, so results are exact and
+no floating point or SymPy matrix machinery is involved:
+- determinants via Bareiss elimination
+- rank and nullity
+- invariant factors (Smith normal form diagonal)
+- signature of a symmetric matrix via congruence diagonalization
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from math import gcd
+from typing import Sequence
+
+__all__ = [
+    "bareiss_determinant",
+    "integer_rank",
+    "smith_normal_form_diagonal",
+    "symmetric_signature",
+]
+__version__ = "0.1"
+__author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
+
+
+def _copy_rows(matrix: Sequence[Sequence[int]]) -> list[list[int]]:
+    """Return a mutable copy of ``matrix`` as a list of integer lists."""
+    return [[int(value) for value in row] for row in matrix]
+
+
+def bareiss_determinant(matrix: Sequence[Sequence[int]]) -> int:
+    """Return the determinant of a square integer matrix.
+
+    Uses fraction-free Bareiss elimination, so all intermediate values stay
+    integral and bounded by minors of the input matrix.
+
+    Args:
+        matrix: Square matrix given as a sequence of integer rows.
+
+    Returns:
+        int: The determinant (``1`` for the empty matrix).
+
+    Raises:
+        ValueError: If the matrix is not square.
+    """
+    m = _copy_rows(matrix)
+    n = len(m)
+    if any(len(row) != n for row in m):
+        raise ValueError("The determinant is defined only for square matrices")
+
+    sign = 1
+    previous_pivot = 1
+    for k in range(n - 1):
+        if m[k][k] == 0:
+            # find a row below with a nonzero pivot and swap
+            swap = next((i for i in range(k + 1, n) if m[i][k] != 0), None)
+            if swap is None:
+                return 0
+            m[k], m[swap] = m[swap], m[k]
+            sign = -sign
+        pivot = m[k][k]
+        for i in range(k + 1, n):
+            row_i, row_k = m[i], m[k]
+            factor = row_i[k]
+            for j in range(k + 1, n):
+                row_i[j] = (row_i[j] * pivot - factor * row_k[j]) // previous_pivot
+            row_i[k] = 0
+        previous_pivot = pivot
+
+    return sign * m[n - 1][n - 1] if n else 1
+
+
+def integer_rank(matrix: Sequence[Sequence[int]]) -> int:
+    """Return the rank of an integer matrix (over the rationals).
+
+    Args:
+        matrix: Matrix given as a sequence of integer rows.
+
+    Returns:
+        int: The rank.
+    """
+    m = _copy_rows(matrix)
+    if not m:
+        return 0
+    rows, cols = len(m), len(m[0])
+    rank = 0
+    previous_pivot = 1
+    for col in range(cols):
+        pivot_row = next((i for i in range(rank, rows) if m[i][col] != 0), None)
+        if pivot_row is None:
+            continue
+        m[rank], m[pivot_row] = m[pivot_row], m[rank]
+        pivot = m[rank][col]
+        for i in range(rank + 1, rows):
+            factor = m[i][col]
+            m[i] = [(m[i][j] * pivot - factor * m[rank][j]) // previous_pivot for j in range(cols)]
+        previous_pivot = pivot
+        rank += 1
+        if rank == rows:
+            break
+    return rank
+
+
+def smith_normal_form_diagonal(matrix: Sequence[Sequence[int]]) -> list[int]:
+    """Return the invariant factors of an integer matrix.
+
+    The invariant factors ``d_1 | d_2 | ... | d_r`` are the nonzero diagonal
+    entries of the Smith normal form, followed by ``min(rows, cols) - r`` zeros.
+    They determine the abelian group presented by the matrix, i.e. the cokernel
+    ``Z^rows / im(matrix)`` is ``Z/d_1 + ... + Z/d_r + Z^(rows - r)``.
+
+    Args:
+        matrix: Matrix given as a sequence of integer rows.
+
+    Returns:
+        list[int]: Nonnegative invariant factors of length ``min(rows, cols)``.
+    """
+    m = _copy_rows(matrix)
+    rows = len(m)
+    cols = len(m[0]) if rows else 0
+    diagonal = []
+
+    for t in range(min(rows, cols)):
+        # choose the smallest nonzero entry of the remaining block as the pivot
+        entries = [(abs(m[i][j]), i, j) for i in range(t, rows) for j in range(t, cols) if m[i][j] != 0]
+        if not entries:
+            diagonal.extend([0] * (min(rows, cols) - t))
+            break
+        _, i, j = min(entries)
+        m[t], m[i] = m[i], m[t]
+        for row in m:
+            row[t], row[j] = row[j], row[t]
+
+        while True:
+            pivot = m[t][t]
+            done = True
+            # clear the pivot column
+            for i in range(t + 1, rows):
+                if m[i][t]:
+                    q = m[i][t] // pivot
+                    m[i] = [a - q * b for a, b in zip(m[i], m[t])]
+                    if m[i][t]:
+                        done = False
+            # clear the pivot row
+            for j in range(t + 1, cols):
+                if m[t][j]:
+                    q = m[t][j] // pivot
+                    for row in m:
+                        row[j] -= q * row[t]
+                    if m[t][j]:
+                        done = False
+            if done:
+                # the pivot must divide the whole remaining block
+                bad = next(((i, j) for i in range(t + 1, rows) for j in range(t + 1, cols) if m[i][j] % pivot), None)
+                if bad is None:
+                    break
+                m[t] = [a + b for a, b in zip(m[t], m[bad[0]])]
+                continue
+            # move the smallest remaining entry of the row/column to the pivot position
+            entries = [(abs(m[i][t]), i, t) for i in range(t, rows) if m[i][t]] + \
+                      [(abs(m[t][j]), t, j) for j in range(t, cols) if m[t][j]]
+            _, i, j = min(entries)
+            m[t], m[i] = m[i], m[t]
+            for row in m:
+                row[t], row[j] = row[j], row[t]
+
+        diagonal.append(abs(m[t][t]))
+
+    # normalize so that each factor divides the next
+    nonzero = [d for d in diagonal if d]
+    for i in range(len(nonzero)):
+        for j in range(i + 1, len(nonzero)):
+            g = gcd(nonzero[i], nonzero[j])
+            nonzero[i], nonzero[j] = g, nonzero[i] * nonzero[j] // g
+    return nonzero + [0] * (len(diagonal) - len(nonzero))
+
+
+def symmetric_signature(matrix: Sequence[Sequence[int]]) -> tuple[int, int]:
+    """Return the signature and nullity of a symmetric integer matrix.
+
+    The matrix is diagonalized by congruence (simultaneous row and column
+    operations) over the rationals; by Sylvester's law of inertia, the signs of
+    the diagonal entries give the signature.
+
+    Args:
+        matrix: Symmetric matrix given as a sequence of integer rows.
+
+    Returns:
+        tuple[int, int]: The pair ``(signature, nullity)``, where the signature is
+        the number of positive minus the number of negative eigenvalues.
+
+    Raises:
+        ValueError: If the matrix is not symmetric.
+    """
+    m = [[Fraction(value) for value in row] for row in matrix]
+    n = len(m)
+    if any(len(row) != n for row in m) or any(m[i][j] != m[j][i] for i in range(n) for j in range(i)):
+        raise ValueError("The signature is defined only for symmetric matrices")
+
+    positive = negative = 0
+    size = n
+    while size:
+        # move a nonzero diagonal entry to the pivot position (index 0 of the remaining block)
+        pivot = next((i for i in range(size) if m[i][i] != 0), None)
+        if pivot is None:
+            # no nonzero diagonal entry: add a row/column with a nonzero off-diagonal entry
+            pair = next(((i, j) for i in range(size) for j in range(i + 1, size) if m[i][j] != 0), None)
+            if pair is None:
+                break  # the remaining block is zero
+            i, j = pair
+            # row_i += row_j, col_i += col_j gives m[i][i] = 2 m[i][j] != 0
+            m[i] = [a + b for a, b in zip(m[i], m[j])]
+            for row in m:
+                row[i] += row[j]
+            pivot = i
+
+        m[0], m[pivot] = m[pivot], m[0]
+        for row in m:
+            row[0], row[pivot] = row[pivot], row[0]
+
+        d = m[0][0]
+        if d > 0:
+            positive += 1
+        else:
+            negative += 1
+        # eliminate the first row and column, keep the remaining (size - 1) block
+        m = [[m[i][j] - m[i][0] * m[0][j] / d for j in range(1, size)] for i in range(1, size)]
+        size -= 1
+
+    return positive - negative, n - positive - negative
+
+
+if __name__ == "__main__":
+    pass
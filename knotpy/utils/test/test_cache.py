@@ -4,8 +4,10 @@ test_cache.py
 Unit tests for the Cache class from cache.py.
 """
 
+import threading
+
 import pytest
-from knotpy.utils.cache import Cache
+from knotpy.utils.cache import Cache, BoundedCache, cache_stats
 
 
 def test_cache_insertion_and_length_limits():
@@ -56,5 +58,80 @@ def test_refuse_replace_when_key_not_shorter():
     assert 'q' in cache
     assert len(cache) == 2
 
+def test_lru_eviction_order():
+    cache = BoundedCache(max_entries=2, policy="lru")
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.get('a') == 1  # 'b' is now the least recently used
+    cache['c'] = 3
+    assert 'b' not in cache
+    assert cache.keys() == ['a', 'c']
+    assert cache.evictions == 1
+
+def test_lfu_eviction_order():
+    cache = BoundedCache(max_entries=2, policy="lfu")
+    cache['a'] = 1
+    cache['b'] = 2
+    cache.get('b')
+    cache.get('b')
+    cache.get('a')
+    cache['c'] = 3  # 'a' has fewer uses than 'b'
+    assert 'a' not in cache
+    cache.get('c')
+    cache.get('c')
+    cache['d'] = 4  # ties are broken by age, 'b' is older
+    assert set(cache) == {'c', 'd'}
+
+def test_counters_and_stats():
+    cache = BoundedCache(max_total_size=3, size=len, name="test_counters")
+    cache['a'] = "xx"
+    cache['b'] = "yy"  # total size 4 > 3, evicts 'a'
+    assert cache.get('a') is None
+    assert cache.get('b') == "yy"
+    stats = cache_stats()["test_counters"]
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"], stats["size"]) == (1, 1, 1, 1, 2)
+    assert stats["hit_rate"] == 0.5
+    assert stats["bytes"] > 0
+    cache.clear()
+    assert cache.stats()["bytes"] == 0 and len(cache) == 0
+
+def test_total_size_eviction_keeps_new_key():
+    for policy in ("lfu", "lru", "length"):
+        cache = BoundedCache(policy=policy, max_total_size=10, size=lambda v: v)
+        cache['aa'] = 5
+        cache.get('aa')
+        cache.get('aa')
+        cache['b'] = 4
+        cache.get('b')
+        cache['new'] = 3  # evicts an older entry, not the new one
+        assert 'new' in cache and len(cache) == 2 and cache.total_size <= 10
+    assert set(cache) == {'b', 'new'}  # "length" evicts the longest key other than the new one
+
+    cache = BoundedCache(policy="lfu", max_total_size=10, size=lambda v: v)
+    cache['a'] = 5
+    cache.get('a')
+    cache.get('a')
+    cache['b'] = 4
+    cache.get('b')
+    cache['new'] = 3
+    assert set(cache) == {'a', 'new'}  # 'b' is the least frequently used older entry
+
+def test_thread_safety():
+    cache = BoundedCache(max_entries=50, policy="lfu")
+
+    def work(offset):
+        for i in range(2000):
+            cache[(offset + i) % 80] = i
+            cache.get((offset * i) % 80)
+
+    threads = [threading.Thread(target=work, args=(t,)) for t in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(cache) == 50
+    assert cache.hits + cache.misses == 8 * 2000
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,42 @@
+import gc
+import weakref
+
+from knotpy.utils.decorators import paused_garbage_collection
+
+
+class _Node:
+    pass
+
+
+def test_paused_garbage_collection():
+    assert gc.isenabled()
+    with paused_garbage_collection():
+        assert not gc.isenabled()
+        node = _Node()
+        node.self = node  # a reference cycle created in the batch
+        reference = weakref.ref(node)
+        del node
+    assert gc.isenabled() and gc.get_freeze_count() == 0
+
+    # objects of the batch are moved to the oldest generation, cycles are still collected
+    gc.collect()
+    assert reference() is None
+
+    # objects frozen by the application stay frozen
+    gc.freeze()
+    try:
+        count = gc.get_freeze_count()
+        with paused_garbage_collection():
+            _Node()
+        assert gc.get_freeze_count() == count
+    finally:
+        gc.unfreeze()
+
+    # the collector stays disabled if it was disabled
+    gc.disable()
+    try:
+        with paused_garbage_collection():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
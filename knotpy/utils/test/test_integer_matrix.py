@@ -0,0 +1,35 @@
+import sympy as sp
+
+from knotpy.utils.integer_matrix import (
+    bareiss_determinant,
+    integer_rank,
+    smith_normal_form_diagonal,
+    symmetric_signature,
+)
+
+
+def test_bareiss_determinant():
+    m = [[2, -1, 0], [-1, 2, -1], [0, -1, 2]]
+    assert bareiss_determinant(m) == 4
+    assert bareiss_determinant([[0, 1], [1, 0]]) == -1
+    assert bareiss_determinant([[1, 2], [2, 4]]) == 0
+    assert bareiss_determinant([]) == 1
+    m = [[3, 1, 4, 1], [5, 9, 2, 6], [5, 3, 5, 8], [9, 7, 9, 3]]
+    assert bareiss_determinant(m) == sp.Matrix(m).det()
+
+
+def test_integer_rank():
+    assert integer_rank([[1, 2, 3], [2, 4, 6], [1, 0, 1]]) == 2
+    assert integer_rank([[0, 0], [0, 0]]) == 0
+
+
+def test_smith_normal_form_diagonal():
+    assert smith_normal_form_diagonal([[2, 4, 4], [-6, 6, 12], [10, -4, -16]]) == [2, 6, 12]
+    assert smith_normal_form_diagonal([[2, 0], [0, 3]]) == [1, 6]
+    assert smith_normal_form_diagonal([[3, 3], [3, 3]]) == [3, 0]
+
+
+def test_symmetric_signature():
+    assert symmetric_signature([[0, 1], [1, 0]]) == (0, 0)
+    assert symmetric_signature([[2, -1], [-1, 2]]) == (2, 0)
+    assert symmetric_signature([[-1, 0, 0], [0, 0, 0], [0, 0, -3]]) == (-2, 1)